@@ -181,11 +181,8 @@ impl DataTransformer {
             first.order.size.precision,
         );
 
-        // Encode data to record batches
-        let batches: Vec<RecordBatch> = data
-            .into_iter()
-            .map(|delta| OrderBookDelta::encode_batch(&metadata, &[delta]))
-            .collect();
+        // Encode all data into a single record batch
+        let batches: Vec<RecordBatch> = vec![OrderBookDelta::encode_batch(&metadata, &data)];
 
         let schema = OrderBookDelta::get_schema(metadata);
         Self::record_batches_to_pybytes(py, batches, schema)
@@ -208,11 +205,8 @@ impl DataTransformer {
             first.bid_size.precision,
         );
 
-        // Encode data to record batches
-        let batches: Vec<RecordBatch> = data
-            .into_iter()
-            .map(|quote| QuoteTick::encode_batch(&metadata, &[quote]))
-            .collect();
+        // Encode all data into a single record batch
+        let batches: Vec<RecordBatch> = vec![QuoteTick::encode_batch(&metadata, &data)];
 
         let schema = QuoteTick::get_schema(metadata);
         Self::record_batches_to_pybytes(py, batches, schema)
@@ -235,11 +229,8 @@ impl DataTransformer {
             first.size.precision,
         );
 
-        // Encode data to record batches
-        let batches: Vec<RecordBatch> = data
-            .into_iter()
-            .map(|trade| TradeTick::encode_batch(&metadata, &[trade]))
-            .collect();
+        // Encode all data into a single record batch
+        let batches: Vec<RecordBatch> = vec![TradeTick::encode_batch(&metadata, &data)];
 
         let schema = TradeTick::get_schema(metadata);
         Self::record_batches_to_pybytes(py, batches, schema)
@@ -259,13 +250,10 @@ impl DataTransformer {
             first.volume.precision,
         );
 
-        // Encode data to record batches
-        let batches: Vec<RecordBatch> = data
-            .into_iter()
-            .map(|bar| Bar::encode_batch(&metadata, &[bar]))
-            .collect();
+        // Encode all data into a single record batch
+        let batches: Vec<RecordBatch> = vec![Bar::encode_batch(&metadata, &data)];
 
-        let schema = TradeTick::get_schema(metadata);
+        let schema = Bar::get_schema(metadata);
         Self::record_batches_to_pybytes(py, batches, schema)
     }
 }
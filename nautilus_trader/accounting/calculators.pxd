@@ -31,6 +31,20 @@ cdef class ExchangeRateCalculator:
     )
 
 
+cdef class ExchangeRateGraph:
+    cdef ExchangeRateCalculator _calculator
+    cdef dict _bid_quotes
+    cdef dict _ask_quotes
+    cdef dict _rates
+    cdef dict _cross_rates
+    cdef dict _cross_edges
+
+    cpdef void update(self, str symbol, double bid, double ask)
+    cpdef double get_rate(self, Currency from_currency, Currency to_currency, PriceType price_type)
+    cpdef void clear(self)
+    cdef void _set_rate(self, dict rates, str lhs, str rhs, double rate)
+
+
 cdef class RolloverInterestCalculator:
     cdef dict _rate_data
 
@@ -182,6 +182,178 @@ cdef class ExchangeRateCalculator:
         return quotes.get(to_currency.code, 0.0)
 
 
+cdef class ExchangeRateGraph:
+    """
+    Provides a currency graph of exchange rates, updated incrementally from quotes.
+
+    Each quoted currency pair adds an edge (with its inverse) for the bid, ask
+    and mid price types. Direct rates are read from the edges, and one-hop cross
+    rates (through a common currency) are memoized until a quote for either of
+    their edges is updated. Rates which need more than one hop are calculated by
+    the `ExchangeRateCalculator` from the current quotes.
+    """
+
+    def __init__(self):
+        self._calculator = ExchangeRateCalculator()
+        self._bid_quotes: dict[str, float] = {}
+        self._ask_quotes: dict[str, float] = {}
+        self._rates: dict[PriceType, dict[str, dict[str, float]]] = {
+            PriceType.BID: {},
+            PriceType.ASK: {},
+            PriceType.MID: {},
+        }
+        self._cross_rates: dict[tuple[PriceType, str, str], float] = {}
+        self._cross_edges: dict[tuple[str, str], set[tuple[PriceType, str, str]]] = {}
+
+    cpdef void update(self, str symbol, double bid, double ask):
+        """
+        Update the graph with the given currency pair quote.
+
+        Parameters
+        ----------
+        symbol : str
+            The currency pair symbol in the form 'BASE/QUOTE'.
+        bid : double
+            The bid price for the pair.
+        ask : double
+            The ask price for the pair.
+
+        """
+        Condition.valid_string(symbol, "symbol")
+
+        cdef tuple pieces = symbol.partition("/")
+        cdef str code_lhs = pieces[0]
+        cdef str code_rhs = pieces[2]
+
+        self._bid_quotes[symbol] = bid
+        self._ask_quotes[symbol] = ask
+        self._set_rate(self._rates[PriceType.BID], code_lhs, code_rhs, bid)
+        self._set_rate(self._rates[PriceType.ASK], code_lhs, code_rhs, ask)
+        self._set_rate(self._rates[PriceType.MID], code_lhs, code_rhs, (bid + ask) / 2.0)
+
+        # Invalidate cross rates calculated through this edge
+        cdef tuple edge = (code_lhs, code_rhs) if code_lhs < code_rhs else (code_rhs, code_lhs)
+        cdef set keys = self._cross_edges.pop(edge, None)
+        cdef tuple key
+        if keys:
+            for key in keys:
+                self._cross_rates.pop(key, None)
+
+    cdef void _set_rate(self, dict rates, str lhs, str rhs, double rate):
+        cdef dict lhs_rates = rates.get(lhs)
+        if lhs_rates is None:
+            lhs_rates = {}
+            rates[lhs] = lhs_rates
+        cdef dict rhs_rates = rates.get(rhs)
+        if rhs_rates is None:
+            rhs_rates = {}
+            rates[rhs] = rhs_rates
+
+        lhs_rates[rhs] = rate
+        if f"{rhs}/{lhs}" in self._bid_quotes:
+            return  # Reverse pair is also quoted (no inverse)
+        if rate == 0.0:
+            rhs_rates.pop(lhs, None)  # No inverse of a zero price
+        else:
+            rhs_rates[lhs] = 1.0 / rate
+
+    cpdef double get_rate(self, Currency from_currency, Currency to_currency, PriceType price_type):
+        """
+        Return the exchange rate for the given price type.
+
+        Parameters
+        ----------
+        from_currency : Currency
+            The currency to convert from.
+        to_currency : Currency
+            The currency to convert to.
+        price_type : PriceType
+            The price type for conversion.
+
+        Returns
+        -------
+        double
+
+        Raises
+        ------
+        ValueError
+            If `price_type` is ``LAST``.
+
+        Notes
+        -----
+        If insufficient data to calculate exchange rate then will return 0.
+
+        """
+        Condition.not_none(from_currency, "from_currency")
+        Condition.not_none(to_currency, "to_currency")
+        Condition.true(price_type != PriceType.LAST, "price_type was invalid (LAST)")
+
+        if from_currency == to_currency:
+            return 1.0  # No conversion necessary
+
+        cdef dict rates = self._rates.get(price_type)
+        if rates is None:
+            raise ValueError(f"Cannot calculate exchange rate for PriceType."
+                             f"{price_type_to_str(price_type)}")
+
+        cdef str from_code = from_currency.code
+        cdef str to_code = to_currency.code
+        cdef dict from_rates = rates.get(from_code)
+        cdef dict to_rates = rates.get(to_code)
+        if from_rates is None or to_rates is None:
+            return 0.0  # Not enough data
+
+        # Direct (or inverse) rate
+        xrate = from_rates.get(to_code)
+        if xrate is not None:
+            return xrate
+
+        # Memoized cross rate
+        cdef tuple key = (price_type, from_code, to_code)
+        xrate = self._cross_rates.get(key)
+        if xrate is not None:
+            return xrate
+
+        # Search for a common currency
+        cdef str code
+        cdef double rate
+        for code, rate in from_rates.items():
+            if code not in to_rates:
+                continue
+            xrate = rate / to_rates[code]
+            self._cross_rates[key] = xrate
+            for edge in (
+                (from_code, code) if from_code < code else (code, from_code),
+                (to_code, code) if to_code < code else (code, to_code),
+            ):
+                keys = self._cross_edges.get(edge)
+                if keys is None:
+                    keys = set()
+                    self._cross_edges[edge] = keys
+                keys.add(key)
+            return xrate
+
+        # More than one hop
+        return self._calculator.get_rate(
+            from_currency=from_currency,
+            to_currency=to_currency,
+            price_type=price_type,
+            bid_quotes=self._bid_quotes,
+            ask_quotes=self._ask_quotes,
+        )
+
+    cpdef void clear(self):
+        """
+        Clear all quotes and rates from the graph.
+        """
+        self._bid_quotes.clear()
+        self._ask_quotes.clear()
+        for rates in self._rates.values():
+            rates.clear()
+        self._cross_rates.clear()
+        self._cross_edges.clear()
+
+
 cdef class RolloverInterestCalculator:
     """
     Provides rollover interest rate calculations.
@@ -17,6 +17,7 @@ from cpython.datetime cimport datetime
 from libc.stdint cimport uint64_t
 
 from nautilus_trader.common.clock cimport Clock
+from nautilus_trader.common.clock cimport TestClock
 from nautilus_trader.common.logging cimport Logger
 from nautilus_trader.common.logging cimport LoggerAdapter
 from nautilus_trader.core.data cimport Data
@@ -24,6 +25,7 @@ from nautilus_trader.core.rust.backtest cimport TimeEventAccumulatorAPI
 from nautilus_trader.core.rust.core cimport CVec
 from nautilus_trader.core.uuid cimport UUID4
 from nautilus_trader.data.engine cimport DataEngine
+from nautilus_trader.model.identifiers cimport ClientId
 
 
 cdef class BacktestEngine:
@@ -44,17 +46,32 @@ cdef class BacktestEngine:
     cdef datetime _backtest_end
 
     cdef dict _venues
-    cdef list _data
+    cdef list _data_streams
+    cdef list _data_stream_batches
+    cdef list _data_heap
     cdef uint64_t _data_len
     cdef uint64_t _index
     cdef uint64_t _iteration
 
+    cdef TestClock _kernel_clock
+    cdef list _timer_clocks
+    cdef list _timer_clock_sources
+    cdef dict _timer_clock_indices
+    cdef list _timer_next_ns
+    cdef list _timer_heap
+    cdef list _timer_changes
+
+    cdef str _validate_data_source(self, first, ClientId client_id)
+    cdef void _init_data_merge(self, uint64_t start_ns)
     cdef Data _next(self)
-    cdef CVec _advance_time(self, uint64_t ts_now, list clocks)
+    cdef list _next_stream_batch(self, uint64_t stream_index)
+    cdef void _init_timer_heap(self, list clocks)
+    cdef void _release_timer_clocks(self)
+    cdef void _schedule_clock(self, uint64_t clock_index)
+    cdef CVec _advance_time(self, uint64_t ts_now)
     cdef void _process_raw_time_event_handlers(
         self,
         CVec raw_handlers,
-        list clocks,
         uint64_t ts_now,
         bint only_now,
     )
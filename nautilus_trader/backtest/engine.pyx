@@ -14,8 +14,10 @@
 # -------------------------------------------------------------------------------------------------
 
 import asyncio
+import heapq
 import pickle
 from decimal import Decimal
+from collections.abc import Iterable
 from typing import Optional, Union
 
 import pandas as pd
@@ -33,6 +35,7 @@ from nautilus_trader.config.error import InvalidConfiguration
 from nautilus_trader.system.kernel import NautilusKernel
 
 from cpython.datetime cimport datetime
+from libc.stdint cimport UINT64_MAX
 from libc.stdint cimport uint64_t
 
 from nautilus_trader.backtest.data_client cimport BacktestDataClient
@@ -124,11 +127,22 @@ cdef class BacktestEngine:
 
         # Venues and data
         self._venues: dict[Venue, SimulatedExchange] = {}
-        self._data: list[Data] = []
+        self._data_streams: list[list[Data]] = []  # Each stream is sorted by `ts_init`
+        self._data_stream_batches: list = []  # Batch iterators for streamed sources (else ``None``)
+        self._data_heap: list[tuple[int, int, int]] = []  # (ts_init, stream index, position)
         self._data_len: uint64_t = 0
         self._index: uint64_t = 0
         self._iteration: uint64_t = 0
 
+        # Timers (scheduled across all clocks)
+        self._kernel_clock: Optional[TestClock] = None
+        self._timer_clocks: list[TestClock] = []
+        self._timer_clock_sources: list[Optional[TestClock]] = []  # Time sources prior to the run
+        self._timer_clock_indices: dict[TestClock, int] = {}
+        self._timer_next_ns: list[int] = []  # Next event time per clock (0 if none)
+        self._timer_heap: list[tuple[int, int]] = []  # (next event time, clock index)
+        self._timer_changes: list[TestClock] = []  # Clocks with changed timers
+
         # Timing
         self._run_started: Optional[datetime] = None
         self._run_finished: Optional[datetime] = None
@@ -313,12 +327,22 @@ cdef class BacktestEngine:
         """
         Return the engines internal data stream.
 
+        The independently added data streams are merged in `ts_init` order,
+        where data with equal timestamps retain the order they were added.
+
         Returns
         -------
         list[Data]
 
+        Raises
+        ------
+        ValueError
+            If a data stream has been added with `add_data_stream()` (streamed
+            batches are not held by the engine).
+
         """
-        return self._data.copy()
+        self._check_no_data_stream_sources("data")
+        return _merge_data_streams(self._data_streams)
 
     @property
     def portfolio(self) -> PortfolioFacade:
@@ -573,8 +597,79 @@ cdef class BacktestEngine:
         Condition.list_type(data, Data, "data")
 
         first = data[0]
+        cdef str data_prepend_str = self._validate_data_source(first, client_id)
+
+        # Add data as an independent stream (only the new data requires sorting)
+        if _is_sorted_by_ts_init(data):
+            data = data.copy()
+        else:
+            data = sorted(data, key=lambda x: x.ts_init)
+
+        self._data_streams.append(data)
+        self._data_stream_batches.append(None)
+        self._data_len += len(data)
+
+        self._log.info(
+            f"Added {len(data):,} {data_prepend_str}"
+            f"{type(first).__name__} element{'' if len(data) == 1 else 's'}.",
+        )
+
+    def add_data_stream(self, batches: Iterable[list[Data]], ClientId client_id = None) -> None:
+        """
+        Add the given stream of data batches to the backtest engine.
+
+        Batches are pulled lazily from the stream during the run, so that only
+        the current batch is held in memory. The stream is merged with all other
+        data added to the engine in `ts_init` order.
+
+        Typical sources are the batch generators in `persistence.streaming.batching`,
+        such as `generate_batches_rust` which yields the `DataBackendSession` query
+        results directly.
+
+        Parameters
+        ----------
+        batches : Iterable[list[Data]]
+            The data batches to stream.
+        client_id : ClientId, optional
+            The data client ID to associate with generic data.
 
-        cdef str data_prepend_str = ""
+        Raises
+        ------
+        ValueError
+            If `batches` contains no data.
+        ValueError
+            If the first batch contains objects which are not a type of `Data`.
+        ValueError
+            If `instrument_id` for the data is not found in the cache.
+        ValueError
+            If data elements do not have an `instrument_id` and `client_id` is ``None``.
+
+        Warnings
+        --------
+        Assumes all data elements are of the same type, and that the batches
+        are yielded in `ts_init` order (data within each batch is sorted if required).
+        A stream is consumed by the run, and must be added again for subsequent runs.
+
+        """
+        Condition.not_none(batches, "batches")
+
+        batches = iter(batches)
+        cdef list batch = _next_data_batch(batches)
+        Condition.true(batch is not None, "`batches` contained no data")
+        Condition.list_type(batch, Data, "batch")
+
+        first = batch[0]
+        cdef str data_prepend_str = self._validate_data_source(first, client_id)
+
+        self._data_streams.append(batch)
+        self._data_stream_batches.append(batches)
+        self._data_len += len(batch)
+
+        self._log.info(
+            f"Added {data_prepend_str}{type(first).__name__} data stream.",
+        )
+
+    cdef str _validate_data_source(self, first, ClientId client_id):
         if hasattr(first, "instrument_id"):
             Condition.true(
                 first.instrument_id in self.kernel.cache.instrument_ids(),
@@ -583,7 +678,7 @@ cdef class BacktestEngine:
             )
             # Check client has been registered
             self._add_market_data_client_if_not_exists(first.instrument_id.venue)
-            data_prepend_str = f"{first.instrument_id} "
+            return f"{first.instrument_id} "
         elif isinstance(first, Bar):
             Condition.true(
                 first.bar_type.instrument_id in self.kernel.cache.instrument_ids(),
@@ -596,21 +691,14 @@ cdef class BacktestEngine:
                 "bar_type.aggregation_source",
                 "required source",
             )
-            data_prepend_str = f"{first.bar_type} "
+            return f"{first.bar_type} "
         else:
             Condition.not_none(client_id, "client_id")
             # Check client has been registered
             self._add_data_client_if_not_exists(client_id)
             if isinstance(first, GenericData):
-                data_prepend_str = f"{type(data[0].data).__name__} "
-
-        # Add data
-        self._data = sorted(self._data + data, key=lambda x: x.ts_init)
-
-        self._log.info(
-            f"Added {len(data):,} {data_prepend_str}"
-            f"{type(first).__name__} element{'' if len(data) == 1 else 's'}.",
-        )
+                return f"{type(first.data).__name__} "
+            return ""
 
     def dump_pickled_data(self) -> bytes:
         """
@@ -620,8 +708,21 @@ cdef class BacktestEngine:
         -------
         bytes
 
+        Raises
+        ------
+        ValueError
+            If a data stream has been added with `add_data_stream()` (streamed
+            batches are not held by the engine).
+
         """
-        return pickle.dumps(self._data)
+        self._check_no_data_stream_sources("dump_pickled_data")
+        return pickle.dumps(_merge_data_streams(self._data_streams))
+
+    def _check_no_data_stream_sources(self, str method):
+        Condition.true(
+            not any(self._data_stream_batches),
+            f"`{method}` is not supported for data added with `add_data_stream()`",
+        )
 
     def load_pickled_data(self, bytes data) -> None:
         """
@@ -641,10 +742,13 @@ cdef class BacktestEngine:
         """
         Condition.not_none(data, "data")
 
-        self._data = pickle.loads(data)
+        cdef list loaded = pickle.loads(data)
+        self._data_streams = [loaded]
+        self._data_stream_batches = [None]
+        self._data_len = len(loaded)
 
         self._log.info(
-            f"Loaded {len(self._data):,} data "
+            f"Loaded {len(loaded):,} data "
             f"element{'' if len(data) == 1 else 's'} from pickle.",
         )
 
@@ -765,6 +869,8 @@ cdef class BacktestEngine:
         for exchange in self._venues.values():
             exchange.reset()
 
+        self._release_timer_clocks()
+
         # Reset run IDs
         self._run_config_id = None
         self._run_id = None
@@ -786,7 +892,9 @@ cdef class BacktestEngine:
         Does not clear added instruments.
 
         """
-        self._data.clear()
+        self._data_streams.clear()
+        self._data_stream_batches.clear()
+        self._data_heap.clear()
         self._data_len = 0
         self._index = 0
 
@@ -820,6 +928,7 @@ cdef class BacktestEngine:
 
         """
         self.clear_data()
+        self._release_timer_clocks()
         self.kernel.dispose()
 
     def run(
@@ -836,8 +945,9 @@ cdef class BacktestEngine:
         post-run analysis performed.
 
         If more data than can fit in memory is to be run through the backtest
-        engine, then `streaming` mode can be utilized. The expected sequence is as
-        follows:
+        engine, then data can be added with `add_data_stream()`, which pulls
+        batches lazily during the run. Alternatively `streaming` mode can be
+        utilized. The expected sequence is as follows:
          - Add initial data batch and strategies.
          - Call `run(streaming=True)`.
          - Call `clear_data()`.
@@ -864,8 +974,15 @@ cdef class BacktestEngine:
             If no data has been added to the engine.
         ValueError
             If the `start` is >= the `end` datetime.
+        ValueError
+            If `streaming` is True and a data stream has been added with
+            `add_data_stream()` (batches are already pulled during the run).
 
         """
+        Condition.true(
+            not (streaming and any(self._data_stream_batches)),
+            "`streaming` mode is not supported for data added with `add_data_stream()`",
+        )
         self._run(start, end, run_config_id)
         if not streaming:
             self.end()
@@ -942,25 +1059,31 @@ cdef class BacktestEngine:
         end: Optional[Union[datetime, str, int]] = None,
         run_config_id: Optional[str] = None,
     ):
+        cdef list streams = [stream for stream in self._data_streams if stream]
+        Condition.not_empty(streams, "data")
+
         cdef uint64_t start_ns
         cdef uint64_t end_ns
+        cdef list stream
         # Time range check and set
         if start is None:
             # Set `start` to start of data
-            start_ns = self._data[0].ts_init
+            start_ns = min([stream[0].ts_init for stream in streams])
             start = unix_nanos_to_dt(start_ns)
         else:
             start = pd.to_datetime(start, utc=True)
             start_ns = start.value
-        if end is None:
+        if end is None and any(self._data_stream_batches):
+            # Run until all data streams are exhausted (end of data is not known ahead)
+            end_ns = UINT64_MAX
+        elif end is None:
             # Set `end` to end of data
-            end_ns = self._data[-1].ts_init
+            end_ns = max([stream[-1].ts_init for stream in streams])
             end = unix_nanos_to_dt(end_ns)
         else:
             end = pd.to_datetime(end, utc=True)
             end_ns = end.value
         Condition.true(start_ns < end_ns, "start was >= end")
-        Condition.not_empty(self._data, "data")
 
         # Gather clocks
         cdef list clocks = [self.kernel.clock]
@@ -972,6 +1095,7 @@ cdef class BacktestEngine:
         cdef TestClock clock
         for clock in clocks:
             clock.set_time(start_ns)
+        self._init_timer_heap(clocks)
 
         cdef SimulatedExchange exchange
         if self._iteration == 0:
@@ -1006,15 +1130,8 @@ cdef class BacktestEngine:
 
         self._log_run(start, end)
 
-        # Set data stream length
-        self._data_len = len(self._data)
-
-        # Set starting index
-        cdef uint64_t i
-        for i in range(self._data_len):
-            if start_ns <= self._data[i].ts_init:
-                self._index = i
-                break
+        # Initialize the k-way merge of data streams from the start
+        self._init_data_merge(start_ns)
 
         # -- MAIN BACKTEST LOOP -----------------------------------------------#
         cdef bint force_stop = False
@@ -1029,7 +1146,7 @@ cdef class BacktestEngine:
                     break
                 if data.ts_init > last_ns:
                     # Advance clocks to the next data time
-                    raw_handlers = self._advance_time(data.ts_init, clocks)
+                    raw_handlers = self._advance_time(data.ts_init)
                     raw_handlers_count = raw_handlers.len
 
                 # Process data through venue
@@ -1060,7 +1177,6 @@ cdef class BacktestEngine:
                     # Finally process the time events
                     self._process_raw_time_event_handlers(
                         raw_handlers,
-                        clocks,
                         last_ns,
                         only_now=True,
                     )
@@ -1086,41 +1202,167 @@ cdef class BacktestEngine:
         if raw_handlers_count > 0:
             self._process_raw_time_event_handlers(
                 raw_handlers,
-                clocks,
                 last_ns,
                 only_now=True,
             )
             vec_time_event_handlers_drop(raw_handlers)
 
+    cdef void _init_data_merge(self, uint64_t start_ns):
+        # Position each stream at its first element at or after `start_ns`,
+        # and seed the heap with the head of each non-exhausted stream.
+        self._data_heap = []
+        self._index = 0
+
+        cdef:
+            uint64_t i
+            uint64_t position
+            list stream
+        for i in range(len(self._data_streams)):
+            stream = self._data_streams[i]
+            position = _bisect_ts_init(stream, start_ns)
+            while position == <uint64_t>len(stream) and self._data_stream_batches[i] is not None:
+                # Skip whole streamed batches prior to the start
+                self._index += position
+                stream = self._next_stream_batch(i)
+                position = _bisect_ts_init(stream, start_ns)
+            self._index += position
+            if position < <uint64_t>len(stream):
+                self._data_heap.append((stream[position].ts_init, i, position))
+
+        heapq.heapify(self._data_heap)
+
     cdef Data _next(self):
-        cdef uint64_t cursor = self._index
+        if not self._data_heap:
+            return None
+
+        cdef:
+            uint64_t stream_index
+            uint64_t position
+            list stream
+        _, stream_index, position = self._data_heap[0]
+        stream = self._data_streams[stream_index]
+        cdef Data data = stream[position]
+
+        # Advance the stream cursor, dropping the stream from the heap when exhausted
+        position += 1
+        if position == <uint64_t>len(stream) and self._data_stream_batches[stream_index] is not None:
+            stream = self._next_stream_batch(stream_index)
+            position = 0
+        if position < <uint64_t>len(stream):
+            heapq.heapreplace(self._data_heap, (stream[position].ts_init, stream_index, position))
+        else:
+            heapq.heappop(self._data_heap)
+
         self._index += 1
-        if cursor < self._data_len:
-            return self._data[cursor]
+        return data
+
+    cdef list _next_stream_batch(self, uint64_t stream_index):
+        # Pull the next batch for a streamed source, which replaces the previous
+        # batch (releasing it). Returns an empty list when the stream is exhausted.
+        cdef list batch = _next_data_batch(self._data_stream_batches[stream_index])
+        if batch is None:
+            batch = []
+            self._data_stream_batches[stream_index] = None
+
+        self._data_streams[stream_index] = batch
+        self._data_len += len(batch)
+        return batch
+
+    cdef void _init_timer_heap(self, list clocks):
+        # Component clocks read their time from the kernel clock, so only the
+        # kernel clock is set as time advances. Seed the heap with the next event
+        # time of each clock, clocks then report their own timer changes.
+        self._release_timer_clocks()
+        self._kernel_clock = clocks[0]
+        self._timer_clocks = clocks
+        self._timer_clock_sources = [clock._time_source for clock in clocks]
+        self._timer_clock_indices = {clock: i for i, clock in enumerate(clocks)}
+        self._timer_next_ns = [0] * len(clocks)
+        self._timer_heap = []
+        self._timer_changes = []
 
-    cdef CVec _advance_time(self, uint64_t ts_now, list clocks):
-        cdef TestClock clock
-        for clock in clocks:
+        cdef:
+            uint64_t i
+            TestClock clock
+        for i in range(len(clocks)):
+            clock = clocks[i]
+            clock.register_timer_changes(self._timer_changes)
+            clock.set_time_source(None if i == 0 else self._kernel_clock)
+            self._schedule_clock(i)
+
+    cdef void _release_timer_clocks(self):
+        # Restore the time source of each clock from prior to the run, and stop
+        # the clocks reporting timer changes to the engine
+        cdef:
+            uint64_t i
+            TestClock clock
+        for i in range(len(self._timer_clocks)):
+            clock = self._timer_clocks[i]
+            clock.register_timer_changes(None)
+            clock.set_time_source(self._timer_clock_sources[i])
+
+        self._kernel_clock = None
+        self._timer_clocks = []
+        self._timer_clock_sources = []
+        self._timer_clock_indices = {}
+        self._timer_next_ns = []
+        self._timer_heap = []
+        self._timer_changes = []
+
+    cdef void _schedule_clock(self, uint64_t clock_index):
+        cdef TestClock clock = self._timer_clocks[clock_index]
+        cdef uint64_t next_time_ns = clock.next_event_time_ns()
+        if next_time_ns == self._timer_next_ns[clock_index]:
+            return  # Already scheduled (or no active timers)
+
+        # Any previous heap entry for the clock is now stale (skipped when popped)
+        self._timer_next_ns[clock_index] = next_time_ns
+        if next_time_ns > 0:
+            heapq.heappush(self._timer_heap, (next_time_ns, clock_index))
+
+    cdef CVec _advance_time(self, uint64_t ts_now):
+        cdef:
+            uint64_t clock_index
+            uint64_t next_time_ns
+            TestClock clock
+
+        # Reschedule clocks whose timers changed since the last advance
+        if self._timer_changes:
+            for clock in self._timer_changes:
+                clock.reset_timers_changed()
+                self._schedule_clock(self._timer_clock_indices[clock])
+            self._timer_changes.clear()
+
+        # Only advance clocks with timer events due at or before `ts_now`
+        cdef list due = []
+        while self._timer_heap and self._timer_heap[0][0] <= ts_now:
+            next_time_ns, clock_index = heapq.heappop(self._timer_heap)
+            if next_time_ns != self._timer_next_ns[clock_index]:
+                continue  # Stale entry
+            self._timer_next_ns[clock_index] = 0
+            clock = self._timer_clocks[clock_index]
             time_event_accumulator_advance_clock(
                 &self._accumulator,
                 &clock._mem,
                 ts_now,
                 False,
             )
+            due.append(clock_index)
+
+        for clock_index in due:
+            self._schedule_clock(clock_index)
 
         cdef CVec raw_handlers = time_event_accumulator_drain(&self._accumulator)
 
         # Handle all events prior to the `ts_now`
         self._process_raw_time_event_handlers(
             raw_handlers,
-            clocks,
             ts_now,
             only_now=False,
         )
 
-        # Set all clocks to now
-        for clock in clocks:
-            clock.set_time(ts_now)
+        # Set all clocks to now (through the shared time source)
+        self._kernel_clock.set_time(ts_now)
 
         # Return all remaining events to be handled (at `ts_now`)
         return raw_handlers
@@ -1128,7 +1370,6 @@ cdef class BacktestEngine:
     cdef void _process_raw_time_event_handlers(
         self,
         CVec raw_handler_vec,
-        list clocks,
         uint64_t ts_now,
         bint only_now,
     ):
@@ -1139,7 +1380,6 @@ cdef class BacktestEngine:
             uint64_t ts_last_init = 0
             TimeEventHandler_t raw_handler
             TimeEvent event
-            TestClock clock
             object callback
             SimulatedExchange exchange
         for i in range(raw_handler_vec.len):
@@ -1147,8 +1387,7 @@ cdef class BacktestEngine:
             ts_event_init = raw_handler.event.ts_init
             if (only_now and ts_event_init < ts_now) or (not only_now and ts_event_init == ts_now):
                 continue
-            for clock in clocks:
-                clock.set_time(ts_event_init)
+            self._kernel_clock.set_time(ts_event_init)
             event = TimeEvent.from_mem_c(raw_handler.event)
 
             # Cast raw `PyObject *` to a `PyObject`
@@ -1178,7 +1417,7 @@ cdef class BacktestEngine:
                 for b in account.starting_balances().values():
                     self._log.info(b.to_str())
 
-    def _log_run(self, start: pd.Timestamp, end: pd.Timestamp):
+    def _log_run(self, start: pd.Timestamp, end: Optional[pd.Timestamp]):
         self._log.info("\033[36m=================================================================")
         self._log.info("\033[36m BACKTEST RUN")
         self._log.info("\033[36m=================================================================")
@@ -1187,7 +1426,12 @@ cdef class BacktestEngine:
         self._log.info(f"Run started:    {self._run_started}")
         self._log.info(f"Backtest start: {self._backtest_start}")
         self._log.info(f"Batch start:    {start}")
-        self._log.info(f"Batch end:      {end}")
+        if end is None:
+            # Streamed sources run until exhausted, so the end is not known ahead
+            streams = sum(batches is not None for batches in self._data_stream_batches)
+            self._log.info(f"Batch end:      end of data ({streams} streams)")
+        else:
+            self._log.info(f"Batch end:      {end}")
         self._log.info("\033[36m-----------------------------------------------------------------")
 
     def _log_post_run(self):
@@ -1316,3 +1560,52 @@ cdef class BacktestEngine:
                 logger=self._kernel.logger,
             )
             self._kernel.data_engine.register_client(client)
+
+
+cdef bint _is_sorted_by_ts_init(list data):
+    cdef:
+        uint64_t i
+        uint64_t ts_last = 0
+        uint64_t ts_init
+    for i in range(len(data)):
+        ts_init = data[i].ts_init
+        if ts_init < ts_last:
+            return False
+        ts_last = ts_init
+    return True
+
+
+cdef list _next_data_batch(batches):
+    # Return the next non-empty batch from the iterator sorted by `ts_init`, else ``None``
+    cdef list batch
+    for batch in batches:
+        if not batch:
+            continue
+        if not _is_sorted_by_ts_init(batch):
+            batch = sorted(batch, key=lambda x: x.ts_init)
+        return batch
+    return None
+
+
+cdef uint64_t _bisect_ts_init(list data, uint64_t ts_init):
+    # Return the position of the first element with `ts_init` >= the given timestamp
+    cdef:
+        uint64_t lo = 0
+        uint64_t hi = len(data)
+        uint64_t mid
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if data[mid].ts_init < ts_init:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+cdef list _merge_data_streams(list streams):
+    if not streams:
+        return []
+    if len(streams) == 1:
+        return streams[0].copy()
+    # `heapq.merge` is stable, so data with equal timestamps retain stream order
+    return list(heapq.merge(*streams, key=lambda x: x.ts_init))
@@ -2043,6 +2043,9 @@ cdef class OrderMatchingEngine:
         )
         self.msgbus.send(endpoint="ExecEngine.process", msg=event)
 
+        # Re-index the (now updated) order for matching
+        self._core.update_order(order)
+
     cdef void _generate_order_canceled(self, Order order):
         # Generate event
         cdef uint64_t ts_now = self._clock.timestamp_ns()
@@ -2075,6 +2078,9 @@ cdef class OrderMatchingEngine:
         )
         self.msgbus.send(endpoint="ExecEngine.process", msg=event)
 
+        # Re-index the (now triggered) order for matching
+        self._core.update_order(order)
+
     cdef void _generate_order_expired(self, Order order):
         # Generate event
         cdef uint64_t ts_now = self._clock.timestamp_ns()
@@ -15,6 +15,8 @@
 
 from __future__ import annotations
 
+import multiprocessing
+from collections.abc import Iterator
 from decimal import Decimal
 
 import pandas as pd
@@ -22,6 +24,7 @@ import pandas as pd
 from nautilus_trader.backtest.engine import BacktestEngine
 from nautilus_trader.backtest.engine import BacktestEngineConfig
 from nautilus_trader.backtest.results import BacktestResult
+from nautilus_trader.backtest.results import BacktestResultStore
 from nautilus_trader.config import ActorFactory
 from nautilus_trader.config import BacktestDataConfig
 from nautilus_trader.config import BacktestRunConfig
@@ -38,9 +41,9 @@ from nautilus_trader.model.identifiers import ClientId
 from nautilus_trader.model.identifiers import InstrumentId
 from nautilus_trader.model.identifiers import Venue
 from nautilus_trader.model.objects import Money
-from nautilus_trader.persistence.streaming.engine import StreamingEngine
-from nautilus_trader.persistence.streaming.engine import extract_generic_data_client_ids
-from nautilus_trader.persistence.streaming.engine import groupby_datatype
+from nautilus_trader.persistence.catalog.shared import SharedCatalogData
+from nautilus_trader.persistence.streaming.engine import generate_data_config_batches
+from nautilus_trader.persistence.streaming.engine import sort_data_configs
 
 
 class BacktestNode:
@@ -51,6 +54,12 @@ class BacktestNode:
     ----------
     configs : list[BacktestRunConfig]
         The backtest run configurations.
+    shared_data : SharedCatalogData, optional
+        The shared catalog data to load data configs from (where shared),
+        rather than querying the catalog.
+    result_store : BacktestResultStore, optional
+        The store of previous results. Configs with a stored result for unchanged
+        catalog data are not re-run, and the results of new runs are stored.
 
     Raises
     ------
@@ -61,7 +70,12 @@ class BacktestNode:
 
     """
 
-    def __init__(self, configs: list[BacktestRunConfig]):
+    def __init__(
+        self,
+        configs: list[BacktestRunConfig],
+        shared_data: SharedCatalogData | None = None,
+        result_store: BacktestResultStore | None = None,
+    ):
         PyCondition.not_none(configs, "configs")
         PyCondition.not_empty(configs, "configs")
         PyCondition.true(
@@ -73,6 +87,8 @@ class BacktestNode:
 
         # Configuration
         self._configs: list[BacktestRunConfig] = configs
+        self._shared_data: SharedCatalogData | None = shared_data
+        self._result_store: BacktestResultStore | None = result_store
         self._engines: dict[str, BacktestEngine] = {}
 
     @property
@@ -114,18 +130,80 @@ class BacktestNode:
         """
         return list(self._engines.values())
 
-    def run(self) -> list[BacktestResult]:
+    def run(
+        self,
+        workers: int | None = None,
+        max_runs_per_worker: int = 1,
+        share_data: bool = False,
+    ) -> list[BacktestResult]:
         """
-        Execute a group of backtest run configs synchronously.
+        Execute a group of backtest run configs.
+
+        By default the configs are run synchronously in this process. If `workers`
+        is specified then each config is run in a separate worker process (in
+        parallel), with the results shipped back in the order of the configs.
+
+        Parameters
+        ----------
+        workers : int, optional
+            The number of worker processes for running configs in parallel.
+            If ``None`` then runs sequentially in this process.
+        max_runs_per_worker : int, default 1
+            The maximum number of configs a worker process will run before it
+            is replaced by a fresh process (bounds the memory held per worker).
+        share_data : bool, default False
+            If the data for each distinct data config should be queried from the
+            catalog once, and shared read-only with all worker processes through
+            memory-mapped Arrow IPC files (only applicable with `workers`).
 
         Returns
         -------
         list[BacktestResult]
             The results of the backtest runs.
 
+        Raises
+        ------
+        ValueError
+            If `workers` is not a positive integer.
+        ValueError
+            If `max_runs_per_worker` is not a positive integer.
+
+        Warnings
+        --------
+        Worker processes are spawned, so any calling script must guard its entry
+        point with ``if __name__ == "__main__":``. Engines are created within the
+        worker processes, and so are not available from `get_engine(...)`.
+        Engines are also not created for configs with a stored result.
+
         """
-        results: list[BacktestResult] = []
-        for config in self._configs:
+        if workers is not None:
+            PyCondition.positive_int(workers, "workers")
+            PyCondition.positive_int(max_runs_per_worker, "max_runs_per_worker")
+
+        configs: list[BacktestRunConfig] = self._configs
+        keys: list[str | None] = [None] * len(configs)
+        results: dict[int, BacktestResult] = {}
+        if self._result_store is not None:
+            for i, key in enumerate(self._result_store.keys(configs)):
+                keys[i] = key
+                stored = self._result_store.load(key)
+                if stored is not None:
+                    results[i] = stored
+
+        pending: list[int] = [i for i in range(len(configs)) if i not in results]
+        if workers is not None and pending:
+            run_results = self._run_parallel(
+                configs=[configs[i] for i in pending],
+                keys=[keys[i] for i in pending],
+                workers=workers,
+                max_runs_per_worker=max_runs_per_worker,
+                share_data=share_data,
+            )
+            results.update(zip(pending, run_results))
+            pending = []
+
+        for i in pending:
+            config = configs[i]
             result = self._run(
                 run_config_id=config.id,
                 engine_config=config.engine,
@@ -133,9 +211,73 @@ class BacktestNode:
                 data_configs=config.data,
                 batch_size_bytes=config.batch_size_bytes,
             )
-            results.append(result)
+            key = keys[i]
+            if self._result_store is not None and key is not None:
+                self._store_result(self._result_store, key, config, result)
+            results[i] = result
 
-        return results
+        return [results[i] for i in range(len(configs))]
+
+    def _store_result(
+        self,
+        result_store: BacktestResultStore,
+        key: str,
+        config: BacktestRunConfig,
+        result: BacktestResult,
+    ) -> None:
+        reports: dict[str, pd.DataFrame] | None = None
+        if result_store.save_reports:
+            engine = self._engines[config.id]
+            reports = {
+                "orders": engine.trader.generate_orders_report(),
+                "order_fills": engine.trader.generate_order_fills_report(),
+                "positions": engine.trader.generate_positions_report(),
+            }
+            for venue_config in config.venues:
+                report = engine.trader.generate_account_report(Venue(venue_config.name))
+                reports[f"account_{venue_config.name}"] = report
+        result_store.save(key, result, reports)
+
+    def _run_parallel(
+        self,
+        configs: list[BacktestRunConfig],
+        keys: list[str | None],
+        workers: int,
+        max_runs_per_worker: int,
+        share_data: bool,
+    ) -> list[BacktestResult]:
+        shared_data = self._shared_data
+        owns_shared_data = False
+        if share_data and shared_data is None:
+            shared_data = SharedCatalogData()
+            owns_shared_data = True
+
+        try:
+            if share_data:
+                for config in configs:
+                    if config.batch_size_bytes is not None:
+                        continue  # Streaming runs read batches directly
+                    for data_config in config.data:
+                        shared_data.add(data_config)
+
+            # Spawn (rather than fork) workers, as forking a process with running
+            # threads and native resources is unsafe
+            context = multiprocessing.get_context("spawn")
+            with context.Pool(
+                processes=min(workers, len(configs)),
+                maxtasksperchild=max_runs_per_worker,
+            ) as pool:
+                return pool.starmap(
+                    _run_config_in_worker,
+                    [
+                        (config, shared_data, self._result_store, key)
+                        for config, key in zip(configs, keys)
+                    ],
+                    chunksize=1,
+                )
+        finally:
+            if owns_shared_data:
+                shared_data.dispose()
 
     def _validate_configs(self, configs: list[BacktestRunConfig]):
         venue_ids: list[Venue] = []
@@ -234,7 +376,6 @@ class BacktestNode:
                 run_config_id=run_config_id,
                 engine=engine,
                 data_configs=data_configs,
-                batch_size_bytes=batch_size_bytes,
             )
         else:
             self._run_oneshot(
@@ -253,29 +394,27 @@ class BacktestNode:
         run_config_id: str,
         engine: BacktestEngine,
         data_configs: list[BacktestDataConfig],
-        batch_size_bytes: int,
     ) -> None:
-        data_client_ids = extract_generic_data_client_ids(data_configs=data_configs)
-
-        streaming_engine = StreamingEngine(
-            data_configs=data_configs,
-            target_batch_size_bytes=batch_size_bytes,
-        )
+        # Add each data config as an independent stream (merged in the engine),
+        # in the order which defines the sequence of objects with the same timestamp.
+        for config in sort_data_configs(data_configs):
+            engine._log.info(
+                f"Streaming {config.data_type} data for instrument={config.instrument_id}.",
+            )
+            batches = generate_data_config_batches(config)
+            if is_nautilus_class(config.data_type):
+                engine.add_data_stream(batches)
+            else:
+                if config.client_id is None:
+                    raise ValueError(
+                        f"Data type {config.data_type} not setup for loading into backtest engine",
+                    )
+                engine.add_data_stream(
+                    batches=_generic_data_batches(batches, DataType(config.data_type)),
+                    client_id=ClientId(config.client_id),
+                )
 
-        for batch in streaming_engine:
-            engine.clear_data()
-            grouped = groupby_datatype(batch)
-            for data in grouped:
-                if data["type"] in data_client_ids:
-                    # Generic data - manually re-add client_id as it gets lost in the streaming join
-                    data.update({"client_id": ClientId(data_client_ids[data["type"]])})
-                    data["data"] = [
-                        GenericData(data_type=DataType(data["type"]), data=d) for d in data["data"]
-                    ]
-                self._load_engine_data(engine=engine, data=data)
-            engine.run(run_config_id=run_config_id, streaming=True)
-
-        engine.end()
+        engine.run(run_config_id=run_config_id)
         engine.dispose()
 
     def _run_oneshot(
@@ -290,6 +429,9 @@ class BacktestNode:
             engine._log.info(
                 f"Reading {config.data_type} data for instrument={config.instrument_id}.",
             )
+            if self._shared_data is not None and self._shared_data.contains(config):
+                self._add_shared_engine_data(engine=engine, config=config)
+                continue
             d = config.load()
             if config.instrument_id and d["instrument"] is None:
                 engine._log.warning(
@@ -311,7 +453,44 @@ class BacktestNode:
         engine.run(run_config_id=run_config_id)
         engine.dispose()
 
+    def _add_shared_engine_data(self, engine: BacktestEngine, config: BacktestDataConfig) -> None:
+        # Stream the shared data into the engine, so only the current batch of
+        # objects is decoded from the memory-mapped table (rather than all of it)
+        d = self._shared_data.load_batches(config, batch_size=config.batch_size)
+        if config.instrument_id and d["instrument"] is None:
+            engine._log.warning(
+                f"Requested instrument_id={config.instrument_id} not found in catalog",
+            )
+            return
+        if not is_nautilus_class(config.data_type) and d["client_id"] is None:
+            raise ValueError(
+                f"Data type {config.data_type} not setup for loading into backtest engine",
+            )
+        engine._log.info(f"Streaming shared {config.data_type} data.")
+        engine.add_data_stream(batches=d["data"], client_id=d["client_id"])
+
     def dispose(self):
         for engine in self.get_engines():
             if not engine.trader.is_disposed:
                 engine.dispose()
+
+
+def _generic_data_batches(batches: Iterator[list], data_type: DataType) -> Iterator[list[GenericData]]:
+    for batch in batches:
+        yield [GenericData(data_type=data_type, data=d) for d in batch]
+
+
+def _run_config_in_worker(
+    config: BacktestRunConfig,
+    shared_data: SharedCatalogData | None,
+    result_store: BacktestResultStore | None = None,
+    key: str | None = None,
+) -> BacktestResult:
+    node = BacktestNode(configs=[config], shared_data=shared_data)
+    try:
+        result = node.run()[0]
+        if result_store is not None and key is not None:
+            node._store_result(result_store, key, config, result)
+        return result
+    finally:
+        node.dispose()
@@ -15,7 +15,18 @@
 
 from __future__ import annotations
 
+import hashlib
+import os
+import pickle
+import shutil
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import pandas as pd
+
+
+if TYPE_CHECKING:
+    from nautilus_trader.config import BacktestRunConfig
 
 
 @dataclass
@@ -59,6 +70,198 @@ class BacktestResult:
     #     return f"{self.__class__.__name__}({self.run_id}, {repr_balance()})"
 
 
+class BacktestResultStore:
+    """
+    Provides an on-disk store of backtest results, keyed by run config and catalog data.
+
+    The key for a run config is a hash of the config ID and the fingerprints of the
+    data catalogs it reads from (the path, size and modified time of every file
+    under each catalog's ``data`` directory). A stored result is therefore only
+    returned for an identical config run over unchanged catalog data.
+
+    Parameters
+    ----------
+    path : str
+        The directory for the stored results.
+    save_reports : bool, default False
+        If the orders, order fills, positions and account reports should be
+        stored along with each result.
+
+    Warnings
+    --------
+    Changes to strategy code (rather than strategy config) are not detected, the
+    store should be cleared when the code for a stored run changes.
+
+    """
+
+    def __init__(self, path: str, save_reports: bool = False):
+        os.makedirs(path, exist_ok=True)
+
+        self._path = path
+        self.save_reports = save_reports
+
+    @property
+    def path(self) -> str:
+        """
+        Return the directory for the stored results.
+
+        Returns
+        -------
+        str
+
+        """
+        return self._path
+
+    def keys(self, configs: list[BacktestRunConfig]) -> list[str]:
+        """
+        Return the store keys for the given run configs.
+
+        Each distinct catalog is fingerprinted once for all `configs`.
+
+        Parameters
+        ----------
+        configs : list[BacktestRunConfig]
+            The run configs for the keys.
+
+        Returns
+        -------
+        list[str]
+
+        """
+        fingerprints: dict[tuple, str] = {}
+        keys: list[str] = []
+        for config in configs:
+            value = hashlib.sha256(config.id.encode())
+            for data_config in config.data:
+                catalog_key = (
+                    data_config.catalog_path,
+                    data_config.catalog_fs_protocol,
+                    repr(sorted((data_config.catalog_fs_storage_options or {}).items())),
+                )
+                if catalog_key not in fingerprints:
+                    fingerprints[catalog_key] = _catalog_fingerprint(data_config.catalog())
+                value.update(fingerprints[catalog_key].encode())
+            keys.append(value.hexdigest())
+        return keys
+
+    def contains(self, key: str) -> bool:
+        """
+        Return a value indicating whether a result is stored for the given key.
+
+        Parameters
+        ----------
+        key : str
+            The store key.
+
+        Returns
+        -------
+        bool
+
+        """
+        return os.path.exists(self._result_path(key))
+
+    def load(self, key: str) -> BacktestResult | None:
+        """
+        Return the stored result for the given key (if found).
+
+        Parameters
+        ----------
+        key : str
+            The store key.
+
+        Returns
+        -------
+        BacktestResult or ``None``
+
+        """
+        if not self.contains(key):
+            return None
+        with open(self._result_path(key), "rb") as f:
+            return pickle.load(f)  # noqa: S301 (written by this store)
+
+    def load_reports(self, key: str) -> dict[str, pd.DataFrame]:
+        """
+        Return the stored reports for the given key.
+
+        Parameters
+        ----------
+        key : str
+            The store key.
+
+        Returns
+        -------
+        dict[str, pd.DataFrame]
+            The reports keyed by name (empty if no reports were stored).
+
+        """
+        reports_dir = os.path.join(self._path, key, "reports")
+        if not self.contains(key) or not os.path.isdir(reports_dir):
+            return {}
+        return {
+            os.path.splitext(name)[0]: pd.read_pickle(os.path.join(reports_dir, name))
+            for name in sorted(os.listdir(reports_dir))
+        }
+
+    def save(
+        self,
+        key: str,
+        result: BacktestResult,
+        reports: dict[str, pd.DataFrame] | None = None,
+    ) -> None:
+        """
+        Store the given result (and reports) for the given key.
+
+        The result is written last, so an interrupted save is never loaded.
+
+        Parameters
+        ----------
+        key : str
+            The store key.
+        result : BacktestResult
+            The result to store.
+        reports : dict[str, pd.DataFrame], optional
+            The reports to store, keyed by name.
+
+        """
+        entry_dir = os.path.join(self._path, key)
+        reports_dir = os.path.join(entry_dir, "reports")
+        if os.path.isdir(reports_dir):
+            shutil.rmtree(reports_dir)
+        os.makedirs(entry_dir, exist_ok=True)
+
+        if reports:
+            os.makedirs(reports_dir)
+            for name, report in reports.items():
+                report.to_pickle(os.path.join(reports_dir, f"{name}.pkl"))
+
+        temp_path = f"{self._result_path(key)}.tmp"
+        with open(temp_path, "wb") as f:
+            pickle.dump(result, f)
+        os.replace(temp_path, self._result_path(key))
+
+    def clear(self) -> None:
+        """
+        Remove all stored results.
+        """
+        for name in os.listdir(self._path):
+            shutil.rmtree(os.path.join(self._path, name), ignore_errors=True)
+
+    def _result_path(self, key: str) -> str:
+        return os.path.join(self._path, key, "result.pkl")
+
+
+def _catalog_fingerprint(catalog) -> str:
+    value = hashlib.sha256()
+    data_path = f"{catalog.path}/data"
+    if catalog.fs.exists(data_path):
+        files = catalog.fs.find(data_path, detail=True)
+        for name in sorted(files):
+            info = files[name]
+            modified = info.get("mtime") or info.get("LastModified") or info.get("created")
+            value.update(f"{name}|{info.get('size')}|{modified}\n".encode())
+    return value.hexdigest()
+
+
 def ensure_plotting(func):
     """
     Decorate a function that require a plotting library.
@@ -16,7 +16,7 @@
 from cpython.datetime cimport datetime
 
 from nautilus_trader.accounting.accounts.base cimport Account
-from nautilus_trader.accounting.calculators cimport ExchangeRateCalculator
+from nautilus_trader.accounting.calculators cimport ExchangeRateGraph
 from nautilus_trader.cache.base cimport CacheFacade
 from nautilus_trader.cache.database cimport CacheDatabase
 from nautilus_trader.common.actor cimport Actor
@@ -52,10 +52,9 @@ from nautilus_trader.trading.strategy cimport Strategy
 cdef class Cache(CacheFacade):
     cdef LoggerAdapter _log
     cdef CacheDatabase _database
-    cdef ExchangeRateCalculator _xrate_calculator
-
     cdef dict _general
     cdef dict _xrate_symbols
+    cdef dict _xrate_graphs
     cdef dict _tickers
     cdef dict _quote_ticks
     cdef dict _trade_ticks
@@ -122,8 +121,12 @@ cdef class Cache(CacheFacade):
     cpdef void clear_index(self)
     cpdef void reset(self)
     cpdef void flush_db(self)
+    cpdef void flush_writes(self)
+    cpdef bint sync_writes(self, double timeout_secs=*)
+    cpdef void close_db(self)
 
-    cdef tuple _build_quote_table(self, Venue venue)
+    cdef ExchangeRateGraph _get_xrate_graph(self, Venue venue)
+    cdef void _update_xrate(self, InstrumentId instrument_id)
     cdef void _build_index_venue_account(self)
     cdef void _cache_venue_account_id(self, AccountId account_id)
     cdef void _build_indexes_from_orders(self)
@@ -26,7 +26,7 @@ from cpython.datetime cimport datetime
 from libc.stdint cimport uint64_t
 
 from nautilus_trader.accounting.accounts.base cimport Account
-from nautilus_trader.accounting.calculators cimport ExchangeRateCalculator
+from nautilus_trader.accounting.calculators cimport ExchangeRateGraph
 from nautilus_trader.cache.base cimport CacheFacade
 from nautilus_trader.common.logging cimport LogColor
 from nautilus_trader.common.logging cimport Logger
@@ -99,7 +99,6 @@ cdef class Cache(CacheFacade):
 
         self._database = database
         self._log = LoggerAdapter(component_name=type(self).__name__, logger=logger)
-        self._xrate_calculator = ExchangeRateCalculator()
 
         # Configuration
         self.tick_capacity = config.tick_capacity
@@ -110,6 +109,7 @@ cdef class Cache(CacheFacade):
         # Caches
         self._general: dict[str, bytes] = {}
         self._xrate_symbols: dict[InstrumentId, str] = {}
+        self._xrate_graphs: dict[Venue, ExchangeRateGraph] = {}
         self._tickers: dict[InstrumentId, deque[Ticker]] = {}
         self._quote_ticks: dict[InstrumentId, deque[QuoteTick]] = {}
         self._trade_ticks: dict[InstrumentId, deque[TradeTick]] = {}
@@ -713,6 +713,7 @@ cdef class Cache(CacheFacade):
 
         self._general.clear()
         self._xrate_symbols.clear()
+        self._xrate_graphs.clear()
         self._tickers.clear()
         self._quote_ticks.clear()
         self._trade_ticks.clear()
@@ -748,6 +749,47 @@ cdef class Cache(CacheFacade):
 
         self._log.info("Execution database flushed.")
 
+    cpdef void flush_writes(self):
+        """
+        Send any writes buffered by the database.
+
+        This should be called at event boundaries, so that all writes resulting
+        from an event are sent together.
+
+        """
+        if self._database is not None:
+            self._database.flush_writes()
+
+    cpdef bint sync_writes(self, double timeout_secs=10.0):
+        """
+        Send any writes buffered by the database, and wait until all writes have
+        been written (a barrier for write-behind databases).
+
+        Parameters
+        ----------
+        timeout_secs : double, default 10.0
+            The maximum time to wait for the writes.
+
+        Returns
+        -------
+        bool
+            True if all writes were written within the timeout.
+
+        """
+        if self._database is None:
+            return True
+
+        return self._database.sync_writes(timeout_secs)
+
+    cpdef void close_db(self):
+        """
+        Close the caches database, writing any pending writes and releasing its
+        resources (such as background threads).
+
+        """
+        if self._database is not None:
+            self._database.close()
+
     cdef void _build_index_venue_account(self):
         cdef AccountId account_id
         for account_id in self._accounts.keys():
@@ -1151,6 +1193,9 @@ cdef class Cache(CacheFacade):
 
         ticks.appendleft(tick)
 
+        if instrument_id in self._xrate_symbols:
+            self._update_xrate(instrument_id)
+
     cpdef void add_trade_tick(self, TradeTick tick):
         """
         Add the given trade tick to the cache.
@@ -1197,8 +1242,10 @@ cdef class Cache(CacheFacade):
         cdef PriceType price_type = <PriceType>bar._mem.bar_type.spec.price_type
         if price_type == PriceType.BID:
             self._bars_bid[bar.bar_type.instrument_id] = bar
+            self._update_xrate(bar.bar_type.instrument_id)
         elif price_type == PriceType.ASK:
             self._bars_ask[bar.bar_type.instrument_id] = bar
+            self._update_xrate(bar.bar_type.instrument_id)
 
     cpdef void add_quote_ticks(self, list ticks):
         """
@@ -1237,6 +1284,8 @@ cdef class Cache(CacheFacade):
         for tick in ticks:
             cached_ticks.appendleft(tick)
 
+        self._update_xrate(instrument_id)
+
     cpdef void add_trade_ticks(self, list ticks):
         """
         Add the given trade ticks to the cache.
@@ -1315,8 +1364,10 @@ cdef class Cache(CacheFacade):
         cdef PriceType price_type = <PriceType>bar._mem.bar_type.spec.price_type
         if price_type == PriceType.BID:
             self._bars_bid[bar.bar_type.instrument_id] = bar
+            self._update_xrate(bar.bar_type.instrument_id)
         elif price_type == PriceType.ASK:
             self._bars_ask[bar.bar_type.instrument_id] = bar
+            self._update_xrate(bar.bar_type.instrument_id)
 
     cpdef void add_currency(self, Currency currency):
         """
@@ -1355,6 +1406,7 @@ cdef class Cache(CacheFacade):
             self._xrate_symbols[instrument.id] = (
                 f"{instrument.base_currency}/{instrument.quote_currency}"
             )
+            self._update_xrate(instrument.id)
 
         self._log.debug(f"Added instrument {instrument.id}.")
 
@@ -2425,48 +2477,49 @@ cdef class Cache(CacheFacade):
         if from_currency == to_currency:
             return Decimal(1)  # No conversion necessary
 
-        cdef tuple quotes = self._build_quote_table(venue)
-
-        return self._xrate_calculator.get_rate(
+        return self._get_xrate_graph(venue).get_rate(
             from_currency=from_currency,
             to_currency=to_currency,
             price_type=price_type,
-            bid_quotes=quotes[0],  # Bid
-            ask_quotes=quotes[1],  # Ask
         )
 
-    cdef tuple _build_quote_table(self, Venue venue):
-        cdef dict bid_quotes = {}
-        cdef dict ask_quotes = {}
+    cdef ExchangeRateGraph _get_xrate_graph(self, Venue venue):
+        cdef ExchangeRateGraph graph = self._xrate_graphs.get(venue)
+        if graph is None:
+            graph = ExchangeRateGraph()
+            self._xrate_graphs[venue] = graph
+
+        return graph
+
+    cdef void _update_xrate(self, InstrumentId instrument_id):
+        # Update the exchange rate graph for the venue with the latest prices
+        cdef str base_quote = self._xrate_symbols.get(instrument_id)
+        if base_quote is None:
+            return  # Not an exchange rate instrument
 
         cdef:
-            InstrumentId instrument_id
-            str base_quote
             Price bid
             Price ask
             Bar bid_bar
             Bar ask_bar
-        for instrument_id, base_quote in self._xrate_symbols.items():
-            if instrument_id.venue != venue:
-                continue
-
-            ticks = self._quote_ticks.get(instrument_id)
-            if ticks:
-                bid = ticks[0].bid
-                ask = ticks[0].ask
-            else:
-                # No quotes for instrument_id
-                bid_bar = self._bars_bid.get(instrument_id)
-                ask_bar = self._bars_ask.get(instrument_id)
-                if bid_bar is None or ask_bar is None:
-                    continue # No prices for instrument_id
-                bid = bid_bar.close
-                ask = ask_bar.close
-
-            bid_quotes[base_quote] = bid.as_f64_c()
-            ask_quotes[base_quote] = ask.as_f64_c()
-
-        return bid_quotes, ask_quotes
+        ticks = self._quote_ticks.get(instrument_id)
+        if ticks:
+            bid = ticks[0].bid
+            ask = ticks[0].ask
+        else:
+            # No quotes for instrument_id
+            bid_bar = self._bars_bid.get(instrument_id)
+            ask_bar = self._bars_ask.get(instrument_id)
+            if bid_bar is None or ask_bar is None:
+                return  # No prices for instrument_id
+            bid = bid_bar.close
+            ask = ask_bar.close
+
+        self._get_xrate_graph(instrument_id.venue).update(
+            base_quote,
+            bid.as_f64_c(),
+            ask.as_f64_c(),
+        )
 
 # -- INSTRUMENT QUERIES ---------------------------------------------------------------------------
 
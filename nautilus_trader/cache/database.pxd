@@ -81,3 +81,7 @@ cdef class CacheDatabase:
     cpdef void snapshot_position_state(self, Position position, Money unrealized_pnl=*)
 
     cpdef void heartbeat(self, datetime timestamp)
+
+    cpdef void flush_writes(self)
+    cpdef bint sync_writes(self, double timeout_secs=*)
+    cpdef void close(self)
@@ -203,3 +203,45 @@ cdef class CacheDatabase:
     cpdef void heartbeat(self, datetime timestamp):
         """Abstract method (implement in subclass)."""
         raise NotImplementedError("method must be implemented in the subclass")  # pragma: no cover
+
+    cpdef void flush_writes(self):
+        """
+        Send any buffered writes to the database.
+
+        Called at event boundaries, the default implementation does nothing
+        (override if the database buffers writes).
+
+        """
+        pass
+
+    cpdef bint sync_writes(self, double timeout_secs=10.0):
+        """
+        Send any buffered writes, and wait until all writes have been written to
+        the database.
+
+        The default implementation only calls `flush_writes` (override if the
+        database writes asynchronously).
+
+        Parameters
+        ----------
+        timeout_secs : double, default 10.0
+            The maximum time to wait for the writes.
+
+        Returns
+        -------
+        bool
+            True if all writes were written within the timeout.
+
+        """
+        self.flush_writes()
+        return True
+
+    cpdef void close(self):
+        """
+        Close the database, releasing any resources (such as background threads).
+
+        The default implementation only calls `sync_writes` (override if the
+        database holds resources).
+
+        """
+        self.sync_writes()
@@ -0,0 +1,423 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2023 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import threading
+import time
+from typing import Any
+from typing import Callable
+from typing import Optional
+
+from nautilus_trader.common.logging import Logger
+from nautilus_trader.common.logging import LoggerAdapter
+from nautilus_trader.core.correctness import PyCondition
+
+
+WRITE_SET = "set"
+WRITE_HSET = "hset"
+WRITE_RPUSH = "rpush"
+WRITE_DELETE = "delete"
+
+# A command is a mutable [op, payload] pair, so it can be coalesced in place
+Commands = dict[str, list[list]]
+
+
+class WriteBehindQueue:
+    """
+    Provides a bounded write-behind queue for cache database writes.
+
+    Writes are staged on the calling thread, and committed at explicit flush
+    points (e.g. event boundaries). Committed writes are drained by a background
+    thread, which passes them to the `writer` in batches.
+
+    Repeated writes to the same key are coalesced while they are waiting:
+
+    - `set` replaces a pending `set` value.
+    - `hset` merges its mapping into a pending `hset` mapping.
+    - `rpush` appends its value to the values of a pending `rpush`.
+    - `delete` supersedes all pending writes to the key.
+
+    The order of writes for each key is always preserved.
+
+    Parameters
+    ----------
+    writer : Callable[[dict[str, list[list]]], None]
+        The callable which writes a batch of commands (keyed commands in order,
+        each command an [op, payload] pair). Called on the background thread.
+        If the writer raises then the batch is retried.
+    logger : Logger
+        The logger for the queue.
+    maxsize : int, default 100_000
+        The maximum number of committed writes (waiting or in-flight) before
+        `put` blocks until the writer catches up. Staged writes are not bounded
+        (they are only released by a `commit` from the staging thread), so the
+        caller should commit at least every `maxsize` writes.
+    retry_delay_secs : float, default 1.0
+        The delay before retrying a failed batch.
+
+    Raises
+    ------
+    ValueError
+        If `maxsize` is not positive (> 0).
+    ValueError
+        If `retry_delay_secs` is negative (< 0).
+
+    """
+
+    def __init__(
+        self,
+        writer: Callable[[Commands], None],
+        logger: Logger,
+        maxsize: int = 100_000,
+        retry_delay_secs: float = 1.0,
+    ) -> None:
+        PyCondition.callable(writer, "writer")
+        PyCondition.positive_int(maxsize, "maxsize")
+        PyCondition.not_negative(retry_delay_secs, "retry_delay_secs")
+
+        self._writer = writer
+        self._log = LoggerAdapter(component_name=type(self).__name__, logger=logger)
+        self._maxsize = maxsize
+        self._retry_delay_secs = retry_delay_secs
+
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._is_running = False
+
+        self._staged: Commands = {}
+        self._pending: Commands = {}
+        self._staged_count = 0
+        self._pending_count = 0
+        self._inflight_count = 0
+        self._ts_pending: Optional[int] = None  # Monotonic ns of the oldest pending commit
+        self._ts_inflight: Optional[int] = None  # Monotonic ns of the oldest in-flight commit
+
+        # Metrics
+        self._max_depth = 0
+        self._written_count = 0
+        self._coalesced_count = 0
+        self._error_count = 0
+
+    @property
+    def is_running(self) -> bool:
+        """
+        Return whether the background writer thread is running.
+
+        Returns
+        -------
+        bool
+
+        """
+        return self._is_running
+
+    @property
+    def depth(self) -> int:
+        """
+        Return the number of writes not yet written (staged, committed or in-flight).
+
+        Returns
+        -------
+        int
+
+        """
+        with self._cond:
+            return self._depth()
+
+    @property
+    def staged(self) -> int:
+        """
+        Return the number of writes staged since the last commit.
+
+        Returns
+        -------
+        int
+
+        """
+        return self._staged_count
+
+    @property
+    def max_depth(self) -> int:
+        """
+        Return the maximum depth the queue has reached.
+
+        Returns
+        -------
+        int
+
+        """
+        return self._max_depth
+
+    @property
+    def lag_ns(self) -> int:
+        """
+        Return the age (nanoseconds) of the oldest committed write not yet written.
+
+        Returns
+        -------
+        int
+
+        """
+        with self._cond:
+            ts_oldest = self._ts_inflight if self._ts_inflight is not None else self._ts_pending
+            if ts_oldest is None:
+                return 0
+            return time.monotonic_ns() - ts_oldest
+
+    @property
+    def written_count(self) -> int:
+        """
+        Return the total number of writes written.
+
+        Returns
+        -------
+        int
+
+        """
+        return self._written_count
+
+    @property
+    def coalesced_count(self) -> int:
+        """
+        Return the total number of writes coalesced into a pending command.
+
+        Returns
+        -------
+        int
+
+        """
+        return self._coalesced_count
+
+    @property
+    def error_count(self) -> int:
+        """
+        Return the total number of failed batch writes (which were retried).
+
+        Returns
+        -------
+        int
+
+        """
+        return self._error_count
+
+    def start(self) -> None:
+        """
+        Start the background writer thread.
+        """
+        with self._cond:
+            if self._is_running:
+                return
+            self._is_running = True
+            self._thread = threading.Thread(
+                target=self._run,
+                name=type(self).__name__,
+                daemon=True,
+            )
+            self._thread.start()
+
+    def stop(self, timeout_secs: Optional[float] = None) -> bool:
+        """
+        Commit all staged writes, wait for them to be written, then stop the
+        background writer thread.
+
+        Parameters
+        ----------
+        timeout_secs : float, optional
+            The maximum time to wait for the writes. If ``None`` then waits
+            until all writes are written.
+
+        Returns
+        -------
+        bool
+            True if all writes were written before stopping.
+
+        """
+        self.commit()
+        is_synced = self.sync(timeout_secs)
+
+        with self._cond:
+            self._is_running = False
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout_secs)
+            self._thread = None
+
+        return is_synced
+
+    def put(self, key: str, op: str, payload: Any) -> None:
+        """
+        Stage the given write (to be committed at the next flush point).
+
+        Blocks while the committed writes are at `maxsize` (back pressure).
+
+        Parameters
+        ----------
+        key : str
+            The key to write to.
+        op : str {'set', 'hset', 'rpush', 'delete'}
+            The write operation.
+        payload : object
+            The value (`set`, `rpush`), mapping (`hset`) or ``None`` (`delete`).
+
+        """
+        with self._cond:
+            # Only committed writes count towards the bound, as staged writes are
+            # released by a commit from this (the blocked) thread
+            if self._backlog() >= self._maxsize:
+                self._log.warning(f"Queue full at {self._maxsize} writes, waiting for writer...")
+                while self._backlog() >= self._maxsize and self._is_running:
+                    self._cond.wait()
+
+            if op == WRITE_RPUSH:
+                payload = [payload]
+            elif op == WRITE_HSET:
+                payload = dict(payload)
+            if _coalesce(self._staged, key, op, payload):
+                self._coalesced_count += 1
+            self._staged_count += 1
+            self._max_depth = max(self._max_depth, self._depth())
+
+    def commit(self) -> None:
+        """
+        Commit all staged writes for the background writer (a flush point).
+        """
+        with self._cond:
+            if not self._staged_count:
+                return
+
+            for key, commands in self._staged.items():
+                for op, payload in commands:
+                    if _coalesce(self._pending, key, op, payload):
+                        self._coalesced_count += 1
+            if self._ts_pending is None:
+                self._ts_pending = time.monotonic_ns()
+            self._pending_count += self._staged_count
+            self._staged = {}
+            self._staged_count = 0
+            self._cond.notify_all()
+
+    def sync(self, timeout_secs: Optional[float] = None) -> bool:
+        """
+        Wait until all committed writes have been written (a barrier).
+
+        Staged writes are not committed (call `commit` first).
+
+        Parameters
+        ----------
+        timeout_secs : float, optional
+            The maximum time to wait. If ``None`` then waits until all writes
+            are written.
+
+        Returns
+        -------
+        bool
+            True if all committed writes were written within the timeout.
+
+        """
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: not self._pending_count and not self._inflight_count,
+                timeout_secs,
+            )
+
+    def clear(self) -> None:
+        """
+        Discard all staged and committed writes, and wait for any in-flight
+        batch to complete.
+        """
+        with self._cond:
+            self._staged = {}
+            self._pending = {}
+            self._staged_count = 0
+            self._pending_count = 0
+            self._ts_pending = None
+            self._cond.notify_all()
+            self._cond.wait_for(lambda: not self._inflight_count)
+
+    def _depth(self) -> int:
+        return self._staged_count + self._backlog()
+
+    def _backlog(self) -> int:
+        return self._pending_count + self._inflight_count
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._pending_count or not self._is_running)
+                if not self._pending_count:
+                    return  # Stopped
+
+                batch = self._pending
+                self._pending = {}
+                self._inflight_count = self._pending_count
+                self._pending_count = 0
+                self._ts_inflight = self._ts_pending
+                self._ts_pending = None
+
+            try:
+                self._writer(batch)
+            except Exception as e:
+                self._log.error(f"Error writing batch of {self._inflight_count} writes (will retry): {e!r}")
+                with self._cond:
+                    self._error_count += 1
+                    self._requeue(batch)
+                time.sleep(self._retry_delay_secs)
+                continue
+
+            with self._cond:
+                self._written_count += self._inflight_count
+                self._inflight_count = 0
+                self._ts_inflight = None
+                self._cond.notify_all()
+
+    def _requeue(self, batch: Commands) -> None:
+        # The failed batch is older than any pending writes, so goes in front
+        for key, commands in self._pending.items():
+            for op, payload in commands:
+                _coalesce(batch, key, op, payload)
+        self._pending = batch
+        self._pending_count += self._inflight_count
+        self._inflight_count = 0
+        if self._ts_inflight is not None:
+            self._ts_pending = self._ts_inflight
+        self._ts_inflight = None
+
+
+def _coalesce(commands: Commands, key: str, op: str, payload: Any) -> bool:
+    # Add the command for the key, returns whether it was coalesced
+    key_commands = commands.get(key)
+    if key_commands is None:
+        commands[key] = [[op, payload]]
+        return False
+
+    if op == WRITE_DELETE:
+        key_commands.clear()
+        key_commands.append([op, payload])
+        return True
+
+    last = key_commands[-1]
+    if last[0] != op:
+        key_commands.append([op, payload])
+        return False
+
+    if op == WRITE_SET:
+        last[1] = payload
+    elif op == WRITE_HSET:
+        last[1].update(payload)
+    elif op == WRITE_RPUSH:
+        last[1].extend(payload)
+    else:
+        key_commands.append([op, payload])
+        return False
+
+    return True
@@ -38,3 +38,14 @@ class Environment(Enum):
     BACKTEST = "backtest"
     SANDBOX = "sandbox"
     LIVE = "live"
+
+
+@unique
+class QueueOverflowPolicy(Enum):
+    """
+    Represents the policy for handling messages when a live engine queue is full.
+    """
+
+    BLOCK = "block"
+    DROP_OLDEST = "drop_oldest"
+    COALESCE = "coalesce"
@@ -70,7 +70,16 @@ cdef class Clock:
 
 cdef class TestClock(Clock):
     cdef TestClock_API _mem
+    cdef TestClock _time_source
+    cdef list _timer_changes
+    cdef bint _is_timers_changed
 
+    cdef void _sync_time(self)
+    cdef void _on_timers_changed(self)
+    cdef void register_timer_changes(self, list timer_changes)
+    cdef void reset_timers_changed(self)
+    cpdef void set_time_source(self, TestClock source=*)
+    cpdef uint64_t next_event_time_ns(self)
     cpdef void set_time(self, uint64_t to_time_ns)
     cdef CVec advance_time_c(self, uint64_t to_time_ns, bint set_time=*)
     cpdef list advance_time(self, uint64_t to_time_ns, bint set_time=*)
@@ -437,12 +437,18 @@ cdef class TestClock(Clock):
     """
     Provides a monotonic clock for backtesting and unit testing.
 
+    A clock can read its time from another `TestClock` (a shared time source),
+    so that many clocks are moved forward by setting the time on the source alone.
+
     """
 
     __test__ = False  # Required so pytest does not consider this a test class
 
     def __init__(self):
         self._mem = test_clock_new()
+        self._time_source = None
+        self._timer_changes = None
+        self._is_timers_changed = False
 
     def __del__(self) -> None:
         if self._mem._0 != NULL:
@@ -457,14 +463,83 @@ cdef class TestClock(Clock):
         return test_clock_timer_count(&self._mem)
 
     cpdef double timestamp(self):
+        if self._time_source is not None:
+            return test_clock_timestamp(&self._time_source._mem)
         return test_clock_timestamp(&self._mem)
 
     cpdef uint64_t timestamp_ms(self):
+        if self._time_source is not None:
+            return test_clock_timestamp_ms(&self._time_source._mem)
         return test_clock_timestamp_ms(&self._mem)
 
     cpdef uint64_t timestamp_ns(self):
+        if self._time_source is not None:
+            return test_clock_timestamp_ns(&self._time_source._mem)
         return test_clock_timestamp_ns(&self._mem)
 
+    cpdef void set_time_source(self, TestClock source = None):
+        """
+        Set the clock to read its time from the given `source` clock.
+
+        Timers remain with this clock, and are only advanced by `advance_time`.
+
+        Parameters
+        ----------
+        source : TestClock, optional
+            The clock to read the time from. If ``None`` then the clock reads
+            its own time (the time of the previous source is retained).
+
+        Raises
+        ------
+        ValueError
+            If `source` is this clock.
+
+        """
+        Condition.true(source is not self, "`source` was this clock")
+
+        if source is None:
+            self._sync_time()
+        self._time_source = source
+
+    cdef void _sync_time(self):
+        # Bring the internal time up to the source time (before timer operations)
+        if self._time_source is not None:
+            test_clock_set_time(&self._mem, test_clock_timestamp_ns(&self._time_source._mem))
+
+    cdef void _on_timers_changed(self):
+        if self._timer_changes is not None and not self._is_timers_changed:
+            self._is_timers_changed = True
+            self._timer_changes.append(self)
+
+    cdef void register_timer_changes(self, list timer_changes):
+        # The clock appends itself to `timer_changes` when its timers change
+        # (once, until `reset_timers_changed` is called).
+        self._timer_changes = timer_changes
+        self._is_timers_changed = False
+
+    cdef void reset_timers_changed(self):
+        self._is_timers_changed = False
+
+    cpdef uint64_t next_event_time_ns(self):
+        """
+        Return the time of the next event from all *active* timers.
+
+        Returns
+        -------
+        uint64_t
+            Zero if there are no active timers.
+
+        """
+        cdef uint64_t next_time_ns = 0
+        cdef uint64_t timer_next_ns
+        cdef str name
+        for name in <list>test_clock_timer_names(&self._mem):
+            timer_next_ns = test_clock_next_time_ns(&self._mem, pystr_to_cstr(name))
+            if next_time_ns == 0 or timer_next_ns < next_time_ns:
+                next_time_ns = timer_next_ns
+
+        return next_time_ns
+
     cpdef void register_default_handler(self, callback: Callable[[TimeEvent], None]):
         Condition.callable(callback, "callback")
 
@@ -479,12 +554,14 @@ cdef class TestClock(Clock):
         Condition.valid_string(name, "name")
         Condition.not_in(name, self.timer_names, "name", "self.timer_names")
 
+        self._sync_time()
         test_clock_set_time_alert_ns(
             &self._mem,
             pystr_to_cstr(name),
             alert_time_ns,
             <PyObject *>callback,
         )
+        self._on_timers_changed()
 
     cpdef void set_timer_ns(
         self,
@@ -505,6 +582,7 @@ cdef class TestClock(Clock):
             Condition.true(stop_time_ns > ts_now, "`stop_time_ns` was < `ts_now`")
             Condition.true(start_time_ns + interval_ns <= stop_time_ns, "`start_time_ns` + `interval_ns` was > `stop_time_ns`")
 
+        self._sync_time()
         test_clock_set_timer_ns(
             &self._mem,
             pystr_to_cstr(name),
@@ -513,6 +591,7 @@ cdef class TestClock(Clock):
             stop_time_ns,
             <PyObject *>callback,
         )
+        self._on_timers_changed()
 
     cpdef uint64_t next_time_ns(self, str name):
         Condition.valid_string(name, "name")
@@ -523,14 +602,19 @@ cdef class TestClock(Clock):
         Condition.is_in(name, self.timer_names, "name", "self.timer_names")
 
         test_clock_cancel_timer(&self._mem, pystr_to_cstr(name))
+        self._on_timers_changed()
 
     cpdef void cancel_timers(self):
         test_clock_cancel_timers(&self._mem)
+        self._on_timers_changed()
 
     cpdef void set_time(self, uint64_t to_time_ns):
         """
         Set the clocks datetime to the given time (UTC).
 
+        If the clock has a time source then only the internal time of this
+        clock is set (its time is still read from the source).
+
         Parameters
         ----------
         to_time_ns : uint64_t
@@ -540,9 +624,12 @@ cdef class TestClock(Clock):
         test_clock_set_time(&self._mem, to_time_ns)
 
     cdef CVec advance_time_c(self, uint64_t to_time_ns, bint set_time=True):
+        self._sync_time()
         Condition.true(to_time_ns >= test_clock_timestamp_ns(&self._mem), "to_time_ns was < time_ns (not monotonic)")
 
-        return <CVec>test_clock_advance_time(&self._mem, to_time_ns, set_time)
+        cdef CVec raw_handler_vec = <CVec>test_clock_advance_time(&self._mem, to_time_ns, set_time)
+        self._on_timers_changed()
+        return raw_handler_vec
 
     cpdef list advance_time(self, uint64_t to_time_ns, bint set_time=True):
         """
@@ -0,0 +1,63 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2023 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from libc.stdint cimport uint64_t
+
+
+cdef enum:
+    HISTOGRAM_BUCKETS = 252
+
+
+cdef class LatencyHistogram:
+    cdef uint64_t _buckets[HISTOGRAM_BUCKETS]
+
+    cdef readonly str name
+    """The name of the histogram.\n\n:returns: `str`"""
+    cdef readonly uint64_t count
+    """The count of recorded samples.\n\n:returns: `int`"""
+    cdef readonly uint64_t total_ns
+    """The sum of all recorded samples (nanoseconds).\n\n:returns: `int`"""
+    cdef readonly uint64_t min_ns
+    """The minimum recorded sample (nanoseconds).\n\n:returns: `int`"""
+    cdef readonly uint64_t max_ns
+    """The maximum recorded sample (nanoseconds).\n\n:returns: `int`"""
+
+    cdef void record_c(self, uint64_t elapsed_ns)
+    cpdef void record(self, uint64_t elapsed_ns)
+    cpdef double mean_ns(self)
+    cpdef uint64_t percentile_ns(self, double q)
+    cpdef dict to_dict(self)
+    cpdef void reset(self)
+
+
+cdef class Profiler:
+    cdef dict _histograms
+    cdef dict _handler_names
+    cdef dict _send_names
+
+    cpdef uint64_t timestamp_ns(self)
+    cdef LatencyHistogram histogram_c(self, str name)
+    cdef void record_c(self, str name, uint64_t elapsed_ns)
+    cdef void record_handler_c(self, handler, uint64_t elapsed_ns)
+    cdef void record_send_c(self, str endpoint, uint64_t elapsed_ns)
+    cpdef void record(self, str name, uint64_t elapsed_ns)
+    cpdef LatencyHistogram histogram(self, str name)
+    cpdef list names(self)
+    cpdef dict snapshot(self)
+    cpdef str summary(self, int limit=*)
+    cpdef void reset(self)
+
+
+cpdef str handler_name(handler)
@@ -0,0 +1,385 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2023 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from operator import attrgetter
+from time import perf_counter_ns
+from types import ModuleType
+
+from libc.math cimport ceil
+from libc.stdint cimport UINT64_MAX
+from libc.stdint cimport uint64_t
+from libc.string cimport memset
+
+from nautilus_trader.core.correctness cimport Condition
+
+
+cdef inline int _bucket_index(uint64_t value) nogil:
+    # Log-linear bucketing: each power of two is split into four sub-buckets,
+    # bounding the relative error of any reported percentile to 25%.
+    if value < 4:
+        return <int>value
+    cdef int msb = 0
+    cdef uint64_t v = value
+    while v > 1:
+        v >>= 1
+        msb += 1
+    return 4 * (msb - 1) + <int>((value >> (msb - 2)) & 3)
+
+
+cdef inline uint64_t _bucket_upper(int index) nogil:
+    if index < 4:
+        return <uint64_t>index
+    cdef int msb = index // 4 + 1
+    cdef uint64_t sub = <uint64_t>(index % 4)
+    return ((4 + sub) << (msb - 2)) + ((<uint64_t>1) << (msb - 2)) - 1
+
+
+cdef str _format_ns(double value_ns):
+    if value_ns < 1_000:
+        return f"{value_ns:.0f}ns"
+    elif value_ns < 1_000_000:
+        return f"{value_ns / 1_000:.1f}us"
+    elif value_ns < 1_000_000_000:
+        return f"{value_ns / 1_000_000:.1f}ms"
+    return f"{value_ns / 1_000_000_000:.2f}s"
+
+
+cdef class LatencyHistogram:
+    """
+    Provides a fixed size log-linear histogram of latency samples (nanoseconds).
+
+    Recording a sample is constant time with no allocation, and percentiles are
+    reported as the upper bound of the bucket which contains them.
+
+    Parameters
+    ----------
+    name : str
+        The name of the histogram.
+
+    Raises
+    ------
+    ValueError
+        If `name` is not a valid string.
+
+    """
+
+    def __init__(self, str name not None):
+        Condition.valid_string(name, "name")
+
+        self.name = name
+        self.reset()
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}("
+            f"name={self.name}, "
+            f"count={self.count}, "
+            f"mean={_format_ns(self.mean_ns())}, "
+            f"max={_format_ns(self.max_ns)})"
+        )
+
+    cdef void record_c(self, uint64_t elapsed_ns):
+        self._buckets[_bucket_index(elapsed_ns)] += 1
+        self.count += 1
+        self.total_ns += elapsed_ns
+        if elapsed_ns < self.min_ns:
+            self.min_ns = elapsed_ns
+        if elapsed_ns > self.max_ns:
+            self.max_ns = elapsed_ns
+
+    cpdef void record(self, uint64_t elapsed_ns):
+        """
+        Record the given elapsed time sample.
+
+        Parameters
+        ----------
+        elapsed_ns : uint64_t
+            The elapsed time (nanoseconds).
+
+        """
+        self.record_c(elapsed_ns)
+
+    cpdef double mean_ns(self):
+        """
+        Return the mean of the recorded samples (nanoseconds).
+
+        Returns
+        -------
+        double
+
+        """
+        if self.count == 0:
+            return 0.0
+        return <double>self.total_ns / <double>self.count
+
+    cpdef uint64_t percentile_ns(self, double q):
+        """
+        Return the approximate `q` percentile of the recorded samples (nanoseconds).
+
+        Parameters
+        ----------
+        q : double
+            The percentile to return, in the range [0, 1].
+
+        Returns
+        -------
+        uint64_t
+
+        Raises
+        ------
+        ValueError
+            If `q` is not in range [0, 1].
+
+        """
+        Condition.in_range(q, 0.0, 1.0, "q")
+
+        if self.count == 0:
+            return 0
+
+        cdef uint64_t rank = <uint64_t>ceil(q * <double>self.count)
+        if rank == 0:
+            rank = 1
+
+        cdef uint64_t seen = 0
+        cdef int i
+        for i in range(HISTOGRAM_BUCKETS):
+            seen += self._buckets[i]
+            if seen >= rank:
+                return min(_bucket_upper(i), self.max_ns)
+
+        return self.max_ns  # Pragma: no cover (unreachable)
+
+    cpdef dict to_dict(self):
+        """
+        Return a dictionary summary of the histogram.
+
+        Returns
+        -------
+        dict[str, object]
+
+        """
+        return {
+            "count": self.count,
+            "total_ns": self.total_ns,
+            "mean_ns": self.mean_ns(),
+            "min_ns": self.min_ns if self.count > 0 else 0,
+            "p50_ns": self.percentile_ns(0.50),
+            "p90_ns": self.percentile_ns(0.90),
+            "p99_ns": self.percentile_ns(0.99),
+            "max_ns": self.max_ns,
+        }
+
+    cpdef void reset(self):
+        """
+        Reset the histogram by clearing all recorded samples.
+
+        """
+        memset(self._buckets, 0, sizeof(self._buckets))
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = UINT64_MAX
+        self.max_ns = 0
+
+
+cdef class Profiler:
+    """
+    Provides per-component latency histograms for hot-path instrumentation.
+
+    Samples are keyed by name, where the system instrumentation uses the
+    following prefixes:
+     - `handler:` for message bus subscription handler invocations, named by
+       the handler owner ID (or type) and method, e.g. `handler:EMACross-000.handle_bar`.
+     - `send:` for message bus point-to-point sends, named by endpoint address.
+     - `engine:` for the engine entry points, e.g. `engine:DataEngine.process`.
+
+    Timings are inclusive, so a strategy handler publishing further messages
+    includes the time of the nested handlers.
+
+    Warnings
+    --------
+    This profiler is not thread-safe and must be called from the same thread as
+    the event loop.
+
+    """
+
+    def __init__(self):
+        self._histograms: dict[str, LatencyHistogram] = {}
+        self._handler_names: dict[object, str] = {}
+        self._send_names: dict[str, str] = {}
+
+    cpdef uint64_t timestamp_ns(self):
+        """
+        Return the current monotonic timestamp (nanoseconds) for timing samples.
+
+        Returns
+        -------
+        uint64_t
+
+        """
+        return perf_counter_ns()
+
+    cdef LatencyHistogram histogram_c(self, str name):
+        cdef LatencyHistogram histogram = self._histograms.get(name)
+        if histogram is None:
+            histogram = LatencyHistogram(name)
+            self._histograms[name] = histogram
+        return histogram
+
+    cdef void record_c(self, str name, uint64_t elapsed_ns):
+        self.histogram_c(name).record_c(elapsed_ns)
+
+    cdef void record_handler_c(self, handler, uint64_t elapsed_ns):
+        cdef str name = self._handler_names.get(handler)
+        if name is None:
+            name = f"handler:{handler_name(handler)}"
+            self._handler_names[handler] = name
+        self.histogram_c(name).record_c(elapsed_ns)
+
+    cdef void record_send_c(self, str endpoint, uint64_t elapsed_ns):
+        cdef str name = self._send_names.get(endpoint)
+        if name is None:
+            name = f"send:{endpoint}"
+            self._send_names[endpoint] = name
+        self.histogram_c(name).record_c(elapsed_ns)
+
+    cpdef void record(self, str name, uint64_t elapsed_ns):
+        """
+        Record the given elapsed time sample for the given name.
+
+        Parameters
+        ----------
+        name : str
+            The name of the instrumented component or call.
+        elapsed_ns : uint64_t
+            The elapsed time (nanoseconds).
+
+        """
+        Condition.not_none(name, "name")
+
+        self.histogram_c(name).record_c(elapsed_ns)
+
+    cpdef LatencyHistogram histogram(self, str name):
+        """
+        Return the histogram for the given name (if found).
+
+        Parameters
+        ----------
+        name : str
+            The name of the histogram.
+
+        Returns
+        -------
+        LatencyHistogram or ``None``
+
+        """
+        return self._histograms.get(name)
+
+    cpdef list names(self):
+        """
+        Return the names of all recorded histograms.
+
+        Returns
+        -------
+        list[str]
+
+        """
+        return sorted(self._histograms.keys())
+
+    cpdef dict snapshot(self):
+        """
+        Return a dictionary summary of every histogram keyed by name.
+
+        Returns
+        -------
+        dict[str, dict[str, object]]
+
+        """
+        cdef LatencyHistogram histogram
+        return {
+            name: histogram.to_dict()
+            for name, histogram in sorted(self._histograms.items())
+        }
+
+    cpdef str summary(self, int limit = 0):
+        """
+        Return a human readable summary table of the histograms, sorted by the
+        total time recorded (descending).
+
+        Parameters
+        ----------
+        limit : int, default 0
+            The maximum number of histograms to include (zero for all).
+
+        Returns
+        -------
+        str
+
+        """
+        cdef list histograms = sorted(
+            self._histograms.values(),
+            key=attrgetter("total_ns"),
+            reverse=True,
+        )
+        if limit > 0:
+            histograms = histograms[:limit]
+
+        cdef list lines = []
+        cdef LatencyHistogram h
+        for h in histograms:
+            lines.append(
+                f"{h.name}: "
+                f"count={h.count:,}, "
+                f"total={_format_ns(h.total_ns)}, "
+                f"mean={_format_ns(h.mean_ns())}, "
+                f"p50={_format_ns(h.percentile_ns(0.50))}, "
+                f"p99={_format_ns(h.percentile_ns(0.99))}, "
+                f"max={_format_ns(h.max_ns)}",
+            )
+
+        return "\n".join(lines)
+
+    cpdef void reset(self):
+        """
+        Reset the profiler by clearing all histograms.
+
+        """
+        self._histograms.clear()
+
+
+cpdef str handler_name(handler):
+    """
+    Return the profiling name for the given handler.
+
+    Bound methods are named by the ID of their owner (falling back to the owner
+    type name) and the method name, e.g. `EMACross-000.handle_bar`.
+
+    Parameters
+    ----------
+    handler : Callable
+        The handler to name.
+
+    Returns
+    -------
+    str
+
+    """
+    cdef str method = getattr(handler, "__name__", None) or type(handler).__name__
+    owner = getattr(handler, "__self__", None)
+    if owner is None or isinstance(owner, (type, ModuleType)):
+        return getattr(handler, "__qualname__", None) or method
+
+    owner_id = getattr(owner, "id", None)
+    cdef str owner_name = str(owner_id) if owner_id is not None else type(owner).__name__
+    return f"{owner_name}.{method}"
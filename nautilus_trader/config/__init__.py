@@ -40,6 +40,7 @@ from nautilus_trader.config.common import InstrumentProviderConfig
 from nautilus_trader.config.common import LoggingConfig
 from nautilus_trader.config.common import NautilusKernelConfig
 from nautilus_trader.config.common import OrderEmulatorConfig
+from nautilus_trader.config.common import ProfilingConfig
 from nautilus_trader.config.common import RiskEngineConfig
 from nautilus_trader.config.common import StrategyConfig
 from nautilus_trader.config.common import StrategyFactory
@@ -74,6 +75,7 @@ __all__ = [
     "LoggingConfig",
     "NautilusKernelConfig",
     "OrderEmulatorConfig",
+    "ProfilingConfig",
     "RiskEngineConfig",
     "StrategyConfig",
     "StrategyFactory",
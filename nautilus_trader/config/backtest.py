@@ -181,6 +181,8 @@ class BacktestEngineConfig(NautilusKernelConfig, frozen=True):
         The live execution engine configuration.
     streaming : StreamingConfig, optional
         The configuration for streaming to feather files.
+    profiling : ProfilingConfig, optional
+        The configuration for hot-path profiling (disabled if ``None``).
     strategies : list[ImportableStrategyConfig]
         The strategy configurations for the node.
     actors : list[ImportableActorConfig]
@@ -220,7 +222,8 @@ class BacktestRunConfig(NautilusConfig, frozen=True):
     data : list[BacktestDataConfig]
         The data configurations for the backtest run.
     batch_size_bytes : optional
-        The batch block size in bytes (will then run in streaming mode).
+        If set then will run in streaming mode, where data is streamed into the
+        engine in batches of `BacktestDataConfig.batch_size` rows per data config.
 
     """
 
@@ -164,6 +164,21 @@ class CacheDatabaseConfig(NautilusConfig, frozen=True):
     timestamps_as_iso8601, default False
         If timestamps should be persisted as ISO 8601 strings.
         If `False` then will persit as UNIX nanoseconds.
+    read_batch_size : int, default 1000
+        The maximum number of keys to scan and read per round trip when bulk
+        loading from the database.
+    buffer_writes : bool, default False
+        If order, position and account writes should be buffered and sent in
+        batches (at each event boundary, or when `write_batch_size` is reached).
+    write_batch_size : int, default 1000
+        The maximum number of buffered write commands before they are sent.
+    write_behind : bool, default False
+        If writes should be sent asynchronously by a background thread, keeping
+        database round trips off the event handling path (repeated writes to the
+        same key are coalesced while waiting).
+    write_queue_size : int, default 100_000
+        The maximum number of write-behind writes waiting to be sent, before
+        further writes block (back pressure). Must be greater than `write_batch_size`.
 
     """
 
@@ -175,6 +190,11 @@ class CacheDatabaseConfig(NautilusConfig, frozen=True):
     ssl: bool = False
     flush_on_start: bool = False
     timestamps_as_iso8601: bool = False
+    read_batch_size: int = 1000
+    buffer_writes: bool = False
+    write_batch_size: int = 1000
+    write_behind: bool = False
+    write_queue_size: int = 100_000
 
 
 class InstrumentProviderConfig(NautilusConfig, frozen=True):
@@ -307,6 +327,10 @@ class StreamingConfig(NautilusConfig, frozen=True):
         The flush interval (milliseconds) for writing chunks.
     replace_existing: bool, default False
         If any existing feather files should be replaced.
+    include_types : list[str], optional
+        The type names to write (if ``None`` then all registered types are written).
+    max_batch_size : int, default 10_000
+        The maximum number of rows buffered per type before a record batch is written.
 
     """
 
@@ -316,6 +340,7 @@ class StreamingConfig(NautilusConfig, frozen=True):
     flush_interval_ms: Optional[int] = None
     replace_existing: bool = False
     include_types: Optional[list[str]] = None
+    max_batch_size: int = 10_000
 
     @property
     def fs(self):
@@ -329,6 +354,27 @@ class StreamingConfig(NautilusConfig, frozen=True):
         )
 
 
+class ProfilingConfig(NautilusConfig, frozen=True):
+    """
+    Configuration for hot-path profiling of a ``NautilusKernel``.
+
+    When configured, message bus handler invocations and the engine entry points
+    are timed and aggregated into per-component latency histograms.
+
+    Parameters
+    ----------
+    log_interval_secs : PositiveFloat, optional
+        The interval (seconds) between logging profiling summaries.
+        If ``None`` then a summary is only logged when the kernel is disposed.
+    log_limit : PositiveInt, default 20
+        The maximum number of histograms (by total time) in each logged summary.
+
+    """
+
+    log_interval_secs: Optional[PositiveFloat] = 60.0
+    log_limit: PositiveInt = 20
+
+
 class DataCatalogConfig(NautilusConfig, frozen=True):
     """
     Configuration for a data catalog.
@@ -623,6 +669,8 @@ class NautilusKernelConfig(NautilusConfig, frozen=True):
         The configuration for streaming to feather files.
     catalog : DataCatalogConfig, optional
         The data catalog config.
+    profiling : ProfilingConfig, optional
+        The configuration for hot-path profiling (disabled if ``None``).
     actors : list[ImportableActorConfig]
         The actor configurations for the kernel.
     strategies : list[ImportableStrategyConfig]
@@ -656,6 +704,7 @@ class NautilusKernelConfig(NautilusConfig, frozen=True):
     exec_engine: Optional[ExecEngineConfig] = None
     streaming: Optional[StreamingConfig] = None
     catalog: Optional[DataCatalogConfig] = None
+    profiling: Optional[ProfilingConfig] = None
     actors: list[ImportableActorConfig] = []
     strategies: list[ImportableStrategyConfig] = []
     exec_algorithms: list[ImportableExecAlgorithmConfig] = []
@@ -16,6 +16,7 @@
 from typing import Optional
 
 from nautilus_trader.common import Environment
+from nautilus_trader.common import QueueOverflowPolicy
 from nautilus_trader.config.common import DataEngineConfig
 from nautilus_trader.config.common import ExecEngineConfig
 from nautilus_trader.config.common import InstrumentProviderConfig
@@ -35,10 +36,17 @@ class LiveDataEngineConfig(DataEngineConfig, frozen=True):
     ----------
     qsize : PositiveInt, default 100_000
         The queue size for the engines internal queue buffers.
+    qoverflow_policy : QueueOverflowPolicy, default ``BLOCK``
+        The policy for data arriving when the internal data queue is full.
+        ``BLOCK`` holds data on a backlog (no data is lost), ``DROP_OLDEST``
+        drops the oldest queued data, and ``COALESCE`` replaces a queued quote
+        or ticker for the same instrument (otherwise dropping the oldest).
+        Commands, requests and responses are always held on a backlog.
 
     """
 
     qsize: PositiveInt = 100_000
+    qoverflow_policy: QueueOverflowPolicy = QueueOverflowPolicy.BLOCK
 
 
 class LiveRiskEngineConfig(RiskEngineConfig, frozen=True):
@@ -174,6 +182,8 @@ class TradingNodeConfig(NautilusKernelConfig, frozen=True):
         The live execution engine configuration.
     streaming : StreamingConfig, optional
         The configuration for streaming to feather files.
+    profiling : ProfilingConfig, optional
+        The configuration for hot-path profiling (disabled if ``None``).
     data_clients : dict[str, ImportableConfig | LiveDataClientConfig], optional
         The data client configurations.
     exec_clients : dict[str, ImportableConfig | LiveExecClientConfig], optional
@@ -61,6 +61,16 @@ cdef class DataEngine(Component):
     cdef readonly bint _time_bars_build_with_no_updates
     cdef readonly bint _time_bars_timestamp_on_close
     cdef readonly bint _validate_data_sequence
+    cdef readonly dict _topics_instrument
+    cdef readonly dict _topics_deltas
+    cdef readonly dict _topics_tickers
+    cdef readonly dict _topics_quotes
+    cdef readonly dict _topics_trades
+    cdef readonly dict _topics_bars
+    cdef readonly dict _topics_venue_status
+    cdef readonly dict _topics_instrument_status
+    cdef readonly dict _topics_close_price
+    cdef readonly dict _topics_generic
 
     cdef readonly bint debug
     """If debug mode is active (will provide extra debug logging).\n\n:returns: `bool`"""
@@ -174,3 +184,9 @@ cdef class DataEngine(Component):
     cpdef void _update_synthetic_with_quote(self, SyntheticInstrument synthetic, QuoteTick update)
     cpdef void _update_synthetics_with_trade(self, list synthetics, TradeTick update)
     cpdef void _update_synthetic_with_trade(self, SyntheticInstrument synthetic, TradeTick update)
+
+# -- TOPICS ---------------------------------------------------------------------------------------
+
+    cdef str _instrument_topic(self, dict topics, str prefix, InstrumentId instrument_id)
+    cdef str _keyed_topic(self, dict topics, str prefix, object key)
+    cdef str _generic_topic(self, DataType data_type)
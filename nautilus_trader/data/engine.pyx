@@ -29,6 +29,7 @@ Alternative implementations can be written on top of the generic engine - which
 just need to override the `execute`, `process`, `send` and `receive` methods.
 """
 
+import sys
 from typing import Callable, Optional
 
 from nautilus_trader.common.enums import LogColor
@@ -47,6 +48,7 @@ from nautilus_trader.common.logging cimport RECV
 from nautilus_trader.common.logging cimport REQ
 from nautilus_trader.common.logging cimport RES
 from nautilus_trader.common.logging cimport Logger
+from nautilus_trader.common.profiling cimport Profiler
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.data cimport Data
 from nautilus_trader.core.datetime cimport dt_to_unix_nanos
@@ -139,6 +141,21 @@ cdef class DataEngine(Component):
         self._subscribed_synthetic_quotes: list[InstrumentId] = []
         self._subscribed_synthetic_trades: list[InstrumentId] = []
 
+        # Interned publishing topics (built once per key). These grow with every
+        # instrument, bar type and data type published (whether subscribed or not),
+        # and are only cleared on reset, as each entry is small and bounded by the
+        # number of distinct streams rather than the number of messages.
+        self._topics_instrument: dict[InstrumentId, str] = {}
+        self._topics_deltas: dict[InstrumentId, str] = {}
+        self._topics_tickers: dict[InstrumentId, str] = {}
+        self._topics_quotes: dict[InstrumentId, str] = {}
+        self._topics_trades: dict[InstrumentId, str] = {}
+        self._topics_bars: dict[BarType, str] = {}
+        self._topics_venue_status: dict[Venue, str] = {}
+        self._topics_instrument_status: dict[InstrumentId, str] = {}
+        self._topics_close_price: dict[InstrumentId, str] = {}
+        self._topics_generic: dict[DataType, str] = {}
+
         # Settings
         self.debug = config.debug
         self._time_bars_build_with_no_updates = config.time_bars_build_with_no_updates
@@ -547,6 +564,16 @@ cdef class DataEngine(Component):
         self._synthetic_trade_feeds.clear()
         self._subscribed_synthetic_quotes.clear()
         self._subscribed_synthetic_trades.clear()
+        self._topics_instrument.clear()
+        self._topics_deltas.clear()
+        self._topics_tickers.clear()
+        self._topics_quotes.clear()
+        self._topics_trades.clear()
+        self._topics_bars.clear()
+        self._topics_venue_status.clear()
+        self._topics_instrument_status.clear()
+        self._topics_close_price.clear()
+        self._topics_generic.clear()
 
         self._clock.cancel_timers()
         self.command_count = 0
@@ -589,7 +616,14 @@ cdef class DataEngine(Component):
         """
         Condition.not_none(data, "data")
 
-        self._handle_data(data)
+        cdef Profiler profiler = self._msgbus.profiler
+        cdef uint64_t start_ns
+        if profiler is None:
+            self._handle_data(data)
+        else:
+            start_ns = profiler.timestamp_ns()
+            self._handle_data(data)
+            profiler.record_c("engine:DataEngine.process", profiler.timestamp_ns() - start_ns)
 
     cpdef void request(self, DataRequest request):
         """
@@ -1403,9 +1437,7 @@ cdef class DataEngine(Component):
     cpdef void _handle_instrument(self, Instrument instrument):
         self._cache.add_instrument(instrument)
         self._msgbus.publish_c(
-            topic=f"data.instrument"
-                  f".{instrument.id.venue}"
-                  f".{instrument.id.symbol}",
+            topic=self._instrument_topic(self._topics_instrument, "data.instrument", instrument.id),
             msg=instrument,
         )
 
@@ -1415,26 +1447,20 @@ cdef class DataEngine(Component):
             deltas=[delta]
         )
         self._msgbus.publish_c(
-            topic=f"data.book.deltas"
-                  f".{deltas.instrument_id.venue}"
-                  f".{deltas.instrument_id.symbol}",
+            topic=self._instrument_topic(self._topics_deltas, "data.book.deltas", deltas.instrument_id),
             msg=deltas,
         )
 
     cpdef void _handle_order_book_deltas(self, OrderBookDeltas deltas):
         self._msgbus.publish_c(
-            topic=f"data.book.deltas"
-                  f".{deltas.instrument_id.venue}"
-                  f".{deltas.instrument_id.symbol}",
+            topic=self._instrument_topic(self._topics_deltas, "data.book.deltas", deltas.instrument_id),
             msg=deltas,
         )
 
     cpdef void _handle_ticker(self, Ticker ticker):
         self._cache.add_ticker(ticker)
         self._msgbus.publish_c(
-            topic=f"data.tickers"
-                  f".{ticker.instrument_id.venue}"
-                  f".{ticker.instrument_id.symbol}",
+            topic=self._instrument_topic(self._topics_tickers, "data.tickers", ticker.instrument_id),
             msg=ticker,
         )
 
@@ -1447,9 +1473,7 @@ cdef class DataEngine(Component):
             self._update_synthetics_with_quote(synthetics, tick)
 
         self._msgbus.publish_c(
-            topic=f"data.quotes"
-                  f".{tick.instrument_id.venue}"
-                  f".{tick.instrument_id.symbol}",
+            topic=self._instrument_topic(self._topics_quotes, "data.quotes", tick.instrument_id),
             msg=tick,
         )
 
@@ -1462,9 +1486,7 @@ cdef class DataEngine(Component):
             self._update_synthetics_with_trade(synthetics, tick)
 
         self._msgbus.publish_c(
-            topic=f"data.trades"
-                  f".{tick.instrument_id.venue}"
-                  f".{tick.instrument_id.symbol}",
+            topic=self._instrument_topic(self._topics_trades, "data.trades", tick.instrument_id),
             msg=tick,
         )
 
@@ -1505,19 +1527,31 @@ cdef class DataEngine(Component):
         if not bar.is_revision:
             self._cache.add_bar(bar)
 
-        self._msgbus.publish_c(topic=f"data.bars.{bar_type}", msg=bar)
+        self._msgbus.publish_c(
+            topic=self._keyed_topic(self._topics_bars, "data.bars", bar_type),
+            msg=bar,
+        )
 
     cpdef void _handle_venue_status_update(self, VenueStatusUpdate data):
-        self._msgbus.publish_c(topic=f"data.status.{data.venue}", msg=data)
+        self._msgbus.publish_c(
+            topic=self._keyed_topic(self._topics_venue_status, "data.status", data.venue),
+            msg=data,
+        )
 
     cpdef void _handle_instrument_status_update(self, InstrumentStatusUpdate data):
-        self._msgbus.publish_c(topic=f"data.status.{data.instrument_id.venue}.{data.instrument_id.symbol}", msg=data)
+        self._msgbus.publish_c(
+            topic=self._instrument_topic(self._topics_instrument_status, "data.status", data.instrument_id),
+            msg=data,
+        )
 
     cpdef void _handle_close_price(self, InstrumentClose data):
-        self._msgbus.publish_c(topic=f"data.venue.close_price.{data.instrument_id}", msg=data)
+        self._msgbus.publish_c(
+            topic=self._keyed_topic(self._topics_close_price, "data.venue.close_price", data.instrument_id),
+            msg=data,
+        )
 
     cpdef void _handle_generic_data(self, GenericData data):
-        self._msgbus.publish_c(topic=f"data.{data.data_type.topic}", msg=data.data)
+        self._msgbus.publish_c(topic=self._generic_topic(data.data_type), msg=data.data)
 
 # -- RESPONSE HANDLERS ----------------------------------------------------------------------------
 
@@ -1667,18 +1701,14 @@ cdef class DataEngine(Component):
         # Subscribe to required data
         if bar_type.spec.price_type == PriceType.LAST:
             self._msgbus.subscribe(
-                topic=f"data.trades"
-                      f".{bar_type.instrument_id.venue}"
-                      f".{bar_type.instrument_id.symbol}",
+                topic=self._instrument_topic(self._topics_trades, "data.trades", bar_type.instrument_id),
                 handler=aggregator.handle_trade_tick,
                 priority=5,
             )
             self._handle_subscribe_trade_ticks(client, bar_type.instrument_id)
         else:
             self._msgbus.subscribe(
-                topic=f"data.quotes"
-                      f".{bar_type.instrument_id.venue}"
-                      f".{bar_type.instrument_id.symbol}",
+                topic=self._instrument_topic(self._topics_quotes, "data.quotes", bar_type.instrument_id),
                 handler=aggregator.handle_quote_tick,
                 priority=5,
             )
@@ -1699,17 +1729,13 @@ cdef class DataEngine(Component):
         # Unsubscribe from update ticks
         if bar_type.spec.price_type == PriceType.LAST:
             self._msgbus.unsubscribe(
-                topic=f"data.trades"
-                      f".{bar_type.instrument_id.venue}"
-                      f".{bar_type.instrument_id.symbol}",
+                topic=self._instrument_topic(self._topics_trades, "data.trades", bar_type.instrument_id),
                 handler=aggregator.handle_trade_tick,
             )
             self._handle_unsubscribe_trade_ticks(client, bar_type.instrument_id)
         else:
             self._msgbus.unsubscribe(
-                topic=f"data.quotes"
-                      f".{bar_type.instrument_id.venue}"
-                      f".{bar_type.instrument_id.symbol}",
+                topic=self._instrument_topic(self._topics_quotes, "data.quotes", bar_type.instrument_id),
                 handler=aggregator.handle_quote_tick,
             )
             self._handle_unsubscribe_quote_ticks(client, bar_type.instrument_id)
@@ -1767,9 +1793,7 @@ cdef class DataEngine(Component):
         )
 
         self._msgbus.publish_c(
-            topic=f"data.quotes"
-                  f".{synthetic_instrument_id.venue}"
-                  f".{synthetic_instrument_id.symbol}",
+            topic=self._instrument_topic(self._topics_quotes, "data.quotes", synthetic_instrument_id),
             msg=synthetic_quote,
         )
 
@@ -1816,8 +1840,31 @@ cdef class DataEngine(Component):
         )
 
         self._msgbus.publish_c(
-            topic=f"data.trades"
-                  f".{synthetic_instrument_id.venue}"
-                  f".{synthetic_instrument_id.symbol}",
+            topic=self._instrument_topic(self._topics_trades, "data.trades", synthetic_instrument_id),
             msg=synthetic_trade,
         )
+
+# -- TOPICS ---------------------------------------------------------------------------------------
+
+    cdef str _instrument_topic(self, dict topics, str prefix, InstrumentId instrument_id):
+        # Topics are built and interned once per key, so publishing the same
+        # stream does not format a new string for every message.
+        cdef str topic = topics.get(instrument_id)
+        if topic is None:
+            topic = sys.intern(f"{prefix}.{instrument_id.venue}.{instrument_id.symbol}")
+            topics[instrument_id] = topic
+        return topic
+
+    cdef str _keyed_topic(self, dict topics, str prefix, object key):
+        cdef str topic = topics.get(key)
+        if topic is None:
+            topic = sys.intern(f"{prefix}.{key}")
+            topics[key] = topic
+        return topic
+
+    cdef str _generic_topic(self, DataType data_type):
+        cdef str topic = self._topics_generic.get(data_type)
+        if topic is None:
+            topic = sys.intern(f"data.{data_type.topic}")
+            self._topics_generic[data_type] = topic
+        return topic
@@ -409,10 +409,7 @@ cdef class OrderEmulator(Actor):
             raise RuntimeError(f"Cannot handle `ModifyOrder`: no matching core for trigger instrument {trigger_instrument_id}.")  # pragma: no cover (design-time error)
 
         matching_core.match_order(order)
-        if order.side == OrderSide.BUY:
-            matching_core.sort_bid_orders()
-        elif order.side == OrderSide.SELL:
-            matching_core.sort_ask_orders()
+        matching_core.update_order(order)
 
     cdef void _handle_cancel_order(self, CancelOrder command):
         cdef Order order = self.cache.order(command.client_order_id)
@@ -942,6 +939,7 @@ cdef class OrderEmulator(Actor):
             ts_init=ts_now,
         )
         order.apply(event)
+        matching_core.update_order(order)
 
         self._send_risk_event(event)
 
@@ -49,6 +49,7 @@ from nautilus_trader.common.logging cimport EVT
 from nautilus_trader.common.logging cimport RECV
 from nautilus_trader.common.logging cimport LogColor
 from nautilus_trader.common.logging cimport Logger
+from nautilus_trader.common.profiling cimport Profiler
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.fsm cimport InvalidStateTrigger
 from nautilus_trader.core.rust.core cimport unix_timestamp_ms
@@ -601,6 +602,7 @@ cdef class ExecutionEngine(Component):
         Condition.not_none(command, "command")
 
         self._execute_command(command)
+        self._cache.flush_writes()
 
     cpdef void process(self, OrderEvent event):
         """
@@ -614,7 +616,16 @@ cdef class ExecutionEngine(Component):
         """
         Condition.not_none(event, "event")
 
-        self._handle_event(event)
+        cdef Profiler profiler = self._msgbus.profiler
+        cdef uint64_t start_ns
+        if profiler is None:
+            self._handle_event(event)
+            self._cache.flush_writes()
+        else:
+            start_ns = profiler.timestamp_ns()
+            self._handle_event(event)
+            self._cache.flush_writes()
+            profiler.record_c("engine:ExecEngine.process", profiler.timestamp_ns() - start_ns)
 
     cpdef void flush_db(self):
         """
@@ -25,6 +25,18 @@ from nautilus_trader.model.objects cimport Price
 from nautilus_trader.model.orders.base cimport Order
 
 
+cdef class PriceLevelIndex:
+    cdef list _keys
+    cdef dict _levels
+
+    cdef void add(self, int64_t key, uint64_t seq, Order order)
+    cdef void remove(self, int64_t key, ClientOrderId client_order_id)
+    cdef void collect_ge(self, int64_t key, list out)
+    cdef void collect_le(self, int64_t key, list out)
+    cdef void collect_all(self, list out)
+    cdef void clear(self)
+
+
 cdef class MatchingCore:
     cdef InstrumentId _instrument_id
     cdef Price _price_increment
@@ -43,6 +55,14 @@ cdef class MatchingCore:
     cdef dict _orders
     cdef list _orders_bid
     cdef list _orders_ask
+    cdef bint _is_bid_sorted
+    cdef bint _is_ask_sorted
+    cdef dict _index
+    cdef uint64_t _seq
+    cdef PriceLevelIndex _bid_passive
+    cdef PriceLevelIndex _bid_stops
+    cdef PriceLevelIndex _ask_passive
+    cdef PriceLevelIndex _ask_stops
 
 # -- QUERIES --------------------------------------------------------------------------------------
 
@@ -61,10 +81,15 @@ cdef class MatchingCore:
     cpdef void reset(self)
     cpdef void add_order(self, Order order)
     cdef void _add_order(self, Order order)
+    cpdef void update_order(self, Order order)
     cdef void sort_bid_orders(self)
     cdef void sort_ask_orders(self)
+    cdef void _update_orders(self, list orders)
     cpdef void delete_order(self, Order order)
     cpdef void iterate(self, uint64_t timestamp_ns)
+    cdef PriceLevelIndex _levels_for(self, Order order)
+    cdef void _index_order(self, Order order, uint64_t seq)
+    cdef void _unindex_order(self, Order order, tuple entry)
 
 # -- MATCHING -------------------------------------------------------------------------------------
 
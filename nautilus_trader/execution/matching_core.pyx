@@ -13,8 +13,11 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from bisect import bisect_left
+from bisect import bisect_right
 from typing import Callable, Optional
 
+from libc.stdint cimport int64_t
 from libc.stdint cimport uint64_t
 
 from nautilus_trader.model.enums_c cimport LiquiditySide
@@ -42,6 +45,13 @@ cdef class MatchingCore:
         The callable when a market order is filled.
     fill_limit_order : Callable[[Order], None]
         The callable when a limit order is filled.
+
+    Notes
+    -----
+    Orders are indexed by price level for each side, so that `iterate` only
+    matches orders whose limit or trigger price has been crossed by the market.
+    When an orders price, trigger price or triggered state changes, then
+    `update_order` must be called to re-index the order.
     """
 
     def __init__(
@@ -71,8 +81,18 @@ cdef class MatchingCore:
 
         # Orders
         self._orders: dict[ClientOrderId, Order] = {}
-        self._orders_bid: list[Order] = []
-        self._orders_ask: list[Order] = []
+        self._orders_bid: list[Order] = []  # Sorted on demand
+        self._orders_ask: list[Order] = []  # Sorted on demand
+        self._is_bid_sorted = True
+        self._is_ask_sorted = True
+
+        # Price index
+        self._index: dict[ClientOrderId, tuple] = {}  # -> (PriceLevelIndex, key, seq)
+        self._seq = 0
+        self._bid_passive = PriceLevelIndex()  # Limit and touch orders
+        self._bid_stops = PriceLevelIndex()
+        self._ask_passive = PriceLevelIndex()  # Limit and touch orders
+        self._ask_stops = PriceLevelIndex()
 
     @property
     def instrument_id(self) -> InstrumentId:
@@ -164,12 +184,30 @@ cdef class MatchingCore:
         return client_order_id in self._orders
 
     cpdef list get_orders(self):
-        return self._orders_bid + self._orders_ask
+        return self.get_orders_bid() + self.get_orders_ask()
 
     cpdef list get_orders_bid(self):
+        cdef list entries
+        if not self._is_bid_sorted:
+            entries = []
+            self._bid_passive.collect_all(entries)
+            self._bid_stops.collect_all(entries)
+            entries.sort(key=_bid_priority)
+            self._orders_bid = [entry[2] for entry in entries]
+            self._is_bid_sorted = True
+
         return self._orders_bid
 
     cpdef list get_orders_ask(self):
+        cdef list entries
+        if not self._is_ask_sorted:
+            entries = []
+            self._ask_passive.collect_all(entries)
+            self._ask_stops.collect_all(entries)
+            entries.sort(key=_ask_priority)
+            self._orders_ask = [entry[2] for entry in entries]
+            self._is_ask_sorted = True
+
         return self._orders_ask
 
 # -- COMMANDS -------------------------------------------------------------------------------------
@@ -188,8 +226,16 @@ cdef class MatchingCore:
 
     cpdef void reset(self):
         self._orders.clear()
-        self._orders_bid.clear()
-        self._orders_ask.clear()
+        self._orders_bid = []
+        self._orders_ask = []
+        self._is_bid_sorted = True
+        self._is_ask_sorted = True
+        self._index.clear()
+        self._seq = 0
+        self._bid_passive.clear()
+        self._bid_stops.clear()
+        self._ask_passive.clear()
+        self._ask_stops.clear()
         self.bid_raw = 0
         self.ask_raw = 0
         self.last_raw = 0
@@ -202,43 +248,119 @@ cdef class MatchingCore:
         self._add_order(order)
 
     cdef void _add_order(self, Order order):
+        if order.client_order_id in self._index:
+            # Being added back, so re-index (retaining its time priority)
+            self.update_order(order)
+            return
+
         # Index order
         self._orders[order.client_order_id] = order
 
-        if order.side == OrderSide.BUY:
-            self._orders_bid.append(order)
-            self.sort_bid_orders()
-        elif order.side == OrderSide.SELL:
-            self._orders_ask.append(order)
-            self.sort_ask_orders()
-        else:
-            raise RuntimeError(f"invalid `OrderSide`, was {order.side}")  # pragma: no cover (design-time error)
+        self._seq += 1
+        self._index_order(order, self._seq)
+
+    cpdef void update_order(self, Order order):
+        """
+        Re-index the given order in the matching core.
+
+        Must be called when the orders price, trigger price or triggered state
+        changes. Does nothing if the order is not in the matching core.
+
+        Parameters
+        ----------
+        order : Order
+            The order to update.
+
+        """
+        cdef tuple entry = self._index.get(order.client_order_id)
+        if entry is None:
+            return  # Not in matching core
+
+        cdef PriceLevelIndex levels = self._levels_for(order)
+        cdef int64_t key = order_sort_key(order)
+        if levels is entry[0] and key == entry[1]:
+            return  # No change
+
+        self._unindex_order(order, entry)
+        self._index_order(order, entry[2])
 
     cdef void sort_bid_orders(self):
-        self._orders_bid.sort(key=order_sort_key, reverse=True)
+        self._update_orders(self.get_orders_bid())
 
     cdef void sort_ask_orders(self):
-        self._orders_ask.sort(key=order_sort_key)
+        self._update_orders(self.get_orders_ask())
+
+    cdef void _update_orders(self, list orders):
+        cdef Order order
+        for order in list(orders):
+            self.update_order(order)
 
     cpdef void delete_order(self, Order order):
         self._orders.pop(order.client_order_id, None)
 
-        if order.side == OrderSide.BUY:
-            if order in self._orders_bid:
-                self._orders_bid.remove(order)
-        elif order.side == OrderSide.SELL:
-            if order in self._orders_ask:
-                self._orders_ask.remove(order)
-        else:
-            raise RuntimeError(f"invalid `OrderSide`, was {order.side}")  # pragma: no cover (design-time error)
+        cdef tuple entry = self._index.pop(order.client_order_id, None)
+        if entry is not None:
+            self._unindex_order(order, entry)
 
     cpdef void iterate(self, uint64_t timestamp_ns):
+        # Only orders with a limit or trigger price crossed by the market are matched
+        cdef list bids = []
+        if self.is_ask_initialized:
+            self._bid_passive.collect_ge(self.ask_raw, bids)
+            self._bid_stops.collect_le(self.ask_raw, bids)
+            bids.sort(key=_bid_priority)
+
+        cdef list asks = []
+        if self.is_bid_initialized:
+            self._ask_passive.collect_le(self.bid_raw, asks)
+            self._ask_stops.collect_ge(self.bid_raw, asks)
+            asks.sort(key=_ask_priority)
+
+        cdef tuple entry
         cdef Order order
-        for order in self._orders_bid + self._orders_ask:  # Lists implicitly copied
+        for entry in bids + asks:
+            order = entry[2]
             if order.is_closed_c():
                 continue  # Orders state has changed since iteration started
             self.match_order(order)
 
+    cdef PriceLevelIndex _levels_for(self, Order order):
+        cdef bint is_stop = (
+            order.order_type == OrderType.STOP_MARKET
+            or order.order_type == OrderType.TRAILING_STOP_MARKET
+            or (
+                (order.order_type == OrderType.STOP_LIMIT or order.order_type == OrderType.TRAILING_STOP_LIMIT)
+                and not order.is_triggered
+            )
+        )
+
+        if order.side == OrderSide.BUY:
+            return self._bid_stops if is_stop else self._bid_passive
+        elif order.side == OrderSide.SELL:
+            return self._ask_stops if is_stop else self._ask_passive
+        else:
+            raise RuntimeError(f"invalid `OrderSide`, was {order.side}")  # pragma: no cover (design-time error)
+
+    cdef void _index_order(self, Order order, uint64_t seq):
+        cdef PriceLevelIndex levels = self._levels_for(order)
+        cdef int64_t key = order_sort_key(order)
+        levels.add(key, seq, order)
+        self._index[order.client_order_id] = (levels, key, seq)
+
+        if order.side == OrderSide.BUY:
+            self._is_bid_sorted = False
+        else:
+            self._is_ask_sorted = False
+
+    cdef void _unindex_order(self, Order order, tuple entry):
+        cdef PriceLevelIndex levels = entry[0]
+        levels.remove(entry[1], order.client_order_id)
+
+        if order.side == OrderSide.BUY:
+            self._is_bid_sorted = False
+        else:
+            self._is_ask_sorted = False
+
 # -- MATCHING -------------------------------------------------------------------------------------
 
     cpdef void match_order(self, Order order, bint initial = False):
@@ -312,6 +434,8 @@ cdef class MatchingCore:
             if self.is_limit_matched(order.side, order.price):
                 order.liquidity_side = LiquiditySide.TAKER
                 self._fill_limit_order(order)
+            # Re-index if now triggered and still resting
+            self.update_order(order)
 
     cpdef void match_market_if_touched_order(self, Order order):
         if self.is_touch_triggered(order.side, order.trigger_price):
@@ -341,6 +465,8 @@ cdef class MatchingCore:
             if self.is_limit_matched(order.side, order.price):
                 order.liquidity_side = LiquiditySide.TAKER
                 self._fill_limit_order(order)
+            # Re-index if now triggered and still resting
+            self.update_order(order)
 
     cpdef bint is_limit_matched(self, OrderSide side, Price price):
         if side == OrderSide.BUY:
@@ -431,3 +557,69 @@ cdef inline int64_t order_sort_key(Order order):
             f"invalid order type to sort in book, "
             f"was {order_type_to_str(order.order_type)}",
         )
+
+
+def _bid_priority(tuple entry):
+    # Highest price first, then time priority
+    return (-entry[0], entry[1])
+
+
+def _ask_priority(tuple entry):
+    # Lowest price first, then time priority
+    return (entry[0], entry[1])
+
+
+cdef class PriceLevelIndex:
+    """
+    Provides an index of orders grouped by price level.
+
+    Price levels are kept in a sorted list, with the orders at each level in
+    time priority. Adding and removing an order is O(log n) in the number of
+    price levels (plus a memory move when a level is inserted or removed), and
+    collecting the orders beyond a price only visits those levels.
+    """
+
+    def __init__(self):
+        self._keys: list[int] = []
+        self._levels: dict[int, dict[ClientOrderId, tuple]] = {}
+
+    def __len__(self) -> int:
+        return sum(len(level) for level in self._levels.values())
+
+    cdef void add(self, int64_t key, uint64_t seq, Order order):
+        cdef dict level = self._levels.get(key)
+        if level is None:
+            level = {}
+            self._levels[key] = level
+            self._keys.insert(bisect_left(self._keys, key), key)
+
+        level[order.client_order_id] = (key, seq, order)
+
+    cdef void remove(self, int64_t key, ClientOrderId client_order_id):
+        cdef dict level = self._levels.get(key)
+        if level is None:
+            return
+
+        level.pop(client_order_id, None)
+        if not level:
+            del self._levels[key]
+            del self._keys[bisect_left(self._keys, key)]
+
+    cdef void collect_ge(self, int64_t key, list out):
+        cdef int i
+        for i in range(bisect_left(self._keys, key), len(self._keys)):
+            out.extend(self._levels[self._keys[i]].values())
+
+    cdef void collect_le(self, int64_t key, list out):
+        cdef int i
+        for i in range(bisect_right(self._keys, key)):
+            out.extend(self._levels[self._keys[i]].values())
+
+    cdef void collect_all(self, list out):
+        cdef dict level
+        for level in self._levels.values():
+            out.extend(level.values())
+
+    cdef void clear(self):
+        self._keys.clear()
+        self._levels.clear()
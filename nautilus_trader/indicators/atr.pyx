@@ -13,9 +13,14 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import cython
+import numpy as np
+
 from nautilus_trader.indicators.average.ma_factory import MovingAverageFactory
 from nautilus_trader.indicators.average.ma_factory import MovingAverageType
 
+cimport numpy as np
+
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.indicators.base.indicator cimport Indicator
 from nautilus_trader.model.data.bar cimport Bar
@@ -109,6 +114,50 @@ cdef class AverageTrueRange(Indicator):
         self._floor_value()
         self._check_initialized()
 
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def update_raw_batch(self, double[:] high, double[:] low, double[:] close):
+        """
+        Update the indicator with the given raw prices.
+
+        Each set of prices is applied in order with a call to `update_raw`, so
+        the results match the streaming updates exactly. This is not a typed
+        kernel, and saves only the per call overhead of the Python loop.
+
+        Parameters
+        ----------
+        high : np.ndarray
+            The high prices (float64).
+        low : np.ndarray
+            The low prices (float64).
+        close : np.ndarray
+            The close prices (float64).
+
+        Returns
+        -------
+        np.ndarray
+            The indicator value after each update.
+
+        Raises
+        ------
+        ValueError
+            If the lengths of `high`, `low` and `close` are not equal.
+
+        """
+        cdef int length = high.shape[0]
+        Condition.true(
+            low.shape[0] == length and close.shape[0] == length,
+            "the lengths of `high`, `low` and `close` were not equal",
+        )
+
+        cdef np.ndarray output = np.empty(length, dtype=np.float64)
+        cdef double[:] output_view = output
+        cdef int i
+        for i in range(length):
+            self.update_raw(high[i], low[i], close[i])
+            output_view[i] = self.value
+        return output
+
     cdef void _floor_value(self):
         if self._value_floor == 0:
             self.value = self._ma.value
@@ -13,6 +13,11 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import cython
+import numpy as np
+
+cimport numpy as np
+
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.indicators.average.moving_average cimport MovingAverage
 from nautilus_trader.model.data.bar cimport Bar
@@ -106,3 +111,41 @@ cdef class ExponentialMovingAverage(MovingAverage):
 
         self.value = self.alpha * value + ((1.0 - self.alpha) * self.value)
         self._increment_count()
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def update_raw_batch(self, double[:] values):
+        """
+        Update the indicator with the given raw values.
+
+        The recurrence is evaluated over the array in a typed loop (rather than
+        through `update_raw` per value), with the same arithmetic so the results
+        match the streaming updates exactly.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            The update values (float64).
+
+        Returns
+        -------
+        np.ndarray
+            The indicator value after each update.
+
+        """
+        cdef int length = values.shape[0]
+        cdef np.ndarray output = np.empty(length, dtype=np.float64)
+        cdef double[:] output_view = output
+        if length == 0:
+            return output
+
+        cdef double alpha = self.alpha
+        cdef double value = self.value if self.has_inputs else values[0]
+        cdef int i
+        for i in range(length):
+            value = alpha * values[i] + ((1.0 - alpha) * value)
+            output_view[i] = value
+
+        self.value = value
+        self._increment_count_by(length)
+        return output
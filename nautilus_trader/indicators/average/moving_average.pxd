@@ -29,4 +29,5 @@ cdef class MovingAverage(Indicator):
 
     cpdef void update_raw(self, double value)
     cpdef void _increment_count(self)
+    cdef void _increment_count_by(self, int count)
     cpdef void _reset_ma(self)
@@ -16,6 +16,11 @@
 from enum import Enum
 from enum import unique
 
+import cython
+import numpy as np
+
+cimport numpy as np
+
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.indicators.base.indicator cimport Indicator
 from nautilus_trader.model.enums_c cimport PriceType
@@ -80,6 +85,36 @@ cdef class MovingAverage(Indicator):
         """
         raise NotImplementedError("method must be implemented in the subclass")  # pragma: no cover
 
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def update_raw_batch(self, double[:] values):
+        """
+        Update the indicator with the given raw values.
+
+        Each value is applied in order with a call to `update_raw`, so the results
+        match the streaming updates exactly. This is not a typed kernel, and saves
+        only the per call overhead of the Python loop.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            The update values (float64).
+
+        Returns
+        -------
+        np.ndarray
+            The indicator value after each update.
+
+        """
+        cdef int length = values.shape[0]
+        cdef np.ndarray output = np.empty(length, dtype=np.float64)
+        cdef double[:] output_view = output
+        cdef int i
+        for i in range(length):
+            self.update_raw(values[i])
+            output_view[i] = self.value
+        return output
+
     cpdef void _increment_count(self):
         self.count += 1
 
@@ -89,6 +124,17 @@ cdef class MovingAverage(Indicator):
             if self.count >= self.period:
                 self._set_initialized(True)
 
+    cdef void _increment_count_by(self, int count):
+        if count == 0:
+            return
+        self.count += count
+
+        # Initialization logic (as per `_increment_count`)
+        if not self.initialized:
+            self._set_has_inputs(True)
+            if self.count >= self.period:
+                self._set_initialized(True)
+
     cpdef void _reset(self):
         self._reset_ma()
         self.count = 0
@@ -13,13 +13,14 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-from collections import deque
-
+import cython
 import numpy as np
 
+cimport numpy as np
+
 from nautilus_trader.core.correctness cimport Condition
-from nautilus_trader.core.stats cimport fast_mean
 from nautilus_trader.indicators.average.moving_average cimport MovingAverage
+from nautilus_trader.indicators.base.rolling cimport RollingSum
 from nautilus_trader.model.data.bar cimport Bar
 from nautilus_trader.model.data.tick cimport QuoteTick
 from nautilus_trader.model.data.tick cimport TradeTick
@@ -48,7 +49,7 @@ cdef class SimpleMovingAverage(MovingAverage):
         Condition.positive_int(period, "period")
         super().__init__(period, params=[period], price_type=price_type)
 
-        self._inputs = deque(maxlen=period)
+        self._inputs = RollingSum(period)
         self.value = 0
 
     cpdef void handle_quote_tick(self, QuoteTick tick):
@@ -104,10 +105,43 @@ cdef class SimpleMovingAverage(MovingAverage):
             The update value.
 
         """
-        self._inputs.append(value)
+        self._inputs.update(value)
 
-        self.value = fast_mean(np.asarray(self._inputs, dtype=np.float64))
+        self.value = self._inputs.mean()
         self._increment_count()
 
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def update_raw_batch(self, double[:] values):
+        """
+        Update the indicator with the given raw values.
+
+        The rolling sum is updated over the array in a typed loop (rather than
+        through `update_raw` per value), with the same arithmetic so the results
+        match the streaming updates exactly.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            The update values (float64).
+
+        Returns
+        -------
+        np.ndarray
+            The indicator value after each update.
+
+        """
+        cdef int length = values.shape[0]
+        cdef np.ndarray output = np.empty(length, dtype=np.float64)
+        cdef double[:] output_view = output
+        if length == 0:
+            return output
+
+        self._inputs._update_means(values, output_view)
+
+        self.value = output_view[length - 1]
+        self._increment_count_by(length)
+        return output
+
     cpdef void _reset_ma(self):
-        self._inputs.clear()
+        self._inputs.reset()
@@ -57,6 +57,32 @@ cdef class Indicator:
         """Abstract method (implement in subclass)."""
         raise NotImplementedError(f"Cannot handle {repr(bar)}: method not implemented in subclass")  # pragma: no cover
 
+    def update_raw_batch(self, *args):
+        """
+        Update the indicator with the given arrays of raw values.
+
+        The arrays are the float64 NumPy equivalents of the arguments to the
+        indicators `update_raw`, and are applied in order, so the results match
+        the streaming updates exactly.
+
+        Parameters
+        ----------
+        *args : np.ndarray
+            The arrays of update values (float64), of equal length.
+
+        Returns
+        -------
+        np.ndarray or tuple[np.ndarray, ...]
+            The indicator output(s) after each update.
+
+        Raises
+        ------
+        NotImplementedError
+            If the indicator does not support batch updates.
+
+        """
+        raise NotImplementedError(f"{self.name} does not support batch updates")
+
     cpdef void reset(self):
         """
         Reset the indicator.
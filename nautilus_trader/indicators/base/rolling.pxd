@@ -0,0 +1,79 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2023 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from libc.stdint cimport uint64_t
+
+
+cdef class RollingWindow:
+    cdef double* _values
+    cdef int _head
+    cdef int _evictions
+
+    cdef readonly int capacity
+    """The capacity of the window.\n\n:returns: `int`"""
+    cdef readonly int count
+    """The count of values currently in the window.\n\n:returns: `int`"""
+
+    cdef bint _append(self, double value, double* evicted)
+    cdef void _evicted(self)
+    cdef void _resync(self)
+    cdef void _reset_window(self)
+    cpdef void update(self, double value)
+    cpdef void reset(self)
+    cpdef bint is_full(self)
+    cpdef double last(self)
+    cpdef list values(self)
+
+
+cdef class RollingSum(RollingWindow):
+    cdef readonly double sum
+    """The sum of the values in the window.\n\n:returns: `double`"""
+
+    cdef void _update_means(self, double[:] values, double[:] output)
+    cpdef double mean(self)
+
+
+cdef class RollingMeanVariance(RollingWindow):
+    cdef readonly double mean
+    """The mean of the values in the window.\n\n:returns: `double`"""
+    cdef double _m2
+
+    cdef void _update_moments(self, double value, bint is_evicted, double evicted)
+    cpdef double variance(self)
+    cpdef double std(self)
+    cpdef double std_with_mean(self, double mean)
+
+
+cdef class RollingMinMax(RollingWindow):
+    cdef uint64_t* _max_seqs
+    cdef uint64_t* _min_seqs
+    cdef int _max_front
+    cdef int _max_size
+    cdef int _min_front
+    cdef int _min_size
+    cdef uint64_t _seq
+
+    cpdef double max(self)
+    cpdef double min(self)
+
+
+cdef class RollingRegression(RollingMeanVariance):
+    cdef double _y_sum
+    cdef double _xy_sum
+
+    cpdef double slope(self)
+    cpdef double intercept(self)
+    cpdef double fitted(self, double x)
+    cpdef double r_squared(self)
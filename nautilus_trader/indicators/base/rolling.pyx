@@ -0,0 +1,631 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2023 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import cython
+
+from cpython.mem cimport PyMem_Free
+from cpython.mem cimport PyMem_Malloc
+from libc.math cimport INFINITY
+from libc.math cimport NAN
+from libc.math cimport sqrt
+from libc.stdint cimport uint64_t
+
+from nautilus_trader.core.correctness cimport Condition
+
+
+# The minimum count of evictions between re-summing the window (bounds the
+# floating point drift of the running sums at an amortized O(1) cost)
+cdef int _RESYNC_MIN = 1024
+
+
+cdef class RollingWindow:
+    """
+    Provides a fixed capacity ring buffer of values, as the base for rolling
+    window statistics which are updated in O(1) per value with no allocation.
+
+    Parameters
+    ----------
+    capacity : int
+        The capacity of the window (> 0).
+
+    Raises
+    ------
+    ValueError
+        If `capacity` is not positive (> 0).
+
+    """
+
+    def __cinit__(self, int capacity):
+        Condition.positive_int(capacity, "capacity")
+
+        self._values = <double *>PyMem_Malloc(capacity * sizeof(double))
+        if self._values == NULL:
+            raise MemoryError()
+
+        self.capacity = capacity
+        self.count = 0
+        self._head = 0
+        self._evictions = 0
+
+    def __dealloc__(self):
+        PyMem_Free(self._values)
+
+    def __reduce__(self):
+        return self.__class__, (self.capacity,), self.values()
+
+    def __setstate__(self, state):
+        self.reset()
+        for value in state:
+            self.update(value)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(capacity={self.capacity}, count={self.count})"
+
+    cdef bint _append(self, double value, double* evicted):
+        # Write the value at the head, returns True if the oldest value was evicted
+        cdef bint is_full = self.count == self.capacity
+        if is_full:
+            evicted[0] = self._values[self._head]
+        else:
+            self.count += 1
+
+        self._values[self._head] = value
+        self._head += 1
+        if self._head == self.capacity:
+            self._head = 0
+
+        return is_full
+
+    cdef void _evicted(self):
+        self._evictions += 1
+        if self._evictions >= self.capacity and self._evictions >= _RESYNC_MIN:
+            self._resync()
+            self._evictions = 0
+
+    cdef void _resync(self):
+        pass  # Optionally override (recalculate statistics from the window values)
+
+    cdef void _reset_window(self):
+        self.count = 0
+        self._head = 0
+        self._evictions = 0
+
+    cpdef void update(self, double value):
+        """
+        Update the window with the given value.
+
+        If the window is full then the oldest value is evicted.
+
+        Parameters
+        ----------
+        value : double
+            The update value.
+
+        """
+        cdef double evicted = 0.0
+        self._append(value, &evicted)
+
+    cpdef void reset(self):
+        """
+        Reset the window by clearing all values and statistics.
+        """
+        self._reset_window()
+
+    cpdef bint is_full(self):
+        """
+        Return a value indicating whether the window is at capacity.
+
+        Returns
+        -------
+        bool
+
+        """
+        return self.count == self.capacity
+
+    cpdef double last(self):
+        """
+        Return the most recent value in the window.
+
+        Returns
+        -------
+        double
+            Zero if the window is empty.
+
+        """
+        if self.count == 0:
+            return 0.0
+        if self._head == 0:
+            return self._values[self.capacity - 1]
+        return self._values[self._head - 1]
+
+    cpdef list values(self):
+        """
+        Return the values in the window (oldest first).
+
+        Returns
+        -------
+        list[double]
+
+        """
+        cdef int start = self._head if self.count == self.capacity else 0
+        cdef int i
+        return [self._values[(start + i) % self.capacity] for i in range(self.count)]
+
+
+cdef class RollingSum(RollingWindow):
+    """
+    Provides a running sum over a rolling window of values.
+
+    Parameters
+    ----------
+    capacity : int
+        The capacity of the window (> 0).
+
+    Raises
+    ------
+    ValueError
+        If `capacity` is not positive (> 0).
+
+    """
+
+    def __init__(self, int capacity):
+        self.sum = 0.0
+
+    cdef void _resync(self):
+        cdef int start = self._head if self.count == self.capacity else 0
+        cdef double total = 0.0
+        cdef int i
+        for i in range(self.count):
+            total += self._values[(start + i) % self.capacity]
+        self.sum = total
+
+    cdef void _reset_window(self):
+        RollingWindow._reset_window(self)
+        self.sum = 0.0
+
+    cpdef void update(self, double value):
+        """
+        Update the window with the given value.
+
+        Parameters
+        ----------
+        value : double
+            The update value.
+
+        """
+        cdef double evicted = 0.0
+        if self._append(value, &evicted):
+            self.sum += value - evicted
+            self._evicted()
+        else:
+            self.sum += value
+
+    cpdef double mean(self):
+        """
+        Return the mean of the values in the window.
+
+        Returns
+        -------
+        double
+            Zero if the window is empty.
+
+        """
+        if self.count == 0:
+            return 0.0
+        return self.sum / self.count
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef void _update_means(self, double[:] values, double[:] output):
+        # Update the window with each value in order (as per `update`), writing
+        # the mean following each update to `output`
+        cdef double value
+        cdef double evicted
+        cdef int i
+        for i in range(values.shape[0]):
+            value = values[i]
+            evicted = 0.0
+            if self._append(value, &evicted):
+                self.sum += value - evicted
+                self._evicted()
+            else:
+                self.sum += value
+            output[i] = self.sum / self.count
+
+
+cdef class RollingMeanVariance(RollingWindow):
+    """
+    Provides the mean and variance over a rolling window of values.
+
+    The moments are maintained with Welford's algorithm, extended to remove the
+    value evicted from the window.
+
+    Parameters
+    ----------
+    capacity : int
+        The capacity of the window (> 0).
+
+    Raises
+    ------
+    ValueError
+        If `capacity` is not positive (> 0).
+
+    """
+
+    def __init__(self, int capacity):
+        self.mean = 0.0
+        self._m2 = 0.0
+
+    cdef void _update_moments(self, double value, bint is_evicted, double evicted):
+        cdef double delta
+        cdef double new_mean
+        if is_evicted:
+            new_mean = self.mean + (value - evicted) / self.count
+            self._m2 += (value - evicted) * (value - new_mean + evicted - self.mean)
+            self.mean = new_mean
+            if self._m2 < 0.0:
+                self._m2 = 0.0  # Guard against rounding
+        else:
+            delta = value - self.mean
+            self.mean += delta / self.count
+            self._m2 += delta * (value - self.mean)
+
+    cdef void _resync(self):
+        cdef int start = self._head if self.count == self.capacity else 0
+        cdef double total = 0.0
+        cdef double delta
+        cdef int i
+        for i in range(self.count):
+            total += self._values[(start + i) % self.capacity]
+        self.mean = total / self.count
+
+        self._m2 = 0.0
+        for i in range(self.count):
+            delta = self._values[(start + i) % self.capacity] - self.mean
+            self._m2 += delta * delta
+
+    cdef void _reset_window(self):
+        RollingWindow._reset_window(self)
+        self.mean = 0.0
+        self._m2 = 0.0
+
+    cpdef void update(self, double value):
+        """
+        Update the window with the given value.
+
+        Parameters
+        ----------
+        value : double
+            The update value.
+
+        """
+        cdef double evicted = 0.0
+        cdef bint is_evicted = self._append(value, &evicted)
+        self._update_moments(value, is_evicted, evicted)
+        if is_evicted:
+            self._evicted()
+
+    cpdef double variance(self):
+        """
+        Return the (population) variance of the values in the window.
+
+        Returns
+        -------
+        double
+            Zero if the window is empty.
+
+        """
+        if self.count == 0:
+            return 0.0
+        return self._m2 / self.count
+
+    cpdef double std(self):
+        """
+        Return the (population) standard deviation of the values in the window.
+
+        Returns
+        -------
+        double
+            Zero if the window is empty.
+
+        """
+        return sqrt(self.variance())
+
+    cpdef double std_with_mean(self, double mean):
+        """
+        Return the standard deviation of the values in the window about the
+        given mean.
+
+        Parameters
+        ----------
+        mean : double
+            The mean for the calculation.
+
+        Returns
+        -------
+        double
+            Zero if the window is empty.
+
+        """
+        if self.count == 0:
+            return 0.0
+        cdef double delta = self.mean - mean
+        return sqrt(self._m2 / self.count + delta * delta)
+
+
+cdef class RollingMinMax(RollingWindow):
+    """
+    Provides the minimum and maximum over a rolling window of values.
+
+    Candidate extremes are held in monotonic queues, so each update costs
+    amortized O(1) regardless of the window capacity.
+
+    Parameters
+    ----------
+    capacity : int
+        The capacity of the window (> 0).
+
+    Raises
+    ------
+    ValueError
+        If `capacity` is not positive (> 0).
+
+    """
+
+    def __cinit__(self, int capacity):
+        self._max_seqs = <uint64_t *>PyMem_Malloc(capacity * sizeof(uint64_t))
+        self._min_seqs = <uint64_t *>PyMem_Malloc(capacity * sizeof(uint64_t))
+        if self._max_seqs == NULL or self._min_seqs == NULL:
+            raise MemoryError()
+
+        self._max_front = 0
+        self._max_size = 0
+        self._min_front = 0
+        self._min_size = 0
+        self._seq = 0
+
+    def __dealloc__(self):
+        PyMem_Free(self._max_seqs)
+        PyMem_Free(self._min_seqs)
+
+    cdef void _reset_window(self):
+        RollingWindow._reset_window(self)
+        self._max_front = 0
+        self._max_size = 0
+        self._min_front = 0
+        self._min_size = 0
+        self._seq = 0
+
+    cpdef void update(self, double value):
+        """
+        Update the window with the given value.
+
+        Parameters
+        ----------
+        value : double
+            The update value.
+
+        """
+        cdef uint64_t seq = self._seq
+        cdef uint64_t capacity = self.capacity
+
+        # Expire the candidates leaving the window (the value at sequence
+        # `seq - capacity` is overwritten by this update).
+        if seq >= capacity:
+            if self._max_size > 0 and self._max_seqs[self._max_front] <= seq - capacity:
+                self._max_front = (self._max_front + 1) % self.capacity
+                self._max_size -= 1
+            if self._min_size > 0 and self._min_seqs[self._min_front] <= seq - capacity:
+                self._min_front = (self._min_front + 1) % self.capacity
+                self._min_size -= 1
+
+        # Drop candidates which can no longer be an extreme
+        cdef int back
+        while self._max_size > 0:
+            back = (self._max_front + self._max_size - 1) % self.capacity
+            if self._values[self._max_seqs[back] % capacity] > value:
+                break
+            self._max_size -= 1
+        while self._min_size > 0:
+            back = (self._min_front + self._min_size - 1) % self.capacity
+            if self._values[self._min_seqs[back] % capacity] < value:
+                break
+            self._min_size -= 1
+
+        self._max_seqs[(self._max_front + self._max_size) % self.capacity] = seq
+        self._max_size += 1
+        self._min_seqs[(self._min_front + self._min_size) % self.capacity] = seq
+        self._min_size += 1
+
+        cdef double evicted = 0.0
+        self._append(value, &evicted)
+        self._seq += 1
+
+    cpdef double max(self):
+        """
+        Return the maximum value in the window.
+
+        Returns
+        -------
+        double
+            Zero if the window is empty.
+
+        """
+        if self._max_size == 0:
+            return 0.0
+        return self._values[self._max_seqs[self._max_front] % <uint64_t>self.capacity]
+
+    cpdef double min(self):
+        """
+        Return the minimum value in the window.
+
+        Returns
+        -------
+        double
+            Zero if the window is empty.
+
+        """
+        if self._min_size == 0:
+            return 0.0
+        return self._values[self._min_seqs[self._min_front] % <uint64_t>self.capacity]
+
+
+cdef class RollingRegression(RollingMeanVariance):
+    """
+    Provides a simple linear regression over a rolling window of values.
+
+    The values are regressed against their position in the window
+    (1 for the oldest value up to `count` for the most recent), using running
+    sums which are shifted as the window rolls.
+
+    Parameters
+    ----------
+    capacity : int
+        The capacity of the window (> 0).
+
+    Raises
+    ------
+    ValueError
+        If `capacity` is not positive (> 0).
+
+    """
+
+    def __init__(self, int capacity):
+        super().__init__(capacity)
+        self._y_sum = 0.0
+        self._xy_sum = 0.0
+
+    cdef void _resync(self):
+        RollingMeanVariance._resync(self)
+
+        cdef int start = self._head if self.count == self.capacity else 0
+        cdef double value
+        cdef int i
+        self._y_sum = 0.0
+        self._xy_sum = 0.0
+        for i in range(self.count):
+            value = self._values[(start + i) % self.capacity]
+            self._y_sum += value
+            self._xy_sum += (i + 1) * value
+
+    cdef void _reset_window(self):
+        RollingMeanVariance._reset_window(self)
+        self._y_sum = 0.0
+        self._xy_sum = 0.0
+
+    cpdef void update(self, double value):
+        """
+        Update the window with the given value.
+
+        Parameters
+        ----------
+        value : double
+            The update value.
+
+        """
+        cdef double evicted = 0.0
+        cdef double y_sum = self._y_sum
+        cdef bint is_evicted = self._append(value, &evicted)
+        self._update_moments(value, is_evicted, evicted)
+        if is_evicted:
+            # Every remaining value shifts down one position, and the new
+            # value takes the last position.
+            self._xy_sum += self.count * value - y_sum
+            self._y_sum += value - evicted
+            self._evicted()
+        else:
+            self._xy_sum += self.count * value
+            self._y_sum += value
+
+    cpdef double slope(self):
+        """
+        Return the slope of the regression line.
+
+        Returns
+        -------
+        double
+            Zero if the window contains less than two values.
+
+        """
+        cdef int n = self.count
+        if n < 2:
+            return 0.0
+        cdef double x_sum = 0.5 * n * (n + 1)
+        cdef double x2_sum = x_sum * (2 * n + 1) / 3
+        cdef double divisor = n * x2_sum - x_sum * x_sum
+        return (n * self._xy_sum - x_sum * self._y_sum) / divisor
+
+    cpdef double intercept(self):
+        """
+        Return the intercept of the regression line.
+
+        Returns
+        -------
+        double
+            The last value if the window contains less than two values.
+
+        """
+        cdef int n = self.count
+        if n < 2:
+            return self.last()
+        cdef double x_sum = 0.5 * n * (n + 1)
+        cdef double x2_sum = x_sum * (2 * n + 1) / 3
+        cdef double divisor = n * x2_sum - x_sum * x_sum
+        return (self._y_sum * x2_sum - x_sum * self._xy_sum) / divisor
+
+    cpdef double fitted(self, double x):
+        """
+        Return the value of the regression line at the given position.
+
+        Parameters
+        ----------
+        x : double
+            The position in the window.
+
+        Returns
+        -------
+        double
+
+        """
+        return self.slope() * x + self.intercept()
+
+    cpdef double r_squared(self):
+        """
+        Return the coefficient of determination (R²) of the regression.
+
+        Returns
+        -------
+        double
+            Zero if the window contains less than two values.
+
+        """
+        cdef int n = self.count
+        if n < 2:
+            return 0.0
+
+        cdef double x_sum = 0.5 * n * (n + 1)
+        cdef double slope = self.slope()
+        if self._m2 != 0.0:
+            return slope * (self._xy_sum - x_sum * self._y_sum / n) / self._m2
+
+        # All values are equal (the total sum of squares is zero), so the
+        # residuals are exactly the offsets of the line from the last value.
+        cdef double x2_sum = x_sum * (2 * n + 1) / 3
+        cdef double offset = self.intercept() - self.last()
+        cdef double ss_res = slope * slope * x2_sum + 2 * slope * offset * x_sum + n * offset * offset
+        return -INFINITY if ss_res > 0.0 else NAN
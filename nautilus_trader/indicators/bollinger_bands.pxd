@@ -13,12 +13,14 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from nautilus_trader.indicators.average.moving_average cimport MovingAverage
 from nautilus_trader.indicators.base.indicator cimport Indicator
+from nautilus_trader.indicators.base.rolling cimport RollingMeanVariance
 
 
 cdef class BollingerBands(Indicator):
-    cdef object _ma
-    cdef object _prices
+    cdef MovingAverage _ma
+    cdef RollingMeanVariance _prices
 
     cdef readonly int period
     """The period for the moving average.\n\n:returns: `int`"""
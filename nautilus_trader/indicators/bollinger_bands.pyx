@@ -13,16 +13,17 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-from collections import deque
-
+import cython
 import numpy as np
 
 from nautilus_trader.indicators.average.ma_factory import MovingAverageFactory
 from nautilus_trader.indicators.average.ma_factory import MovingAverageType
 
+cimport numpy as np
+
 from nautilus_trader.core.correctness cimport Condition
-from nautilus_trader.core.stats cimport fast_std_with_mean
 from nautilus_trader.indicators.base.indicator cimport Indicator
+from nautilus_trader.indicators.base.rolling cimport RollingMeanVariance
 from nautilus_trader.model.data.bar cimport Bar
 from nautilus_trader.model.data.tick cimport QuoteTick
 from nautilus_trader.model.data.tick cimport TradeTick
@@ -66,7 +67,7 @@ cdef class BollingerBands(Indicator):
         self.period = period
         self.k = k
         self._ma = MovingAverageFactory.create(period, ma_type)
-        self._prices = deque(maxlen=period)
+        self._prices = RollingMeanVariance(period)
 
         self.upper = 0.0
         self.middle = 0.0
@@ -139,29 +140,76 @@ cdef class BollingerBands(Indicator):
         # Add data to queues
         cdef double typical = (high + low + close) / 3.0
 
-        self._prices.append(typical)
+        self._prices.update(typical)
         self._ma.update_raw(typical)
 
         # Initialization logic
         if not self.initialized:
             self._set_has_inputs(True)
-            if len(self._prices) >= self.period:
+            if self._prices.count >= self.period:
                 self._set_initialized(True)
 
         # Calculate values
-        cdef double std = fast_std_with_mean(
-            values=np.asarray(self._prices, dtype=np.float64),
-            mean=self._ma.value,
-        )
+        cdef double std = self._prices.std_with_mean(self._ma.value)
 
         # Set values
         self.upper = self._ma.value + (self.k * std)
         self.middle = self._ma.value
         self.lower = self._ma.value - (self.k * std)
 
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def update_raw_batch(self, double[:] high, double[:] low, double[:] close):
+        """
+        Update the indicator with the given raw prices.
+
+        Each set of prices is applied in order with a call to `update_raw`, so
+        the results match the streaming updates exactly. This is not a typed
+        kernel, and saves only the per call overhead of the Python loop.
+
+        Parameters
+        ----------
+        high : np.ndarray
+            The high prices (float64).
+        low : np.ndarray
+            The low prices (float64).
+        close : np.ndarray
+            The close prices (float64).
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray, np.ndarray]
+            The upper, middle and lower values after each update.
+
+        Raises
+        ------
+        ValueError
+            If the lengths of `high`, `low` and `close` are not equal.
+
+        """
+        cdef int length = high.shape[0]
+        Condition.true(
+            low.shape[0] == length and close.shape[0] == length,
+            "the lengths of `high`, `low` and `close` were not equal",
+        )
+
+        cdef np.ndarray upper = np.empty(length, dtype=np.float64)
+        cdef np.ndarray middle = np.empty(length, dtype=np.float64)
+        cdef np.ndarray lower = np.empty(length, dtype=np.float64)
+        cdef double[:] upper_view = upper
+        cdef double[:] middle_view = middle
+        cdef double[:] lower_view = lower
+        cdef int i
+        for i in range(length):
+            self.update_raw(high[i], low[i], close[i])
+            upper_view[i] = self.upper
+            middle_view[i] = self.middle
+            lower_view[i] = self.lower
+        return upper, middle, lower
+
     cpdef void _reset(self):
         self._ma.reset()
-        self._prices.clear()
+        self._prices.reset()
 
         self.upper = 0.0
         self.middle = 0.0
@@ -13,10 +13,14 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-from collections import deque
+import cython
+import numpy as np
+
+cimport numpy as np
 
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.indicators.base.indicator cimport Indicator
+from nautilus_trader.indicators.base.rolling cimport RollingMinMax
 from nautilus_trader.model.data.bar cimport Bar
 from nautilus_trader.model.data.tick cimport QuoteTick
 from nautilus_trader.model.data.tick cimport TradeTick
@@ -48,8 +52,8 @@ cdef class DonchianChannel(Indicator):
         super().__init__(params=[period])
 
         self.period = period
-        self._upper_prices = deque(maxlen=period)
-        self._lower_prices = deque(maxlen=period)
+        self._upper_prices = RollingMinMax(period)
+        self._lower_prices = RollingMinMax(period)
 
         self.upper = 0
         self.middle = 0
@@ -113,23 +117,71 @@ cdef class DonchianChannel(Indicator):
 
         """
         # Add data to queues
-        self._upper_prices.append(high)
-        self._lower_prices.append(low)
+        self._upper_prices.update(high)
+        self._lower_prices.update(low)
 
         # Initialization logic
         if not self.initialized:
             self._set_has_inputs(True)
-            if len(self._upper_prices) >= self.period and len(self._lower_prices) >= self.period:
+            if self._upper_prices.count >= self.period and self._lower_prices.count >= self.period:
                 self._set_initialized(True)
 
         # Set values
-        self.upper = max(self._upper_prices)
-        self.lower = min(self._lower_prices)
+        self.upper = self._upper_prices.max()
+        self.lower = self._lower_prices.min()
         self.middle = (self.upper + self.lower) / 2
 
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def update_raw_batch(self, double[:] high, double[:] low):
+        """
+        Update the indicator with the given raw prices.
+
+        Each set of prices is applied in order with a call to `update_raw`, so
+        the results match the streaming updates exactly. This is not a typed
+        kernel, and saves only the per call overhead of the Python loop.
+
+        Parameters
+        ----------
+        high : np.ndarray
+            The high prices (float64).
+        low : np.ndarray
+            The low prices (float64).
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray, np.ndarray]
+            The upper, middle and lower values after each update.
+
+        Raises
+        ------
+        ValueError
+            If the lengths of `high` and `low` are not equal.
+
+        """
+        cdef int length = high.shape[0]
+        Condition.true(
+            low.shape[0] == length,
+            "the lengths of `high` and `low` were not equal",
+        )
+
+        cdef np.ndarray upper = np.empty(length, dtype=np.float64)
+        cdef np.ndarray middle = np.empty(length, dtype=np.float64)
+        cdef np.ndarray lower = np.empty(length, dtype=np.float64)
+        cdef double[:] upper_view = upper
+        cdef double[:] middle_view = middle
+        cdef double[:] lower_view = lower
+        cdef int i
+        for i in range(length):
+            self.update_raw(high[i], low[i])
+            upper_view[i] = self.upper
+            middle_view[i] = self.middle
+            lower_view[i] = self.lower
+        return upper, middle, lower
+
     cpdef void _reset(self):
-        self._upper_prices.clear()
-        self._lower_prices.clear()
+        self._upper_prices.reset()
+        self._lower_prices.reset()
 
         self.upper = 0
         self.middle = 0
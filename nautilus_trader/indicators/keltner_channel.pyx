@@ -13,9 +13,14 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import cython
+import numpy as np
+
 from nautilus_trader.indicators.average.ma_factory import MovingAverageFactory
 from nautilus_trader.indicators.average.ma_factory import MovingAverageType
 
+cimport numpy as np
+
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.indicators.atr cimport AverageTrueRange
 from nautilus_trader.indicators.base.indicator cimport Indicator
@@ -127,6 +132,56 @@ cdef class KeltnerChannel(Indicator):
             if self._ma.initialized:
                 self._set_initialized(True)
 
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def update_raw_batch(self, double[:] high, double[:] low, double[:] close):
+        """
+        Update the indicator with the given raw prices.
+
+        Each set of prices is applied in order with a call to `update_raw`, so
+        the results match the streaming updates exactly. This is not a typed
+        kernel, and saves only the per call overhead of the Python loop.
+
+        Parameters
+        ----------
+        high : np.ndarray
+            The high prices (float64).
+        low : np.ndarray
+            The low prices (float64).
+        close : np.ndarray
+            The close prices (float64).
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray, np.ndarray]
+            The upper, middle and lower values after each update.
+
+        Raises
+        ------
+        ValueError
+            If the lengths of `high`, `low` and `close` are not equal.
+
+        """
+        cdef int length = high.shape[0]
+        Condition.true(
+            low.shape[0] == length and close.shape[0] == length,
+            "the lengths of `high`, `low` and `close` were not equal",
+        )
+
+        cdef np.ndarray upper = np.empty(length, dtype=np.float64)
+        cdef np.ndarray middle = np.empty(length, dtype=np.float64)
+        cdef np.ndarray lower = np.empty(length, dtype=np.float64)
+        cdef double[:] upper_view = upper
+        cdef double[:] middle_view = middle
+        cdef double[:] lower_view = lower
+        cdef int i
+        for i in range(length):
+            self.update_raw(high[i], low[i], close[i])
+            upper_view[i] = self.upper
+            middle_view[i] = self.middle
+            lower_view[i] = self.lower
+        return upper, middle, lower
+
     cpdef void _reset(self):
         """
         Reset the indicator.
@@ -14,10 +14,11 @@
 # -------------------------------------------------------------------------------------------------
 
 from nautilus_trader.indicators.base.indicator cimport Indicator
+from nautilus_trader.indicators.base.rolling cimport RollingRegression
 
 
 cdef class LinearRegression(Indicator):
-    cdef object _inputs
+    cdef RollingRegression _inputs
 
     cdef readonly int period
     """The window period.\n\n:returns: `int`"""
@@ -13,15 +13,12 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-from collections import deque
-from statistics import mean
-
-import numpy as np
-
-cimport numpy as np
+from libc.math cimport M_PI
+from libc.math cimport atan
 
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.indicators.base.indicator cimport Indicator
+from nautilus_trader.indicators.base.rolling cimport RollingRegression
 from nautilus_trader.model.data.bar cimport Bar
 
 
@@ -45,7 +42,7 @@ cdef class LinearRegression(Indicator):
         super().__init__(params=[period])
 
         self.period = period
-        self._inputs = deque(maxlen=self.period)
+        self._inputs = RollingRegression(self.period)
         self.slope = 0.0
         self.intercept = 0.0
         self.degree = 0.0
@@ -77,38 +74,27 @@ cdef class LinearRegression(Indicator):
             The close price.
 
         """
-        self._inputs.append(close)
+        self._inputs.update(close)
 
         # Warmup indicator logic
         if not self.initialized:
             self._set_has_inputs(True)
-            if len(self._inputs) >= self.period:
+            if self._inputs.count >= self.period:
                 self._set_initialized(True)
             else:
                 return
 
-        cdef np.ndarray x_arr = np.arange(1, self.period + 1, dtype=np.float64)
-        cdef np.ndarray y_arr = np.asarray(self._inputs, dtype=np.float64)
-        cdef double x_sum = 0.5 * self.period * (self.period + 1)
-        cdef double x2_sum = x_sum * (2 * self.period + 1) / 3
-        cdef double divisor = self.period * x2_sum - x_sum * x_sum
-        cdef double y_sum = sum(y_arr)
-        cdef double xy_sum = sum(x_arr * y_arr)
-        self.slope = (self.period * xy_sum - x_sum * y_sum) / divisor
-        self.intercept = (y_sum * x2_sum - x_sum * xy_sum) / divisor
-
-        cdef np.ndarray residuals = np.zeros(self.period, dtype=np.float64)
-        cdef int i
-        for i in np.arange(self.period):
-            residuals[i] = self.slope * x_arr[i] + self.intercept - y_arr[i]
-
-        self.value = residuals[-1] + y_arr[-1]
-        self.degree = 180.0 / np.pi * np.arctan(self.slope)
-        self.cfo = 100.0 * residuals[-1] / y_arr[-1]
-        self.R2 = 1.0 - sum(residuals * residuals) / sum((y_arr - mean(y_arr)) * (y_arr - mean(y_arr)))
+        self.slope = self._inputs.slope()
+        self.intercept = self._inputs.intercept()
+
+        cdef double residual = self.slope * self.period + self.intercept - close
+        self.value = residual + close
+        self.degree = 180.0 / M_PI * atan(self.slope)
+        self.cfo = 100.0 * residual / close
+        self.R2 = self._inputs.r_squared()
 
     cpdef void _reset(self):
-        self._inputs.clear()
+        self._inputs.reset()
         self.slope = 0.0
         self.intercept = 0.0
         self.degree = 0.0
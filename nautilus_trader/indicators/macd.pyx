@@ -13,9 +13,14 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import cython
+import numpy as np
+
 from nautilus_trader.indicators.average.ma_factory import MovingAverageFactory
 from nautilus_trader.indicators.average.moving_average import MovingAverageType
 
+cimport numpy as np
+
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.indicators.base.indicator cimport Indicator
 from nautilus_trader.model.data.bar cimport Bar
@@ -139,6 +144,36 @@ cdef class MovingAverageConvergenceDivergence(Indicator):
             if self._fast_ma.initialized and self._slow_ma.initialized:
                 self._set_initialized(True)
 
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def update_raw_batch(self, double[:] close):
+        """
+        Update the indicator with the given raw values.
+
+        Each value is applied in order with a call to `update_raw`, so the results
+        match the streaming updates exactly. This is not a typed kernel, and saves
+        only the per call overhead of the Python loop.
+
+        Parameters
+        ----------
+        close : np.ndarray
+            The close prices (float64).
+
+        Returns
+        -------
+        np.ndarray
+            The indicator value after each update.
+
+        """
+        cdef int length = close.shape[0]
+        cdef np.ndarray output = np.empty(length, dtype=np.float64)
+        cdef double[:] output_view = output
+        cdef int i
+        for i in range(length):
+            self.update_raw(close[i])
+            output_view[i] = self.value
+        return output
+
     cpdef void _reset(self):
         self._fast_ma.reset()
         self._slow_ma.reset()
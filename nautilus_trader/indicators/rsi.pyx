@@ -13,9 +13,14 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import cython
+import numpy as np
+
 from nautilus_trader.indicators.average.ma_factory import MovingAverageFactory
 from nautilus_trader.indicators.average.moving_average import MovingAverageType
 
+cimport numpy as np
+
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.indicators.base.indicator cimport Indicator
 from nautilus_trader.model.data.bar cimport Bar
@@ -108,6 +113,36 @@ cdef class RelativeStrengthIndex(Indicator):
         self.value = self._rsi_max - (self._rsi_max / (1 + rs))
         self._last_value = value
 
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def update_raw_batch(self, double[:] values):
+        """
+        Update the indicator with the given raw values.
+
+        Each value is applied in order with a call to `update_raw`, so the results
+        match the streaming updates exactly. This is not a typed kernel, and saves
+        only the per call overhead of the Python loop.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            The update values (float64).
+
+        Returns
+        -------
+        np.ndarray
+            The indicator value after each update.
+
+        """
+        cdef int length = values.shape[0]
+        cdef np.ndarray output = np.empty(length, dtype=np.float64)
+        cdef double[:] output_view = output
+        cdef int i
+        for i in range(length):
+            self.update_raw(values[i])
+            output_view[i] = self.value
+        return output
+
     cpdef void _reset(self):
         self._average_gain.reset()
         self._average_loss.reset()
@@ -13,7 +13,13 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from nautilus_trader.accounting.accounts.base cimport Account
 from nautilus_trader.cache.database cimport CacheDatabase
+from nautilus_trader.model.currency cimport Currency
+from nautilus_trader.model.identifiers cimport ClientOrderId
+from nautilus_trader.model.identifiers cimport PositionId
+from nautilus_trader.model.orders.base cimport Order
+from nautilus_trader.model.position cimport Position
 from nautilus_trader.serialization.base cimport Serializer
 
 
@@ -36,3 +42,23 @@ cdef class RedisCacheDatabase(CacheDatabase):
 
     cdef Serializer _serializer
     cdef object _redis
+    cdef int _read_batch_size
+    cdef int _write_batch_size
+    cdef bint _buffer_writes
+    cdef object _pipe
+    cdef list _pipe_checks
+    cdef object _write_queue
+
+    cdef list _scan_keys(self, str pattern)
+    cdef list _get_values(self, list keys)
+    cdef list _get_lists(self, list keys)
+    cdef list _get_hashes(self, list keys)
+    cdef Currency _currency_from_hash(self, str code, dict c_hash)
+    cdef Account _account_from_events(self, list events)
+    cdef Order _order_from_events(self, list events)
+    cdef Position _position_from_events(self, list events, dict instruments)
+    cdef void _queue_index_order_position(self, ClientOrderId client_order_id, PositionId position_id)
+    cdef void _sync_for_read(self)
+    cdef void _write(self, str key, str op, object payload, tuple check)
+    cdef void _end_write(self, bint buffered)
+    cdef void _check_write_reply(self, tuple check, object reply)
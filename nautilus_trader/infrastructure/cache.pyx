@@ -16,6 +16,11 @@
 import warnings
 from typing import Optional
 
+from nautilus_trader.cache.write_behind import WRITE_DELETE
+from nautilus_trader.cache.write_behind import WRITE_HSET
+from nautilus_trader.cache.write_behind import WRITE_RPUSH
+from nautilus_trader.cache.write_behind import WRITE_SET
+from nautilus_trader.cache.write_behind import WriteBehindQueue
 from nautilus_trader.config import CacheDatabaseConfig
 
 from cpython.datetime cimport datetime
@@ -83,6 +88,12 @@ cdef str _SNAPSHOTS_ORDERS = "snapshots:orders"
 cdef str _SNAPSHOTS_POSITIONS = "snapshots:positions"
 cdef str _HEARTBEAT = "health:heartbeat"
 
+# Reply checks for buffered write commands
+cdef int _CHECK_ADD_ACCOUNT = 1
+cdef int _CHECK_ADD_ORDER = 2
+cdef int _CHECK_ADD_POSITION = 3
+cdef int _CHECK_UPDATE_ORDER = 4
+
 
 cdef class RedisCacheDatabase(CacheDatabase):
     """
@@ -162,6 +173,41 @@ cdef class RedisCacheDatabase(CacheDatabase):
             ssl=config.ssl,
         )
 
+        # Batching
+        Condition.positive_int(config.read_batch_size, "config.read_batch_size")
+        Condition.positive_int(config.write_batch_size, "config.write_batch_size")
+        self._read_batch_size = config.read_batch_size
+        self._write_batch_size = config.write_batch_size
+        self._buffer_writes = config.buffer_writes
+        self._pipe = self._redis.pipeline()
+        self._pipe_checks = []  # Reply checks for the queued write commands
+
+        # Write-behind
+        self._write_queue = None
+        if config.write_behind:
+            Condition.true(
+                config.write_queue_size > config.write_batch_size,
+                "`config.write_queue_size` must be greater than `config.write_batch_size`",
+            )
+            self._write_queue = WriteBehindQueue(
+                writer=self._write_commands,
+                logger=logger,
+                maxsize=config.write_queue_size,
+            )
+            self._write_queue.start()
+
+    @property
+    def write_queue(self):
+        """
+        Return the write-behind queue for the database (if configured).
+
+        Returns
+        -------
+        WriteBehindQueue or ``None``
+
+        """
+        return self._write_queue
+
 # -- COMMANDS -------------------------------------------------------------------------------------
 
     cpdef void flush(self):
@@ -170,6 +216,10 @@ cdef class RedisCacheDatabase(CacheDatabase):
 
         """
         self._log.debug("Flushing database....")
+        if self._write_queue is not None:
+            self._write_queue.clear()  # Barrier: no pending writes land after the flush
+        self._pipe.reset()  # Discard any buffered writes
+        self._pipe_checks.clear()
         self._redis.flushdb()
         self._log.info("Flushed database.", LogColor.BLUE)
 
@@ -182,17 +232,20 @@ cdef class RedisCacheDatabase(CacheDatabase):
         dict[str, bytes]
 
         """
+        self._sync_for_read()
+
         cdef dict general = {}
 
-        cdef list general_keys = self._redis.keys(f"{self._key_general}*")
+        cdef list general_keys = self._scan_keys(f"{self._key_general}*")
         if not general_keys:
             return general
 
+        cdef list values = self._get_values(general_keys)
+
         cdef bytes key_bytes
         cdef bytes value_bytes
         cdef str key
-        for key_bytes in general_keys:
-            value_bytes = self._redis.get(name=key_bytes)
+        for key_bytes, value_bytes in zip(general_keys, values):
             if value_bytes is not None:
                 key = key_bytes.decode(_UTF8).rsplit(':', maxsplit=1)[1]
                 general[key] = value_bytes
@@ -208,18 +261,23 @@ cdef class RedisCacheDatabase(CacheDatabase):
         dict[str, Currency]
 
         """
+        self._sync_for_read()
+
         cdef dict currencies = {}
 
-        cdef list currency_keys = self._redis.keys(f"{self._key_currencies}*")
+        cdef list currency_keys = self._scan_keys(f"{self._key_currencies}*")
         if not currency_keys:
             return currencies
 
+        cdef list hashes = self._get_hashes(currency_keys)
+
         cdef bytes key_bytes
+        cdef dict c_hash
         cdef str currency_code
         cdef Currency currency
-        for key_bytes in currency_keys:
+        for key_bytes, c_hash in zip(currency_keys, hashes):
             currency_code = key_bytes.decode(_UTF8).rsplit(':', maxsplit=1)[1]
-            currency = self.load_currency(currency_code)
+            currency = self._currency_from_hash(currency_code, c_hash)
 
             if currency is not None:
                 currencies[currency.code] = currency
@@ -235,23 +293,22 @@ cdef class RedisCacheDatabase(CacheDatabase):
         dict[InstrumentId, Instrument]
 
         """
+        self._sync_for_read()
+
         cdef dict instruments = {}
 
-        cdef list instrument_keys = self._redis.keys(f"{self._key_instruments}*")
+        cdef list instrument_keys = self._scan_keys(f"{self._key_instruments}*")
         if not instrument_keys:
             return instruments
 
-        cdef bytes key_bytes
-        cdef str key_str
-        cdef InstrumentId instrument_id
+        cdef bytes instrument_bytes
         cdef Instrument instrument
-        for key_bytes in instrument_keys:
-            key_str = key_bytes.decode(_UTF8).rsplit(':', maxsplit=1)[1]
-            instrument_id = InstrumentId.from_str_c(key_str)
-            instrument = self.load_instrument(instrument_id)
+        for instrument_bytes in self._get_values(instrument_keys):
+            if not instrument_bytes:
+                continue
 
-            if instrument is not None:
-                instruments[instrument.id] = instrument
+            instrument = self._serializer.deserialize(instrument_bytes)
+            instruments[instrument.id] = instrument
 
         return instruments
 
@@ -264,23 +321,22 @@ cdef class RedisCacheDatabase(CacheDatabase):
         dict[InstrumentId, SyntheticInstrument]
 
         """
+        self._sync_for_read()
+
         cdef dict synthetics = {}
 
-        cdef list synthetic_keys = self._redis.keys(f"{self._key_synthetics}*")
+        cdef list synthetic_keys = self._scan_keys(f"{self._key_synthetics}*")
         if not synthetic_keys:
             return synthetics
 
-        cdef bytes key_bytes
-        cdef str key_str
-        cdef InstrumentId instrument_id
+        cdef bytes synthetic_bytes
         cdef SyntheticInstrument synthetic
-        for key_bytes in synthetic_keys:
-            key_str = key_bytes.decode(_UTF8).rsplit(':', maxsplit=1)[1]
-            instrument_id = InstrumentId.from_str_c(key_str)
-            synthetic = self.load_synthetic(instrument_id)
+        for synthetic_bytes in self._get_values(synthetic_keys):
+            if not synthetic_bytes:
+                continue
 
-            if synthetic is not None:
-                synthetics[synthetic.id] = synthetic
+            synthetic = self._serializer.deserialize(synthetic_bytes)
+            synthetics[synthetic.id] = synthetic
 
         return synthetics
 
@@ -293,20 +349,18 @@ cdef class RedisCacheDatabase(CacheDatabase):
         dict[AccountId, Account]
 
         """
+        self._sync_for_read()
+
         cdef dict accounts = {}
 
-        cdef list account_keys = self._redis.keys(f"{self._key_accounts}*")
+        cdef list account_keys = self._scan_keys(f"{self._key_accounts}*")
         if not account_keys:
             return accounts
 
-        cdef bytes key_bytes
-        cdef str account_str
-        cdef AccountId account_id
+        cdef list events
         cdef Account account
-        for key_bytes in account_keys:
-            account_str = key_bytes.decode(_UTF8).rsplit(':', maxsplit=1)[1]
-            account_id = AccountId(account_str)
-            account = self.load_account(account_id)
+        for events in self._get_lists(account_keys):
+            account = self._account_from_events(events)
 
             if account is not None:
                 accounts[account.id] = account
@@ -322,20 +376,18 @@ cdef class RedisCacheDatabase(CacheDatabase):
         dict[ClientOrderId, Order]
 
         """
+        self._sync_for_read()
+
         cdef dict orders = {}
 
-        cdef list order_keys = self._redis.keys(f"{self._key_orders}*")
+        cdef list order_keys = self._scan_keys(f"{self._key_orders}*")
         if not order_keys:
             return orders
 
-        cdef bytes key_bytes
-        cdef str key_str
-        cdef ClientOrderId client_order_id
+        cdef list events
         cdef Order order
-        for key_bytes in order_keys:
-            key_str = key_bytes.decode(_UTF8).rsplit(':', maxsplit=1)[1]
-            client_order_id = ClientOrderId(key_str)
-            order = self.load_order(client_order_id)
+        for events in self._get_lists(order_keys):
+            order = self._order_from_events(events)
 
             if order is not None:
                 orders[order.client_order_id] = order
@@ -351,20 +403,19 @@ cdef class RedisCacheDatabase(CacheDatabase):
         dict[PositionId, Position]
 
         """
+        self._sync_for_read()
+
         cdef dict positions = {}
 
-        cdef list position_keys = self._redis.keys(f"{self._key_positions}*")
+        cdef list position_keys = self._scan_keys(f"{self._key_positions}*")
         if not position_keys:
             return positions
 
-        cdef bytes key_bytes
-        cdef str key_str
-        cdef PositionId position_id
+        cdef dict instruments = {}  # Instruments loaded for the positions
+        cdef list events
         cdef Position position
-        for key_bytes in position_keys:
-            key_str = key_bytes.decode(_UTF8).rsplit(':', maxsplit=1)[1]
-            position_id = PositionId(key_str)
-            position = self.load_position(position_id)
+        for events in self._get_lists(position_keys):
+            position = self._position_from_events(events, instruments)
 
             if position is not None:
                 positions[position.id] = position
@@ -380,6 +431,8 @@ cdef class RedisCacheDatabase(CacheDatabase):
         dict[ClientOrderId, PositionId]
 
         """
+        self._sync_for_read()
+
         cdef dict raw_index = self._redis.hgetall(self._key_index_order_position)
 
         return {ClientOrderId(k.decode("utf-8")): PositionId(v.decode("utf-8")) for k, v in raw_index.items()}
@@ -393,6 +446,8 @@ cdef class RedisCacheDatabase(CacheDatabase):
         dict[ClientOrderId, ClientId]
 
         """
+        self._sync_for_read()
+
         cdef dict raw_index = self._redis.hgetall(self._key_index_order_client)
 
         return {ClientOrderId(k.decode("utf-8")): ClientId(v.decode("utf-8")) for k, v in raw_index.items()}
@@ -413,18 +468,9 @@ cdef class RedisCacheDatabase(CacheDatabase):
         """
         Condition.not_none(code, "code")
 
-        cdef dict c_hash = self._redis.hgetall(name=self._key_currencies + code)
-        cdef dict c_map = {k.decode('utf-8'): v for k, v in c_hash.items()}
-        if not c_map:
-            return None
+        self._sync_for_read()
 
-        return Currency(
-            code=code,
-            precision=int(c_map["precision"]),
-            iso4217=int(c_map["iso4217"]),
-            name=c_map["name"].decode(_UTF8),
-            currency_type=currency_type_from_str(c_map["currency_type"].decode("utf-8")),
-        )
+        return self._currency_from_hash(code, self._redis.hgetall(name=self._key_currencies + code))
 
     cpdef Instrument load_instrument(self, InstrumentId instrument_id):
         """
@@ -443,6 +489,8 @@ cdef class RedisCacheDatabase(CacheDatabase):
         """
         Condition.not_none(instrument_id, "instrument_id")
 
+        self._sync_for_read()
+
         cdef str key = self._key_instruments + instrument_id.to_str()
         cdef bytes instrument_bytes = self._redis.get(name=key)
         if not instrument_bytes:
@@ -473,6 +521,8 @@ cdef class RedisCacheDatabase(CacheDatabase):
         Condition.not_none(instrument_id, "instrument_id")
         Condition.true(instrument_id.is_synthetic(), "instrument_id was not for a synthetic instrument")
 
+        self._sync_for_read()
+
         cdef str key = self._key_synthetics + instrument_id.to_str()
         cdef bytes synthetic_bytes = self._redis.get(name=key)
         if not synthetic_bytes:
@@ -496,22 +546,15 @@ cdef class RedisCacheDatabase(CacheDatabase):
         """
         Condition.not_none(account_id, "account_id")
 
+        self._sync_for_read()
+
         cdef list events = self._redis.lrange(
             name=self._key_accounts + account_id.to_str(),
             start=0,
             end=-1,
         )
 
-        # Check there is at least one event to pop
-        if not events:
-            return None
-
-        cdef bytes event
-        cdef Account account = AccountFactory.create_c(self._serializer.deserialize(events[0]))
-        for event in events[1:]:
-            account.apply(event=self._serializer.deserialize(event))
-
-        return account
+        return self._account_from_events(events)
 
     cpdef Order load_order(self, ClientOrderId client_order_id):
         """
@@ -529,12 +572,102 @@ cdef class RedisCacheDatabase(CacheDatabase):
         """
         Condition.not_none(client_order_id, "client_order_id")
 
+        self._sync_for_read()
+
         cdef list events = self._redis.lrange(
             name=self._key_orders + client_order_id.to_str(),
             start=0,
             end=-1,
         )
 
+        return self._order_from_events(events)
+
+    cpdef Position load_position(self, PositionId position_id):
+        """
+        Load the position associated with the given ID (if found).
+
+        Parameters
+        ----------
+        position_id : PositionId
+            The position ID to load.
+
+        Returns
+        -------
+        Position or ``None``
+
+        """
+        Condition.not_none(position_id, "position_id")
+
+        self._sync_for_read()
+
+        cdef list events = self._redis.lrange(
+            name=self._key_positions + position_id.to_str(),
+            start=0,
+            end=-1,
+        )
+
+        return self._position_from_events(events, {})
+
+    cdef list _scan_keys(self, str pattern):
+        # SCAN may return a key more than once, so deduplicate (preserving order)
+        return list(dict.fromkeys(self._redis.scan_iter(match=pattern, count=self._read_batch_size)))
+
+    cdef list _get_values(self, list keys):
+        cdef list values = []
+        cdef int i
+        for i in range(0, len(keys), self._read_batch_size):
+            values.extend(self._redis.mget(keys[i:i + self._read_batch_size]))
+
+        return values
+
+    cdef list _get_lists(self, list keys):
+        cdef list values = []
+        cdef int i
+        for i in range(0, len(keys), self._read_batch_size):
+            pipe = self._redis.pipeline(transaction=False)
+            for key in keys[i:i + self._read_batch_size]:
+                pipe.lrange(key, 0, -1)
+            values.extend(pipe.execute())
+
+        return values
+
+    cdef list _get_hashes(self, list keys):
+        cdef list values = []
+        cdef int i
+        for i in range(0, len(keys), self._read_batch_size):
+            pipe = self._redis.pipeline(transaction=False)
+            for key in keys[i:i + self._read_batch_size]:
+                pipe.hgetall(key)
+            values.extend(pipe.execute())
+
+        return values
+
+    cdef Currency _currency_from_hash(self, str code, dict c_hash):
+        cdef dict c_map = {k.decode('utf-8'): v for k, v in c_hash.items()}
+        if not c_map:
+            return None
+
+        return Currency(
+            code=code,
+            precision=int(c_map["precision"]),
+            iso4217=int(c_map["iso4217"]),
+            name=c_map["name"].decode(_UTF8),
+            currency_type=currency_type_from_str(c_map["currency_type"].decode("utf-8")),
+        )
+
+    cdef Account _account_from_events(self, list events):
+        # Check there is at least one event to pop
+        if not events:
+            return None
+
+        cdef bytes event
+        cdef Account account = AccountFactory.create_c(self._serializer.deserialize(events[0]))
+        for event in events[1:]:
+            account.apply(event=self._serializer.deserialize(event))
+
+        return account
+
+    cdef Order _order_from_events(self, list events):
         # Check there is at least one event to pop
         if not events:
             return None
@@ -567,40 +700,25 @@ cdef class RedisCacheDatabase(CacheDatabase):
 
         return order
 
-    cpdef Position load_position(self, PositionId position_id):
-        """
-        Load the position associated with the given ID (if found).
-
-        Parameters
-        ----------
-        position_id : PositionId
-            The position ID to load.
-
-        Returns
-        -------
-        Position or ``None``
-
-        """
-        Condition.not_none(position_id, "position_id")
-
-        cdef list events = self._redis.lrange(
-            name=self._key_positions + position_id.to_str(),
-            start=0,
-            end=-1,
-        )
-
+    cdef Position _position_from_events(self, list events, dict instruments):
         # Check there is at least one event to pop
         if not events:
             return None
 
         cdef OrderFilled initial_fill = self._serializer.deserialize(events.pop(0))
-        cdef Instrument instrument = self.load_instrument(initial_fill.instrument_id)
+
+        cdef Instrument instrument
+        if initial_fill.instrument_id in instruments:
+            instrument = instruments[initial_fill.instrument_id]
+        else:
+            instrument = self.load_instrument(initial_fill.instrument_id)
+            instruments[initial_fill.instrument_id] = instrument
         if instrument is None:
             self._log.error(
                 f"Cannot load position: "
                 f"no instrument found for {initial_fill.instrument_id}",
             )
-            return
+            return None
 
         cdef Position position = Position(instrument, initial_fill)
 
@@ -639,6 +757,8 @@ cdef class RedisCacheDatabase(CacheDatabase):
         """
         Condition.not_none(component_id, "component_id")
 
+        self._sync_for_read()
+
         cdef dict user_state = self._redis.hgetall(
             name=self._key_actors + component_id.to_str() + ":state",
         )
@@ -656,7 +776,8 @@ cdef class RedisCacheDatabase(CacheDatabase):
         """
         Condition.not_none(component_id, "component_id")
 
-        self._redis.delete(self._key_actors + component_id.to_str() + ":state")
+        self._write(self._key_actors + component_id.to_str() + ":state", WRITE_DELETE, None, None)
+        self._end_write(False)
 
         self._log.info(f"Deleted {repr(component_id)}.")
 
@@ -676,6 +797,8 @@ cdef class RedisCacheDatabase(CacheDatabase):
         """
         Condition.not_none(strategy_id, "strategy_id")
 
+        self._sync_for_read()
+
         cdef dict user_state = self._redis.hgetall(
             name=self._key_strategies + strategy_id.to_str() + ":state",
         )
@@ -693,7 +816,8 @@ cdef class RedisCacheDatabase(CacheDatabase):
         """
         Condition.not_none(strategy_id, "strategy_id")
 
-        self._redis.delete(self._key_strategies + strategy_id.to_str() + ":state")
+        self._write(self._key_strategies + strategy_id.to_str() + ":state", WRITE_DELETE, None, None)
+        self._end_write(False)
 
         self._log.info(f"Deleted {repr(strategy_id)}.")
 
@@ -712,7 +836,9 @@ cdef class RedisCacheDatabase(CacheDatabase):
         Condition.not_none(key, "key")
         Condition.not_none(value, "value")
 
-        self._redis.set(name=self._key_general + key, value=value)
+        self._write(self._key_general + key, WRITE_SET, value, None)
+        self._end_write(False)
+
         self._log.debug(f"Added general object {key}.")
 
     cpdef void add_currency(self, Currency currency):
@@ -734,11 +860,8 @@ cdef class RedisCacheDatabase(CacheDatabase):
             "currency_type": currency_type_to_str(currency.currency_type)
         }
 
-        # Command pipeline
-        pipe = self._redis.pipeline()
-        for key, value in currency_map.items():
-            pipe.hset(name=self._key_currencies + currency.code, key=key, value=value)
-        pipe.execute()
+        self._write(self._key_currencies + currency.code, WRITE_HSET, currency_map, None)
+        self._end_write(False)
 
         self._log.debug(f"Added currency {currency.code}.")
 
@@ -755,7 +878,8 @@ cdef class RedisCacheDatabase(CacheDatabase):
         Condition.not_none(instrument, "instrument")
 
         cdef str key = self._key_instruments + instrument.id.to_str()
-        self._redis.set(name=key, value=self._serializer.serialize(instrument))
+        self._write(key, WRITE_SET, self._serializer.serialize(instrument), None)
+        self._end_write(False)
 
         self._log.debug(f"Added instrument {instrument.id}.")
 
@@ -772,7 +896,8 @@ cdef class RedisCacheDatabase(CacheDatabase):
         Condition.not_none(synthetic, "synthetic")
 
         cdef str key = self._key_synthetics + synthetic.id.value
-        self._redis.set(name=key, value=self._serializer.serialize(synthetic))
+        self._write(key, WRITE_SET, self._serializer.serialize(synthetic), None)
+        self._end_write(False)
 
         self._log.debug(f"Added synthetic instrument {synthetic.id}.")
 
@@ -788,18 +913,16 @@ cdef class RedisCacheDatabase(CacheDatabase):
         """
         Condition.not_none(account, "account")
 
-        # Command pipeline
-        pipe = self._redis.pipeline()
-        pipe.rpush(self._key_accounts + account.id.to_str(), self._serializer.serialize(account.last_event_c()))
-        cdef list reply = pipe.execute()
-
-        # Check data integrity of reply
-        if len(reply) > 1:  # Reply = The length of the list after the push operation
-            self._log.error(
-                f"The {repr(account.id)} already existed and was appended to.",
-            )
+        cdef bytes last_event = self._serializer.serialize(account.last_event_c())
+        self._write(
+            self._key_accounts + account.id.to_str(),
+            WRITE_RPUSH,
+            last_event,
+            (_CHECK_ADD_ACCOUNT, account.id),
+        )
 
         self._log.debug(f"Added {account}.")
+        self._end_write(True)
 
     cpdef void add_order(self, Order order, PositionId position_id = None, ClientId client_id = None):
         """
@@ -818,23 +941,28 @@ cdef class RedisCacheDatabase(CacheDatabase):
         Condition.not_none(order, "order")
 
         cdef bytes last_event = self._serializer.serialize(order.last_event_c())
-        cdef int reply = self._redis.rpush(self._key_orders + order.client_order_id.to_str(), last_event)
-
-        # Check data integrity of reply
-        if reply > 1:  # Reply = The length of the list after the push operation
-            # Dropped the log level to debug as this is expected for transformed orders
-            self._log.debug(
-                f"The {repr(order.client_order_id)} already existed and was appended to.",
-            )
+        self._write(
+            self._key_orders + order.client_order_id.to_str(),
+            WRITE_RPUSH,
+            last_event,
+            (_CHECK_ADD_ORDER, order.client_order_id),
+        )
 
         self._log.debug(f"Added {order}.")
 
         if position_id is not None:
-            self.index_order_position(order.client_order_id, position_id)
+            self._queue_index_order_position(order.client_order_id, position_id)
         if client_id is not None:
-            self._redis.hset(self._key_index_order_client, order.client_order_id.to_str(), client_id.to_str())
+            self._write(
+                self._key_index_order_client,
+                WRITE_HSET,
+                {order.client_order_id.to_str(): client_id.to_str()},
+                None,
+            )
             self._log.debug(f"Indexed {order.client_order_id!r} -> {client_id!r}")
 
+        self._end_write(True)
+
     cpdef void add_position(self, Position position):
         """
         Add the given position to the database.
@@ -848,15 +976,15 @@ cdef class RedisCacheDatabase(CacheDatabase):
         Condition.not_none(position, "position")
 
         cdef bytes last_event = self._serializer.serialize(position.last_event_c())
-        cdef int reply = self._redis.rpush(self._key_positions + position.id.to_str(), last_event)
-
-        # Check data integrity of reply
-        if reply > 1:  # Reply = The length of the list after the push operation
-            self._log.warning(
-                f"The {repr(position.id)} already existed and was appended to.",
-            )
+        self._write(
+            self._key_positions + position.id.to_str(),
+            WRITE_RPUSH,
+            last_event,
+            (_CHECK_ADD_POSITION, position.id),
+        )
 
         self._log.debug(f"Added {position}.")
+        self._end_write(True)
 
     cpdef void index_order_position(self, ClientOrderId client_order_id, PositionId position_id):
         """
@@ -873,10 +1001,15 @@ cdef class RedisCacheDatabase(CacheDatabase):
         Condition.not_none(client_order_id, "client_order_id")
         Condition.not_none(position_id, "position_id")
 
-        self._redis.hset(
+        self._queue_index_order_position(client_order_id, position_id)
+        self._end_write(True)
+
+    cdef void _queue_index_order_position(self, ClientOrderId client_order_id, PositionId position_id):
+        self._write(
             self._key_index_order_position,
-            client_order_id.to_str(),
-            position_id.to_str(),
+            WRITE_HSET,
+            {client_order_id.to_str(): position_id.to_str()},
+            None,
         )
 
         self._log.debug(f"Indexed {client_order_id!r} -> {position_id!r}")
@@ -895,16 +1028,11 @@ cdef class RedisCacheDatabase(CacheDatabase):
 
         cdef dict state = actor.save()  # Extract state dictionary from strategy
 
-        # Command pipeline
-        pipe = self._redis.pipeline()
         for key, value in state.items():
-            pipe.hset(
-                name=self._key_actors + actor.id.value + ":state",
-                key=key,
-                value=value,
-            )
             self._log.debug(f"Saving {actor.id} state {{ {key}: {value} }}")
-        pipe.execute()
+        if state:
+            self._write(self._key_actors + actor.id.value + ":state", WRITE_HSET, state, None)
+            self._end_write(False)
 
         self._log.debug(f"Saved actor state for {actor.id.value}.")
 
@@ -922,16 +1050,11 @@ cdef class RedisCacheDatabase(CacheDatabase):
 
         cdef dict state = strategy.save()  # Extract state dictionary from strategy
 
-        # Command pipeline
-        pipe = self._redis.pipeline()
         for key, value in state.items():
-            pipe.hset(
-                name=self._key_strategies + strategy.id.value + ":state",
-                key=key,
-                value=value,
-            )
             self._log.debug(f"Saving {strategy.id} state {{ {key}: {value} }}")
-        pipe.execute()
+        if state:
+            self._write(self._key_strategies + strategy.id.value + ":state", WRITE_HSET, state, None)
+            self._end_write(False)
 
         self._log.debug(f"Saved strategy state for {strategy.id.value}.")
 
@@ -947,9 +1070,10 @@ cdef class RedisCacheDatabase(CacheDatabase):
         Condition.not_none(account, "account")
 
         cdef bytes serialized_event = self._serializer.serialize(account.last_event_c())
-        self._redis.rpush(self._key_accounts + account.id.to_str(), serialized_event)
+        self._write(self._key_accounts + account.id.to_str(), WRITE_RPUSH, serialized_event, None)
 
         self._log.debug(f"Updated {account}.")
+        self._end_write(True)
 
     cpdef void update_order(self, Order order):
         """
@@ -964,13 +1088,15 @@ cdef class RedisCacheDatabase(CacheDatabase):
         Condition.not_none(order, "order")
 
         cdef bytes serialized_event = self._serializer.serialize(order.last_event_c())
-        cdef int reply = self._redis.rpush(self._key_orders + order.client_order_id.to_str(), serialized_event)
-
-        # Check data integrity of reply
-        if reply == 1:  # Reply = The length of the list after the push operation
-            self._log.error(f"The updated Order(id={order.client_order_id.to_str()}) did not already exist.")
+        self._write(
+            self._key_orders + order.client_order_id.to_str(),
+            WRITE_RPUSH,
+            serialized_event,
+            (_CHECK_UPDATE_ORDER, order.client_order_id),
+        )
 
         self._log.debug(f"Updated {order}.")
+        self._end_write(True)
 
     cpdef void update_position(self, Position position):
         """
@@ -985,9 +1111,15 @@ cdef class RedisCacheDatabase(CacheDatabase):
         Condition.not_none(position, "position")
 
         cdef bytes serialized_event = self._serializer.serialize(position.last_event_c())
-        cdef int reply = self._redis.rpush(self._key_positions + position.id.to_str(), serialized_event)
+        self._write(
+            self._key_positions + position.id.to_str(),
+            WRITE_RPUSH,
+            serialized_event,
+            None,
+        )
 
         self._log.debug(f"Updated {position}.")
+        self._end_write(True)
 
     cpdef void snapshot_order_state(self, Order order):
         """
@@ -1004,9 +1136,15 @@ cdef class RedisCacheDatabase(CacheDatabase):
         cdef dict order_state = order.to_dict()
         cdef bytes snapshot_bytes = self._serializer.serialize(order_state)
 
-        self._redis.rpush(self._key_snapshots_orders + order.client_order_id.to_str(), snapshot_bytes)
+        self._write(
+            self._key_snapshots_orders + order.client_order_id.to_str(),
+            WRITE_RPUSH,
+            snapshot_bytes,
+            None,
+        )
 
         self._log.debug(f"Added state snapshot {order}.")
+        self._end_write(True)
 
     cpdef void snapshot_position_state(self, Position position, Money unrealized_pnl = None):
         """
@@ -1028,9 +1166,15 @@ cdef class RedisCacheDatabase(CacheDatabase):
             position_state["unrealized_pnl"] = unrealized_pnl.to_str()
 
         cdef bytes snapshot_bytes = self._serializer.serialize(position_state)
-        self._redis.rpush(self._key_snapshots_positions + position.id.to_str(), snapshot_bytes)
+        self._write(
+            self._key_snapshots_positions + position.id.to_str(),
+            WRITE_RPUSH,
+            snapshot_bytes,
+            None,
+        )
 
         self._log.debug(f"Added state snapshot {position}.")
+        self._end_write(True)
 
     cpdef void heartbeat(self, datetime timestamp):
         """
@@ -1045,6 +1189,137 @@ cdef class RedisCacheDatabase(CacheDatabase):
         Condition.not_none(timestamp, "timestamp")
 
         cdef timestamp_str = format_iso8601(timestamp)
-        self._redis.set(self._key_heartbeat, timestamp_str)
+        self._write(self._key_heartbeat, WRITE_SET, timestamp_str, None)
+        self._end_write(False)
 
         self._log.debug(f"Set last heartbeat {timestamp_str}.")
+
+    cpdef void flush_writes(self):
+        """
+        Flush any buffered write commands to the database.
+
+        The commands are sent as a single transactional pipeline, then the
+        replies are checked for data integrity. If write-behind is configured
+        then the buffered writes are committed to the write-behind queue instead.
+
+        """
+        if self._write_queue is not None:
+            self._write_queue.commit()
+            return
+
+        if not self._pipe_checks:
+            return
+
+        cdef list checks = self._pipe_checks
+        self._pipe_checks = []
+        cdef list replies = self._pipe.execute()
+
+        cdef int i
+        for i in range(len(checks)):
+            if checks[i] is not None:
+                self._check_write_reply(checks[i], replies[i])
+
+        self._log.debug(f"Flushed {len(checks)} write command(s).")
+
+    cpdef bint sync_writes(self, double timeout_secs=10.0):
+        """
+        Flush any buffered write commands, and wait until all writes have been
+        written to the database (a barrier for write-behind).
+
+        Parameters
+        ----------
+        timeout_secs : double, default 10.0
+            The maximum time to wait for the writes.
+
+        Returns
+        -------
+        bool
+            True if all writes were written within the timeout.
+
+        """
+        self.flush_writes()
+
+        if self._write_queue is None:
+            return True
+
+        return self._write_queue.sync(timeout_secs)
+
+    cpdef void close(self):
+        """
+        Close the database, writing all pending writes then stopping the
+        write-behind thread (if configured).
+
+        """
+        self.flush_writes()
+
+        if self._write_queue is None:
+            return
+
+        if not self._write_queue.stop(timeout_secs=10.0):
+            self._log.warning("Timed out waiting for pending writes on close.")
+
+    cdef void _sync_for_read(self):
+        if not self.sync_writes():
+            self._log.warning("Timed out waiting for pending writes, the read may be stale.")
+
+    cdef void _write(self, str key, str op, object payload, tuple check):
+        if self._write_queue is not None:
+            # Integrity checks are only made for synchronous writes
+            self._write_queue.put(key, op, payload)
+            return
+
+        if op == WRITE_RPUSH:
+            self._pipe.rpush(key, payload)
+        elif op == WRITE_HSET:
+            self._pipe.hset(key, mapping=payload)
+        elif op == WRITE_SET:
+            self._pipe.set(key, payload)
+        elif op == WRITE_DELETE:
+            self._pipe.delete(key)
+        else:
+            raise ValueError(f"Invalid write `op`, was {op}")  # pragma: no cover (design-time error)
+        self._pipe_checks.append(check)
+
+    cdef void _end_write(self, bint buffered):
+        # Buffered writes are flushed at event boundaries, or when the batch size is reached
+        if buffered and self._buffer_writes:
+            if self._write_queue is not None:
+                if self._write_queue.staged >= self._write_batch_size:
+                    self._write_queue.commit()
+            elif len(self._pipe_checks) >= self._write_batch_size:
+                self.flush_writes()
+        else:
+            self.flush_writes()
+
+    def _write_commands(self, dict commands) -> None:
+        # Called on the write-behind thread, with commands keyed in order
+        pipe = self._redis.pipeline()
+        for key, key_commands in commands.items():
+            for op, payload in key_commands:
+                if op == WRITE_RPUSH:
+                    pipe.rpush(key, *payload)
+                elif op == WRITE_HSET:
+                    pipe.hset(key, mapping=payload)
+                elif op == WRITE_SET:
+                    pipe.set(key, payload)
+                elif op == WRITE_DELETE:
+                    pipe.delete(key)
+        pipe.execute()
+
+    cdef void _check_write_reply(self, tuple check, object reply):
+        # Reply = The length of the list after the push operation
+        cdef int kind = check[0]
+        identifier = check[1]
+        if kind == _CHECK_ADD_ACCOUNT:
+            if reply > 1:
+                self._log.error(f"The {identifier!r} already existed and was appended to.")
+        elif kind == _CHECK_ADD_ORDER:
+            if reply > 1:
+                # Dropped the log level to debug as this is expected for transformed orders
+                self._log.debug(f"The {identifier!r} already existed and was appended to.")
+        elif kind == _CHECK_ADD_POSITION:
+            if reply > 1:
+                self._log.warning(f"The {identifier!r} already existed and was appended to.")
+        elif kind == _CHECK_UPDATE_ORDER:
+            if reply == 1:
+                self._log.error(f"The updated Order(id={identifier.to_str()}) did not already exist.")
@@ -20,7 +20,7 @@ import asyncio
 from nautilus_trader.cache.cache import Cache
 from nautilus_trader.common.clock import LiveClock
 from nautilus_trader.common.logging import Logger
-from nautilus_trader.common.queue import Queue
+from nautilus_trader.common.profiling import Profiler
 from nautilus_trader.config import LiveDataEngineConfig
 from nautilus_trader.core.correctness import PyCondition
 from nautilus_trader.core.data import Data
@@ -28,6 +28,7 @@ from nautilus_trader.data.engine import DataEngine
 from nautilus_trader.data.messages import DataCommand
 from nautilus_trader.data.messages import DataRequest
 from nautilus_trader.data.messages import DataResponse
+from nautilus_trader.live.queues import EngineQueue
 from nautilus_trader.msgbus.bus import MessageBus
 
 
@@ -80,10 +81,16 @@ class LiveDataEngine(DataEngine):
         )
 
         self._loop: asyncio.AbstractEventLoop = loop
-        self._cmd_queue: Queue = Queue(maxsize=config.qsize)
-        self._req_queue: Queue = Queue(maxsize=config.qsize)
-        self._res_queue: Queue = Queue(maxsize=config.qsize)
-        self._data_queue: Queue = Queue(maxsize=config.qsize)
+        self._cmd_queue = EngineQueue("cmd_queue", clock, self._log, maxsize=config.qsize)
+        self._req_queue = EngineQueue("req_queue", clock, self._log, maxsize=config.qsize)
+        self._res_queue = EngineQueue("res_queue", clock, self._log, maxsize=config.qsize)
+        self._data_queue = EngineQueue(
+            "data_queue",
+            clock,
+            self._log,
+            maxsize=config.qsize,
+            overflow_policy=config.qoverflow_policy,
+        )
 
         # Async tasks
         self._cmd_queue_task: asyncio.Task | None = None
@@ -196,6 +203,23 @@ class LiveDataEngine(DataEngine):
         """
         return self._data_queue.qsize()
 
+    def queue_telemetry(self) -> dict[str, dict]:
+        """
+        Return the telemetry for each of the engines internal queues.
+
+        Includes the enqueue-to-dequeue latency histogram summary, the high-water
+        mark of pending items, and the blocked, dropped and coalesced counts.
+
+        Returns
+        -------
+        dict[str, dict]
+
+        """
+        return {
+            queue.name: queue.telemetry()
+            for queue in (self._cmd_queue, self._req_queue, self._res_queue, self._data_queue)
+        }
+
     def kill(self) -> None:
         """
         Kill the engine by abruptly canceling the queue tasks and calling stop.
@@ -224,8 +248,8 @@ class LiveDataEngine(DataEngine):
         """
         Execute the given data command.
 
-        If the internal queue is already full then will log a warning and block
-        until queue size reduces.
+        If the internal queue is already full then will log a warning and hold
+        the message on a backlog until queue size reduces.
 
         Parameters
         ----------
@@ -241,21 +265,14 @@ class LiveDataEngine(DataEngine):
         PyCondition.not_none(command, "command")
         # Do not allow None through (None is a sentinel value which stops the queue)
 
-        try:
-            self._cmd_queue.put_nowait(command)
-        except asyncio.QueueFull:
-            self._log.warning(
-                f"Blocking on `_cmd_queue.put` as queue full at "
-                f"{self._cmd_queue.qsize()} items.",
-            )
-            self._loop.create_task(self._cmd_queue.put(command))  # Blocking until qsize reduces
+        self._cmd_queue.put(command)
 
     def request(self, request: DataRequest) -> None:
         """
         Handle the given request.
 
-        If the internal queue is already full then will log a warning and block
-        until queue size reduces.
+        If the internal queue is already full then will log a warning and hold
+        the message on a backlog until queue size reduces.
 
         Parameters
         ----------
@@ -271,21 +288,14 @@ class LiveDataEngine(DataEngine):
         PyCondition.not_none(request, "request")
         # Do not allow None through (None is a sentinel value which stops the queue)
 
-        try:
-            self._req_queue.put_nowait(request)
-        except asyncio.QueueFull:
-            self._log.warning(
-                f"Blocking on `_req_queue.put` as queue full at "
-                f"{self._req_queue.qsize()} items.",
-            )
-            self._loop.create_task(self._req_queue.put(request))  # Blocking until qsize reduces
+        self._req_queue.put(request)
 
     def response(self, response: DataResponse) -> None:
         """
         Handle the given response.
 
-        If the internal queue is already full then will log a warning and block
-        until queue size reduces.
+        If the internal queue is already full then will log a warning and hold
+        the message on a backlog until queue size reduces.
 
         Parameters
         ----------
@@ -300,21 +310,14 @@ class LiveDataEngine(DataEngine):
         """
         PyCondition.not_none(response, "response")
 
-        try:
-            self._res_queue.put_nowait(response)
-        except asyncio.QueueFull:
-            self._log.warning(
-                f"Blocking on `_res_queue.put` as queue full at "
-                f"{self._res_queue.qsize()} items.",
-            )
-            self._loop.create_task(self._res_queue.put(response))  # Blocking until qsize reduces
+        self._res_queue.put(response)
 
     def process(self, data: Data) -> None:
         """
         Process the given data.
 
-        If the internal queue is already full then will log a warning and block
-        until queue size reduces.
+        If the internal queue is already full then will log a warning and apply
+        the configured overflow policy (see `LiveDataEngineConfig.qoverflow_policy`).
 
         Parameters
         ----------
@@ -330,14 +333,7 @@ class LiveDataEngine(DataEngine):
         PyCondition.not_none(data, "data")
         # Do not allow None through (None is a sentinel value which stops the queue)
 
-        try:
-            self._data_queue.put_nowait(data)
-        except asyncio.QueueFull:
-            self._log.warning(
-                f"Blocking on `_data_queue.put` as queue full at "
-                f"{self._data_queue.qsize()} items.",
-            )
-            self._loop.create_task(self._data_queue.put(data))  # Blocking until qsize reduces
+        self._data_queue.put(data)
 
     # -- INTERNAL -------------------------------------------------------------------------------------
 
@@ -427,12 +423,18 @@ class LiveDataEngine(DataEngine):
 
     async def _run_data_queue(self) -> None:
         self._log.debug(f"Data queue processing starting (qsize={self.data_qsize()})...")
+        profiler: Profiler | None = self._msgbus.profiler
         try:
             while True:
                 data: Data | None = await self._data_queue.get()
                 if data is self._sentinel:
                     break
-                self._handle_data(data)
+                if profiler is None:
+                    self._handle_data(data)
+                else:
+                    start_ns = profiler.timestamp_ns()
+                    self._handle_data(data)
+                    profiler.record("engine:DataEngine.process", profiler.timestamp_ns() - start_ns)
         except asyncio.CancelledError:
             self._log.warning("Data message queue canceled.")
         finally:
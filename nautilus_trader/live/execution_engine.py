@@ -24,7 +24,7 @@ from nautilus_trader.cache.cache import Cache
 from nautilus_trader.common.clock import LiveClock
 from nautilus_trader.common.enums import LogColor
 from nautilus_trader.common.logging import Logger
-from nautilus_trader.common.queue import Queue
+from nautilus_trader.common.profiling import Profiler
 from nautilus_trader.config import LiveExecEngineConfig
 from nautilus_trader.core.correctness import PyCondition
 from nautilus_trader.core.datetime import dt_to_unix_nanos
@@ -39,6 +39,7 @@ from nautilus_trader.execution.reports import ExecutionReport
 from nautilus_trader.execution.reports import OrderStatusReport
 from nautilus_trader.execution.reports import PositionStatusReport
 from nautilus_trader.execution.reports import TradeReport
+from nautilus_trader.live.queues import EngineQueue
 from nautilus_trader.model.enums import LiquiditySide
 from nautilus_trader.model.enums import OrderStatus
 from nautilus_trader.model.enums import OrderType
@@ -117,8 +118,8 @@ class LiveExecutionEngine(ExecutionEngine):
         )
 
         self._loop: asyncio.AbstractEventLoop = loop
-        self._cmd_queue: Queue = Queue(maxsize=config.qsize)
-        self._evt_queue: Queue = Queue(maxsize=config.qsize)
+        self._cmd_queue = EngineQueue("cmd_queue", clock, self._log, maxsize=config.qsize)
+        self._evt_queue = EngineQueue("evt_queue", clock, self._log, maxsize=config.qsize)
 
         # Settings
         self._reconciliation: bool = config.reconciliation
@@ -232,6 +233,20 @@ class LiveExecutionEngine(ExecutionEngine):
         """
         return self._evt_queue.qsize()
 
+    def queue_telemetry(self) -> dict[str, dict]:
+        """
+        Return the telemetry for each of the engines internal queues.
+
+        Includes the enqueue-to-dequeue latency histogram summary, the high-water
+        mark of pending items, and the blocked and dropped counts.
+
+        Returns
+        -------
+        dict[str, dict]
+
+        """
+        return {queue.name: queue.telemetry() for queue in (self._cmd_queue, self._evt_queue)}
+
     # -- COMMANDS -------------------------------------------------------------------------------------
 
     def kill(self) -> None:
@@ -254,8 +269,8 @@ class LiveExecutionEngine(ExecutionEngine):
         """
         Execute the given command.
 
-        If the internal queue is already full then will log a warning and block
-        until queue size reduces.
+        If the internal queue is already full then will log a warning and hold
+        the message on a backlog until queue size reduces.
 
         Parameters
         ----------
@@ -271,21 +286,14 @@ class LiveExecutionEngine(ExecutionEngine):
         PyCondition.not_none(command, "command")
         # Do not allow None through (None is a sentinel value which stops the queue)
 
-        try:
-            self._cmd_queue.put_nowait(command)
-        except asyncio.QueueFull:
-            self._log.warning(
-                f"Blocking on `_cmd_queue.put` as queue full "
-                f"at {self._cmd_queue.qsize()} items.",
-            )
-            self._loop.create_task(self._cmd_queue.put(command))  # Blocking until qsize reduces
+        self._cmd_queue.put(command)
 
     def process(self, event: OrderEvent) -> None:
         """
         Process the given event.
 
-        If the internal queue is already full then will log a warning and block
-        until queue size reduces.
+        If the internal queue is already full then will log a warning and hold
+        the message on a backlog until queue size reduces.
 
         Parameters
         ----------
@@ -300,14 +308,7 @@ class LiveExecutionEngine(ExecutionEngine):
         """
         PyCondition.not_none(event, "event")
 
-        try:
-            self._evt_queue.put_nowait(event)
-        except asyncio.QueueFull:
-            self._log.warning(
-                f"Blocking on `_evt_queue.put` as queue full "
-                f"at {self._evt_queue.qsize()} items.",
-            )
-            self._loop.create_task(self._evt_queue.put(event))  # Blocking until qsize reduces
+        self._evt_queue.put(event)
 
     # -- INTERNAL -------------------------------------------------------------------------------------
 
@@ -348,6 +349,7 @@ class LiveExecutionEngine(ExecutionEngine):
                 if command is self._sentinel:
                     break
                 self._execute_command(command)
+                self._cache.flush_writes()
         except asyncio.CancelledError:
             self._log.warning("Command message queue canceled.")
         finally:
@@ -361,12 +363,20 @@ class LiveExecutionEngine(ExecutionEngine):
         self._log.debug(
             f"Event message queue processing starting (qsize={self.evt_qsize()})...",
         )
+        profiler: Profiler | None = self._msgbus.profiler
         try:
             while True:
                 event: OrderEvent | None = await self._evt_queue.get()
                 if event is self._sentinel:
                     break
-                self._handle_event(event)
+                if profiler is None:
+                    self._handle_event(event)
+                    self._cache.flush_writes()
+                else:
+                    start_ns = profiler.timestamp_ns()
+                    self._handle_event(event)
+                    self._cache.flush_writes()
+                    profiler.record("engine:ExecEngine.process", profiler.timestamp_ns() - start_ns)
         except asyncio.CancelledError:
             self._log.warning("Event message queue canceled.")
         finally:
@@ -483,6 +493,8 @@ class LiveExecutionEngine(ExecutionEngine):
             )
             return False
 
+        self._cache.flush_writes()
+
         self._msgbus.publish(
             topic=f"reports.execution"
             f".{report.instrument_id.venue}"
@@ -558,6 +570,8 @@ class LiveExecutionEngine(ExecutionEngine):
                     result = self._reconcile_position_report(report)
                     results.append(result)
 
+        self._cache.flush_writes()
+
         # Publish mass status
         self._msgbus.publish(
             topic=f"reports.execution.{mass_status.venue}",
@@ -0,0 +1,327 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2023 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Any
+
+from nautilus_trader.common import QueueOverflowPolicy
+from nautilus_trader.common.clock import Clock
+from nautilus_trader.common.logging import LoggerAdapter
+from nautilus_trader.common.profiling import LatencyHistogram
+from nautilus_trader.core.asynchronous import sleep0
+from nautilus_trader.core.correctness import PyCondition
+from nautilus_trader.model.data import QuoteTick
+from nautilus_trader.model.data import Ticker
+
+
+COALESCE_TYPES: tuple[type, ...] = (QuoteTick, Ticker)
+
+
+class EngineQueue:
+    """
+    Provides a bounded queue for live engines with overflow handling and telemetry.
+
+    When the queue is full, new items are handled by the overflow policy:
+     - ``BLOCK``: the item is held on a backlog and moved onto the queue (in
+       order) as items are taken, so no items are lost.
+     - ``DROP_OLDEST``: the oldest queued item is dropped to make room.
+     - ``COALESCE``: a queued quote (or ticker) for the same instrument is
+       replaced by the newer item in place. Items which cannot be coalesced
+       are dropped as for ``DROP_OLDEST``.
+
+    Telemetry is maintained for the enqueue-to-dequeue latency (from each items
+    `ts_init` to the clock time it is taken from the queue), the high-water mark
+    of pending items, and counters for the backpressured, dropped and coalesced
+    items.
+
+    Parameters
+    ----------
+    name : str
+        The name of the queue.
+    clock : Clock
+        The clock for measuring queueing latency.
+    logger : LoggerAdapter
+        The logger for overflow warnings.
+    maxsize : int
+        The maximum capacity of the queue before the overflow policy applies.
+    overflow_policy : QueueOverflowPolicy, default ``BLOCK``
+        The policy for handling items when the queue is full.
+
+    Raises
+    ------
+    ValueError
+        If `name` is not a valid string.
+    ValueError
+        If `maxsize` is not positive (> 0).
+
+    Warnings
+    --------
+    This queue is not thread-safe and must be called from the same thread as the
+    event loop.
+
+    """
+
+    def __init__(
+        self,
+        name: str,
+        clock: Clock,
+        logger: LoggerAdapter,
+        maxsize: int,
+        overflow_policy: QueueOverflowPolicy = QueueOverflowPolicy.BLOCK,
+    ) -> None:
+        PyCondition.valid_string(name, "name")
+        PyCondition.positive_int(maxsize, "maxsize")
+
+        self.name = name
+        self.maxsize = maxsize
+        self.overflow_policy = overflow_policy
+        self.latency = LatencyHistogram(name)
+        self.high_water_mark = 0
+        self.put_count = 0
+        self.get_count = 0
+        self.blocked_count = 0
+        self.dropped_count = 0
+        self.coalesced_count = 0
+
+        self._clock = clock
+        self._log = logger
+        self._coalesce = overflow_policy == QueueOverflowPolicy.COALESCE
+        self._queue: deque[Any] = deque()
+        self._backlog: deque[Any] = deque()
+        self._latest: dict[tuple[type, Any], list[Any]] = {}  # Pending slots by coalesce key
+        self._overflowing = False
+
+    def qsize(self) -> int:
+        """
+        Return the number of items on the queue (excluding any backlog).
+
+        Returns
+        -------
+        int
+
+        """
+        return len(self._queue)
+
+    def backlog_size(self) -> int:
+        """
+        Return the number of items blocked on the backlog waiting for a free slot.
+
+        Returns
+        -------
+        int
+
+        """
+        return len(self._backlog)
+
+    def empty(self) -> bool:
+        """
+        Return whether the queue (including any backlog) is empty.
+
+        Returns
+        -------
+        bool
+
+        """
+        return not self._queue and not self._backlog
+
+    def full(self) -> bool:
+        """
+        Return whether the queue is full.
+
+        Returns
+        -------
+        bool
+
+        """
+        return len(self._queue) >= self.maxsize
+
+    def put(self, item: Any) -> None:
+        """
+        Put the given item onto the queue, applying the overflow policy if full.
+
+        Parameters
+        ----------
+        item : object
+            The item to put.
+
+        """
+        self.put_count += 1
+        if self._backlog or len(self._queue) >= self.maxsize:
+            self._overflow(item)
+        else:
+            self._append(item)
+
+        pending = len(self._queue) + len(self._backlog)
+        if pending > self.high_water_mark:
+            self.high_water_mark = pending
+
+    def put_nowait(self, item: Any) -> None:
+        """
+        Put the given item onto the queue regardless of the maximum capacity.
+
+        Used for control messages (such as sentinels) which must not be
+        dropped or coalesced.
+
+        Parameters
+        ----------
+        item : object
+            The item to put.
+
+        """
+        if self._backlog:
+            self._backlog.append(item)  # Maintain ordering behind blocked items
+        else:
+            self._queue.append([item, None] if self._coalesce else item)
+
+    async def get(self) -> Any:
+        """
+        Remove and return the next item from the queue.
+
+        If the queue is empty, wait until an item is available.
+
+        Returns
+        -------
+        object
+
+        """
+        while not self._queue:
+            # Wait for item to become available
+            await sleep0()
+
+        return self.get_nowait()
+
+    def get_nowait(self) -> Any:
+        """
+        Remove and return the next item from the queue.
+
+        Returns
+        -------
+        object
+
+        Raises
+        ------
+        IndexError
+            If the queue is empty.
+
+        """
+        item = self._queue.popleft()
+        if self._coalesce:
+            item = self._release_slot(item)
+
+        if self._backlog:
+            self._append(self._backlog.popleft())
+        elif self._overflowing and len(self._queue) <= self.maxsize // 2:
+            self._overflowing = False
+            self._log.info(f"Queue `{self.name}` overflow cleared.")
+
+        self.get_count += 1
+        ts_init = getattr(item, "ts_init", None)
+        if ts_init is not None:
+            now_ns = self._clock.timestamp_ns()
+            self.latency.record(now_ns - ts_init if now_ns > ts_init else 0)
+
+        return item
+
+    def telemetry(self) -> dict[str, Any]:
+        """
+        Return a dictionary of the queue telemetry.
+
+        Returns
+        -------
+        dict[str, object]
+
+        """
+        return {
+            "qsize": len(self._queue),
+            "backlog": len(self._backlog),
+            "maxsize": self.maxsize,
+            "high_water_mark": self.high_water_mark,
+            "put_count": self.put_count,
+            "get_count": self.get_count,
+            "blocked_count": self.blocked_count,
+            "dropped_count": self.dropped_count,
+            "coalesced_count": self.coalesced_count,
+            "latency": self.latency.to_dict(),
+        }
+
+    def reset_telemetry(self) -> None:
+        """
+        Reset the queue telemetry counters, high-water mark and latency histogram.
+        """
+        self.latency.reset()
+        self.high_water_mark = len(self._queue) + len(self._backlog)
+        self.put_count = 0
+        self.get_count = 0
+        self.blocked_count = 0
+        self.dropped_count = 0
+        self.coalesced_count = 0
+
+    def _append(self, item: Any) -> None:
+        if not self._coalesce:
+            self._queue.append(item)
+            return
+
+        key = _coalesce_key(item)
+        slot = [item, key]
+        if key is not None:
+            self._latest[key] = slot
+        self._queue.append(slot)
+
+    def _overflow(self, item: Any) -> None:
+        if not self._overflowing:
+            self._overflowing = True
+            self._log.warning(
+                f"Queue `{self.name}` full at {len(self._queue)} items, "
+                f"applying {self.overflow_policy.name} overflow policy.",
+            )
+
+        if self.overflow_policy == QueueOverflowPolicy.BLOCK:
+            self.blocked_count += 1
+            self._backlog.append(item)
+            return
+
+        if self._coalesce:
+            key = _coalesce_key(item)
+            slot = self._latest.get(key) if key is not None else None
+            if slot is not None:
+                slot[0] = item  # Replace pending item in place
+                self.coalesced_count += 1
+                return
+
+        self._drop_oldest()
+        self._append(item)
+
+    def _drop_oldest(self) -> None:
+        if self._queue[0] is None or (self._coalesce and self._queue[0][0] is None):
+            return  # Never drop a sentinel (queue temporarily exceeds capacity)
+
+        oldest = self._queue.popleft()
+        if self._coalesce:
+            self._release_slot(oldest)
+        self.dropped_count += 1
+
+    def _release_slot(self, slot: list[Any]) -> Any:
+        key = slot[1]
+        if key is not None and self._latest.get(key) is slot:
+            del self._latest[key]
+        return slot[0]
+
+
+def _coalesce_key(item: Any) -> tuple[type, Any] | None:
+    if isinstance(item, COALESCE_TYPES):
+        return type(item), item.instrument_id
+    return None
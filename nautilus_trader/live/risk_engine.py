@@ -20,11 +20,12 @@ import asyncio
 from nautilus_trader.cache.base import CacheFacade
 from nautilus_trader.common.clock import LiveClock
 from nautilus_trader.common.logging import Logger
-from nautilus_trader.common.queue import Queue
+from nautilus_trader.common.profiling import Profiler
 from nautilus_trader.config import LiveRiskEngineConfig
 from nautilus_trader.core.correctness import PyCondition
 from nautilus_trader.core.message import Command
 from nautilus_trader.core.message import Event
+from nautilus_trader.live.queues import EngineQueue
 from nautilus_trader.msgbus.bus import MessageBus
 from nautilus_trader.portfolio.base import PortfolioFacade
 from nautilus_trader.risk.engine import RiskEngine
@@ -83,8 +84,8 @@ class LiveRiskEngine(RiskEngine):
         )
 
         self._loop: asyncio.AbstractEventLoop = loop
-        self._cmd_queue: Queue = Queue(maxsize=config.qsize)
-        self._evt_queue: Queue = Queue(maxsize=config.qsize)
+        self._cmd_queue = EngineQueue("cmd_queue", clock, self._log, maxsize=config.qsize)
+        self._evt_queue = EngineQueue("evt_queue", clock, self._log, maxsize=config.qsize)
 
         # Async tasks
         self._cmd_queue_task: asyncio.Task | None = None
@@ -135,6 +136,20 @@ class LiveRiskEngine(RiskEngine):
         """
         return self._evt_queue.qsize()
 
+    def queue_telemetry(self) -> dict[str, dict]:
+        """
+        Return the telemetry for each of the engines internal queues.
+
+        Includes the enqueue-to-dequeue latency histogram summary, the high-water
+        mark of pending items, and the blocked and dropped counts.
+
+        Returns
+        -------
+        dict[str, dict]
+
+        """
+        return {queue.name: queue.telemetry() for queue in (self._cmd_queue, self._evt_queue)}
+
     # -- COMMANDS -------------------------------------------------------------------------------------
 
     def kill(self) -> None:
@@ -157,8 +172,8 @@ class LiveRiskEngine(RiskEngine):
         """
         Execute the given command.
 
-        If the internal queue is already full then will log a warning and block
-        until queue size reduces.
+        If the internal queue is already full then will log a warning and hold
+        the message on a backlog until queue size reduces.
 
         Parameters
         ----------
@@ -174,20 +189,14 @@ class LiveRiskEngine(RiskEngine):
         PyCondition.not_none(command, "command")
         # Do not allow None through (None is a sentinel value which stops the queue)
 
-        try:
-            self._cmd_queue.put_nowait(command)
-        except asyncio.QueueFull:
-            self._log.warning(
-                f"Blocking on `_cmd_queue.put` as queue full at {self._cmd_queue.qsize()} items.",
-            )
-            self._loop.create_task(self._cmd_queue.put(command))
+        self._cmd_queue.put(command)
 
     def process(self, event: Event) -> None:
         """
         Process the given event.
 
-        If the internal queue is already full then will log a warning and block
-        until queue size reduces.
+        If the internal queue is already full then will log a warning and hold
+        the message on a backlog until queue size reduces.
 
         Parameters
         ----------
@@ -203,13 +212,7 @@ class LiveRiskEngine(RiskEngine):
         PyCondition.not_none(event, "event")
         # Do not allow None through (None is a sentinel value which stops the queue)
 
-        try:
-            self._evt_queue.put_nowait(event)
-        except asyncio.QueueFull:
-            self._log.warning(
-                f"Blocking on `_evt_queue.put` as queue full at {self._evt_queue.qsize()} items.",
-            )
-            self._evt_queue.put(event)  # Block until qsize reduces below maxsize
+        self._evt_queue.put(event)
 
     # -- INTERNAL -------------------------------------------------------------------------------------
 
@@ -238,12 +241,18 @@ class LiveRiskEngine(RiskEngine):
         self._log.debug(
             f"Command message queue processing (qsize={self.cmd_qsize()})...",
         )
+        profiler: Profiler | None = self._msgbus.profiler
         try:
             while True:
                 command: Command | None = await self._cmd_queue.get()
                 if command is self._sentinel:
                     break
-                self._execute_command(command)
+                if profiler is None:
+                    self._execute_command(command)
+                else:
+                    start_ns = profiler.timestamp_ns()
+                    self._execute_command(command)
+                    profiler.record("engine:RiskEngine.execute", profiler.timestamp_ns() - start_ns)
         except asyncio.CancelledError:
             self._log.warning("Command message queue canceled.")
         finally:
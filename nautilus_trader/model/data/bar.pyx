@@ -761,6 +761,13 @@ cdef class Bar(Data):
     def __repr__(self) -> str:
         return f"{type(self).__name__}({self})"
 
+    @staticmethod
+    cdef Bar from_mem_c(Bar_t mem):
+        cdef Bar bar = Bar.__new__(Bar)
+        bar._mem = mem
+        bar.is_revision = False
+        return bar
+
     @staticmethod
     cdef Bar from_dict_c(dict values):
         Condition.not_none(values, "values")
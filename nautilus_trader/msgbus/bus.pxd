@@ -15,6 +15,7 @@
 
 from nautilus_trader.common.clock cimport Clock
 from nautilus_trader.common.logging cimport LoggerAdapter
+from nautilus_trader.common.profiling cimport Profiler
 from nautilus_trader.core.message cimport Request
 from nautilus_trader.core.message cimport Response
 from nautilus_trader.core.uuid cimport UUID4
@@ -22,11 +23,26 @@ from nautilus_trader.model.identifiers cimport TraderId
 from nautilus_trader.msgbus.subscription cimport Subscription
 
 
+cdef class TopicNode:
+    cdef dict children
+    """The child nodes keyed by topic segment.\n\n:returns: `dict[str, TopicNode]`"""
+    cdef dict subscriptions
+    """The subscriptions with literal topics ending at the node.\n\n:returns: `dict[Subscription, int]`"""
+    cdef dict wildcards
+    """The subscriptions keyed by wildcard pattern tail.\n\n:returns: `dict[str, dict[Subscription, int]]`"""
+    cdef set topics
+    """The resolved published topics ending at the node.\n\n:returns: `set[str]`"""
+
+    cdef bint is_empty(self)
+
+
 cdef class MessageBus:
     cdef Clock _clock
     cdef LoggerAdapter _log
     cdef dict _subscriptions
     cdef dict _patterns
+    cdef TopicNode _topic_root
+    cdef int _subscription_seq
     cdef dict _endpoints
     cdef dict _correlation_index
 
@@ -40,6 +56,8 @@ cdef class MessageBus:
     """The count of responses processed by the bus.\n\n:returns: `int`"""
     cdef readonly int pub_count
     """The count of messages published by the bus.\n\n:returns: `int`"""
+    cdef readonly Profiler profiler
+    """The profiler timing handler invocations (if enabled).\n\n:returns: `Profiler` or ``None``"""
 
     cpdef list endpoints(self)
     cpdef list topics(self)
@@ -48,6 +66,7 @@ cdef class MessageBus:
     cpdef bint is_subscribed(self, str topic, handler)
     cpdef bint is_pending_request(self, UUID4 request_id)
 
+    cpdef void set_profiler(self, Profiler profiler)
     cpdef void register(self, str endpoint, handler)
     cpdef void deregister(self, str endpoint, handler)
     cpdef void send(self, str endpoint, msg)
@@ -58,6 +77,11 @@ cdef class MessageBus:
     cpdef void publish(self, str topic, msg)
     cdef void publish_c(self, str topic, msg)
     cdef Subscription[:] _resolve_subscriptions(self, str topic)
+    cdef void _index_subscription(self, Subscription sub)
+    cdef void _deindex_subscription(self, Subscription sub)
+    cdef list _match_subscriptions(self, str topic)
+    cdef list _resolved_topics(self, Subscription sub)
+    cdef void _update_resolved_topic(self, str topic)
 
 
 cdef bint is_matching(str topic, str pattern)
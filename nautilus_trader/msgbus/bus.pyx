@@ -18,10 +18,11 @@ from typing import Any, Callable
 import cython
 import numpy as np
 
-cimport numpy as np
+from libc.stdint cimport uint64_t
 
 from nautilus_trader.common.clock cimport Clock
 from nautilus_trader.common.logging cimport Logger
+from nautilus_trader.common.profiling cimport Profiler
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.uuid cimport UUID4
 from nautilus_trader.model.identifiers cimport TraderId
@@ -50,6 +51,11 @@ cdef class MessageBus:
     `camp` and `comp`. The question mark can also be used more than once.
     For example, `c??p` would match both of the above examples and `coop`.
 
+    Subscriptions are indexed in a trie over the dot separated topic segments,
+    so that resolving the subscribers for a topic is proportional to the topic
+    depth (plus any wildcard patterns along its path), and the index is updated
+    incrementally on subscribe and unsubscribe.
+
     Parameters
     ----------
     trader_id : TraderId
@@ -91,6 +97,8 @@ cdef class MessageBus:
         self._endpoints: dict[str, Callable[[Any], None]] = {}
         self._patterns: dict[str, Subscription[:]] = {}
         self._subscriptions: dict[Subscription, list[str]] = {}
+        self._topic_root = TopicNode()
+        self._subscription_seq = 0
         self._correlation_index: dict[UUID4, Callable[[Any], None]] = {}
 
         # Counters
@@ -99,6 +107,8 @@ cdef class MessageBus:
         self.res_count = 0
         self.pub_count = 0
 
+        self.profiler = None
+
     cpdef list endpoints(self):
         """
         Return all endpoint addresses registered with the message bus.
@@ -206,6 +216,21 @@ cdef class MessageBus:
 
         return request_id in self._correlation_index
 
+    cpdef void set_profiler(self, Profiler profiler):
+        """
+        Set the profiler for timing handler invocations.
+
+        When set, every handler invoked for a publish or send is timed and the
+        elapsed time is recorded with the profiler (named by handler or endpoint).
+
+        Parameters
+        ----------
+        profiler : Profiler, optional
+            The profiler to record timings with (``None`` disables profiling).
+
+        """
+        self.profiler = profiler
+
     cpdef void register(self, str endpoint, handler: Callable[[Any], None]):
         """
         Register the given `handler` to receive messages at the `endpoint` address.
@@ -289,7 +314,13 @@ cdef class MessageBus:
             )
             return  # Cannot send
 
-        handler(msg)
+        cdef uint64_t start_ns
+        if self.profiler is None:
+            handler(msg)
+        else:
+            start_ns = self.profiler.timestamp_ns()
+            handler(msg)
+            self.profiler.record_send_c(endpoint, self.profiler.timestamp_ns() - start_ns)
         self.sent_count += 1
 
     cpdef void request(self, str endpoint, Request request):
@@ -406,20 +437,20 @@ cdef class MessageBus:
             self._log.debug(f"{sub} already exists.")
             return
 
-        cdef list matches = []
-        cdef list patterns = list(self._patterns.keys())
+        self._index_subscription(sub)
+
+        # Add the subscription to the already resolved topics it matches
+        cdef list matches = self._resolved_topics(sub)
 
         cdef str pattern
         cdef list subs
-        for pattern in patterns:
-            if is_matching(topic, pattern):
-                subs = list(self._patterns[pattern])
-                subs.append(sub)
-                subs = sorted(subs, reverse=True)
-                self._patterns[pattern] = np.ascontiguousarray(subs, dtype=Subscription)
-                matches.append(pattern)
+        for pattern in matches:
+            subs = list(self._patterns[pattern])
+            subs.append(sub)
+            subs = sorted(subs, reverse=True)
+            self._patterns[pattern] = np.ascontiguousarray(subs, dtype=Subscription)
 
-        self._subscriptions[sub] = sorted(matches)
+        self._subscriptions[sub] = matches
 
         self._log.debug(f"Added {sub}.")
 
@@ -463,6 +494,7 @@ cdef class MessageBus:
             self._patterns[pattern] = np.ascontiguousarray(subs, dtype=Subscription)
 
         del self._subscriptions[sub]
+        self._deindex_subscription(sub)
 
         self._log.debug(f"Removed {sub}.")
 
@@ -499,61 +531,235 @@ cdef class MessageBus:
         cdef:
             int i
             Subscription sub
-        for i in range(len(subs)):
-            sub = subs[i]
-            sub.handler(msg)
+            uint64_t start_ns
+        if self.profiler is None:
+            for i in range(len(subs)):
+                sub = subs[i]
+                sub.handler(msg)
+        else:
+            for i in range(len(subs)):
+                sub = subs[i]
+                start_ns = self.profiler.timestamp_ns()
+                sub.handler(msg)
+                self.profiler.record_handler_c(sub.handler, self.profiler.timestamp_ns() - start_ns)
 
         self.pub_count += 1
 
     cdef Subscription[:] _resolve_subscriptions(self, str topic):
-        cdef list subs_list = []
-        cdef Subscription existing_sub
-        for existing_sub in self._subscriptions:
-            if is_matching(topic, existing_sub.topic):
-                subs_list.append(existing_sub)
-
-        subs_list = sorted(subs_list, reverse=True)
+        cdef list subs_list = self._match_subscriptions(topic)
         cdef Subscription[:] subs_array = np.ascontiguousarray(subs_list, dtype=Subscription)
         self._patterns[topic] = subs_array
+        self._update_resolved_topic(topic)
 
-        cdef list matches
-        for sub in subs_array:
-            matches = self._subscriptions.get(sub, [])
-            if topic not in matches:
-                matches.append(topic)
-            self._subscriptions[sub] = sorted(matches)
+        cdef Subscription sub
+        for sub in subs_list:
+            self._subscriptions[sub].append(topic)
 
         return subs_array
 
+    cdef void _index_subscription(self, Subscription sub):
+        cdef list prefix
+        cdef str tail
+        prefix, tail = _split_pattern(sub.topic)
+
+        cdef TopicNode node = self._topic_root
+        cdef TopicNode child
+        cdef str segment
+        for segment in prefix:
+            child = node.children.get(segment)
+            if child is None:
+                child = TopicNode()
+                node.children[segment] = child
+            node = child
+
+        # Sequence retains subscription order for equal priorities
+        self._subscription_seq += 1
+
+        cdef dict subs
+        if tail is None:
+            node.subscriptions[sub] = self._subscription_seq
+        else:
+            subs = node.wildcards.get(tail)
+            if subs is None:
+                subs = {}
+                node.wildcards[tail] = subs
+            subs[sub] = self._subscription_seq
+
+    cdef void _deindex_subscription(self, Subscription sub):
+        cdef list prefix
+        cdef str tail
+        prefix, tail = _split_pattern(sub.topic)
+
+        cdef list path = []
+        cdef TopicNode node = self._topic_root
+        cdef str segment
+        for segment in prefix:
+            path.append((node, segment))
+            node = node.children.get(segment)
+            if node is None:
+                return  # Not indexed
+
+        cdef dict subs
+        if tail is None:
+            node.subscriptions.pop(sub, None)
+        else:
+            subs = node.wildcards.get(tail)
+            if subs is not None:
+                subs.pop(sub, None)
+                if not subs:
+                    del node.wildcards[tail]
+
+        # Prune empty nodes
+        cdef TopicNode parent
+        while path and node.is_empty():
+            parent, segment = path.pop()
+            del parent.children[segment]
+            node = parent
+
+    cdef list _match_subscriptions(self, str topic):
+        cdef list segments = topic.split(".")
+        cdef int n = len(segments)
+        cdef list matches = []  # (subscription, sequence)
+
+        cdef TopicNode node = self._topic_root
+        cdef int depth = 0
+        cdef Py_ssize_t offset = 0
+        cdef str remainder
+        cdef str tail
+        cdef dict subs
+        while True:
+            if node.wildcards and depth < n:
+                # Match wildcard tails against the remaining topic segments
+                remainder = topic[offset:]
+                for tail, subs in node.wildcards.items():
+                    if tail == "*" or is_matching(remainder, tail):
+                        matches.extend(subs.items())
+            if depth == n:
+                matches.extend(node.subscriptions.items())
+                break
+            node = node.children.get(segments[depth])
+            if node is None:
+                break
+            offset += len(segments[depth]) + 1
+            depth += 1
+
+        matches.sort(key=_subscription_order)
+        return [m[0] for m in matches]
+
+    cdef list _resolved_topics(self, Subscription sub):
+        cdef list prefix
+        cdef str tail
+        prefix, tail = _split_pattern(sub.topic)
+
+        cdef TopicNode node = self._topic_root
+        cdef str segment
+        for segment in prefix:
+            node = node.children.get(segment)
+            if node is None:
+                return []  # No resolved topics under the prefix
+
+        if tail is None:
+            return list(node.topics)
+
+        # Resolved topics must have more segments than the literal prefix
+        cdef list matches = []
+        cdef list stack = list(node.children.values())
+        cdef TopicNode child
+        cdef str topic
+        while stack:
+            child = stack.pop()
+            for topic in child.topics:
+                if tail == "*" or is_matching(topic, sub.topic):
+                    matches.append(topic)
+            stack.extend(child.children.values())
+
+        return matches
+
+    cdef void _update_resolved_topic(self, str topic):
+        cdef TopicNode node = self._topic_root
+        cdef TopicNode child
+        cdef str segment
+        for segment in topic.split("."):
+            child = node.children.get(segment)
+            if child is None:
+                child = TopicNode()
+                node.children[segment] = child
+            node = child
+
+        node.topics.add(topic)
+
+
+cdef class TopicNode:
+    """
+    Represents a node in the message bus topic index.
 
-cdef inline bint is_matching(str topic, str pattern):
-    # Get length of string and wildcard pattern
-    cdef int n = len(topic)
-    cdef int m = len(pattern)
+    Each node corresponds to a dot separated topic segment. Subscriptions with
+    literal topics are held at the node for their final segment, whereas those
+    containing wildcards are held at the node for their literal prefix, keyed by
+    the remaining wildcard pattern tail.
 
-    # Create a DP lookup table
-    cdef np.ndarray[np.int8_t, ndim=2] t = np.empty((n + 1, m + 1), dtype=np.int8)
-    t.fill(False)
+    This is an internal class intended to be used by the message bus.
+    """
 
-    # If both pattern and string are empty: match
-    t[0, 0] = True
+    def __init__(self):
+        self.children = {}
+        self.subscriptions = {}
+        self.wildcards = {}
+        self.topics = set()
 
-    # Handle empty string case (i == 0)
-    cdef int j
-    for j in range(1, m + 1):
-        if pattern[j - 1] == '*':
-            t[0, j] = t[0, j - 1]
+    cdef bint is_empty(self):
+        return not (self.children or self.subscriptions or self.wildcards or self.topics)
 
-    # Build a matrix in a bottom-up manner
+
+cdef tuple _split_pattern(str pattern):
+    # Return the leading literal segments and the remaining wildcard tail (if any)
+    cdef list segments = pattern.split(".")
     cdef int i
-    for i in range(1, n + 1):
-        for j in range(1, m + 1):
-            if pattern[j - 1] == '*':
-                t[i, j] = t[i - 1, j] or t[i, j - 1]
-            elif pattern[j - 1] == '?' or topic[i - 1] == pattern[j - 1]:
-                t[i, j] = t[i - 1, j - 1]
-
-    return t[n, m]
+    for i in range(len(segments)):
+        if "*" in segments[i] or "?" in segments[i]:
+            return segments[:i], ".".join(segments[i:])
+    return segments, None
+
+
+def _subscription_order(tuple match):
+    # Higher priority first, then in order of subscription
+    return -(<Subscription>match[0]).priority, match[1]
+
+
+cdef inline bint is_matching(str topic, str pattern):
+    # Iterative wildcard matching, backtracking to the last `*` on a mismatch
+    cdef Py_ssize_t n = len(topic)
+    cdef Py_ssize_t m = len(pattern)
+    cdef Py_ssize_t i = 0
+    cdef Py_ssize_t j = 0
+    cdef Py_ssize_t star = -1
+    cdef Py_ssize_t mark = 0
+    cdef Py_UCS4 c
+    while i < n:
+        if j < m:
+            c = pattern[j]
+            if c == '*':
+                star = j
+                mark = i
+                j += 1
+                continue
+            if c == '?' or c == topic[i]:
+                i += 1
+                j += 1
+                continue
+        if star != -1:
+            # Let the last `*` consume one more character
+            j = star + 1
+            mark += 1
+            i = mark
+            continue
+        return False
+
+    # Any remaining pattern must be all `*`
+    while j < m and pattern[j] == '*':
+        j += 1
+
+    return j == m
 
 
 # Python wrapper for test access
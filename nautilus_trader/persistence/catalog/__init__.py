@@ -14,10 +14,12 @@
 # -------------------------------------------------------------------------------------------------
 
 from nautilus_trader.persistence.catalog.base import BaseDataCatalog
+from nautilus_trader.persistence.catalog.manifest import CatalogManifest
 from nautilus_trader.persistence.catalog.parquet import ParquetDataCatalog
 
 
 __all__ = (
     "BaseDataCatalog",
+    "CatalogManifest",
     "ParquetDataCatalog",
 )
@@ -0,0 +1,60 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2023 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import click
+import pandas as pd
+
+from nautilus_trader.persistence.catalog.compaction import CatalogCompactor
+from nautilus_trader.persistence.catalog.parquet import ParquetDataCatalog
+
+
+@click.group()
+def main():
+    pass
+
+
+@main.command("rebuild-manifest")
+@click.argument("uri")
+def rebuild_manifest(uri: str):
+    """
+    Rebuild the manifest for the catalog at URI.
+    """
+    catalog = ParquetDataCatalog.from_uri(uri)
+    manifest = catalog.rebuild_manifest()
+    click.echo(f"Indexed {len(manifest)} files to {manifest.path}")
+
+
+@main.command("compact")
+@click.argument("uri")
+@click.option("--period", default="1D", help="The time period of each partition.")
+@click.option("--retention", default="1h", help="The time to keep replaced files.")
+def compact(uri: str, period: str, retention: str):
+    """
+    Compact the partitions of the catalog at URI with new files since the last compaction.
+    """
+    catalog = ParquetDataCatalog.from_uri(uri)
+    compactor = CatalogCompactor(
+        fs=catalog.fs,
+        root=catalog.path,
+        period=pd.Timedelta(period),
+        retention=pd.Timedelta(retention),
+    )
+    pending = compactor.pending()
+    written = compactor.compact()
+    click.echo(f"Compacted {len(pending)} partitions into {len(written)} files")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,533 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2023 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from __future__ import annotations
+
+import contextlib
+import pathlib
+import time
+import uuid
+from collections.abc import Iterator
+from typing import Optional
+
+import fsspec
+import msgspec
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from nautilus_trader.core.correctness import PyCondition
+from nautilus_trader.persistence.catalog.manifest import CatalogManifest
+from nautilus_trader.persistence.catalog.manifest import ManifestEntry
+
+
+COMPACTION_STATE_FN = "_compaction_state.json"
+
+
+class CompactionGroup(msgspec.Struct, frozen=True):
+    """
+    Represents a time partition of a catalog dataset directory with files to compact.
+
+    Parameters
+    ----------
+    directory : str
+        The dataset directory (relative to the catalog root), e.g.
+        `data/quote_tick.parquet/instrument_id=AUD-USD.SIM`.
+    bar_specs : list[str]
+        The bar specifications of the files (bar datasets only).
+    start_ns : int
+        The start of the (first) time partition (UNIX nanoseconds).
+    files : list[str]
+        The files in the partition (relative to the catalog root). Files spanning
+        several partitions join them into one group.
+
+    """
+
+    directory: str
+    bar_specs: list[str]
+    start_ns: int
+    files: list[str]
+
+
+class _RetiredFile(msgspec.Struct, frozen=True):
+    path: str
+    ts_retired: int
+
+
+class _CompactionState(msgspec.Struct):
+    retired: list[_RetiredFile] = []
+
+
+class CatalogCompactor:
+    """
+    Provides incremental compaction for a `ParquetDataCatalog` with a manifest.
+
+    Files appended to the catalog since the last compaction are tracked by the
+    catalog manifest. Only the time partitions (`period` buckets of each dataset
+    directory, by `ts_init`) which received new files are compacted, so unchanged
+    data is never read or rewritten. A new file spanning several partitions is
+    compacted together with all the partitions it spans.
+
+    Each partition is rewritten as a streaming k-way merge of its files by
+    `ts_init`, holding roughly one batch per file in memory, with duplicate rows
+    dropped. Rewritten files are split on partition boundaries and written in
+    row groups of `row_group_size` rows.
+
+    Rewrites are safe alongside catalog readers. New files are written to
+    temporary paths and moved into place, then swapped for the replaced files
+    with a single atomic manifest update. Replaced files are only deleted once
+    `retention` has elapsed, so readers which listed files from the previous
+    manifest can finish reading them.
+
+    Parameters
+    ----------
+    fs : fsspec.AbstractFileSystem
+        The catalog filesystem.
+    root : str
+        The catalog root path.
+    period : pd.Timedelta, default 1 day
+        The time period of each partition.
+    batch_size : int, default 65_536
+        The number of rows to read from each file at a time.
+    row_group_size : int, default 65_536
+        The maximum number of rows per row group of the rewritten files.
+    retention : pd.Timedelta, default 1 hour
+        The time to keep replaced files before deleting them.
+
+    Raises
+    ------
+    ValueError
+        If `period` is not positive (> 0).
+    ValueError
+        If `batch_size` is not positive (> 0).
+    ValueError
+        If `row_group_size` is not positive (> 0).
+    ValueError
+        If `retention` is negative (< 0).
+
+    Warnings
+    --------
+    Compaction must not run concurrently with catalog writers.
+
+    An interrupted compaction leaves no partial changes visible to catalog
+    readers, although already written files may remain (unreferenced by the
+    manifest) until removed.
+
+    """
+
+    def __init__(
+        self,
+        fs: fsspec.AbstractFileSystem,
+        root: str,
+        period: pd.Timedelta = pd.Timedelta(days=1),
+        batch_size: int = 65_536,
+        row_group_size: int = 65_536,
+        retention: pd.Timedelta = pd.Timedelta(hours=1),
+    ) -> None:
+        PyCondition.true(period > pd.Timedelta(0), "`period` was not positive")
+        PyCondition.positive_int(batch_size, "batch_size")
+        PyCondition.positive_int(row_group_size, "row_group_size")
+        PyCondition.true(retention >= pd.Timedelta(0), "`retention` was negative")
+
+        self.fs = fs
+        self.root = root.rstrip("/")
+        self.period = period
+        self.batch_size = batch_size
+        self.row_group_size = row_group_size
+        self.retention = retention
+
+    @property
+    def state_path(self) -> str:
+        """
+        Return the path of the compaction state file.
+
+        Returns
+        -------
+        str
+
+        """
+        return f"{self.root}/{COMPACTION_STATE_FN}"
+
+    def pending(self) -> list[CompactionGroup]:
+        """
+        Return the partitions which received new files since the last compaction.
+
+        Returns
+        -------
+        list[CompactionGroup]
+
+        """
+        return self._groups(self._load_manifest())
+
+    def compact(self) -> list[str]:
+        """
+        Compact the partitions which received new files since the last compaction.
+
+        If the catalog has no manifest, one is built first (and every partition
+        is compacted once).
+
+        Returns
+        -------
+        list[str]
+            The paths of the files written.
+
+        """
+        self.purge()
+
+        manifest = self._load_manifest()
+        groups = self._groups(manifest)
+        if not groups:
+            return []
+
+        written: list[str] = []
+        replaced: list[str] = []
+        for group in groups:
+            written += self._compact_group(group)
+            replaced += group.files
+
+        # Swap the rewritten files in with a single atomic manifest update
+        manifest.remove(replaced)
+        manifest.add(
+            msgspec.structs.replace(manifest.read_entry(path), compacted=True)
+            for path in written
+        )
+        manifest.write()
+
+        self._retire(replaced)
+        self.purge()
+
+        return written
+
+    def purge(self) -> list[str]:
+        """
+        Delete the replaced files which have been retained for the retention period.
+
+        Returns
+        -------
+        list[str]
+            The paths of the files deleted.
+
+        """
+        state = self._load_state()
+        if not state.retired:
+            return []
+
+        cutoff = time.time_ns() - self.retention.value
+        deleted: list[str] = []
+        retained: list[_RetiredFile] = []
+        for retired in state.retired:
+            if retired.ts_retired > cutoff:
+                retained.append(retired)
+                continue
+            path = f"{self.root}/{retired.path}"
+            if self.fs.exists(path):
+                self.fs.rm(path)
+            deleted.append(path)
+
+        if deleted:
+            state.retired = retained
+            self._write_state(state)
+
+        return deleted
+
+    def _load_manifest(self) -> CatalogManifest:
+        manifest = CatalogManifest.load(fs=self.fs, root=self.root)
+        if manifest is None:
+            manifest = CatalogManifest.rebuild(fs=self.fs, root=self.root)
+        return manifest
+
+    def _groups(self, manifest: CatalogManifest) -> list[CompactionGroup]:
+        period_ns = self.period.value
+        spans: dict[tuple[str, tuple[str, ...]], list[tuple[int, int, ManifestEntry]]] = {}
+        for entry in manifest.entries():
+            if entry.ts_min is None:
+                continue  # Not timestamped (e.g. instruments)
+            directory = str(pathlib.PurePosixPath(entry.path).parent)
+            first = entry.ts_min // period_ns
+            last = (entry.ts_max if entry.ts_max is not None else entry.ts_min) // period_ns
+            spans.setdefault((directory, tuple(entry.bar_specs)), []).append((first, last, entry))
+
+        pending: list[CompactionGroup] = []
+        for (directory, bar_specs), entries in sorted(spans.items()):
+            # A file is merged with every partition it spans, so partitions joined
+            # by a spanning file are compacted as one group (from the first period)
+            entries.sort(key=lambda x: (x[0], x[1]))
+            clusters: list[tuple[int, int, list[ManifestEntry]]] = []
+            for first, last, entry in entries:
+                if clusters and first <= clusters[-1][1]:
+                    cluster_first, cluster_last, cluster_entries = clusters[-1]
+                    cluster_entries.append(entry)
+                    clusters[-1] = (cluster_first, max(cluster_last, last), cluster_entries)
+                else:
+                    clusters.append((first, last, [entry]))
+
+            for first, _, cluster_entries in clusters:
+                if all(entry.compacted for entry in cluster_entries):
+                    continue
+                files = sorted(
+                    (entry.path for entry in cluster_entries),
+                    key=lambda x: pathlib.PurePosixPath(x).stem,
+                )
+                pending.append(
+                    CompactionGroup(
+                        directory=directory,
+                        bar_specs=list(bar_specs),
+                        start_ns=first * period_ns,
+                        files=files,
+                    ),
+                )
+
+        return pending
+
+    def _compact_group(self, group: CompactionGroup) -> list[str]:
+        paths = [f"{self.root}/{path}" for path in group.files]
+        directory = f"{self.root}/{group.directory}"
+
+        with contextlib.ExitStack() as stack:
+            files = [pq.ParquetFile(stack.enter_context(self.fs.open(p, "rb"))) for p in paths]
+            schema = files[0].schema_arrow
+            try:
+                runs = [f.iter_batches(batch_size=self.batch_size) for f in files]
+                return self._merge(directory, schema, runs)
+            except _UnsortedRunError:
+                # Files written before catalog writers sorted by `ts_init`
+                table = pa.concat_tables(_conform(f.read(), schema) for f in files)
+                table = table.take(pc.sort_indices(table, sort_keys=[("ts_init", "ascending")]))
+                runs = [iter(table.to_batches(max_chunksize=self.batch_size))]
+                return self._merge(directory, schema, runs)
+
+    def _merge(
+        self,
+        directory: str,
+        schema: pa.Schema,
+        batches: list[Iterator[pa.RecordBatch]],
+    ) -> list[str]:
+        writer = _PartitionedWriter(
+            fs=self.fs,
+            directory=directory,
+            schema=schema,
+            period_ns=self.period.value,
+            row_group_size=self.row_group_size,
+        )
+        try:
+            for table in _merge_sorted_runs([_SortedRun(b, schema) for b in batches]):
+                writer.write(_drop_duplicates(table, schema))
+            return writer.close()
+        except BaseException:
+            writer.abort()
+            raise
+
+    def _retire(self, paths: list[str]) -> None:
+        state = self._load_state()
+        ts_retired = time.time_ns()
+        state.retired.extend(_RetiredFile(path=p, ts_retired=ts_retired) for p in paths)
+        self._write_state(state)
+
+    def _load_state(self) -> _CompactionState:
+        if not self.fs.exists(self.state_path):
+            return _CompactionState()
+        with self.fs.open(self.state_path, "rb") as f:
+            return msgspec.json.decode(f.read(), type=_CompactionState)
+
+    def _write_state(self, state: _CompactionState) -> None:
+        tmp_path = f"{self.state_path}.{uuid.uuid4().hex}.tmp"
+        with self.fs.open(tmp_path, "wb") as f:
+            f.write(msgspec.json.encode(state))
+        self.fs.mv(tmp_path, self.state_path)
+
+
+class _UnsortedRunError(Exception):
+    pass
+
+
+class _SortedRun:
+    # A stream of record batches sorted by `ts_init`, buffered from the next
+    # unmerged row up to the end of the last batch read.
+
+    def __init__(self, batches: Iterator[pa.RecordBatch], schema: pa.Schema) -> None:
+        self._batches = batches
+        self._schema = schema
+        self._last_ts = None
+        self.table = schema.empty_table()
+        self.ts = np.empty(0, dtype=schema.field("ts_init").type.to_pandas_dtype())
+        self.exhausted = False
+
+    def fill(self) -> None:
+        # Buffer the next non-empty batch (or mark the run exhausted)
+        for batch in self._batches:
+            if batch.num_rows == 0:
+                continue
+            table = _conform(pa.Table.from_batches([batch]), self._schema)
+            ts = table.column("ts_init").to_numpy()
+            if np.any(ts[1:] < ts[:-1]) or (self._last_ts is not None and ts[0] < self._last_ts):
+                raise _UnsortedRunError
+            self.table = pa.concat_tables([self.table, table])
+            self.ts = np.concatenate([self.ts, ts])
+            self._last_ts = ts[-1]
+            return
+        self.exhausted = True
+
+    def take_before(self, bound) -> pa.Table:
+        # Remove and return the buffered rows with `ts_init` before the bound
+        # (or all rows if ``None``)
+        if bound is None:
+            n = len(self.ts)
+        else:
+            n = int(np.searchsorted(self.ts, bound, side="left"))
+        taken = self.table.slice(0, n)
+        self.table = self.table.slice(n)
+        self.ts = self.ts[n:]
+        return taken
+
+
+def _merge_sorted_runs(runs: list[_SortedRun]) -> Iterator[pa.Table]:
+    # Yield the rows of all runs in chunks sorted by `ts_init`. Each chunk contains
+    # every remaining row before the smallest last buffered timestamp of the
+    # active runs, so rows with equal timestamps are always yielded together.
+    for run in runs:
+        run.fill()
+
+    while True:
+        active = [run for run in runs if not run.exhausted]
+        bound = min(run.ts[-1] for run in active) if active else None
+
+        chunks = [run.take_before(bound) for run in runs]
+        chunks = [chunk for chunk in chunks if chunk.num_rows]
+        if chunks:
+            table = pa.concat_tables(chunks)
+            if len(chunks) > 1:
+                table = table.take(
+                    pc.sort_indices(table, sort_keys=[("ts_init", "ascending")]),
+                )
+            yield table
+
+        if not active:
+            return
+
+        for run in active:
+            if run.ts[-1] == bound:
+                run.fill()
+
+
+class _PartitionedWriter:
+    # Writes sorted tables to temporary files (one per time partition) in row
+    # groups, moved to their final file names on close.
+
+    def __init__(
+        self,
+        fs: fsspec.AbstractFileSystem,
+        directory: str,
+        schema: pa.Schema,
+        period_ns: int,
+        row_group_size: int,
+    ) -> None:
+        self._fs = fs
+        self._directory = directory
+        self._schema = schema
+        self._period_ns = period_ns
+        self._row_group_size = row_group_size
+        self._stack = contextlib.ExitStack()
+        self._writer: Optional[pq.ParquetWriter] = None
+        self._partition: Optional[int] = None
+        self._buffer: list[pa.Table] = []
+        self._buffered = 0
+        self._suffix = ""
+        self._ts_min = None
+        self._ts_max = None
+        self._tmp_paths: list[str] = []
+        self._outputs: list[tuple[str, str]] = []  # (tmp_path, final_path)
+
+    def write(self, table: pa.Table) -> None:
+        if table.num_rows == 0:
+            return
+
+        ts = table.column("ts_init").to_numpy()
+        partitions = ts // ts.dtype.type(self._period_ns)
+        cuts = [0, *(np.flatnonzero(np.diff(partitions)) + 1), len(ts)]
+        for start, stop in zip(cuts[:-1], cuts[1:]):
+            if partitions[start] != self._partition:
+                self._finish_file()
+                self._start_file(table, int(partitions[start]), start)
+            self._buffer.append(table.slice(start, stop - start))
+            self._buffered += stop - start
+            self._ts_max = ts[stop - 1]
+            if self._buffered >= self._row_group_size:
+                self._flush()
+
+    def close(self) -> list[str]:
+        self._finish_file()
+        for tmp_path, final_path in self._outputs:
+            self._fs.mv(tmp_path, final_path)
+        return [final_path for _, final_path in self._outputs]
+
+    def abort(self) -> None:
+        with contextlib.suppress(Exception):
+            self._stack.close()
+        for tmp_path in self._tmp_paths:
+            if self._fs.exists(tmp_path):
+                self._fs.rm(tmp_path)
+
+    def _start_file(self, table: pa.Table, partition: int, row: int) -> None:
+        tmp_path = f"{self._directory}/{uuid.uuid4().hex}.parquet.tmp"
+        self._tmp_paths.append(tmp_path)
+        f = self._stack.enter_context(self._fs.open(tmp_path, "wb"))
+        self._writer = self._stack.enter_context(pq.ParquetWriter(f, self._schema))
+        self._partition = partition
+        self._ts_min = table.column("ts_init")[row].as_py()
+        if "bar_type" in self._schema.names:
+            # Bar type suffix as for the catalog writers
+            self._suffix = "-" + str(table.column("bar_type")[row].as_py()).split(".")[-1]
+
+    def _flush(self) -> None:
+        if not self._buffer:
+            return
+        table = pa.concat_tables(self._buffer)
+        for start in range(0, table.num_rows, self._row_group_size):
+            self._writer.write_table(table.slice(start, self._row_group_size))
+        self._buffer = []
+        self._buffered = 0
+
+    def _finish_file(self) -> None:
+        if self._writer is None:
+            return
+        self._flush()
+        self._stack.close()
+        self._stack = contextlib.ExitStack()
+        self._writer = None
+        tag = f"compacted_{uuid.uuid4().hex[:8]}"
+        basename = f"{self._ts_min}-{self._ts_max}{self._suffix}-{tag}-0.parquet"
+        final_path = f"{self._directory}/{basename}"
+        self._outputs.append((self._tmp_paths[-1], final_path))
+
+
+def _conform(table: pa.Table, schema: pa.Schema) -> pa.Table:
+    if table.schema.equals(schema):
+        return table
+    return table.select(schema.names).cast(schema)
+
+
+def _drop_duplicates(table: pa.Table, schema: pa.Schema) -> pa.Table:
+    # Duplicate rows have equal timestamps, so are adjacent in a sorted table
+    ts = table.column("ts_init").to_numpy()
+    if not np.any(ts[1:] == ts[:-1]):
+        return table
+
+    df = table.to_pandas()
+    deduplicated = df.drop_duplicates(ignore_index=True, keep="last")
+    if len(deduplicated) == len(df):
+        return table
+    return pa.Table.from_pandas(deduplicated, schema=schema, preserve_index=False)
@@ -0,0 +1,500 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2023 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from __future__ import annotations
+
+import bisect
+import itertools
+import pathlib
+import uuid
+from collections.abc import Iterable
+from operator import attrgetter
+from typing import Optional
+
+import fsspec
+import msgspec
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from nautilus_trader.model.data import BarType
+
+
+MANIFEST_FN = "_manifest.json"
+MANIFEST_VERSION = 1
+
+
+class ManifestEntry(msgspec.Struct, frozen=True):
+    """
+    Represents a single data file recorded in a catalog manifest.
+
+    Parameters
+    ----------
+    path : str
+        The file path (relative to the catalog root).
+    data_type : str
+        The data type (dataset) name, e.g. `quote_tick`.
+    instrument_id : str, optional
+        The instrument ID partition value (if partitioned by instrument).
+    bar_specs : list[str]
+        The bar specifications of the bars in the file (bar datasets only).
+    ts_min : int, optional
+        The minimum `ts_init` in the file (``None`` if the data is not timestamped).
+    ts_max : int, optional
+        The maximum `ts_init` in the file (``None`` if the data is not timestamped).
+    num_rows : int
+        The number of rows in the file.
+    size : int
+        The size of the file (bytes).
+    compacted : bool, default False
+        If the file was written by catalog compaction (files appended since the
+        last compaction are not, which marks their partitions for compaction).
+
+    """
+
+    path: str
+    data_type: str
+    instrument_id: Optional[str]
+    bar_specs: list[str]
+    ts_min: Optional[int]
+    ts_max: Optional[int]
+    num_rows: int
+    size: int
+    compacted: bool = False
+
+
+class _ManifestFile(msgspec.Struct):
+    version: int
+    files: list[ManifestEntry]
+
+
+class _IntervalIndex:
+    # Entries sorted by `ts_min` with a running maximum of `ts_max`, so the entries
+    # overlapping a time range are found with two binary searches (both non-decreasing).
+    def __init__(self, entries: list[ManifestEntry]) -> None:
+        self.entries = sorted(entries, key=attrgetter("ts_min"))
+        self.starts = [e.ts_min for e in self.entries]
+        self.max_ends = list(itertools.accumulate((e.ts_max for e in self.entries), max))
+
+    def overlapping(self, start: Optional[int], end: Optional[int]) -> list[ManifestEntry]:
+        lo = 0 if start is None else bisect.bisect_left(self.max_ends, start)
+        hi = len(self.entries) if end is None else bisect.bisect_right(self.starts, end)
+        if start is None:
+            return self.entries[lo:hi]
+        return [e for e in self.entries[lo:hi] if e.ts_max >= start]
+
+
+class CatalogManifest:
+    """
+    Provides a file-level index of the data files in a catalog.
+
+    The manifest records the data type, instrument ID, bar specifications,
+    minimum and maximum `ts_init`, row count and size of every data file, so
+    that files can be selected for a query by interval lookups rather than by
+    listing the catalog (which is slow for object stores such as S3 or GCS).
+
+    The manifest is stored as a single JSON file at the catalog root and is
+    replaced atomically on every update (written to a temporary file which is
+    then moved into place).
+
+    Parameters
+    ----------
+    fs : fsspec.AbstractFileSystem
+        The catalog filesystem.
+    root : str
+        The catalog root path.
+    entries : Iterable[ManifestEntry], optional
+        The initial manifest entries.
+
+    Warnings
+    --------
+    The manifest only tracks files written by the catalog writers, files which
+    are added or removed by other means require the manifest to be rebuilt
+    with `CatalogManifest.rebuild(...)` (or `ParquetDataCatalog.rebuild_manifest()`).
+
+    Concurrent writers to the same catalog are not supported.
+
+    """
+
+    def __init__(
+        self,
+        fs: fsspec.AbstractFileSystem,
+        root: str,
+        entries: Optional[Iterable[ManifestEntry]] = None,
+    ) -> None:
+        self.fs = fs
+        self.root = root.rstrip("/")
+        self._entries: dict[str, ManifestEntry] = {e.path: e for e in entries or ()}
+        self._index: Optional[dict[tuple[str, Optional[str]], _IntervalIndex]] = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(root={self.root}, files={len(self._entries)})"
+
+    @property
+    def path(self) -> str:
+        """
+        Return the path of the manifest file.
+
+        Returns
+        -------
+        str
+
+        """
+        return manifest_path(self.root)
+
+    @classmethod
+    def load(cls, fs: fsspec.AbstractFileSystem, root: str) -> Optional[CatalogManifest]:
+        """
+        Load the manifest for the catalog at the given root (if one exists).
+
+        Parameters
+        ----------
+        fs : fsspec.AbstractFileSystem
+            The catalog filesystem.
+        root : str
+            The catalog root path.
+
+        Returns
+        -------
+        CatalogManifest or ``None``
+
+        """
+        path = manifest_path(root)
+        if not fs.exists(path):
+            return None
+        with fs.open(path, "rb") as f:
+            manifest = msgspec.json.decode(f.read(), type=_ManifestFile)
+        return cls(fs=fs, root=root, entries=manifest.files)
+
+    @classmethod
+    def rebuild(cls, fs: fsspec.AbstractFileSystem, root: str) -> CatalogManifest:
+        """
+        Build a manifest for all data files in the catalog at the given root.
+
+        The catalog is listed once, then each file is indexed from its parquet
+        footer statistics (bar datasets also read the `bar_type` column).
+
+        Parameters
+        ----------
+        fs : fsspec.AbstractFileSystem
+            The catalog filesystem.
+        root : str
+            The catalog root path.
+
+        Returns
+        -------
+        CatalogManifest
+            The rebuilt manifest (not yet written, see `write()`).
+
+        """
+        manifest = cls(fs=fs, root=root)
+        listing = fs.glob(f"{manifest.root}/data/**/*.parquet", detail=True)
+        manifest.add(
+            manifest.read_entry(path, size=info.get("size"))
+            for path, info in sorted(listing.items())
+            if info.get("type") == "file"
+        )
+        return manifest
+
+    def entries(self) -> list[ManifestEntry]:
+        """
+        Return all entries in the manifest (sorted by path).
+
+        Returns
+        -------
+        list[ManifestEntry]
+
+        """
+        return [self._entries[path] for path in sorted(self._entries)]
+
+    def entry(self, path: str) -> Optional[ManifestEntry]:
+        """
+        Return the entry for the given file path (if found).
+
+        Parameters
+        ----------
+        path : str
+            The file path (absolute, or relative to the catalog root).
+
+        Returns
+        -------
+        ManifestEntry or ``None``
+
+        """
+        return self._entries.get(self._relative(path))
+
+    def read_entry(self, path: str, size: Optional[int] = None) -> ManifestEntry:
+        """
+        Return a new manifest entry for the given data file.
+
+        The time range and row count are read from the parquet footer
+        statistics, falling back to reading the `ts_init` column if the
+        statistics are unavailable.
+
+        Parameters
+        ----------
+        path : str
+            The file path (absolute, or relative to the catalog root).
+        size : int, optional
+            The size of the file (bytes), if already known from a listing.
+
+        Returns
+        -------
+        ManifestEntry
+
+        """
+        relative = self._relative(path)
+        data_type, instrument_id = _parse_data_path(relative)
+        full_path = self._absolute(relative)
+
+        with self.fs.open(full_path, "rb") as f:
+            parquet_file = pq.ParquetFile(f)
+            metadata = parquet_file.metadata
+            names = metadata.schema.names
+            ts_min, ts_max = _time_range(parquet_file, metadata, names)
+            bar_specs = _bar_specs(parquet_file) if "bar_type" in names else []
+
+        return ManifestEntry(
+            path=relative,
+            data_type=data_type,
+            instrument_id=instrument_id,
+            bar_specs=bar_specs,
+            ts_min=ts_min,
+            ts_max=ts_max,
+            num_rows=metadata.num_rows,
+            size=size if size is not None else self.fs.size(full_path),
+        )
+
+    def add(self, entries: Iterable[ManifestEntry]) -> None:
+        """
+        Add (or replace) the given entries in the manifest.
+
+        Parameters
+        ----------
+        entries : Iterable[ManifestEntry]
+            The entries to add.
+
+        """
+        for entry in entries:
+            self._entries[entry.path] = entry
+        self._index = None
+
+    def remove(self, paths: Iterable[str]) -> None:
+        """
+        Remove the entries for the given file paths from the manifest.
+
+        Parameters
+        ----------
+        paths : Iterable[str]
+            The file paths (absolute, or relative to the catalog root).
+
+        """
+        for path in paths:
+            self._entries.pop(self._relative(path), None)
+        self._index = None
+
+    def write(self) -> None:
+        """
+        Write the manifest to the catalog, atomically replacing any existing manifest.
+        """
+        data = msgspec.json.encode(_ManifestFile(version=MANIFEST_VERSION, files=self.entries()))
+        tmp_path = f"{self.path}.{uuid.uuid4().hex}.tmp"
+        with self.fs.open(tmp_path, "wb") as f:
+            f.write(data)
+        self.fs.mv(tmp_path, self.path)
+
+    def files(
+        self,
+        data_type: Optional[str] = None,
+        instrument_id: Optional[str] = None,
+        start_nanos: Optional[int] = None,
+        end_nanos: Optional[int] = None,
+        bar_spec: Optional[str] = None,
+    ) -> list[str]:
+        """
+        Return the paths of the timestamped files which overlap the given time range.
+
+        Parameters
+        ----------
+        data_type : str, optional
+            The data type (dataset) name to filter by, if ``None`` then all data types.
+        instrument_id : str, optional
+            The instrument ID partition value to filter by, if ``None`` then all
+            instruments.
+        start_nanos : int, optional
+            The start of the time range (inclusive, UNIX nanoseconds).
+        end_nanos : int, optional
+            The end of the time range (inclusive, UNIX nanoseconds).
+        bar_spec : str, optional
+            The bar specification to filter by (bar datasets only).
+
+        Returns
+        -------
+        list[str]
+            The absolute file paths, sorted by filename.
+
+        """
+        if self._index is None:
+            self._index = self._build_index()
+
+        matched: list[ManifestEntry] = []
+        for (index_type, index_instrument), index in self._index.items():
+            if data_type is not None and index_type != data_type:
+                continue
+            if instrument_id is not None and index_instrument != instrument_id:
+                continue
+            matched.extend(index.overlapping(start_nanos, end_nanos))
+
+        if bar_spec is not None:
+            matched = [e for e in matched if bar_spec in e.bar_specs]
+
+        paths = [self._absolute(e.path) for e in matched]
+        return sorted(paths, key=lambda x: pathlib.PurePosixPath(x).stem)
+
+    def dataset_files(
+        self,
+        data_type: str,
+        instrument_ids: Optional[list[str]] = None,
+        start_nanos: Optional[int] = None,
+        end_nanos: Optional[int] = None,
+    ) -> list[str]:
+        """
+        Return the paths of all files in the given dataset which may contain
+        data for the given instruments and time range.
+
+        Unlike `files(...)`, files without timestamps (such as instruments) are
+        always included.
+
+        Parameters
+        ----------
+        data_type : str
+            The data type (dataset) name.
+        instrument_ids : list[str], optional
+            The instrument ID partition values to filter by, if ``None`` then all
+            instruments (files not partitioned by instrument are always included).
+        start_nanos : int, optional
+            The start of the time range (inclusive, UNIX nanoseconds).
+        end_nanos : int, optional
+            The end of the time range (inclusive, UNIX nanoseconds).
+
+        Returns
+        -------
+        list[str]
+            The absolute file paths, sorted by path.
+
+        """
+        if self._index is None:
+            self._index = self._build_index()
+
+        matched: list[ManifestEntry] = []
+        for (index_type, index_instrument), index in self._index.items():
+            if index_type != data_type:
+                continue
+            if instrument_ids and index_instrument is not None:
+                if index_instrument not in instrument_ids:
+                    continue
+            matched.extend(index.overlapping(start_nanos, end_nanos))
+
+        # Files without timestamps cannot be pruned by time range
+        matched.extend(
+            e
+            for e in self._entries.values()
+            if e.data_type == data_type
+            and e.ts_min is None
+            and (not instrument_ids or e.instrument_id is None or e.instrument_id in instrument_ids)
+        )
+
+        return sorted(self._absolute(e.path) for e in matched)
+
+    def _build_index(self) -> dict[tuple[str, Optional[str]], _IntervalIndex]:
+        groups: dict[tuple[str, Optional[str]], list[ManifestEntry]] = {}
+        for entry in self._entries.values():
+            if entry.ts_min is None or entry.ts_max is None:
+                continue  # Not timestamped
+            groups.setdefault((entry.data_type, entry.instrument_id), []).append(entry)
+        return {key: _IntervalIndex(entries) for key, entries in groups.items()}
+
+    def _relative(self, path: str) -> str:
+        prefix = f"{self.root}/"
+        return path[len(prefix) :] if path.startswith(prefix) else path
+
+    def _absolute(self, relative: str) -> str:
+        return f"{self.root}/{relative}"
+
+
+def manifest_path(root: str) -> str:
+    """
+    Return the manifest file path for the catalog at the given root.
+
+    Parameters
+    ----------
+    root : str
+        The catalog root path.
+
+    Returns
+    -------
+    str
+
+    """
+    return f"{root.rstrip('/')}/{MANIFEST_FN}"
+
+
+def _parse_data_path(relative: str) -> tuple[str, Optional[str]]:
+    # Parse the dataset name and instrument ID partition from a relative file path,
+    # e.g. `data/quote_tick.parquet/instrument_id=AUD-USD.SIM/<file>.parquet`.
+    parts = relative.split("/")
+    data_type = next(
+        (p[: -len(".parquet")] for p in parts[:-1] if p.endswith(".parquet")),
+        pathlib.PurePosixPath(relative).stem,
+    )
+    instrument_id = next(
+        (p[len("instrument_id=") :] for p in parts[:-1] if p.startswith("instrument_id=")),
+        None,
+    )
+    return data_type, instrument_id
+
+
+def _time_range(
+    parquet_file: pq.ParquetFile,
+    metadata: pq.FileMetaData,
+    names: list[str],
+) -> tuple[Optional[int], Optional[int]]:
+    if "ts_init" not in names or metadata.num_rows == 0:
+        return None, None
+
+    column = names.index("ts_init")
+    ts_min: Optional[int] = None
+    ts_max: Optional[int] = None
+    for i in range(metadata.num_row_groups):
+        row_group = metadata.row_group(i)
+        if row_group.num_rows == 0:
+            continue
+        stats = row_group.column(column).statistics
+        if stats is None or not stats.has_min_max:
+            # Statistics not written, read the column instead
+            min_max = pc.min_max(parquet_file.read(columns=["ts_init"]).column("ts_init"))
+            return min_max["min"].as_py(), min_max["max"].as_py()
+        ts_min = stats.min if ts_min is None else min(ts_min, stats.min)
+        ts_max = stats.max if ts_max is None else max(ts_max, stats.max)
+
+    return ts_min, ts_max
+
+
+def _bar_specs(parquet_file: pq.ParquetFile) -> list[str]:
+    # The `bar_type` column is dictionary encoded, so only the distinct values are parsed
+    values = pc.unique(parquet_file.read(columns=["bar_type"]).column("bar_type")).to_pylist()
+    return sorted({str(BarType.from_str(str(value)).spec) for value in values if value})
@@ -39,19 +39,20 @@ from nautilus_trader.model.data import Bar
 from nautilus_trader.model.data import BarSpecification
 from nautilus_trader.model.data import DataType
 from nautilus_trader.model.data import GenericData
-from nautilus_trader.model.data import QuoteTick
-from nautilus_trader.model.data import TradeTick
 from nautilus_trader.model.objects import FIXED_SCALAR
 from nautilus_trader.persistence.catalog.base import BaseDataCatalog
+from nautilus_trader.persistence.catalog.manifest import CatalogManifest
+from nautilus_trader.persistence.catalog.manifest import manifest_path
 from nautilus_trader.persistence.external.metadata import load_mappings
 from nautilus_trader.persistence.external.util import is_filename_in_time_range
+from nautilus_trader.persistence.streaming.batching import RUST_DATA_TYPES
 from nautilus_trader.persistence.streaming.batching import generate_batches_rust
 from nautilus_trader.serialization.arrow.serializer import ParquetSerializer
+from nautilus_trader.serialization.arrow.serializer import get_schema
 from nautilus_trader.serialization.arrow.serializer import list_schemas
 from nautilus_trader.serialization.arrow.util import camel_to_snake_case
 from nautilus_trader.serialization.arrow.util import class_to_filename
 from nautilus_trader.serialization.arrow.util import clean_key
-from nautilus_trader.serialization.arrow.util import dict_of_lists_to_list_of_dicts
 
 
 class ParquetDataCatalog(BaseDataCatalog):
@@ -71,6 +72,12 @@ class ParquetDataCatalog(BaseDataCatalog):
     --------
     The catalog is not threadsafe.
 
+    Notes
+    -----
+    If the catalog has a manifest (see `CatalogManifest`), files are selected for
+    queries from the manifest rather than by listing the catalog. Catalogs created
+    before the manifest was introduced can be indexed with `rebuild_manifest()`.
+
     """
 
     def __init__(
@@ -96,6 +103,8 @@ class ParquetDataCatalog(BaseDataCatalog):
             path = "/" + path
 
         self.path = str(path)
+        self._manifest: Optional[CatalogManifest] = None
+        self._manifest_key: Optional[str] = None
 
     @classmethod
     def from_env(cls):
@@ -146,6 +155,7 @@ class ParquetDataCatalog(BaseDataCatalog):
         table_kwargs: Optional[dict] = None,
         clean_instrument_keys: bool = True,
         as_dataframe: bool = True,
+        as_table: bool = False,
         projections: Optional[dict] = None,
         **kwargs,
     ):
@@ -156,10 +166,6 @@ class ParquetDataCatalog(BaseDataCatalog):
             if clean_instrument_keys:
                 instrument_ids = list(set(map(clean_key, instrument_ids)))
             filters.append(ds.field(instrument_id_column).cast("string").isin(instrument_ids))
-        if start is not None:
-            filters.append(ds.field(ts_column) >= pd.Timestamp(start).value)
-        if end is not None:
-            filters.append(ds.field(ts_column) <= pd.Timestamp(end).value)
 
         full_path = self.make_path(cls=cls)
 
@@ -167,7 +173,7 @@ class ParquetDataCatalog(BaseDataCatalog):
             if raise_on_empty:
                 raise FileNotFoundError(f"protocol={self.fs.protocol}, path={full_path}")
             else:
-                return pd.DataFrame() if as_dataframe else None
+                return pd.DataFrame() if as_dataframe and not as_table else None
 
         # Load rust objects
         if isinstance(start, int) or start is None:
@@ -180,14 +186,23 @@ class ParquetDataCatalog(BaseDataCatalog):
         else:
             end_nanos = dt_to_unix_nanos(end)  # datetime > nanos
 
-        use_rust = kwargs.get("use_rust") and cls in (QuoteTick, TradeTick)
-        if use_rust and kwargs.get("as_nautilus"):
+        bar_spec = kwargs.pop("bar_spec", None)
+        if isinstance(bar_spec, str):
+            bar_spec = BarSpecification.from_str(bar_spec)
+
+        # Bar files are only selected by bar specification
+        use_rust = (
+            kwargs.get("use_rust")
+            and cls in RUST_DATA_TYPES
+            and (cls is not Bar or bar_spec is not None)
+        )
+        if use_rust and kwargs.get("as_nautilus") and not as_table:
             assert instrument_ids is not None
             assert len(instrument_ids) > 0
 
             to_merge = []
             for instrument_id in instrument_ids:
-                files = self.get_files(cls, instrument_id, start_nanos, end_nanos)
+                files = self.get_files(cls, instrument_id, start_nanos, end_nanos, bar_spec)
 
                 if raise_on_empty and not files:
                     raise RuntimeError("No files found.")
@@ -206,7 +221,22 @@ class ParquetDataCatalog(BaseDataCatalog):
 
             return list(heapq.merge(*to_merge, key=lambda x: x.ts_init))
 
-        dataset = ds.dataset(full_path, partitioning="hive", filesystem=self.fs)
+        dataset = self._dataset(
+            cls=cls,
+            full_path=full_path,
+            instrument_ids=instrument_ids if instrument_id_column == "instrument_id" else None,
+            start_nanos=start_nanos if ts_column == "ts_init" else None,
+            end_nanos=end_nanos if ts_column == "ts_init" else None,
+        )
+
+        # Time range literals match the column type, so row groups are pruned by statistics
+        ts_type = (
+            dataset.schema.field(ts_column).type if ts_column in dataset.schema.names else None
+        )
+        if start is not None:
+            filters.append(ds.field(ts_column) >= pa.scalar(pd.Timestamp(start).value, ts_type))
+        if end is not None:
+            filters.append(ds.field(ts_column) <= pa.scalar(pd.Timestamp(end).value, ts_type))
 
         table_kwargs = table_kwargs or {}
         if projections:
@@ -219,6 +249,9 @@ class ParquetDataCatalog(BaseDataCatalog):
             print(e)
             raise e
 
+        if as_table:
+            return table
+
         if use_rust:
             df = int_to_float_dataframe(table.to_pandas())
             if start_nanos and end_nanos is None:
@@ -245,6 +278,86 @@ class ParquetDataCatalog(BaseDataCatalog):
         else:
             return self._handle_table_nautilus(table=table, cls=cls, mappings=mappings)
 
+    def _dataset(
+        self,
+        cls: type,
+        full_path: str,
+        instrument_ids: Optional[list[str]],
+        start_nanos: Optional[int],
+        end_nanos: Optional[int],
+    ) -> ds.Dataset:
+        manifest = self.manifest()
+        if manifest is None:
+            return ds.dataset(full_path, partitioning="hive", filesystem=self.fs)
+
+        data_type = class_to_filename(cls=cls)
+        files = manifest.dataset_files(
+            data_type=data_type,
+            instrument_ids=[clean_key(i) for i in instrument_ids] if instrument_ids else None,
+            start_nanos=start_nanos,
+            end_nanos=end_nanos,
+        )
+        if files:
+            return ds.dataset(
+                files,
+                partitioning="hive",
+                partition_base_dir=full_path,
+                filesystem=self.fs,
+            )
+
+        # No files match, the manifest is authoritative so the dataset is not listed.
+        # The empty dataset takes the schema of any file in the dataset (including
+        # partition fields), otherwise the registered schema for the class.
+        files = manifest.dataset_files(data_type=data_type)
+        if files:
+            schema = ds.dataset(
+                files[:1],
+                partitioning="hive",
+                partition_base_dir=full_path,
+                filesystem=self.fs,
+            ).schema
+        else:
+            schema = get_schema(cls)
+        return ds.dataset(schema.empty_table())
+
+    def query_table(
+        self,
+        cls: type,
+        filter_expr: Optional[Callable] = None,
+        instrument_ids: Optional[list[str]] = None,
+        **kwargs,
+    ) -> Optional[pa.Table]:
+        """
+        Return the raw Arrow table for the given query (without deserializing).
+
+        Values for columns with dictionary mappings are left encoded, the mappings
+        can be loaded with `load_inverse_mappings(...)`.
+
+        Parameters
+        ----------
+        cls : type
+            The data class to query.
+        filter_expr : Callable, optional
+            The dataset filter expression for the query.
+        instrument_ids : list[str], optional
+            The instrument IDs to filter the query by.
+        **kwargs
+            The additional query keyword arguments (e.g. `start` and `end`).
+
+        Returns
+        -------
+        pa.Table or ``None``
+            ``None`` if no dataset exists for `cls` (when not raising on empty).
+
+        """
+        return self._query(
+            cls=cls,
+            filter_expr=filter_expr,
+            instrument_ids=instrument_ids,
+            as_table=True,
+            **kwargs,
+        )
+
     def make_path(self, cls: type, instrument_id: Optional[str] = None) -> str:
         path = f"{self.path}/data/{class_to_filename(cls=cls)}.parquet"
         if instrument_id is not None:
@@ -259,6 +372,19 @@ class ParquetDataCatalog(BaseDataCatalog):
         end_nanos: Optional[int] = None,
         bar_spec: Optional[BarSpecification] = None,
     ) -> list[str]:
+        if cls is Bar and not bar_spec:
+            return []  # Bar files are only selected by bar specification
+
+        manifest = self.manifest()
+        if manifest is not None:
+            return manifest.files(
+                data_type=class_to_filename(cls=cls),
+                instrument_id=clean_key(instrument_id) if instrument_id is not None else None,
+                start_nanos=start_nanos,
+                end_nanos=end_nanos,
+                bar_spec=str(bar_spec) if cls is Bar else None,
+            )
+
         folder = self.make_path(cls=cls, instrument_id=instrument_id)
 
         if not self.fs.isdir(folder):
@@ -292,6 +418,17 @@ class ParquetDataCatalog(BaseDataCatalog):
         start_nanos: Optional[int] = None,
         end_nanos: Optional[int] = None,
     ) -> list[str]:
+        manifest = self.manifest()
+        if manifest is not None:
+            if instrument_id is None:
+                return manifest.files(start_nanos=start_nanos, end_nanos=end_nanos)
+            return manifest.files(
+                data_type=class_to_filename(cls=cls),
+                instrument_id=clean_key(instrument_id),
+                start_nanos=start_nanos,
+                end_nanos=end_nanos,
+            )
+
         folder = (
             self.path
             if instrument_id is None
@@ -314,6 +451,94 @@ class ParquetDataCatalog(BaseDataCatalog):
 
         return files
 
+    # -- MANIFEST ----------------------------------------------------------------------------------
+
+    def manifest(self) -> Optional[CatalogManifest]:
+        """
+        Return the catalog manifest (if one exists).
+
+        The manifest is cached, and only reloaded when the manifest file changes.
+
+        Returns
+        -------
+        CatalogManifest or ``None``
+
+        """
+        path = manifest_path(self.path)
+        try:
+            key = self.fs.ukey(path)
+        except FileNotFoundError:
+            self._manifest = None
+            self._manifest_key = None
+            return None
+
+        if self._manifest is None or key != self._manifest_key:
+            self._manifest = CatalogManifest.load(fs=self.fs, root=self.path)
+            self._manifest_key = key
+
+        return self._manifest
+
+    def rebuild_manifest(self) -> CatalogManifest:
+        """
+        Rebuild the catalog manifest from all data files in the catalog.
+
+        Use this to create a manifest for an existing catalog, or to recover a
+        manifest after files were added or removed without the catalog writers.
+
+        Returns
+        -------
+        CatalogManifest
+
+        """
+        manifest = CatalogManifest.rebuild(fs=self.fs, root=self.path)
+        self._write_manifest(manifest)
+        return manifest
+
+    def update_manifest(
+        self,
+        added: Optional[list[str]] = None,
+        removed: Optional[list[str]] = None,
+        create: bool = False,
+    ) -> Optional[CatalogManifest]:
+        """
+        Update the catalog manifest for the given written and removed files.
+
+        Each update is written as a single atomic replacement of the manifest file.
+
+        Parameters
+        ----------
+        added : list[str], optional
+            The paths of the files written (or overwritten).
+        removed : list[str], optional
+            The paths of the files removed.
+        create : bool, default False
+            If a new manifest should be created when the catalog has no manifest.
+            This must only be set when the catalog contained no data before the
+            given files were written, otherwise existing files would be missing
+            from the manifest.
+
+        Returns
+        -------
+        CatalogManifest or ``None``
+            ``None`` if the catalog has no manifest (and `create` was False).
+
+        """
+        manifest = self.manifest()
+        if manifest is None:
+            if not create:
+                return None
+            manifest = CatalogManifest(fs=self.fs, root=self.path)
+
+        manifest.remove(removed or [])
+        manifest.add(manifest.read_entry(path) for path in added or [])
+        self._write_manifest(manifest)
+        return manifest
+
+    def _write_manifest(self, manifest: CatalogManifest) -> None:
+        manifest.write()
+        self._manifest = manifest
+        self._manifest_key = self.fs.ukey(manifest.path)
+
     def load_inverse_mappings(self, path):
         mappings = load_mappings(fs=self.fs, path=path)
         for key in mappings:
@@ -347,19 +572,20 @@ class ParquetDataCatalog(BaseDataCatalog):
         mappings: Optional[dict],
     ):
         if isinstance(table, pa.Table):
-            dicts = dict_of_lists_to_list_of_dicts(table.to_pydict())
+            # Mappings are applied column-wise, once per distinct value
+            dicts = map_table_columns(table, mappings or {}).to_pylist()
         elif isinstance(table, pd.DataFrame):
             dicts = table.to_dict("records")
+            for key, maps in mappings.items():
+                for d in dicts:
+                    if d[key] in maps:
+                        d[key] = maps[d[key]]
         else:
             raise TypeError(
                 f"`table` was {type(table)}, expected `pyarrow.Table` or `pandas.DataFrame`",
             )
         if not dicts:
             return []
-        for key, maps in mappings.items():
-            for d in dicts:
-                if d[key] in maps:
-                    d[key] = maps[d[key]]
         data = ParquetSerializer.deserialize(cls=cls, chunk=dicts)
         return data
 
@@ -504,6 +730,38 @@ def read_feather_file(path: str, fs: Optional[fsspec.AbstractFileSystem] = None)
         return
 
 
+def map_table_columns(table: pa.Table, mappings: dict[str, dict]) -> pa.Table:
+    """
+    Return the `table` with the values of each mapped column replaced by its mapping.
+
+    Each column is dictionary encoded so the mapping is applied once per distinct
+    value, then the mapped values are taken back out by index.
+
+    Parameters
+    ----------
+    table : pa.Table
+        The table to map.
+    mappings : dict[str, dict]
+        The value mappings per column name (values without a mapping are kept).
+
+    Returns
+    -------
+    pa.Table
+
+    """
+    for key, maps in mappings.items():
+        if key not in table.column_names or not maps:
+            continue
+        index = table.column_names.index(key)
+        column = table.column(key).combine_chunks()
+        if not pa.types.is_dictionary(column.type):
+            column = column.dictionary_encode()
+        dictionary = column.dictionary.to_pylist()
+        mapped = pa.array([maps.get(value, value) for value in dictionary])
+        table = table.set_column(index, key, mapped.take(column.indices))
+    return table
+
+
 def combine_filters(*filters):
     filters = tuple(x for x in filters if x is not None)
     if len(filters) == 0:
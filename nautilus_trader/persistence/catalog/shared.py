@@ -0,0 +1,259 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2023 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import os
+import shutil
+import tempfile
+from collections.abc import Iterator
+from typing import Any
+from typing import Optional
+
+import pyarrow as pa
+
+from nautilus_trader.config import BacktestDataConfig
+from nautilus_trader.config.backtest import tokenize_config
+from nautilus_trader.core.inspect import is_nautilus_class
+from nautilus_trader.model.data import DataType
+from nautilus_trader.model.data import GenericData
+from nautilus_trader.model.identifiers import ClientId
+from nautilus_trader.persistence.catalog.parquet import ParquetDataCatalog
+
+
+# Shared memory backed filesystem (where available)
+_SHM_DIR = "/dev/shm"
+
+
+class SharedCatalogData:
+    """
+    Provides catalog query results shared read-only between processes.
+
+    The data for each config is queried from its catalog once and written to an
+    Arrow IPC file (in shared memory under ``/dev/shm`` where available). Consumers
+    memory-map the file, so the Arrow buffers are shared zero-copy through the OS
+    page cache rather than each process re-reading and decoding the parquet files.
+
+    Instances are picklable, and so can be passed to worker processes.
+
+    Parameters
+    ----------
+    path : str, optional
+        The directory for the shared files. If ``None`` then a temporary directory
+        is created.
+
+    Warnings
+    --------
+    Data configs using the Rust backend (`use_rust`) are not shared, and should be
+    loaded directly from the catalog.
+
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        if path is None:
+            path = tempfile.mkdtemp(
+                prefix="nautilus-shared-",
+                dir=_SHM_DIR if os.path.isdir(_SHM_DIR) else None,
+            )
+        os.makedirs(path, exist_ok=True)
+
+        self._path = path
+        self._entries: dict[str, tuple[str, dict]] = {}  # token -> (file path, mappings)
+
+    @property
+    def path(self) -> str:
+        """
+        Return the directory for the shared files.
+
+        Returns
+        -------
+        str
+
+        """
+        return self._path
+
+    def contains(self, config: BacktestDataConfig) -> bool:
+        """
+        Return a value indicating whether data for the given config is shared.
+
+        Parameters
+        ----------
+        config : BacktestDataConfig
+            The data config to check.
+
+        Returns
+        -------
+        bool
+
+        """
+        return _config_token(config) in self._entries
+
+    def add(self, config: BacktestDataConfig) -> bool:
+        """
+        Query the data for the given config and write it to a shared file.
+
+        Parameters
+        ----------
+        config : BacktestDataConfig
+            The data config to share.
+
+        Returns
+        -------
+        bool
+            True if the data is shared, False if the config is not supported
+            (using the Rust backend) or no data was found.
+
+        """
+        token = _config_token(config)
+        if token in self._entries:
+            return True  # Already shared
+        if config.use_rust:
+            return False
+
+        query = config.query
+        catalog = config.catalog()
+        table = catalog.query_table(
+            cls=query["cls"],
+            filter_expr=query["filter_expr"],
+            instrument_ids=query["instrument_ids"],
+            start=query["start"],
+            end=query["end"],
+            raise_on_empty=False,
+        )
+        if table is None or table.num_rows == 0:
+            return False  # Loaded (and logged as not found) per run instead
+
+        file_path = os.path.join(self._path, f"{token}.arrow")
+        with pa.OSFile(file_path, "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+
+        mappings = catalog.load_inverse_mappings(path=catalog.make_path(cls=query["cls"]))
+        self._entries[token] = (file_path, mappings)
+        return True
+
+    def load(self, config: BacktestDataConfig) -> dict[str, Any]:
+        """
+        Load the shared data for the given config.
+
+        The returned dictionary is in the same form as `BacktestDataConfig.load()`.
+
+        Parameters
+        ----------
+        config : BacktestDataConfig
+            The data config to load.
+
+        Returns
+        -------
+        dict[str, Any]
+
+        Raises
+        ------
+        KeyError
+            If data for `config` is not shared.
+
+        Warnings
+        --------
+        All the data is decoded into objects held by the calling process, only the
+        Arrow buffers are shared. Use `load_batches()` to bound the objects held.
+
+        """
+        loaded = self.load_batches(config, batch_size=None)
+        loaded["data"] = [d for batch in loaded["data"] for d in batch]
+        return loaded
+
+    def load_batches(
+        self,
+        config: BacktestDataConfig,
+        batch_size: Optional[int] = None,
+    ) -> dict[str, Any]:
+        """
+        Load the shared data for the given config as lazily decoded batches.
+
+        The batches are decoded from the memory-mapped table as they are pulled,
+        so only the current batch of objects is held by the calling process (for
+        use with `BacktestEngine.add_data_stream()`).
+
+        The returned dictionary is in the same form as `BacktestDataConfig.load()`,
+        where the "data" is an iterator of batches.
+
+        Parameters
+        ----------
+        config : BacktestDataConfig
+            The data config to load.
+        batch_size : int, optional
+            The maximum number of rows per batch. If ``None`` then the table is
+            decoded in a single batch.
+
+        Returns
+        -------
+        dict[str, Any]
+
+        Raises
+        ------
+        KeyError
+            If data for `config` is not shared.
+
+        """
+        file_path, mappings = self._entries[_config_token(config)]
+
+        catalog = config.catalog()
+        instruments = catalog.instruments(
+            instrument_ids=[config.instrument_id] if config.instrument_id else None,
+            as_nautilus=True,
+        )
+        if not instruments:
+            return {"data": iter([]), "instrument": None}
+
+        return {
+            "type": config.data_type,
+            "data": _decode_batches(file_path, config, mappings, batch_size),
+            "instrument": instruments[0] if config.instrument_id else None,
+            "client_id": ClientId(config.client_id) if config.client_id else None,
+        }
+
+    def dispose(self) -> None:
+        """
+        Remove all shared files.
+        """
+        shutil.rmtree(self._path, ignore_errors=True)
+        self._entries.clear()
+
+
+def _config_token(config: BacktestDataConfig) -> str:
+    return tokenize_config(config.dict())
+
+
+def _decode_batches(
+    file_path: str,
+    config: BacktestDataConfig,
+    mappings: dict,
+    batch_size: Optional[int],
+) -> Iterator[list]:
+    # Memory-map the file (the table buffers reference the mapped pages)
+    source = pa.memory_map(file_path, "r")
+    table = pa.ipc.open_file(source).read_all()
+
+    cls = config.data_type
+    data_type = None if is_nautilus_class(cls) else DataType(cls, metadata=config.metadata)
+    for batch in table.to_batches(max_chunksize=batch_size):
+        if batch.num_rows == 0:
+            continue
+        data = ParquetDataCatalog._handle_table_nautilus(
+            table=pa.Table.from_batches([batch]),
+            cls=cls,
+            mappings=mappings,
+        )
+        if data_type is not None:
+            data = [GenericData(data_type=data_type, data=d) for d in data]
+        yield data
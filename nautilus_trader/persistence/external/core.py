@@ -51,6 +51,9 @@ from nautilus_trader.serialization.arrow.util import clean_partition_cols
 from nautilus_trader.serialization.arrow.util import maybe_list
 
 
+DEFAULT_ROW_GROUP_SIZE = 65_536
+
+
 class RawFile:
     """
     Provides a wrapper of `fsspec.OpenFile` that processes a raw file and writes to
@@ -214,13 +217,19 @@ def determine_partition_cols(cls: type, instrument_id: Optional[str] = None) ->
     return None
 
 
-def merge_existing_data(catalog: BaseDataCatalog, cls: type, df: pd.DataFrame) -> pd.DataFrame:
+def merge_existing_data(
+    catalog: BaseDataCatalog,
+    cls: type,
+    df: pd.DataFrame,
+) -> Optional[pd.DataFrame]:
     """
     Handle existing data for instrument subclasses.
 
     Instruments all live in a single file, so merge with existing data. For all other
     classes, simply return data unchanged.
 
+    Returns ``None`` if every instrument is already in the catalog (nothing to write).
+
     """
     if cls not in Instrument.__subclasses__():
         return df
@@ -228,8 +237,12 @@ def merge_existing_data(catalog: BaseDataCatalog, cls: type, df: pd.DataFrame) -
         try:
             existing = catalog.instruments(instrument_type=cls)
             subset = [c for c in df.columns if c not in ("ts_init", "ts_event", "type")]
+            existing = existing.drop_duplicates(subset=subset)
             merged = pd.concat([existing, df.drop(["type"], axis=1)])
-            return merged.drop_duplicates(subset=subset)
+            merged = merged.drop_duplicates(subset=subset)
+            if len(merged) == len(existing):
+                return None  # No new or changed instruments
+            return merged
         except pa.lib.ArrowInvalid:
             return df
 
@@ -241,8 +254,14 @@ def write_tables(
 ):
     """
     Write tables to catalog.
+
+    If the catalog has a manifest (or contains no data yet), all files written are
+    recorded in the manifest with a single update once every table is written.
+
     """
     rows_written = 0
+    written: list[str] = []
+    create_manifest = catalog.manifest() is None and not catalog.fs.exists(f"{catalog.path}/data")
 
     iterator = [
         (cls, instrument_id, df)
@@ -264,8 +283,10 @@ def write_tables(
             else merge_existing_data(catalog=catalog, cls=cls, df=df)
         )
         kwargs.pop("merge_existing_data", None)
+        if merged is None:
+            continue
 
-        write_parquet(
+        written += write_parquet(
             fs=catalog.fs,
             path=path,
             df=merged,
@@ -280,6 +301,9 @@ def write_tables(
         )
         rows_written += len(df)
 
+    if written:
+        catalog.update_manifest(added=written, create=create_manifest)
+
     return rows_written
 
 
@@ -322,15 +346,34 @@ def write_parquet(
     df: pd.DataFrame,
     partition_cols: Optional[list[str]],
     schema: pa.Schema,
+    row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+    basename_tag: Optional[str] = None,
     **kwargs,
-):
+) -> list[str]:
     """
     Write a single dataframe to parquet.
+
+    Files are written sorted by `ts_init` in row groups of at most `row_group_size`
+    rows, so readers can skip row groups outside a time range by their statistics.
+
+    If `basename_tag` is given, it is added to the default filenames (after the
+    time range), so that writes covering the same time range do not collide.
+
+    Returns
+    -------
+    list[str]
+        The paths of the files written.
+
     """
     # Check partition values are valid before writing to parquet
     mappings = check_partition_columns(df=df, partition_columns=partition_cols)
     df = clean_partition_cols(df=df, mappings=mappings)
 
+    # Sort so every file written is sorted by `ts_init` (including existing files
+    # overwritten with the same basename), as readers rely on sorted files
+    if "ts_init" in df.columns:
+        df = df.sort_values("ts_init", kind="mergesort", ignore_index=True)
+
     # Dataframe -> pyarrow Table
     try:
         table = pa.Table.from_pandas(df, schema)
@@ -339,14 +382,15 @@ def write_parquet(
         raise
 
     if "basename_template" not in kwargs and "ts_init" in df.columns:
+        tag = f"-{basename_tag}" if basename_tag else ""
         if "bar_type" in df.columns:
             suffix = df.iloc[0]["bar_type"].split(".")[-1]
             kwargs["basename_template"] = (
-                f"{df['ts_init'].min()}-{df['ts_init'].max()}" + "-" + suffix + "-{i}.parquet"
+                f"{df['ts_init'].min()}-{df['ts_init'].max()}" + "-" + suffix + tag + "-{i}.parquet"
             )
         else:
             kwargs["basename_template"] = (
-                f"{df['ts_init'].min()}-{df['ts_init'].max()}" + "-{i}.parquet"
+                f"{df['ts_init'].min()}-{df['ts_init'].max()}" + tag + "-{i}.parquet"
             )
 
     # Write the actual file
@@ -363,20 +407,32 @@ def write_parquet(
 
     files = set(fs.glob(f"{path}/**"))
 
+    written: list[str] = []
+    file_visitor = kwargs.pop("file_visitor", None)
+
+    def visit_file(written_file):
+        written.append(written_file.path)
+        if file_visitor is not None:
+            file_visitor(written_file)
+
     ds.write_dataset(
         data=table,
         base_dir=path,
         filesystem=fs,
         partitioning=partitions,
         format="parquet",
+        file_visitor=visit_file,
+        max_rows_per_group=row_group_size,
         **kwargs,
     )
 
-    # Ensure data written by write_dataset is sorted
+    # Ensure data written by write_dataset is sorted (files overwritten with the same
+    # basename are not new, so are included from the visited files)
     new_files = set(fs.glob(f"{path}/**/*.parquet")) - files
+    new_files.update(fn for fn in written if fn.endswith(".parquet"))
 
     del df
-    for fn in new_files:
+    for fn in sorted(new_files):
         try:
             ndf = pd.read_parquet(BytesIO(fs.open(fn).read()))
         except ArrowInvalid:
@@ -384,11 +440,12 @@ def write_parquet(
             continue
         # assert ndf.shape[0] == shape
         if "ts_init" in ndf.columns:
-            ndf = ndf.sort_values("ts_init").reset_index(drop=True)
+            ndf = ndf.sort_values("ts_init", kind="mergesort").reset_index(drop=True)
         pq.write_table(
             table=pa.Table.from_pandas(ndf),
             where=fn,
             filesystem=fs,
+            row_group_size=row_group_size,
         )
 
     # Write the ``_common_metadata`` parquet file without row groups statistics
@@ -401,6 +458,8 @@ def write_parquet(
             mappings["instrument_id"].update(existing["instrument_id"])
         write_partition_column_mappings(fs=fs, path=path, mappings=mappings)
 
+    return sorted(written)
+
 
 def write_objects(catalog: ParquetDataCatalog, chunk: list, **kwargs):
     serialized = split_and_serialize(objs=chunk)
@@ -434,6 +493,9 @@ def _validate_dataset(catalog: ParquetDataCatalog, path: str, new_partition_form
 
     sort_key = lambda x: (x[1][0], x[1][1].strftime(new_partition_format))  # noqa: E731
 
+    added: list[str] = []
+    removed: list[str] = []
+
     for part, values_iter in groupby(sorted(fn_to_start, key=sort_key), key=sort_key):
         values = list(values_iter)
         filenames = [v[0] for v in values]
@@ -441,15 +503,22 @@ def _validate_dataset(catalog: ParquetDataCatalog, path: str, new_partition_form
         # Read files, drop duplicates
         df: pd.DataFrame = ds.dataset(filenames, filesystem=fs).to_table().to_pandas()
         df = df.drop_duplicates(ignore_index=True, keep="last")
+        if "ts_init" in df.columns:
+            df = df.sort_values("ts_init", kind="stable", ignore_index=True)
 
         # Write new file
         table = pa.Table.from_pandas(df, schema=dataset.schema)
         new_fn = filenames[0].replace(pathlib.Path(filenames[0]).stem, part[1])
-        pq.write_table(table=table, where=fs.open(new_fn, "wb"))
+        with fs.open(new_fn, "wb") as f:
+            pq.write_table(table=table, where=f, row_group_size=DEFAULT_ROW_GROUP_SIZE)
+        added.append(new_fn)
 
         # Remove old files
         for fn in filenames:
             fs.rm(fn)
+            removed.append(fn)
+
+    catalog.update_manifest(added=added, removed=removed)
 
 
 def validate_data_catalog(catalog: ParquetDataCatalog, **kwargs):
@@ -0,0 +1,440 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2023 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import multiprocessing
+import os
+import queue
+import time
+import traceback
+import uuid
+from typing import Any
+from typing import Callable
+from typing import Optional
+
+import fsspec
+import msgspec
+from tqdm import tqdm
+
+from nautilus_trader.persistence.catalog.parquet import ParquetDataCatalog
+from nautilus_trader.persistence.external.core import RawFile
+from nautilus_trader.persistence.external.core import dicts_to_dataframes
+from nautilus_trader.persistence.external.core import make_raw_files
+from nautilus_trader.persistence.external.core import split_and_serialize
+from nautilus_trader.persistence.external.core import write_tables
+from nautilus_trader.persistence.external.readers import Reader
+
+
+INGEST_STATE_FN = "_ingest_state.json"
+
+
+class IngestFileState(msgspec.Struct):
+    """
+    Represents the ingestion progress of a single raw file.
+
+    Parameters
+    ----------
+    fingerprint : str
+        The fingerprint of the raw file when ingested (changes if the file changes).
+    blocks : int
+        The number of blocks committed to the catalog.
+    rows : int
+        The number of rows committed to the catalog.
+    complete : bool
+        If every block of the file has been committed.
+
+    """
+
+    fingerprint: str
+    blocks: int = 0
+    rows: int = 0
+    complete: bool = False
+
+
+class IngestState:
+    """
+    Provides the persisted progress of raw file ingestion into a catalog.
+
+    Progress is recorded per raw file after each committed block, so an
+    interrupted ingestion can resume from the last committed block of each file.
+    The state is stored as a single JSON file at the catalog root, replaced
+    atomically on every update.
+
+    Parameters
+    ----------
+    fs : fsspec.AbstractFileSystem
+        The catalog filesystem.
+    root : str
+        The catalog root path.
+    files : dict[str, IngestFileState], optional
+        The initial progress by raw file path.
+
+    """
+
+    def __init__(
+        self,
+        fs: fsspec.AbstractFileSystem,
+        root: str,
+        files: Optional[dict[str, IngestFileState]] = None,
+    ) -> None:
+        self.fs = fs
+        self.root = root.rstrip("/")
+        self.files: dict[str, IngestFileState] = files or {}
+
+    @property
+    def path(self) -> str:
+        """
+        Return the path of the state file.
+
+        Returns
+        -------
+        str
+
+        """
+        return f"{self.root}/{INGEST_STATE_FN}"
+
+    @classmethod
+    def load(cls, fs: fsspec.AbstractFileSystem, root: str) -> IngestState:
+        """
+        Load the ingestion state for the catalog at the given root.
+
+        Parameters
+        ----------
+        fs : fsspec.AbstractFileSystem
+            The catalog filesystem.
+        root : str
+            The catalog root path.
+
+        Returns
+        -------
+        IngestState
+            The loaded state (empty if no state exists).
+
+        """
+        state = cls(fs=fs, root=root)
+        if fs.exists(state.path):
+            with fs.open(state.path, "rb") as f:
+                state.files = msgspec.json.decode(f.read(), type=dict[str, IngestFileState])
+        return state
+
+    def resume_from(self, path: str, fingerprint: str) -> Optional[int]:
+        """
+        Return the block index to resume ingesting the given raw file from.
+
+        Parameters
+        ----------
+        path : str
+            The raw file path.
+        fingerprint : str
+            The current fingerprint of the raw file.
+
+        Returns
+        -------
+        int or ``None``
+            ``None`` if the file is already completely ingested.
+
+        """
+        file_state = self.files.get(path)
+        if file_state is None or file_state.fingerprint != fingerprint:
+            return 0  # New or changed file
+        if file_state.complete:
+            return None
+        return file_state.blocks
+
+    def commit_block(self, path: str, fingerprint: str, block: int, rows: int) -> None:
+        """
+        Record the given block of the raw file as committed.
+
+        Parameters
+        ----------
+        path : str
+            The raw file path.
+        fingerprint : str
+            The fingerprint of the raw file.
+        block : int
+            The index of the committed block.
+        rows : int
+            The number of rows committed for the block.
+
+        """
+        file_state = self.files.get(path)
+        if file_state is None or file_state.fingerprint != fingerprint:
+            file_state = IngestFileState(fingerprint=fingerprint)
+            self.files[path] = file_state
+        file_state.blocks = block + 1
+        file_state.rows += rows
+        self.write()
+
+    def complete(self, path: str, fingerprint: str) -> None:
+        """
+        Record the raw file as completely ingested.
+
+        Parameters
+        ----------
+        path : str
+            The raw file path.
+        fingerprint : str
+            The fingerprint of the raw file.
+
+        """
+        file_state = self.files.get(path)
+        if file_state is None or file_state.fingerprint != fingerprint:
+            file_state = IngestFileState(fingerprint=fingerprint)
+            self.files[path] = file_state
+        file_state.complete = True
+        self.write()
+
+    def write(self) -> None:
+        """
+        Write the state to the catalog, atomically replacing any existing state.
+        """
+        tmp_path = f"{self.path}.{uuid.uuid4().hex}.tmp"
+        with self.fs.open(tmp_path, "wb") as f:
+            f.write(msgspec.json.encode(self.files))
+        self.fs.mv(tmp_path, self.path)
+
+
+def process_files_parallel(
+    glob_path: str,
+    reader: Reader,
+    catalog: ParquetDataCatalog,
+    block_size: str = "128mb",
+    compression: str = "infer",
+    workers: Optional[int] = None,
+    max_blocks_in_flight: Optional[int] = None,
+    resume: bool = True,
+    progress: bool = True,
+    mp_context: str = "spawn",
+    worker_initializer: Optional[Callable[[], None]] = None,
+    **kwargs,
+) -> dict[str, int]:
+    """
+    Process raw files into the catalog using a pool of worker processes.
+
+    Each worker process has its own copy of `reader`, and parses and serializes
+    one file at a time into columnar tables (per data type and instrument) for
+    each block. Blocks are passed through a bounded queue to a single writer
+    stage in this process, which commits the blocks of each file in order with
+    filenames tagged by the raw file and block (so no two blocks collide on a
+    partition file, and re-committing a block overwrites rather than duplicates).
+
+    Progress is recorded in the catalog after each committed block, so an
+    interrupted ingestion resumes from the last committed block of each file.
+
+    Parameters
+    ----------
+    glob_path : str
+        The fsspec glob path of the raw files to process.
+    reader : Reader
+        The reader for the raw files (copied to each worker process).
+    catalog : ParquetDataCatalog
+        The catalog to write to.
+    block_size : str, default '128mb'
+        The max block size to read from each raw file.
+    compression : str, default 'infer'
+        The compression of the raw files.
+    workers : int, optional
+        The number of worker processes (defaults to the CPU count).
+    max_blocks_in_flight : int, optional
+        The maximum number of parsed blocks waiting for the writer stage
+        (defaults to twice the number of workers), bounding memory usage.
+    resume : bool, default True
+        If previously committed progress should be resumed from (completely
+        ingested files are skipped).
+    progress : bool, default True
+        If a progress bar of the rows written (and rows/sec) should be shown.
+    mp_context : str, default 'spawn'
+        The multiprocessing start method (forking a process with running threads
+        is unsafe).
+    worker_initializer : Callable[[], None], optional
+        The callable to run in each worker process on start, such as registering
+        custom data serializers (which are not inherited by spawned processes).
+    **kwargs
+        The additional fsspec options for opening the raw files.
+
+    Returns
+    -------
+    dict[str, int]
+        The number of rows written by raw file path (including resumed progress).
+
+    Raises
+    ------
+    RuntimeError
+        If processing a raw file fails in a worker process (progress committed
+        before the failure is kept for resuming).
+    RuntimeError
+        If a worker process exits while processing a raw file.
+
+    Warnings
+    --------
+    With the `spawn` start method `reader` and `worker_initializer` must be
+    picklable (e.g. not built from lambdas or closures).
+
+    """
+    workers = workers or os.cpu_count() or 1
+    max_blocks_in_flight = max_blocks_in_flight or 2 * workers
+
+    raw_files = make_raw_files(
+        glob_path=glob_path,
+        block_size=block_size,
+        compression=compression,
+        **kwargs,
+    )
+
+    state = IngestState.load(fs=catalog.fs, root=catalog.path)
+    if not resume:
+        state.files.clear()
+
+    results: dict[str, int] = {}
+    tasks: list[tuple[RawFile, str, int]] = []
+    for raw_file in raw_files:
+        path = raw_file.open_file.path
+        fingerprint = _fingerprint(raw_file)
+        start_block = state.resume_from(path, fingerprint)
+        if start_block is None:
+            results[path] = state.files[path].rows  # Already ingested
+            continue
+        if start_block > 0:
+            logging.info(f"Resuming {path} from block {start_block}")
+        else:
+            state.files.pop(path, None)
+        results[path] = state.files[path].rows if path in state.files else 0
+        tasks.append((raw_file, fingerprint, start_block))
+
+    if not tasks:
+        return results
+
+    context = multiprocessing.get_context(mp_context)
+    blocks: multiprocessing.Queue = context.Queue(maxsize=max_blocks_in_flight)
+    started = time.monotonic()
+    rows_written = 0
+
+    with context.Pool(
+        processes=min(workers, len(tasks)),
+        initializer=_init_worker,
+        initargs=(reader, blocks, worker_initializer),
+    ) as pool, tqdm(total=None, unit="rows", disable=not progress) as progress_bar:
+        pending = {
+            raw_file.open_file.path: pool.apply_async(
+                _process_raw_file_blocks,
+                (raw_file, start_block),
+            )
+            for raw_file, _, start_block in tasks
+        }
+        fingerprints = {raw_file.open_file.path: fingerprint for raw_file, fingerprint, _ in tasks}
+        running: dict[str, int] = {}  # Raw file path -> worker process ID
+
+        while pending:
+            try:
+                message = blocks.get(timeout=0.1)
+            except queue.Empty:
+                _check_failed(pending, running)
+                continue
+
+            kind, path = message[0], message[1]
+            if kind == "start":
+                running[path] = message[2]
+            elif kind == "block":
+                _, _, block, tables = message
+                tag = f"{_path_tag(path)}_{block}"
+                rows = write_tables(catalog=catalog, tables=tables, basename_tag=tag)
+                state.commit_block(path, fingerprints[path], block, rows)
+                results[path] += rows
+                rows_written += rows
+                progress_bar.update(rows)
+            elif kind == "done":
+                state.complete(path, fingerprints[path])
+                running.pop(path, None)
+                pending.pop(path).get()
+            else:  # error
+                running.pop(path, None)
+                pending.pop(path)
+                raise RuntimeError(f"Failed processing {path}:\n{message[2]}")
+
+    elapsed = time.monotonic() - started
+    logging.info(
+        f"Wrote {rows_written:,} rows from {len(tasks)} files in {elapsed:.1f}s "
+        f"({rows_written / elapsed if elapsed > 0 else 0:,.0f} rows/sec)",
+    )
+
+    return results
+
+
+def _fingerprint(raw_file: RawFile) -> str:
+    open_file = raw_file.open_file
+    info = open_file.fs.info(open_file.path)
+    key = (open_file.path, info.get("size"), info.get("mtime") or info.get("ETag"))
+    return hashlib.sha256(repr(key).encode()).hexdigest()[:16]
+
+
+def _path_tag(path: str) -> str:
+    # Stable across runs, so a re-committed block overwrites its previous files
+    return hashlib.sha256(path.encode()).hexdigest()[:8]
+
+
+def _check_failed(pending: dict[str, Any], running: dict[str, int]) -> None:
+    for path, result in pending.items():
+        if result.ready() and not result.successful():
+            try:
+                result.get()
+            except Exception as e:
+                raise RuntimeError(f"Failed processing {path}") from e
+
+    # The pool replaces a worker which exits (e.g. killed), but its task is lost
+    # and would never complete
+    alive = {process.pid for process in multiprocessing.active_children()}
+    for path, pid in running.items():
+        if pid not in alive:
+            raise RuntimeError(f"Worker process {pid} exited while processing {path}")
+
+
+# -- WORKER ----------------------------------------------------------------------------------------
+
+_worker_reader: Optional[Reader] = None
+_worker_queue: Optional[multiprocessing.Queue] = None
+
+
+def _init_worker(
+    reader: Reader,
+    blocks: multiprocessing.Queue,
+    initializer: Optional[Callable[[], None]],
+) -> None:
+    global _worker_reader, _worker_queue
+    _worker_reader = reader
+    _worker_queue = blocks
+    if initializer is not None:
+        initializer()
+
+
+def _process_raw_file_blocks(raw_file: RawFile, start_block: int) -> None:
+    reader = _worker_reader
+    blocks = _worker_queue
+    path = raw_file.open_file.path
+    blocks.put(("start", path, os.getpid()))
+    try:
+        for i, block in enumerate(raw_file.iter()):
+            objs = [x for x in reader.parse(block) if x is not None]
+            if i < start_block:
+                continue  # Already committed (parsed to maintain the reader state)
+            tables = dicts_to_dataframes(split_and_serialize(objs))
+            blocks.put(("block", path, i, tables))
+        reader.on_file_complete()
+        blocks.put(("done", path))
+    except Exception:
+        reader.on_file_complete()
+        blocks.put(("error", path, traceback.format_exc()))
@@ -22,6 +22,8 @@ from typing import Optional
 import pandas as pd
 
 from nautilus_trader.core.nautilus_pyo3.persistence import NautilusDataType
+from nautilus_trader.model.data import Bar
+from nautilus_trader.model.data import OrderBookDelta
 from nautilus_trader.model.data import QuoteTick
 from nautilus_trader.model.data import TradeTick
 
@@ -129,5 +131,9 @@ def py_type_to_parquet_type(cls: type) -> NautilusDataType:
         return NautilusDataType.QuoteTick
     elif cls == TradeTick:
         return NautilusDataType.TradeTick
+    elif cls == Bar:
+        return NautilusDataType.Bar
+    elif cls == OrderBookDelta:
+        return NautilusDataType.OrderBookDelta
     else:
         raise RuntimeError(f"Type {cls} not supported as a `NautilusDataType` yet.")
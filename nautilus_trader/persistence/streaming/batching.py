@@ -13,7 +13,6 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-import itertools
 import sys
 from collections.abc import Generator
 from pathlib import Path
@@ -26,6 +25,8 @@ import pyarrow.parquet as pq
 
 from nautilus_trader.core.data import Data
 from nautilus_trader.core.nautilus_pyo3.persistence import DataBackendSession
+from nautilus_trader.model.data import Bar
+from nautilus_trader.model.data import OrderBookDelta
 from nautilus_trader.model.data import QuoteTick
 from nautilus_trader.model.data import TradeTick
 from nautilus_trader.model.identifiers import InstrumentId
@@ -34,6 +35,23 @@ from nautilus_trader.persistence.wranglers import list_from_capsule
 from nautilus_trader.serialization.arrow.serializer import ParquetSerializer
 
 
+RUST_DATA_TYPES: tuple[type, ...] = (QuoteTick, TradeTick, Bar, OrderBookDelta)
+
+
+def _bisect_ts_init(batch: list[Data], ts: int, right: bool = False) -> int:
+    # Return the insertion index for `ts` in the (time ordered) `batch`
+    lo = 0
+    hi = len(batch)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        ts_init = batch[mid].ts_init
+        if ts_init < ts or (right and ts_init == ts):
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
 def _generate_batches_within_time_range(
     batches: Generator[list[Data], None, None],
     start_nanos: Optional[int] = None,
@@ -53,23 +71,22 @@ def _generate_batches_within_time_range(
     end = end_nanos
     started = False
     for batch in batches:
+        if not batch:
+            yield batch
+            continue
+
         min = batch[0].ts_init
         max = batch[-1].ts_init
-        if min < start and max < start:
+        if max < start:
             batch = []  # not started yet
-
-        if max >= start and not started:
-            timestamps = np.array([x.ts_init for x in batch])
-            mask = timestamps >= start
-            masked = list(itertools.compress(batch, mask))
-            batch = masked
+        elif not started:
+            # Binary search the boundary batch (batches are ordered by `ts_init`)
+            if min < start:
+                batch = batch[_bisect_ts_init(batch, start) :]
             started = True
 
         if max > end:
-            timestamps = np.array([x.ts_init for x in batch])
-            mask = timestamps <= end
-            masked = list(itertools.compress(batch, mask))
-            batch = masked
+            batch = batch[: _bisect_ts_init(batch, end, right=True)]
             if batch:
                 yield batch
             return  # stop iterating
@@ -77,23 +94,46 @@ def _generate_batches_within_time_range(
         yield batch
 
 
+def _time_range_query(table_name: str, start_nanos: Optional[int], end_nanos: Optional[int]) -> str:
+    # The time range predicate is pushed down to the parquet reader, which skips
+    # row groups (and pages) by their `ts_init` statistics
+    conditions = []
+    if start_nanos is not None:
+        conditions.append(f"ts_init >= CAST({int(start_nanos)} AS BIGINT UNSIGNED)")
+    if end_nanos is not None:
+        conditions.append(f"ts_init <= CAST({int(end_nanos)} AS BIGINT UNSIGNED)")
+    return f"SELECT * FROM {table_name} WHERE {' AND '.join(conditions)} ORDER BY ts_init"
+
+
 def _generate_batches_rust(
     files: list[str],
     cls: type,
     batch_size: int = 10_000,
-) -> Generator[list[Union[QuoteTick, TradeTick]], None, None]:
+    start_nanos: Optional[int] = None,
+    end_nanos: Optional[int] = None,
+) -> Generator[list[Union[QuoteTick, TradeTick, Bar, OrderBookDelta]], None, None]:
     files = sorted(files, key=lambda x: Path(x).stem)
 
-    assert cls in (QuoteTick, TradeTick)
+    assert cls in RUST_DATA_TYPES
 
     session = DataBackendSession(chunk_size=batch_size)
 
-    for file in files:
-        session.add_file(
-            "data",
-            file,
-            py_type_to_parquet_type(cls),
-        )
+    data_type = py_type_to_parquet_type(cls)
+    for i, file in enumerate(files):
+        if start_nanos is None and end_nanos is None:
+            session.add_file(
+                "data",
+                file,
+                data_type,
+            )
+        else:
+            table_name = f"data_{i}"
+            session.add_file_with_query(
+                table_name,
+                file,
+                _time_range_query(table_name, start_nanos, end_nanos),
+                data_type,
+            )
 
     result = session.to_query_result()
 
@@ -108,8 +148,67 @@ def generate_batches_rust(
     start_nanos: Optional[int] = None,
     end_nanos: Optional[int] = None,
 ) -> Generator[list[Data], None, None]:
-    batches = _generate_batches_rust(files=files, cls=cls, batch_size=batch_size)
-    yield from _generate_batches_within_time_range(batches, start_nanos, end_nanos)
+    """
+    Return a generator of time ordered data batches decoded by the Rust backend.
+
+    The time range is filtered by the query, so row groups outside the range
+    are skipped by their `ts_init` statistics rather than read and decoded.
+
+    """
+    yield from _generate_batches_rust(
+        files=files,
+        cls=cls,
+        batch_size=batch_size,
+        start_nanos=start_nanos,
+        end_nanos=end_nanos,
+    )
+
+
+def _row_groups_in_time_range(
+    metadata: pq.FileMetaData,
+    start_nanos: Optional[int],
+    end_nanos: Optional[int],
+) -> list[int]:
+    # Select row groups by their `ts_init` statistics (row groups without
+    # statistics are always selected)
+    row_groups = list(range(metadata.num_row_groups))
+    if start_nanos is None and end_nanos is None:
+        return row_groups
+
+    names = metadata.schema.names
+    if "ts_init" not in names:
+        return row_groups
+
+    column = names.index("ts_init")
+    selected = []
+    for i in row_groups:
+        stats = metadata.row_group(i).column(column).statistics
+        if stats is not None and stats.has_min_max:
+            if start_nanos is not None and stats.max < start_nanos:
+                continue
+            if end_nanos is not None and stats.min > end_nanos:
+                continue
+        selected.append(i)
+    return selected
+
+
+def _slice_batch_to_time_range(
+    batch: pa.RecordBatch,
+    start_nanos: Optional[int],
+    end_nanos: Optional[int],
+) -> pa.RecordBatch:
+    # Binary search the (time ordered) batch for the range boundaries
+    timestamps = batch.column("ts_init").to_numpy()
+    ts_type = timestamps.dtype.type  # Search with the same dtype (avoids float64 promotion)
+    lo = 0
+    hi = len(timestamps)
+    if start_nanos is not None:
+        lo = int(np.searchsorted(timestamps, ts_type(start_nanos), side="left"))
+    if end_nanos is not None:
+        hi = int(np.searchsorted(timestamps, ts_type(end_nanos), side="right"))
+    if lo == 0 and hi == len(timestamps):
+        return batch
+    return batch.slice(lo, hi - lo)
 
 
 def _generate_batches(
@@ -118,13 +217,28 @@ def _generate_batches(
     fs: fsspec.AbstractFileSystem,
     instrument_id: Optional[InstrumentId] = None,  # Should be stored in metadata of parquet file?
     batch_size: int = 10_000,
+    start_nanos: Optional[int] = None,
+    end_nanos: Optional[int] = None,
 ) -> Generator[list[Data], None, None]:
     files = sorted(files, key=lambda x: Path(x).stem)
+    use_time_range = start_nanos is not None or end_nanos is not None
     for file in files:
-        for batch in pq.ParquetFile(fs.open(file)).iter_batches(batch_size=batch_size):
+        parquet_file = pq.ParquetFile(fs.open(file))
+        row_groups = _row_groups_in_time_range(parquet_file.metadata, start_nanos, end_nanos)
+        if not row_groups:
+            continue
+
+        for batch in parquet_file.iter_batches(batch_size=batch_size, row_groups=row_groups):
             if batch.num_rows == 0:
                 break
 
+            if use_time_range and "ts_init" in batch.schema.names:
+                if end_nanos is not None and batch.column("ts_init")[0].as_py() > end_nanos:
+                    return  # Files and batches are ordered by `ts_init`
+                batch = _slice_batch_to_time_range(batch, start_nanos, end_nanos)
+                if batch.num_rows == 0:
+                    continue
+
             table = pa.Table.from_batches([batch])
 
             if instrument_id is not None and "instrument_id" not in batch.schema.names:
@@ -145,11 +259,20 @@ def generate_batches(
     start_nanos: Optional[int] = None,
     end_nanos: Optional[int] = None,
 ) -> Generator[list[Data], None, None]:
+    """
+    Return a generator of time ordered data batches decoded in Python.
+
+    Row groups outside the time range are skipped by their `ts_init` statistics,
+    and the boundary batches are trimmed by binary search before decoding.
+
+    """
     batches = _generate_batches(
         files=files,
         cls=cls,
         instrument_id=instrument_id,
         fs=fs,
         batch_size=batch_size,
+        start_nanos=start_nanos,
+        end_nanos=end_nanos,
     )
     yield from _generate_batches_within_time_range(batches, start_nanos, end_nanos)
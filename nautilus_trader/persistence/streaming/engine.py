@@ -153,17 +153,7 @@ class StreamingEngine(_BufferIterator):
         data_configs: list[BacktestDataConfig],
         target_batch_size_bytes: int = parse_bytes("512mb"),  # ,
     ):
-        # Sort configs (larger time_aggregated bar specifications first)
-        # Define the order of objects with the same timestamp.
-        # Larger bar aggregations first. H4 > H1
-        def _sort_larger_specifications_first(config: BacktestDataConfig) -> tuple[int, int]:
-            if config.bar_spec is None:
-                return sys.maxsize, sys.maxsize  # last
-            else:
-                spec = BarSpecification.from_str(config.bar_spec)
-                return spec.aggregation * -1, spec.step * -1
-
-        self._configs = sorted(data_configs, key=_sort_larger_specifications_first)
+        self._configs = sort_data_configs(data_configs)
 
         buffers = list(map(self._config_to_buffer, data_configs))
 
@@ -174,42 +164,67 @@ class StreamingEngine(_BufferIterator):
 
     @staticmethod
     def _config_to_buffer(config: BacktestDataConfig) -> _StreamingBuffer:
-        if config.data_type is Bar:
-            assert config.bar_spec
+        return _StreamingBuffer(batches=generate_data_config_batches(config))
 
-        files = config.catalog().get_files(
+
+def sort_data_configs(data_configs: list[BacktestDataConfig]) -> list[BacktestDataConfig]:
+    """
+    Sort the given data configs to define the order of objects with the same timestamp.
+
+    Larger time aggregated bar specifications are sorted first (H4 > H1), with
+    all non-bar data last.
+    """
+
+    def _sort_larger_specifications_first(config: BacktestDataConfig) -> tuple[int, int]:
+        if config.bar_spec is None:
+            return sys.maxsize, sys.maxsize  # last
+        else:
+            spec = BarSpecification.from_str(config.bar_spec)
+            return spec.aggregation * -1, spec.step * -1
+
+    return sorted(data_configs, key=_sort_larger_specifications_first)
+
+
+def generate_data_config_batches(
+    config: BacktestDataConfig,
+) -> Generator[list[Data], None, None]:
+    """
+    Return a generator of time ordered data batches from the catalog for the given `config`.
+    """
+    if config.data_type is Bar:
+        assert config.bar_spec
+
+    files = config.catalog().get_files(
+        cls=config.data_type,
+        instrument_id=config.instrument_id,
+        start_nanos=config.start_time_nanos,
+        end_nanos=config.end_time_nanos,
+        bar_spec=BarSpecification.from_str(config.bar_spec) if config.bar_spec else None,
+    )
+
+    assert files, f"No files found for {config}"
+    assert config.batch_size is not None
+
+    if config.use_rust:
+        return generate_batches_rust(
+            files=files,
             cls=config.data_type,
-            instrument_id=config.instrument_id,
+            batch_size=config.batch_size,
+            start_nanos=config.start_time_nanos,
+            end_nanos=config.end_time_nanos,
+        )
+    else:
+        return generate_batches(
+            files=files,
+            cls=config.data_type,
+            instrument_id=InstrumentId.from_str(config.instrument_id)
+            if config.instrument_id
+            else None,
+            fs=fsspec.filesystem(config.catalog_fs_protocol or "file"),
+            batch_size=config.batch_size,
             start_nanos=config.start_time_nanos,
             end_nanos=config.end_time_nanos,
-            bar_spec=BarSpecification.from_str(config.bar_spec) if config.bar_spec else None,
         )
-
-        assert files, f"No files found for {config}"
-        assert config.batch_size is not None
-
-        if config.use_rust:
-            batches = generate_batches_rust(
-                files=files,
-                cls=config.data_type,
-                batch_size=config.batch_size,
-                start_nanos=config.start_time_nanos,
-                end_nanos=config.end_time_nanos,
-            )
-        else:
-            batches = generate_batches(
-                files=files,
-                cls=config.data_type,
-                instrument_id=InstrumentId.from_str(config.instrument_id)
-                if config.instrument_id
-                else None,
-                fs=fsspec.filesystem(config.catalog_fs_protocol or "file"),
-                batch_size=config.batch_size,
-                start_nanos=config.start_time_nanos,
-                end_nanos=config.end_time_nanos,
-            )
-
-        return _StreamingBuffer(batches=batches)
 
 
 def extract_generic_data_client_ids(data_configs: list["BacktestDataConfig"]) -> dict:
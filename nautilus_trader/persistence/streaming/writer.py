@@ -32,7 +32,6 @@ from nautilus_trader.serialization.arrow.serializer import get_cls_table
 from nautilus_trader.serialization.arrow.serializer import list_schemas
 from nautilus_trader.serialization.arrow.serializer import register_parquet
 from nautilus_trader.serialization.arrow.util import GENERIC_DATA_PREFIX
-from nautilus_trader.serialization.arrow.util import list_dicts_to_dict_lists
 
 
 class StreamingFeatherWriter:
@@ -51,6 +50,15 @@ class StreamingFeatherWriter:
         The flush interval (milliseconds) for writing chunks.
     replace : bool, default False
         If existing files at the given `path` should be replaced.
+    include_types : tuple[type], optional
+        The type names to write (if ``None`` then all registered types are written).
+    max_batch_size : int, default 10_000
+        The maximum number of rows buffered per table before a record batch is written.
+
+    Notes
+    -----
+    Rows are buffered into columns per table, and written as a single record batch
+    when `max_batch_size` rows are buffered or the flush interval has elapsed.
 
     """
 
@@ -62,7 +70,10 @@ class StreamingFeatherWriter:
         flush_interval_ms: Optional[int] = None,
         replace: bool = False,
         include_types: Optional[tuple[type]] = None,
+        max_batch_size: int = 10_000,
     ):
+        PyCondition.positive_int(max_batch_size, "max_batch_size")
+
         self.fs: fsspec.AbstractFileSystem = fsspec.filesystem(fs_protocol)
 
         self.path = path
@@ -90,8 +101,13 @@ class StreamingFeatherWriter:
         self.logger = logger
         self._files: dict[type, BinaryIO] = {}
         self._writers: dict[type, RecordBatchStreamWriter] = {}
+        self._table_schemas: dict[str, pa.Schema] = {}
+        self._columns: dict[str, dict[str, list]] = {}
+        self._row_counts: dict[str, int] = {}
         self._create_writers()
 
+        self.max_batch_size = max_batch_size
+
         self.flush_interval_ms = datetime.timedelta(milliseconds=flush_interval_ms or 1000)
         self._last_flush = datetime.datetime(1970, 1, 1)  # Default value to begin
         self.missing_writers: set[type] = set()
@@ -111,6 +127,9 @@ class StreamingFeatherWriter:
         self._files[cls] = f
 
         self._writers[table_name] = pa.ipc.new_stream(f, schema)
+        self._table_schemas[table_name] = schema
+        self._columns[table_name] = {name: [] for name in schema.names}
+        self._row_counts[table_name] = 0
 
     def _create_writers(self):
         for cls in self._schemas:
@@ -150,29 +169,65 @@ class StreamingFeatherWriter:
                 return
             else:
                 return
-        writer: RecordBatchStreamWriter = self._writers[table]
-        serialized = ParquetSerializer.serialize(obj)
+        try:
+            serialized = ParquetSerializer.serialize(obj)
+        except Exception as e:
+            self.logger.error(f"Failed to serialize {cls=}")
+            self.logger.error(f"ERROR = `{e}`")
+            return
         if not serialized:
             return
         if isinstance(serialized, dict):
             serialized = [serialized]
-        original = list_dicts_to_dict_lists(
-            serialized,
-            keys=self._schemas[cls].names,
-        )
-        data = list(original.values())
+
+        columns = self._columns[table]
+        for name, values in columns.items():
+            values.extend([row.get(name) for row in serialized])
+        self._row_counts[table] += len(serialized)
+
+        if self._row_counts[table] >= self.max_batch_size:
+            self._write_batch(table)
+        self.check_flush()
+
+    def _write_batch(self, table: str) -> None:
+        if self._row_counts[table] == 0:
+            return
+        schema = self._table_schemas[table]
+        columns = self._columns[table]
+        self._columns[table] = {name: [] for name in schema.names}
+        self._row_counts[table] = 0
+
+        writer: RecordBatchStreamWriter = self._writers[table]
         try:
-            batch = pa.record_batch(data, schema=self._schemas[cls])
-            writer.write_batch(batch)
-            self.check_flush()
-        except Exception as e:
-            self.logger.error(f"Failed to serialize {cls=}")
-            self.logger.error(f"ERROR = `{e}`")
-            self.logger.debug(f"data = {original}")
+            batch = pa.record_batch(list(columns.values()), schema=schema)
+        except Exception:
+            # Isolate the rows which cannot be converted so the rest are still written
+            self._write_rows(table, columns)
+            return
+        writer.write_batch(batch)
+
+    def _write_rows(self, table: str, columns: dict[str, list]) -> None:
+        schema = self._table_schemas[table]
+        writer: RecordBatchStreamWriter = self._writers[table]
+        valid: list[int] = []
+        for i in range(len(next(iter(columns.values())))):
+            row = {name: values[i] for name, values in columns.items()}
+            try:
+                pa.record_batch([[value] for value in row.values()], schema=schema)
+                valid.append(i)
+            except Exception as e:
+                self.logger.error(f"Failed to serialize {table=}")
+                self.logger.error(f"ERROR = `{e}`")
+                self.logger.debug(f"data = {row}")
+        if not valid:
+            return
+        data = [[values[i] for i in valid] for values in columns.values()]
+        writer.write_batch(pa.record_batch(data, schema=schema))
 
     def check_flush(self) -> None:
         """
-        Flush all stream writers if current time greater than the next flush interval.
+        Flush all buffered rows and stream writers if current time greater than the next
+        flush interval.
         """
         now = datetime.datetime.now()
         if now - self._last_flush > self.flush_interval_ms:
@@ -181,8 +236,10 @@ class StreamingFeatherWriter:
 
     def flush(self) -> None:
         """
-        Flush all stream writers.
+        Write all buffered rows and flush all stream writers.
         """
+        for table in self._writers:
+            self._write_batch(table)
         for stream in self._files.values():
             if not stream.closed:
                 stream.flush()
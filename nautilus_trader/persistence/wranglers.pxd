@@ -14,13 +14,10 @@
 # -------------------------------------------------------------------------------------------------
 
 from libc.stdint cimport int64_t
+from libc.stdint cimport uint8_t
 from libc.stdint cimport uint64_t
 
-from nautilus_trader.model.data.bar cimport Bar
 from nautilus_trader.model.data.bar cimport BarType
-from nautilus_trader.model.data.tick cimport QuoteTick
-from nautilus_trader.model.data.tick cimport TradeTick
-from nautilus_trader.model.enums_c cimport AggressorSide
 from nautilus_trader.model.instruments.base cimport Instrument
 
 
@@ -29,24 +26,14 @@ cdef list capsule_to_data_list(object capsule)
 cdef class QuoteTickDataWrangler:
     cdef readonly Instrument instrument
 
-    cpdef QuoteTick _build_tick_from_raw(
+    cdef list _build_ticks(
         self,
-        int64_t raw_bid,
-        int64_t raw_ask,
-        uint64_t raw_bid_size,
-        uint64_t raw_ask_size,
-        uint64_t ts_event,
-        uint64_t ts_init,
-    )
-
-    cpdef QuoteTick _build_tick(
-        self,
-        double bid,
-        double ask,
-        double bid_size,
-        double ask_size,
-        uint64_t ts_event,
-        uint64_t ts_init,
+        const int64_t[:] raw_bids,
+        const int64_t[:] raw_asks,
+        const uint64_t[:] raw_bid_sizes,
+        const uint64_t[:] raw_ask_sizes,
+        const uint64_t[:] ts_events,
+        const uint64_t[:] ts_inits,
     )
 
 
@@ -54,24 +41,14 @@ cdef class TradeTickDataWrangler:
     cdef readonly Instrument instrument
     cdef readonly processed_data
 
-    cpdef TradeTick _build_tick_from_raw(
-        self,
-        int64_t raw_price,
-        uint64_t raw_size,
-        AggressorSide aggressor_side,
-        str trade_id,
-        uint64_t ts_event,
-        uint64_t ts_init,
-    )
-
-    cpdef TradeTick _build_tick(
+    cdef list _build_ticks(
         self,
-        double price,
-        double size,
-        AggressorSide aggressor_side,
-        str trade_id,
-        uint64_t ts_event,
-        uint64_t ts_init,
+        const int64_t[:] raw_prices,
+        const uint64_t[:] raw_sizes,
+        const uint8_t[:] aggressor_sides,
+        list trade_ids,
+        const uint64_t[:] ts_events,
+        const uint64_t[:] ts_inits,
     )
 
 
@@ -79,4 +56,13 @@ cdef class BarDataWrangler:
     cdef readonly BarType bar_type
     cdef readonly Instrument instrument
 
-    cpdef Bar _build_bar(self, double[:] values, uint64_t ts_event, uint64_t ts_init_delta)
+    cdef list _build_bars(
+        self,
+        const int64_t[:] raw_opens,
+        const int64_t[:] raw_highs,
+        const int64_t[:] raw_lows,
+        const int64_t[:] raw_closes,
+        const uint64_t[:] raw_volumes,
+        const uint64_t[:] ts_events,
+        const uint64_t[:] ts_inits,
+    )
@@ -14,7 +14,6 @@
 # -------------------------------------------------------------------------------------------------
 
 import random
-from copy import copy
 from typing import Optional
 
 import numpy as np
@@ -22,21 +21,27 @@ import pandas as pd
 
 from cpython.pycapsule cimport PyCapsule_GetPointer
 from libc.stdint cimport int64_t
+from libc.stdint cimport uint8_t
 from libc.stdint cimport uint64_t
 
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.data cimport Data
 from nautilus_trader.core.datetime cimport as_utc_index
 from nautilus_trader.core.rust.core cimport CVec
-from nautilus_trader.core.rust.core cimport secs_to_nanos
 from nautilus_trader.core.rust.model cimport Data_t
 from nautilus_trader.core.rust.model cimport Data_t_Tag
+from nautilus_trader.core.rust.model cimport FIXED_PRECISION
+from nautilus_trader.core.rust.model cimport PRICE_MAX
+from nautilus_trader.core.rust.model cimport PRICE_MIN
+from nautilus_trader.core.rust.model cimport QUANTITY_MAX
+from nautilus_trader.core.rust.model cimport QUANTITY_MIN
 from nautilus_trader.model.data.bar cimport Bar
 from nautilus_trader.model.data.bar cimport BarType
 from nautilus_trader.model.data.book cimport OrderBookDelta
 from nautilus_trader.model.data.tick cimport QuoteTick
 from nautilus_trader.model.data.tick cimport TradeTick
 from nautilus_trader.model.enums_c cimport AggressorSide
+from nautilus_trader.model.identifiers cimport InstrumentId
 from nautilus_trader.model.identifiers cimport TradeId
 from nautilus_trader.model.instruments.base cimport Instrument
 from nautilus_trader.model.objects cimport Price
@@ -57,6 +62,8 @@ cdef inline list capsule_to_data_list(object capsule):
             ticks.append(QuoteTick.from_mem_c(ptr[i].quote))
         elif ptr[i].tag == Data_t_Tag.DELTA:
             ticks.append(OrderBookDelta.from_mem_c(ptr[i].delta))
+        elif ptr[i].tag == Data_t_Tag.BAR:
+            ticks.append(Bar.from_mem_c(ptr[i].bar))
 
     return ticks
 
@@ -65,6 +72,31 @@ def list_from_capsule(capsule) -> list[Data]:
     return capsule_to_data_list(capsule)
 
 
+cdef object _timestamps_ns(object index):
+    # Return the UNIX nanosecond timestamps of the given tz-aware UTC index
+    return np.ascontiguousarray(index.values.astype("datetime64[ns]", copy=False).view(np.uint64))
+
+
+cdef object _to_raw(object values, uint8_t precision, object dtype):
+    # Scale the given values to fixed-point raw values, rounded half away from zero
+    # to the given precision (as for `Price` and `Quantity`), where the raw values
+    # of sizes are `uint64` and of prices `int64`.
+    cdef object array = np.asarray(values, dtype=np.float64)
+    if not np.isfinite(array).all():
+        raise ValueError("`values` contained NaN or infinite values")
+    cdef bint is_size = dtype is np.uint64
+    cdef double min_value = QUANTITY_MIN if is_size else PRICE_MIN
+    cdef double max_value = QUANTITY_MAX if is_size else PRICE_MAX
+    if array.size > 0 and (array.min() < min_value or array.max() > max_value):
+        raise ValueError(
+            f"`values` contained values outside the valid range "
+            f"[{min_value}, {max_value}] for {'sizes' if is_size else 'prices'}",
+        )
+    cdef object scaled = array * (10.0 ** precision)
+    cdef object rounded = np.trunc(scaled + np.copysign(0.5, scaled)).astype(dtype)
+    return np.ascontiguousarray(rounded * dtype(10) ** (FIXED_PRECISION - precision))
+
+
 cdef class QuoteTickDataWrangler:
     """
     Provides a means of building lists of Nautilus `QuoteTick` objects.
@@ -106,29 +138,42 @@ cdef class QuoteTickDataWrangler:
         -------
         list[QuoteTick]
 
+        Raises
+        ------
+        ValueError
+            If `data` contains NaN or infinite prices or sizes.
+        ValueError
+            If `data` contains prices or sizes outside their valid range
+            (including negative sizes).
+
         """
         Condition.false(data.empty, "data.empty")
         Condition.not_none(default_volume, "default_volume")
 
-        as_utc_index(data)
+        data = as_utc_index(data)
+
+        cdef uint8_t price_prec = self.instrument.price_precision
+        cdef uint8_t size_prec = self.instrument.size_precision
 
-        if "bid_size" not in data.columns:
-            data["bid_size"] = float(default_volume)
-        if "ask_size" not in data.columns:
-            data["ask_size"] = float(default_volume)
+        if "bid_size" in data.columns:
+            bid_sizes = data["bid_size"]
+        else:
+            bid_sizes = np.full(len(data), float(default_volume))
+        if "ask_size" in data.columns:
+            ask_sizes = data["ask_size"]
+        else:
+            ask_sizes = np.full(len(data), float(default_volume))
 
-        cdef uint64_t[:] ts_events = np.ascontiguousarray([secs_to_nanos(dt.timestamp()) for dt in data.index], dtype=np.uint64)  # noqa
-        cdef uint64_t[:] ts_inits = np.ascontiguousarray([ts_event + ts_init_delta for ts_event in ts_events], dtype=np.uint64)  # noqa
+        ts_events = _timestamps_ns(data.index)
 
-        return list(map(
-            self._build_tick,
-            data["bid"],
-            data["ask"],
-            data["bid_size"],
-            data["ask_size"],
+        return self._build_ticks(
+            _to_raw(data["bid"], price_prec, np.int64),
+            _to_raw(data["ask"], price_prec, np.int64),
+            _to_raw(bid_sizes, size_prec, np.uint64),
+            _to_raw(ask_sizes, size_prec, np.uint64),
             ts_events,
-            ts_inits,
-        ))
+            ts_events + np.uint64(ts_init_delta),
+        )
 
     def process_bar_data(
         self,
@@ -163,6 +208,14 @@ cdef class QuoteTickDataWrangler:
         is_raw : bool, default False
             If the data is scaled to the Nautilus fixed precision.
 
+        Raises
+        ------
+        ValueError
+            If `bid_data` or `ask_data` contains infinite values (when not `is_raw`).
+        ValueError
+            If `bid_data` or `ask_data` contains values outside their valid range,
+            including negative volumes (when not `is_raw`).
+
         """
         Condition.not_none(bid_data, "bid_data")
         Condition.not_none(ask_data, "ask_data")
@@ -176,139 +229,112 @@ cdef class QuoteTickDataWrangler:
         bid_data = as_utc_index(bid_data)
         ask_data = as_utc_index(ask_data)
 
-        if "volume" not in bid_data:
-            bid_data["volume"] = float(default_volume * 4)
-
-        if "volume" not in ask_data:
-            ask_data["volume"] = float(default_volume * 4)
-
-        cdef dict data_open = {
-            "bid": bid_data["open"],
-            "ask": ask_data["open"],
-            "bid_size": bid_data["volume"] / 4,
-            "ask_size": ask_data["volume"] / 4,
-        }
-
-        cdef dict data_high = {
-            "bid": bid_data["high"],
-            "ask": ask_data["high"],
-            "bid_size": bid_data["volume"] / 4,
-            "ask_size": ask_data["volume"] / 4,
-        }
-
-        cdef dict data_low = {
-            "bid": bid_data["low"],
-            "ask": ask_data["low"],
-            "bid_size": bid_data["volume"] / 4,
-            "ask_size": ask_data["volume"] / 4,
-        }
-
-        cdef dict data_close = {
-            "bid": bid_data["close"],
-            "ask": ask_data["close"],
-            "bid_size": bid_data["volume"] / 4,
-            "ask_size": ask_data["volume"] / 4,
-        }
-
-        df_ticks_o = pd.DataFrame(data=data_open)
-        df_ticks_h = pd.DataFrame(data=data_high)
-        df_ticks_l = pd.DataFrame(data=data_low)
-        df_ticks_c = pd.DataFrame(data=data_close)
-
-        # Latency offsets
-        df_ticks_o.index = df_ticks_o.index.shift(periods=-300, freq="ms")
-        df_ticks_h.index = df_ticks_h.index.shift(periods=-200, freq="ms")
-        df_ticks_l.index = df_ticks_l.index.shift(periods=-100, freq="ms")
-
-        # Merge tick data
-        df_ticks_final = pd.concat([df_ticks_o, df_ticks_h, df_ticks_l, df_ticks_c])
-        df_ticks_final.dropna(inplace=True)
-        df_ticks_final.sort_index(axis=0, kind="mergesort", inplace=True)
-
-        cdef int i
-        # Randomly shift high low prices
+        # Align bid and ask bars on timestamp
+        bid_data, ask_data = bid_data.align(ask_data, join="inner", axis=0)
+        bid_data = bid_data.sort_index(kind="mergesort")
+        ask_data = ask_data.sort_index(kind="mergesort")
+
+        cdef list columns = ["open", "high", "low", "close"]
+        default_volumes = pd.Series(default_volume * 4, index=bid_data.index)
+        bid_prices = bid_data[columns]
+        ask_prices = ask_data[columns]
+        bid_volumes = bid_data["volume"] if "volume" in bid_data else default_volumes
+        ask_volumes = ask_data["volume"] if "volume" in ask_data else default_volumes
+
+        # Ticks for all opens, then highs, lows and closes (flattened column-wise)
+        missing = np.tile(bid_volumes.isna().to_numpy() | ask_volumes.isna().to_numpy(), 4)
+        missing |= (bid_prices.isna() | ask_prices.isna()).to_numpy().ravel(order="F")
+        if is_raw:
+            # Raw values are taken as integers, as float64 is not exact above 2**53
+            bids = bid_prices.fillna(0).to_numpy(dtype=np.int64).ravel(order="F")
+            asks = ask_prices.fillna(0).to_numpy(dtype=np.int64).ravel(order="F")
+            bid_sizes = np.tile(bid_volumes.fillna(0).to_numpy(dtype=np.uint64) // 4, 4)
+            ask_sizes = np.tile(ask_volumes.fillna(0).to_numpy(dtype=np.uint64) // 4, 4)
+        else:
+            bids = bid_prices.to_numpy(dtype=np.float64).ravel(order="F")
+            asks = ask_prices.to_numpy(dtype=np.float64).ravel(order="F")
+            bid_sizes = np.tile(bid_volumes.to_numpy(dtype=np.float64) / 4, 4)
+            ask_sizes = np.tile(ask_volumes.to_numpy(dtype=np.float64) / 4, 4)
+
+        # Latency offsets for open, high and low ticks
+        ts_bars = _timestamps_ns(bid_data.index)
+        ts_events = np.concatenate([
+            ts_bars - np.uint64(300_000_000),
+            ts_bars - np.uint64(200_000_000),
+            ts_bars - np.uint64(100_000_000),
+            ts_bars,
+        ])
+
+        # Drop incomplete ticks, then order by timestamp (stable)
+        valid = np.flatnonzero(~missing)
+        order = valid[np.argsort(ts_events[valid], kind="stable")]
+        ts_events = np.ascontiguousarray(ts_events[order])
+
+        # Randomly shift high low prices (timestamps keep their order)
         if random_seed is not None:
             random.seed(random_seed)
-            for i in range(0, len(df_ticks_final), 4):
-                if random.getrandbits(1):
-                    high = copy(df_ticks_final.iloc[i + 1])
-                    low = copy(df_ticks_final.iloc[i + 2])
-                    df_ticks_final.iloc[i + 1] = low
-                    df_ticks_final.iloc[i + 2] = high
+            starts = np.arange(0, len(order), 4)
+            swaps = starts[np.array([random.getrandbits(1) for _ in starts], dtype=bool)]
+            swaps = swaps[swaps + 2 < len(order)]
+            shuffled = order.copy()
+            shuffled[swaps + 1] = order[swaps + 2]
+            shuffled[swaps + 2] = order[swaps + 1]
+            order = shuffled
 
-        cdef uint64_t[:] ts_events = np.ascontiguousarray([secs_to_nanos(dt.timestamp()) for dt in df_ticks_final.index], dtype=np.uint64)  # noqa
-        cdef uint64_t[:] ts_inits = np.ascontiguousarray([ts_event + ts_init_delta for ts_event in ts_events], dtype=np.uint64)  # noqa
+        cdef uint8_t price_prec = self.instrument.price_precision
+        cdef uint8_t size_prec = self.instrument.size_precision
 
         if is_raw:
-            return list(map(
-                self._build_tick_from_raw,
-                df_ticks_final["bid"],
-                df_ticks_final["ask"],
-                df_ticks_final["bid_size"],
-                df_ticks_final["ask_size"],
-                ts_events,
-                ts_inits,
-            ))
+            raw_bids = np.ascontiguousarray(bids[order])
+            raw_asks = np.ascontiguousarray(asks[order])
+            raw_bid_sizes = np.ascontiguousarray(bid_sizes[order])
+            raw_ask_sizes = np.ascontiguousarray(ask_sizes[order])
         else:
-            return list(map(
-                self._build_tick,
-                df_ticks_final["bid"],
-                df_ticks_final["ask"],
-                df_ticks_final["bid_size"],
-                df_ticks_final["ask_size"],
-                ts_events,
-                ts_inits,
-            ))
-
-    # cpdef method for Python wrap() (called with map)
-    cpdef QuoteTick _build_tick_from_raw(
-        self,
-        int64_t raw_bid,
-        int64_t raw_ask,
-        uint64_t raw_bid_size,
-        uint64_t raw_ask_size,
-        uint64_t ts_event,
-        uint64_t ts_init,
-    ):
-        return QuoteTick.from_raw_c(
-            self.instrument.id,
-            raw_bid,
-            raw_ask,
-            self.instrument.price_precision,
-            self.instrument.price_precision,
-            raw_bid_size,
-            raw_ask_size,
-            self.instrument.size_precision,
-            self.instrument.size_precision,
-            ts_event,
-            ts_init,
+            raw_bids = _to_raw(bids[order], price_prec, np.int64)
+            raw_asks = _to_raw(asks[order], price_prec, np.int64)
+            raw_bid_sizes = _to_raw(bid_sizes[order], size_prec, np.uint64)
+            raw_ask_sizes = _to_raw(ask_sizes[order], size_prec, np.uint64)
+
+        return self._build_ticks(
+            raw_bids,
+            raw_asks,
+            raw_bid_sizes,
+            raw_ask_sizes,
+            ts_events,
+            ts_events + np.uint64(ts_init_delta),
         )
 
-    # cpdef method for Python wrap() (called with map)
-    cpdef QuoteTick _build_tick(
+    cdef list _build_ticks(
         self,
-        double bid,
-        double ask,
-        double bid_size,
-        double ask_size,
-        uint64_t ts_event,
-        uint64_t ts_init,
+        const int64_t[:] raw_bids,
+        const int64_t[:] raw_asks,
+        const uint64_t[:] raw_bid_sizes,
+        const uint64_t[:] raw_ask_sizes,
+        const uint64_t[:] ts_events,
+        const uint64_t[:] ts_inits,
     ):
-        # Build a quote tick from the given values. The function expects the values to
-        # be an ndarray with 4 elements [bid, ask, bid_size, ask_size] of type double.
-        return QuoteTick.from_raw_c(
-            self.instrument.id,
-            int(bid * 1e9),
-            int(ask * 1e9),
-            self.instrument.price_precision,
-            self.instrument.price_precision,
-            int(bid_size * 1e9),
-            int(ask_size * 1e9),
-            self.instrument.size_precision,
-            self.instrument.size_precision,
-            ts_event,
-            ts_init,
-        )
+        cdef InstrumentId instrument_id = self.instrument.id
+        cdef uint8_t price_prec = self.instrument.price_precision
+        cdef uint8_t size_prec = self.instrument.size_precision
+        cdef list ticks = []
+
+        cdef Py_ssize_t i
+        for i in range(ts_events.shape[0]):
+            ticks.append(QuoteTick.from_raw_c(
+                instrument_id,
+                raw_bids[i],
+                raw_asks[i],
+                price_prec,
+                price_prec,
+                raw_bid_sizes[i],
+                raw_ask_sizes[i],
+                size_prec,
+                size_prec,
+                ts_events[i],
+                ts_inits[i],
+            ))
+
+        return ticks
 
 
 cdef class TradeTickDataWrangler:
@@ -343,6 +369,11 @@ cdef class TradeTickDataWrangler:
         ------
         ValueError
             If `data` is empty.
+        ValueError
+            If `data` contains NaN or infinite values (when not `is_raw`).
+        ValueError
+            If `data` contains prices or sizes outside their valid range,
+            including negative sizes (when not `is_raw`).
 
         """
         Condition.not_none(data, "data")
@@ -350,81 +381,64 @@ cdef class TradeTickDataWrangler:
 
         data = as_utc_index(data)
 
-        cdef uint64_t[:] ts_events = np.ascontiguousarray([secs_to_nanos(dt.timestamp()) for dt in data.index], dtype=np.uint64)  # noqa
-        cdef uint64_t[:] ts_inits = np.ascontiguousarray([ts_event + ts_init_delta for ts_event in ts_events], dtype=np.uint64)  # noqa
-
         if is_raw:
-            return list(map(
-                self._build_tick_from_raw,
-                data["price"],
-                data["quantity"],
-                self._create_side_if_not_exist(data),
-                data["trade_id"].astype(str),
-                ts_events,
-                ts_inits,
-            ))
+            raw_prices = np.ascontiguousarray(data["price"], dtype=np.int64)
+            raw_sizes = np.ascontiguousarray(data["quantity"], dtype=np.uint64)
         else:
-            return list(map(
-                self._build_tick,
-                data["price"],
-                data["quantity"],
-                self._create_side_if_not_exist(data),
-                data["trade_id"].astype(str),
-                ts_events,
-                ts_inits,
-            ))
+            raw_prices = _to_raw(data["price"], self.instrument.price_precision, np.int64)
+            raw_sizes = _to_raw(data["quantity"], self.instrument.size_precision, np.uint64)
+
+        ts_events = _timestamps_ns(data.index)
+
+        return self._build_ticks(
+            raw_prices,
+            raw_sizes,
+            self._create_side_if_not_exist(data),
+            data["trade_id"].astype(str).tolist(),
+            ts_events,
+            ts_events + np.uint64(ts_init_delta),
+        )
 
     def _create_side_if_not_exist(self, data):
         if "side" in data.columns:
-            return data["side"].apply(lambda x: AggressorSide.BUYER if str(x).upper() == "BUY" else AggressorSide.SELLER)
+            is_buyer = (data["side"].astype(str).str.upper() == "BUY").to_numpy()
         else:
-            return data["buyer_maker"].apply(lambda x: AggressorSide.SELLER if x is True else AggressorSide.BUYER)
-
-    # cpdef method for Python wrap() (called with map)
-    cpdef TradeTick _build_tick_from_raw(
+            buyer_maker = data["buyer_maker"]
+            if buyer_maker.dtype == bool:
+                is_buyer = ~buyer_maker.to_numpy()
+            else:
+                is_buyer = np.array([x is not True for x in buyer_maker], dtype=bool)
+        return np.where(is_buyer, AggressorSide.BUYER, AggressorSide.SELLER).astype(np.uint8)
+
+    cdef list _build_ticks(
         self,
-        int64_t raw_price,
-        uint64_t raw_size,
-        AggressorSide aggressor_side,
-        str trade_id,
-        uint64_t ts_event,
-        uint64_t ts_init,
+        const int64_t[:] raw_prices,
+        const uint64_t[:] raw_sizes,
+        const uint8_t[:] aggressor_sides,
+        list trade_ids,
+        const uint64_t[:] ts_events,
+        const uint64_t[:] ts_inits,
     ):
-        return TradeTick.from_raw_c(
-            self.instrument.id,
-            raw_price,
-            self.instrument.price_precision,
-            raw_size,
-            self.instrument.size_precision,
-            aggressor_side,
-            TradeId(trade_id),
-            ts_event,
-            ts_init,
-        )
+        cdef InstrumentId instrument_id = self.instrument.id
+        cdef uint8_t price_prec = self.instrument.price_precision
+        cdef uint8_t size_prec = self.instrument.size_precision
+        cdef list ticks = []
+
+        cdef Py_ssize_t i
+        for i in range(ts_events.shape[0]):
+            ticks.append(TradeTick.from_raw_c(
+                instrument_id,
+                raw_prices[i],
+                price_prec,
+                raw_sizes[i],
+                size_prec,
+                <AggressorSide>aggressor_sides[i],
+                TradeId(trade_ids[i]),
+                ts_events[i],
+                ts_inits[i],
+            ))
 
-    # cpdef method for Python wrap() (called with map)
-    cpdef TradeTick _build_tick(
-        self,
-        double price,
-        double size,
-        AggressorSide aggressor_side,
-        str trade_id,
-        uint64_t ts_event,
-        uint64_t ts_init,
-    ):
-        # Build a quote tick from the given values. The function expects the values to
-        # be an ndarray with 4 elements [bid, ask, bid_size, ask_size] of type double.
-        return TradeTick.from_raw_c(
-            self.instrument.id,
-            int(price * 1e9),
-            self.instrument.price_precision,
-            int(size * 1e9),
-            self.instrument.size_precision,
-            aggressor_side,
-            TradeId(trade_id),
-            ts_event,
-            ts_init,
-        )
+        return ticks
 
 
 cdef class BarDataWrangler:
@@ -481,6 +495,11 @@ cdef class BarDataWrangler:
         ------
         ValueError
             If `data` is empty.
+        ValueError
+            If `data` contains NaN or infinite values.
+        ValueError
+            If `data` contains prices or volumes outside their valid range
+            (including negative volumes).
 
         """
         Condition.not_none(data, "data")
@@ -489,30 +508,48 @@ cdef class BarDataWrangler:
 
         data = as_utc_index(data)
 
-        if "volume" not in data:
-            data["volume"] = float(default_volume)
+        cdef uint8_t price_prec = self.instrument.price_precision
+        cdef uint8_t size_prec = self.instrument.size_precision
 
-        cdef uint64_t[:] ts_events = np.ascontiguousarray([secs_to_nanos(dt.timestamp()) for dt in data.index], dtype=np.uint64)  # noqa
-        cdef uint64_t[:] ts_inits = np.ascontiguousarray([ts_event + ts_init_delta for ts_event in ts_events], dtype=np.uint64)  # noqa
+        volumes = data["volume"] if "volume" in data else np.full(len(data), float(default_volume))
 
-        return list(map(
-            self._build_bar,
-            data.values,
+        ts_events = _timestamps_ns(data.index)
+
+        return self._build_bars(
+            _to_raw(data["open"], price_prec, np.int64),
+            _to_raw(data["high"], price_prec, np.int64),
+            _to_raw(data["low"], price_prec, np.int64),
+            _to_raw(data["close"], price_prec, np.int64),
+            _to_raw(volumes, size_prec, np.uint64),
             ts_events,
-            ts_inits
-        ))
-
-    # cpdef method for Python wrap() (called with map)
-    cpdef Bar _build_bar(self, double[:] values, uint64_t ts_event, uint64_t ts_init):
-        # Build a bar from the given index and values. The function expects the
-        # values to be an ndarray with 5 elements [open, high, low, close, volume].
-        return Bar(
-            bar_type=self.bar_type,
-            open=Price(values[0], self.instrument.price_precision),
-            high=Price(values[1], self.instrument.price_precision),
-            low=Price(values[2], self.instrument.price_precision),
-            close=Price(values[3], self.instrument.price_precision),
-            volume=Quantity(values[4], self.instrument.size_precision),
-            ts_event=ts_event,
-            ts_init=ts_init,
+            ts_events + np.uint64(ts_init_delta),
         )
+
+    cdef list _build_bars(
+        self,
+        const int64_t[:] raw_opens,
+        const int64_t[:] raw_highs,
+        const int64_t[:] raw_lows,
+        const int64_t[:] raw_closes,
+        const uint64_t[:] raw_volumes,
+        const uint64_t[:] ts_events,
+        const uint64_t[:] ts_inits,
+    ):
+        cdef uint8_t price_prec = self.instrument.price_precision
+        cdef uint8_t size_prec = self.instrument.size_precision
+        cdef list bars = []
+
+        cdef Py_ssize_t i
+        for i in range(ts_events.shape[0]):
+            bars.append(Bar(
+                self.bar_type,
+                Price.from_raw_c(raw_opens[i], price_prec),
+                Price.from_raw_c(raw_highs[i], price_prec),
+                Price.from_raw_c(raw_lows[i], price_prec),
+                Price.from_raw_c(raw_closes[i], price_prec),
+                Quantity.from_raw_c(raw_volumes[i], size_prec),
+                ts_events[i],
+                ts_inits[i],
+            ))
+
+        return bars
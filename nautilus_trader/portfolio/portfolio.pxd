@@ -33,6 +33,17 @@ from nautilus_trader.msgbus.bus cimport MessageBus
 from nautilus_trader.portfolio.base cimport PortfolioFacade
 
 
+cdef class CurrencyTotals:
+    cdef dict _parts
+    cdef dict _totals
+    cdef dict _counts
+
+    cpdef void set(self, InstrumentId instrument_id, dict parts)
+    cpdef void remove(self, InstrumentId instrument_id)
+    cpdef dict totals(self)
+    cpdef void clear(self)
+
+
 cdef class Portfolio(PortfolioFacade):
     cdef LoggerAdapter _log
     cdef Clock _clock
@@ -44,6 +55,10 @@ cdef class Portfolio(PortfolioFacade):
     cdef dict _unrealized_pnls
     cdef dict _net_positions
     cdef set _pending_calcs
+    cdef dict _pnl_totals
+    cdef dict _exposure_totals
+    cdef set _dirty_pnls
+    cdef set _dirty_exposures
 
 # -- COMMANDS -------------------------------------------------------------------------------------
 
@@ -60,6 +75,8 @@ cdef class Portfolio(PortfolioFacade):
 
     cdef object _net_position(self, InstrumentId instrument_id)
     cdef void _update_net_position(self, InstrumentId instrument_id, list positions_open)
+    cdef bint _update_totals(self, Venue venue, bint is_exposure)
+    cdef dict _calculate_parts(self, Instrument instrument, list positions_open, bint is_exposure)
     cdef Money _calculate_unrealized_pnl(self, InstrumentId instrument_id)
     cdef Price _get_last_price(self, Position position)
     cdef double _calculate_xrate_to_base(self, Account account, Instrument instrument, OrderSide side)
@@ -73,6 +73,87 @@ cdef tuple _UPDATE_ORDER_EVENTS = (
 )
 
 
+cdef class CurrencyTotals:
+    """
+    Provides running totals keyed by currency and price type, from the parts
+    contributed by each instrument.
+
+    Setting the parts for an instrument adjusts the totals by the difference, so
+    reading the totals does not iterate the instruments.
+    """
+
+    def __init__(self):
+        self._parts: dict[InstrumentId, dict[tuple[Currency, PriceType], float]] = {}
+        self._totals: dict[tuple[Currency, PriceType], float] = {}
+        self._counts: dict[tuple[Currency, PriceType], int] = {}
+
+    cpdef void set(self, InstrumentId instrument_id, dict parts):
+        """
+        Set the parts for the given instrument (replacing any previous parts).
+
+        Parameters
+        ----------
+        instrument_id : InstrumentId
+            The instrument for the parts.
+        parts : dict[tuple[Currency, PriceType], float]
+            The values to add to the totals.
+
+        """
+        self.remove(instrument_id)
+        if not parts:
+            return
+
+        for key, value in parts.items():
+            self._totals[key] = self._totals.get(key, 0.0) + value
+            self._counts[key] = self._counts.get(key, 0) + 1
+
+        self._parts[instrument_id] = parts
+
+    cpdef void remove(self, InstrumentId instrument_id):
+        """
+        Remove the parts for the given instrument (if found).
+
+        Parameters
+        ----------
+        instrument_id : InstrumentId
+            The instrument for the parts.
+
+        """
+        cdef dict parts = self._parts.pop(instrument_id, None)
+        if parts is None:
+            return
+
+        cdef int count
+        for key, value in parts.items():
+            count = self._counts[key] - 1
+            if count == 0:
+                # No remaining parts (also discards any rounding residue)
+                del self._counts[key]
+                del self._totals[key]
+            else:
+                self._counts[key] = count
+                self._totals[key] -= value
+
+    cpdef dict totals(self):
+        """
+        Return the current totals.
+
+        Returns
+        -------
+        dict[tuple[Currency, PriceType], float]
+
+        """
+        return self._totals.copy()
+
+    cpdef void clear(self):
+        """
+        Clear all parts and totals.
+        """
+        self._parts.clear()
+        self._totals.clear()
+        self._counts.clear()
+
+
 cdef class Portfolio(PortfolioFacade):
     """
     Provides a trading portfolio.
@@ -114,6 +195,13 @@ cdef class Portfolio(PortfolioFacade):
         self._net_positions: dict[InstrumentId, Decimal] = {}
         self._pending_calcs: set[InstrumentId] = set()
 
+        # Running totals of unrealized PnL and net exposure (before conversion
+        # to any account base currency), recalculated only for changed instruments.
+        self._pnl_totals: dict[Venue, CurrencyTotals] = {}
+        self._exposure_totals: dict[Venue, CurrencyTotals] = {}
+        self._dirty_pnls: set[InstrumentId] = set()
+        self._dirty_exposures: set[InstrumentId] = set()
+
         self.analyzer = PortfolioAnalyzer()
 
         # Register default statistics
@@ -230,6 +318,8 @@ cdef class Portfolio(PortfolioFacade):
         """
         # Clean slate
         self._unrealized_pnls.clear()
+        self._pnl_totals.clear()
+        self._exposure_totals.clear()
 
         cdef list all_positions_open = self._cache.positions_open()
 
@@ -238,6 +328,9 @@ cdef class Portfolio(PortfolioFacade):
         for position in all_positions_open:
             instruments.add(position.instrument_id)
 
+        self._dirty_pnls = instruments.copy()
+        self._dirty_exposures = instruments.copy()
+
         cdef bint initialized = True
 
         # Update maintenance (position) margins to initialize portfolio
@@ -304,9 +397,9 @@ cdef class Portfolio(PortfolioFacade):
         """
         Update the portfolio with the given tick.
 
-        Clears the unrealized PnL for the quote ticks instrument, and
-        performs any initialization calculations which may have been pending
-        a market quote update.
+        Clears the unrealized PnL for the quote ticks instrument (marking its
+        totals for recalculation), and performs any initialization calculations
+        which may have been pending a market quote update.
 
         Parameters
         ----------
@@ -317,6 +410,8 @@ cdef class Portfolio(PortfolioFacade):
         Condition.not_none(tick, "tick")
 
         self._unrealized_pnls.pop(tick.instrument_id, None)
+        self._dirty_pnls.add(tick.instrument_id)
+        self._dirty_exposures.add(tick.instrument_id)
 
         if self.initialized:
             return
@@ -401,6 +496,8 @@ cdef class Portfolio(PortfolioFacade):
             account.apply(event)
             self._cache.update_account(account)
 
+        self._cache.flush_writes()
+
         self._log.info(f"Updated {event}.")
 
     cpdef void update_order(self, OrderEvent event):
@@ -508,6 +605,8 @@ cdef class Portfolio(PortfolioFacade):
         self._unrealized_pnls[event.instrument_id] = self._calculate_unrealized_pnl(
             instrument_id=event.instrument_id,
         )
+        self._dirty_pnls.add(event.instrument_id)
+        self._dirty_exposures.add(event.instrument_id)
 
         cdef Account account = self._cache.account(event.account_id)
         if account is None:
@@ -557,6 +656,10 @@ cdef class Portfolio(PortfolioFacade):
         self._net_positions.clear()
         self._unrealized_pnls.clear()
         self._pending_calcs.clear()
+        self._pnl_totals.clear()
+        self._exposure_totals.clear()
+        self._dirty_pnls.clear()
+        self._dirty_exposures.clear()
         self.analyzer.reset()
 
         self.initialized = False
@@ -691,28 +794,52 @@ cdef class Portfolio(PortfolioFacade):
         """
         Condition.not_none(venue, "venue")
 
-        cdef list positions_open = self._cache.positions_open(venue)
-        if not positions_open:
+        self._update_totals(venue, is_exposure=False)
+
+        cdef CurrencyTotals totals = self._pnl_totals.get(venue)
+        if totals is None:
             return {}  # Nothing to calculate
 
-        cdef set instrument_ids = {p.instrument_id for p in positions_open}
+        cdef dict pnl_totals = totals.totals()
+        if not pnl_totals:
+            return {}  # Nothing to calculate
+
+        cdef Account account = self._cache.account_for_venue(self._venue or venue)
+        if account is None:
+            self._log.error(
+                f"Cannot calculate unrealized PnL: "
+                f"no account registered for {venue}."
+            )
+            return {}  # Cannot calculate
 
         cdef dict unrealized_pnls = {}  # type: dict[Currency, 0.0]
 
         cdef:
-            InstrumentId instrument_id
-            Money pnl
-        for instrument_id in instrument_ids:
-            pnl = self._unrealized_pnls.get(instrument_id)
-            if pnl is not None:
-                # PnL already calculated
-                unrealized_pnls[pnl.currency] = unrealized_pnls.get(pnl.currency, 0.0) + pnl.as_f64_c()
-                continue  # To next instrument_id
-            # Calculate PnL
-            pnl = self._calculate_unrealized_pnl(instrument_id)
-            if pnl is None:
-                continue  # Error logged in `_calculate_unrealized_pnl`
-            unrealized_pnls[pnl.currency] = unrealized_pnls.get(pnl.currency, 0.0) + pnl.as_f64_c()
+            tuple key
+            Currency currency
+            double pnl
+            double xrate
+        for key, pnl in pnl_totals.items():
+            currency = key[0]
+            if account.base_currency is not None:
+                xrate = self._cache.get_xrate(
+                    venue=self._venue or venue,
+                    from_currency=currency,
+                    to_currency=account.base_currency,
+                    price_type=key[1],
+                )
+
+                if xrate == 0.0:
+                    self._log.debug(
+                        f"Cannot calculate unrealized PnL: "
+                        f"insufficient data for {currency}/{account.base_currency}."
+                    )
+                    continue  # Cannot calculate
+
+                currency = account.base_currency
+                pnl = round(pnl * xrate, currency.get_precision())
+
+            unrealized_pnls[currency] = unrealized_pnls.get(currency, 0.0) + pnl
 
         return {k: Money(v, k) for k, v in unrealized_pnls.items()}
 
@@ -740,63 +867,42 @@ cdef class Portfolio(PortfolioFacade):
             )
             return None  # Cannot calculate
 
-        cdef list positions_open = self._cache.positions_open(venue)
-        if not positions_open:
+        if not self._update_totals(venue, is_exposure=True):
+            return None  # Cannot calculate
+
+        cdef CurrencyTotals totals = self._exposure_totals.get(venue)
+        if totals is None:
             return {}  # Nothing to calculate
 
         cdef dict net_exposures = {}  # type: dict[Currency, float]
 
         cdef:
-            Position position
-            Instrument instrument
-            Price last
+            tuple key
             Currency settlement_currency
+            double net_exposure
             double xrate
-        for position in positions_open:
-            instrument = self._cache.instrument(position.instrument_id)
-            if instrument is None:
-                self._log.error(
-                    f"Cannot calculate net exposures: "
-                    f"no instrument for {position.instrument_id}."
-                )
-                return None  # Cannot calculate
-
-            last = self._get_last_price(position)
-            if last is None:
-                self._log.error(
-                    f"Cannot calculate net exposures: "
-                    f"no prices for {position.instrument_id}."
+        for key, net_exposure in totals.totals().items():
+            settlement_currency = key[0]
+            if account.base_currency is not None:
+                xrate = self._cache.get_xrate(
+                    venue=self._venue or venue,
+                    from_currency=settlement_currency,
+                    to_currency=account.base_currency,
+                    price_type=key[1],
                 )
-                continue  # Cannot calculate
-
-            xrate = self._calculate_xrate_to_base(
-                instrument=instrument,
-                account=account,
-                side=position.entry,
-            )
 
-            if xrate == 0.0:
-                self._log.error(
-                    f"Cannot calculate net exposures: "
-                    f"insufficient data for {instrument.get_settlement_currency()}/{account.base_currency}."
-                )
-                return None  # Cannot calculate
+                if xrate == 0.0:
+                    self._log.error(
+                        f"Cannot calculate net exposures: "
+                        f"insufficient data for {settlement_currency}/{account.base_currency}."
+                    )
+                    return None  # Cannot calculate
 
-            if account.base_currency is not None:
                 settlement_currency = account.base_currency
-            else:
-                settlement_currency = instrument.get_settlement_currency()
-
-            net_exposure = instrument.notional_value(
-                position.quantity,
-                last,
-            ).as_f64_c()
-            net_exposure = round(net_exposure * xrate, settlement_currency._mem.precision)
+                net_exposure = net_exposure * xrate
 
-            total_net_exposure = net_exposures.get(settlement_currency, 0.0)
-            total_net_exposure += net_exposure
-
-            net_exposures[settlement_currency] = total_net_exposure
+            net_exposure = round(net_exposure, settlement_currency._mem.precision)
+            net_exposures[settlement_currency] = net_exposures.get(settlement_currency, 0.0) + net_exposure
 
         return {k: Money(v, k) for k, v in net_exposures.items()}
 
@@ -1016,6 +1122,92 @@ cdef class Portfolio(PortfolioFacade):
             self._net_positions[instrument_id] = net_position
             self._log.info(f"{instrument_id} net_position={net_position}")
 
+    cdef bint _update_totals(self, Venue venue, bint is_exposure):
+        # Recalculate the totals parts for changed instruments of the venue,
+        # returns False if an instrument could not be found.
+        cdef set dirty = self._dirty_exposures if is_exposure else self._dirty_pnls
+        if not dirty:
+            return True
+
+        cdef dict totals_by_venue = self._exposure_totals if is_exposure else self._pnl_totals
+        cdef CurrencyTotals totals = totals_by_venue.get(venue)
+        if totals is None:
+            totals = CurrencyTotals()
+            totals_by_venue[venue] = totals
+
+        cdef bint is_found = True
+        cdef:
+            InstrumentId instrument_id
+            Instrument instrument
+            list positions_open
+            dict parts
+        for instrument_id in [i for i in dirty if i.venue == venue]:
+            positions_open = self._cache.positions_open(
+                venue=None,  # Faster query filtering
+                instrument_id=instrument_id,
+            )
+            if not positions_open:
+                totals.remove(instrument_id)
+                dirty.discard(instrument_id)
+                continue
+
+            instrument = self._cache.instrument(instrument_id)
+            if instrument is None:
+                self._log.error(
+                    f"Cannot calculate {'net exposures' if is_exposure else 'unrealized PnL'}: "
+                    f"no instrument for {instrument_id}."
+                )
+                totals.remove(instrument_id)
+                is_found = False
+                continue  # Remains changed
+
+            parts = self._calculate_parts(instrument, positions_open, is_exposure)
+            if parts is None:
+                totals.remove(instrument_id)
+                continue  # Remains changed (no prices yet)
+
+            totals.set(instrument_id, parts)
+            if self._cache.quote_tick(instrument_id) is not None:
+                # Otherwise priced from trade ticks, which do not mark changes
+                dirty.discard(instrument_id)
+
+        return is_found
+
+    cdef dict _calculate_parts(self, Instrument instrument, list positions_open, bint is_exposure):
+        # Sum the position values by settlement currency and exchange rate price type
+        cdef Currency settlement_currency = instrument.get_settlement_currency()
+        cdef dict parts = {}
+
+        cdef:
+            Position position
+            Price last
+            tuple key
+            double value
+        for position in positions_open:
+            last = self._get_last_price(position)
+            if last is None:
+                if is_exposure:
+                    self._log.error(
+                        f"Cannot calculate net exposures: "
+                        f"no prices for {position.instrument_id}."
+                    )
+                else:
+                    self._log.debug(
+                        f"Cannot calculate unrealized PnL: no prices for {instrument.id}."
+                    )
+                    self._pending_calcs.add(instrument.id)
+                return None  # Cannot calculate
+
+            if is_exposure:
+                value = instrument.notional_value(position.quantity, last).as_f64_c()
+            else:
+                value = position.unrealized_pnl(last).as_f64_c()
+
+            key = (settlement_currency, PriceType.BID if position.entry == OrderSide.BUY else PriceType.ASK)
+            parts[key] = parts.get(key, 0.0) + value
+
+        return parts
+
     cdef Money _calculate_unrealized_pnl(self, InstrumentId instrument_id):
         cdef Account account = self._cache.account_for_venue(self._venue or instrument_id.venue)
         if account is None:
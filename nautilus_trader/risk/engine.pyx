@@ -32,6 +32,7 @@ from nautilus_trader.common.logging cimport RECV
 from nautilus_trader.common.logging cimport LogColor
 from nautilus_trader.common.logging cimport Logger
 from nautilus_trader.common.messages cimport TradingStateChanged
+from nautilus_trader.common.profiling cimport Profiler
 from nautilus_trader.common.throttler cimport Throttler
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.message cimport Command
@@ -209,7 +210,14 @@ cdef class RiskEngine(Component):
         """
         Condition.not_none(command, "command")
 
-        self._execute_command(command)
+        cdef Profiler profiler = self._msgbus.profiler
+        cdef uint64_t start_ns
+        if profiler is None:
+            self._execute_command(command)
+        else:
+            start_ns = profiler.timestamp_ns()
+            self._execute_command(command)
+            profiler.record_c("engine:RiskEngine.execute", profiler.timestamp_ns() - start_ns)
 
     cpdef void process(self, Event event):
         """
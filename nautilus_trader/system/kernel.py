@@ -40,12 +40,15 @@ from nautilus_trader.common.enums import log_level_from_str
 from nautilus_trader.common.logging import Logger
 from nautilus_trader.common.logging import LoggerAdapter
 from nautilus_trader.common.logging import nautilus_header
+from nautilus_trader.common.profiling import Profiler
+from nautilus_trader.common.timer import TimeEvent
 from nautilus_trader.config import ActorFactory
 from nautilus_trader.config import DataEngineConfig
 from nautilus_trader.config import ExecEngineConfig
 from nautilus_trader.config import LiveDataEngineConfig
 from nautilus_trader.config import LiveExecEngineConfig
 from nautilus_trader.config import LiveRiskEngineConfig
+from nautilus_trader.config import ProfilingConfig
 from nautilus_trader.config import RiskEngineConfig
 from nautilus_trader.config import StrategyFactory
 from nautilus_trader.config import StreamingConfig
@@ -83,6 +86,9 @@ except ImportError:  # pragma: no cover
     uvloop = None
 
 
+_PROFILING_TIMER_NAME = "Profiler.summary"
+
+
 class NautilusKernel:
     """
     Provides the core Nautilus system kernel.
@@ -214,6 +220,11 @@ class NautilusKernel:
             logger=self._logger,
         )
 
+        self._profiler: Profiler | None = None
+        if config.profiling:
+            self._profiler = Profiler()
+            self._msgbus.set_profiler(self._profiler)
+
         self._cache = Cache(
             database=cache_db,
             logger=self._logger,
@@ -394,6 +405,7 @@ class NautilusKernel:
             fs_protocol=config.fs_protocol,
             flush_interval_ms=config.flush_interval_ms,
             include_types=config.include_types,  # type: ignore  # TODO(cs)
+            max_batch_size=config.max_batch_size,
             logger=self.log,
         )
         self._trader.subscribe("*", self._writer.write)
@@ -692,6 +704,51 @@ class NautilusKernel:
         """
         return self._catalog
 
+    @property
+    def profiler(self) -> Profiler | None:
+        """
+        Return the kernels hot-path profiler.
+
+        Returns
+        -------
+        Profiler or ``None``
+
+        """
+        return self._profiler
+
+    def profiling_summary(self) -> str | None:
+        """
+        Return a summary of the profiled handler and engine timings.
+
+        Returns
+        -------
+        str or ``None``
+            ``None`` if profiling is not configured for the kernel.
+
+        """
+        if self._profiler is None:
+            return None
+
+        config: ProfilingConfig = self._config.profiling
+        return self._profiler.summary(limit=config.log_limit)
+
+    def _start_profiling_timer(self, config: ProfilingConfig) -> None:
+        if not config.log_interval_secs:
+            return  # Summary only logged on dispose
+        if _PROFILING_TIMER_NAME in self._clock.timer_names:
+            return  # Already running from a previous start
+
+        self._clock.set_timer(
+            name=_PROFILING_TIMER_NAME,
+            interval=timedelta(seconds=config.log_interval_secs),
+            callback=self._log_profiling_summary,
+        )
+
+    def _log_profiling_summary(self, event: TimeEvent | None = None) -> None:
+        summary = self.profiling_summary()
+        if summary:
+            self._log.info(f"Profiling summary:\n{summary}", LogColor.BLUE)
+
     async def start(self) -> None:
         self._log.info("STARTING...")
 
@@ -765,6 +822,9 @@ class NautilusKernel:
         # Start trader and strategies
         self._trader.start()
 
+        if self._profiler is not None:
+            self._start_profiling_timer(self._config.profiling)
+
     async def _await_engines_connected(self) -> bool:
         # - The data engine clients will be set connected when all
         # instruments are received and updated with the data engine.
@@ -830,9 +890,19 @@ class NautilusKernel:
         if not self.trader.is_disposed:
             self.trader.dispose()
 
+        # Ensure all writes are persisted (write-behind)
+        if not self._cache.sync_writes():
+            self.log.warning("Timed out waiting for cache database writes.")
+        self._cache.close_db()
+
         if self._writer:
             self._writer.close()
 
+        if self._profiler is not None:
+            if _PROFILING_TIMER_NAME in self._clock.timer_names:
+                self._clock.cancel_timer(_PROFILING_TIMER_NAME)
+            self._log_profiling_summary()
+
     def cancel_all_tasks(self) -> None:
         PyCondition.not_none(self.loop, "self.loop")
 
@@ -0,0 +1,717 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2023 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+"""
+Provides an end-to-end throughput benchmark suite for the `BacktestEngine`.
+
+Each scenario runs synthetic data of one type (quotes, trades, bars or L2 order
+book deltas) through an engine with a number of strategies, each holding a number
+of resting limit orders, for a venue book type. Results are written as JSON, and
+can be compared against a stored baseline to flag throughput regressions.
+
+Run from the command line with::
+
+    python -m nautilus_trader.test_kit.benchmark --output results.json --baseline baseline.json
+
+"""
+
+from __future__ import annotations
+
+import datetime
+import json
+import platform
+import sys
+import time
+from dataclasses import asdict
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any
+from typing import Optional
+
+import click
+import numpy as np
+
+import nautilus_trader
+from nautilus_trader.backtest.engine import BacktestEngine
+from nautilus_trader.backtest.engine import BacktestEngineConfig
+from nautilus_trader.config import LoggingConfig
+from nautilus_trader.config import StrategyConfig
+from nautilus_trader.core.data import Data
+from nautilus_trader.model.currencies import USD
+from nautilus_trader.model.data import Bar
+from nautilus_trader.model.data import BarType
+from nautilus_trader.model.data import BookOrder
+from nautilus_trader.model.data import OrderBookDelta
+from nautilus_trader.model.data import OrderBookDeltas
+from nautilus_trader.model.data import QuoteTick
+from nautilus_trader.model.data import TradeTick
+from nautilus_trader.model.enums import AccountType
+from nautilus_trader.model.enums import AggressorSide
+from nautilus_trader.model.enums import BookAction
+from nautilus_trader.model.enums import OmsType
+from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.enums import book_type_from_str
+from nautilus_trader.model.identifiers import InstrumentId
+from nautilus_trader.model.identifiers import TradeId
+from nautilus_trader.model.instruments import Instrument
+from nautilus_trader.model.objects import Money
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+from nautilus_trader.trading.strategy import Strategy
+
+
+DATA_TYPES: tuple[str, ...] = ("quotes", "trades", "bars", "deltas")
+
+# The default regression threshold (fractional drop in events per second)
+DEFAULT_THRESHOLD: float = 0.10
+
+_START_NS: int = 1_577_836_800_000_000_000  # 2020-01-01 UTC
+
+
+# -- SYNTHETIC DATA --------------------------------------------------------------------------------
+
+
+def _random_walk(count: int, start: float, step: float, seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return start + np.cumsum(rng.normal(0.0, step, count))
+
+
+def generate_quote_ticks(
+    instrument: Instrument,
+    count: int,
+    start_ns: int = _START_NS,
+    interval_ns: int = 1_000_000,
+    seed: int = 42,
+) -> list[QuoteTick]:
+    """
+    Return synthetic quote ticks following a random walk for the given instrument.
+
+    Parameters
+    ----------
+    instrument : Instrument
+        The instrument for the ticks.
+    count : int
+        The number of ticks.
+    start_ns : int
+        The UNIX timestamp (nanoseconds) of the first tick.
+    interval_ns : int, default 1ms
+        The interval (nanoseconds) between ticks.
+    seed : int, default 42
+        The random number generator seed.
+
+    Returns
+    -------
+    list[QuoteTick]
+
+    """
+    increment = float(instrument.price_increment)
+    mids = _random_walk(count, 1.0, increment, seed)
+    size = instrument.make_qty(1_000_000)
+    return [
+        QuoteTick(
+            instrument_id=instrument.id,
+            bid=instrument.make_price(mid - increment),
+            ask=instrument.make_price(mid + increment),
+            bid_size=size,
+            ask_size=size,
+            ts_event=start_ns + i * interval_ns,
+            ts_init=start_ns + i * interval_ns,
+        )
+        for i, mid in enumerate(mids)
+    ]
+
+
+def generate_trade_ticks(
+    instrument: Instrument,
+    count: int,
+    start_ns: int = _START_NS,
+    interval_ns: int = 1_000_000,
+    seed: int = 42,
+) -> list[TradeTick]:
+    """
+    Return synthetic trade ticks following a random walk for the given instrument.
+
+    Parameters
+    ----------
+    instrument : Instrument
+        The instrument for the ticks.
+    count : int
+        The number of ticks.
+    start_ns : int
+        The UNIX timestamp (nanoseconds) of the first tick.
+    interval_ns : int, default 1ms
+        The interval (nanoseconds) between ticks.
+    seed : int, default 42
+        The random number generator seed.
+
+    Returns
+    -------
+    list[TradeTick]
+
+    """
+    prices = _random_walk(count, 1.0, float(instrument.price_increment), seed)
+    size = instrument.make_qty(100_000)
+    return [
+        TradeTick(
+            instrument_id=instrument.id,
+            price=instrument.make_price(price),
+            size=size,
+            aggressor_side=AggressorSide.BUYER if i % 2 == 0 else AggressorSide.SELLER,
+            trade_id=TradeId(str(i)),
+            ts_event=start_ns + i * interval_ns,
+            ts_init=start_ns + i * interval_ns,
+        )
+        for i, price in enumerate(prices)
+    ]
+
+
+def generate_bars(
+    instrument: Instrument,
+    bar_type: BarType,
+    count: int,
+    start_ns: int = _START_NS,
+    interval_ns: int = 60_000_000_000,
+    seed: int = 42,
+) -> list[Bar]:
+    """
+    Return synthetic bars following a random walk for the given bar type.
+
+    Parameters
+    ----------
+    instrument : Instrument
+        The instrument for the bars.
+    bar_type : BarType
+        The bar type for the bars.
+    count : int
+        The number of bars.
+    start_ns : int
+        The UNIX timestamp (nanoseconds) of the first bar close.
+    interval_ns : int, default 1min
+        The interval (nanoseconds) between bars.
+    seed : int, default 42
+        The random number generator seed.
+
+    Returns
+    -------
+    list[Bar]
+
+    """
+    increment = float(instrument.price_increment)
+    closes = _random_walk(count + 1, 1.0, increment * 5, seed)
+    volume = instrument.make_qty(1_000_000)
+    bars: list[Bar] = []
+    for i in range(count):
+        open_, close = closes[i], closes[i + 1]
+        bars.append(
+            Bar(
+                bar_type=bar_type,
+                open=instrument.make_price(open_),
+                high=instrument.make_price(max(open_, close) + increment),
+                low=instrument.make_price(min(open_, close) - increment),
+                close=instrument.make_price(close),
+                volume=volume,
+                ts_event=start_ns + i * interval_ns,
+                ts_init=start_ns + i * interval_ns,
+            ),
+        )
+    return bars
+
+
+def generate_order_book_deltas(
+    instrument: Instrument,
+    count: int,
+    levels: int = 10,
+    start_ns: int = _START_NS,
+    interval_ns: int = 1_000_000,
+    seed: int = 42,
+) -> list[OrderBookDelta]:
+    """
+    Return synthetic L2 order book deltas for the given instrument.
+
+    The book is first built with `levels` bid and ask levels, which then receive
+    random size updates.
+
+    Parameters
+    ----------
+    instrument : Instrument
+        The instrument for the deltas.
+    count : int
+        The number of size update deltas (after the initial levels are added).
+    levels : int, default 10
+        The number of price levels per side.
+    start_ns : int
+        The UNIX timestamp (nanoseconds) of the first delta.
+    interval_ns : int, default 1ms
+        The interval (nanoseconds) between update deltas.
+    seed : int, default 42
+        The random number generator seed.
+
+    Returns
+    -------
+    list[OrderBookDelta]
+
+    """
+    increment = float(instrument.price_increment)
+    prices: list[tuple[OrderSide, float]] = []
+    for i in range(levels):
+        prices.append((OrderSide.BUY, 1.0 - (i + 1) * increment))
+        prices.append((OrderSide.SELL, 1.0 + (i + 1) * increment))
+
+    deltas: list[OrderBookDelta] = []
+    for order_id, (side, price) in enumerate(prices, start=1):
+        deltas.append(
+            OrderBookDelta(
+                instrument_id=instrument.id,
+                action=BookAction.ADD,
+                order=BookOrder(
+                    side=side,
+                    price=instrument.make_price(price),
+                    size=instrument.make_qty(1_000_000),
+                    order_id=order_id,
+                ),
+                ts_event=start_ns,
+                ts_init=start_ns,
+            ),
+        )
+
+    rng = np.random.default_rng(seed)
+    level_indexes = rng.integers(0, len(prices), count)
+    sizes = rng.integers(1, 100, count) * 100_000
+    for i in range(count):
+        index = int(level_indexes[i])
+        side, price = prices[index]
+        ts = start_ns + (i + 1) * interval_ns
+        deltas.append(
+            OrderBookDelta(
+                instrument_id=instrument.id,
+                action=BookAction.UPDATE,
+                order=BookOrder(
+                    side=side,
+                    price=instrument.make_price(price),
+                    size=instrument.make_qty(int(sizes[i])),
+                    order_id=index + 1,
+                ),
+                ts_event=ts,
+                ts_init=ts,
+            ),
+        )
+    return deltas
+
+
+# -- STRATEGY --------------------------------------------------------------------------------------
+
+
+class BenchmarkStrategyConfig(StrategyConfig, frozen=True):
+    """
+    Configuration for ``BenchmarkStrategy`` instances.
+
+    Parameters
+    ----------
+    instrument_id : str
+        The instrument ID for the strategy.
+    data_type : str
+        The data type to subscribe to, one of 'quotes', 'trades', 'bars' or 'deltas'.
+    bar_type : str, optional
+        The bar type to subscribe to (for 'bars').
+    book_type : str, default 'L2_MBP'
+        The book type for order book delta subscriptions.
+    open_orders : int, default 0
+        The number of resting limit orders to hold.
+
+    """
+
+    instrument_id: str
+    data_type: str
+    bar_type: Optional[str] = None
+    book_type: str = "L2_MBP"
+    open_orders: int = 0
+
+
+class BenchmarkStrategy(Strategy):
+    """
+    Provides a strategy which subscribes to data and holds resting limit orders.
+
+    The orders are placed on the first data received, priced well below the
+    market so they stay open (and are iterated by the matching engine) for the
+    whole run.
+
+    Parameters
+    ----------
+    config : BenchmarkStrategyConfig
+        The configuration for the instance.
+
+    """
+
+    def __init__(self, config: BenchmarkStrategyConfig) -> None:
+        super().__init__(config)
+        self.instrument_id = InstrumentId.from_str(config.instrument_id)
+        self.data_type = config.data_type
+        self.open_orders = config.open_orders
+        self.received = 0
+        self._orders_placed = False
+
+    def on_start(self) -> None:
+        if self.data_type == "quotes":
+            self.subscribe_quote_ticks(self.instrument_id)
+        elif self.data_type == "trades":
+            self.subscribe_trade_ticks(self.instrument_id)
+        elif self.data_type == "bars":
+            self.subscribe_bars(BarType.from_str(self.config.bar_type))
+        elif self.data_type == "deltas":
+            self.subscribe_order_book_deltas(
+                self.instrument_id,
+                book_type=book_type_from_str(self.config.book_type),
+            )
+        else:
+            raise ValueError(f"Invalid `data_type`, was '{self.data_type}'")
+
+    def on_quote_tick(self, tick: QuoteTick) -> None:
+        self._on_price(tick.bid)
+
+    def on_trade_tick(self, tick: TradeTick) -> None:
+        self._on_price(tick.price)
+
+    def on_bar(self, bar: Bar) -> None:
+        self._on_price(bar.close)
+
+    def on_order_book_deltas(self, deltas: OrderBookDeltas) -> None:
+        self._on_price(deltas.deltas[-1].order.price)
+
+    def _on_price(self, price) -> None:
+        self.received += 1
+        if self._orders_placed:
+            return
+        self._orders_placed = True
+
+        instrument = self.cache.instrument(self.instrument_id)
+        increment = float(instrument.price_increment)
+        quantity = instrument.make_qty(100_000)
+        for i in range(self.open_orders):
+            order = self.order_factory.limit(
+                instrument_id=self.instrument_id,
+                order_side=OrderSide.BUY,
+                quantity=quantity,
+                price=instrument.make_price(float(price) * 0.9 - i * increment),
+            )
+            self.submit_order(order)
+
+
+# -- SCENARIOS -------------------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class BenchmarkScenario:
+    """
+    Represents a single benchmark scenario.
+    """
+
+    data_type: str
+    events: int
+    strategies: int = 1
+    open_orders: int = 0
+    book_type: str = "L1_TBBO"
+
+    @property
+    def name(self) -> str:
+        return (
+            f"{self.data_type}-{self.book_type.lower()}"
+            f"-s{self.strategies}-o{self.open_orders}-n{self.events}"
+        )
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    """
+    Represents the result of a single benchmark scenario.
+    """
+
+    scenario: BenchmarkScenario
+    events: int
+    elapsed_secs: float
+
+    @property
+    def events_per_sec(self) -> float:
+        return self.events / self.elapsed_secs if self.elapsed_secs > 0 else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            **asdict(self.scenario),
+            "elapsed_secs": self.elapsed_secs,
+            "events_per_sec": self.events_per_sec,
+        }
+
+
+def default_scenarios(
+    events: int = 100_000,
+    max_strategies: int = 4,
+    open_orders: tuple[int, ...] = (0, 100),
+) -> list[BenchmarkScenario]:
+    """
+    Return the default scenario matrix.
+
+    Each data type is run with 1 and `max_strategies` strategies, for each of the
+    `open_orders` counts. Quotes are also run against an L2 book, and deltas are
+    always run against an L2 book.
+
+    Parameters
+    ----------
+    events : int, default 100_000
+        The number of data events per scenario.
+    max_strategies : int, default 4
+        The maximum number of strategies per scenario.
+    open_orders : tuple[int, ...], default (0, 100)
+        The resting limit order counts (per strategy).
+
+    Returns
+    -------
+    list[BenchmarkScenario]
+
+    """
+    book_types: dict[str, tuple[str, ...]] = {
+        "quotes": ("L1_TBBO", "L2_MBP"),
+        "trades": ("L1_TBBO",),
+        "bars": ("L1_TBBO",),
+        "deltas": ("L2_MBP",),
+    }
+    strategy_counts = sorted({1, max_strategies})
+
+    scenarios: list[BenchmarkScenario] = []
+    for data_type in DATA_TYPES:
+        for book_type in book_types[data_type]:
+            for strategies in strategy_counts:
+                for orders in open_orders:
+                    scenarios.append(
+                        BenchmarkScenario(
+                            data_type=data_type,
+                            events=events,
+                            strategies=strategies,
+                            open_orders=orders,
+                            book_type=book_type,
+                        ),
+                    )
+    return scenarios
+
+
+def _generate_data(
+    scenario: BenchmarkScenario,
+    instrument: Instrument,
+    bar_type: BarType,
+) -> list[Data]:
+    if scenario.data_type == "quotes":
+        return generate_quote_ticks(instrument, scenario.events)
+    elif scenario.data_type == "trades":
+        return generate_trade_ticks(instrument, scenario.events)
+    elif scenario.data_type == "bars":
+        return generate_bars(instrument, bar_type, scenario.events)
+    elif scenario.data_type == "deltas":
+        return generate_order_book_deltas(instrument, scenario.events)
+    else:
+        raise ValueError(f"Invalid `data_type`, was '{scenario.data_type}'")
+
+
+def run_scenario(scenario: BenchmarkScenario, repeat: int = 1) -> BenchmarkResult:
+    """
+    Run the given scenario and return the fastest of `repeat` runs.
+
+    Only the engine run is timed (data generation and engine setup are excluded).
+
+    Parameters
+    ----------
+    scenario : BenchmarkScenario
+        The scenario to run.
+    repeat : int, default 1
+        The number of times to run the scenario.
+
+    Returns
+    -------
+    BenchmarkResult
+
+    """
+    instrument = TestInstrumentProvider.default_fx_ccy("EUR/USD")
+    bar_type = BarType.from_str(f"{instrument.id}-1-MINUTE-LAST-EXTERNAL")
+    data = _generate_data(scenario, instrument, bar_type)
+
+    best: Optional[float] = None
+    for _ in range(repeat):
+        engine = BacktestEngine(
+            config=BacktestEngineConfig(logging=LoggingConfig(bypass_logging=True)),
+        )
+        engine.add_venue(
+            venue=instrument.id.venue,
+            oms_type=OmsType.HEDGING,
+            account_type=AccountType.MARGIN,
+            base_currency=USD,
+            starting_balances=[Money(1_000_000_000, USD)],
+            default_leverage=Decimal(100),
+            book_type=book_type_from_str(scenario.book_type),
+        )
+        engine.add_instrument(instrument)
+        engine.add_data(data)
+        engine.add_strategies(
+            [
+                BenchmarkStrategy(
+                    BenchmarkStrategyConfig(
+                        order_id_tag=f"{i:03d}",
+                        instrument_id=instrument.id.value,
+                        data_type=scenario.data_type,
+                        bar_type=str(bar_type),
+                        book_type=scenario.book_type,
+                        open_orders=scenario.open_orders,
+                    ),
+                )
+                for i in range(scenario.strategies)
+            ],
+        )
+
+        start = time.perf_counter()
+        engine.run()
+        elapsed = time.perf_counter() - start
+        engine.dispose()
+
+        best = elapsed if best is None else min(best, elapsed)
+
+    return BenchmarkResult(scenario=scenario, events=len(data), elapsed_secs=best or 0.0)
+
+
+# -- RESULTS ---------------------------------------------------------------------------------------
+
+
+def results_to_json(results: list[BenchmarkResult]) -> dict[str, Any]:
+    """
+    Return the JSON results document for the given results.
+
+    Parameters
+    ----------
+    results : list[BenchmarkResult]
+        The results to include.
+
+    Returns
+    -------
+    dict[str, Any]
+
+    """
+    return {
+        "nautilus_trader": nautilus_trader.__version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "created": datetime.datetime.now(tz=datetime.timezone.utc).isoformat(),
+        "scenarios": {result.scenario.name: result.to_dict() for result in results},
+    }
+
+
+def compare_results(
+    results: dict[str, Any],
+    baseline: dict[str, Any],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> list[dict[str, Any]]:
+    """
+    Return the scenarios which regressed against the given baseline.
+
+    A scenario regresses if its events per second dropped by more than its
+    threshold, taken from the baseline ``thresholds`` mapping by scenario name
+    (if present), otherwise `threshold`. Scenarios missing from either document
+    are not compared.
+
+    Parameters
+    ----------
+    results : dict[str, Any]
+        The JSON results document to check.
+    baseline : dict[str, Any]
+        The JSON baseline results document.
+    threshold : float, default 0.10
+        The default fractional drop in events per second allowed.
+
+    Returns
+    -------
+    list[dict[str, Any]]
+        The regressions, with the scenario name, baseline and current events per
+        second, and the fractional change.
+
+    """
+    thresholds: dict[str, float] = baseline.get("thresholds", {})
+    regressions: list[dict[str, Any]] = []
+    for name, current in results["scenarios"].items():
+        expected = baseline["scenarios"].get(name)
+        if expected is None or not expected["events_per_sec"]:
+            continue
+        change = current["events_per_sec"] / expected["events_per_sec"] - 1.0
+        if change < -thresholds.get(name, threshold):
+            regressions.append(
+                {
+                    "scenario": name,
+                    "baseline_events_per_sec": expected["events_per_sec"],
+                    "events_per_sec": current["events_per_sec"],
+                    "change": change,
+                },
+            )
+    return regressions
+
+
+# -- CLI -------------------------------------------------------------------------------------------
+
+
+@click.command()
+@click.option("--output", help="The path to write the JSON results to")
+@click.option("--baseline", help="The path of a JSON baseline results file to compare against")
+@click.option("--threshold", default=DEFAULT_THRESHOLD, help="The allowed fractional drop")
+@click.option("--events", default=100_000, help="The number of data events per scenario")
+@click.option("--max-strategies", default=4, help="The maximum number of strategies")
+@click.option("--open-orders", multiple=True, type=int, help="The open order counts")
+@click.option("--data-type", multiple=True, type=click.Choice(DATA_TYPES), help="The data types")
+@click.option("--repeat", default=3, help="The number of runs per scenario (fastest is kept)")
+def main(
+    output: Optional[str] = None,
+    baseline: Optional[str] = None,
+    threshold: float = DEFAULT_THRESHOLD,
+    events: int = 100_000,
+    max_strategies: int = 4,
+    open_orders: tuple[int, ...] = (),
+    data_type: tuple[str, ...] = (),
+    repeat: int = 3,
+):
+    scenarios = default_scenarios(
+        events=events,
+        max_strategies=max_strategies,
+        open_orders=open_orders or (0, 100),
+    )
+    if data_type:
+        scenarios = [s for s in scenarios if s.data_type in data_type]
+
+    results: list[BenchmarkResult] = []
+    for scenario in scenarios:
+        result = run_scenario(scenario, repeat=repeat)
+        click.echo(f"{scenario.name:<40} {result.events_per_sec:>14,.0f} events/s")
+        results.append(result)
+
+    document = results_to_json(results)
+    if output:
+        with open(output, "w") as f:
+            json.dump(document, f, indent=2)
+
+    if baseline:
+        with open(baseline) as f:
+            regressions = compare_results(document, json.load(f), threshold=threshold)
+        for regression in regressions:
+            click.echo(
+                f"REGRESSION {regression['scenario']}: "
+                f"{regression['baseline_events_per_sec']:,.0f} -> "
+                f"{regression['events_per_sec']:,.0f} events/s "
+                f"({regression['change']:+.1%})",
+                err=True,
+            )
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
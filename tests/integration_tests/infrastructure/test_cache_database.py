@@ -14,6 +14,7 @@
 # -------------------------------------------------------------------------------------------------
 
 import sys
+import threading
 from decimal import Decimal
 
 import pytest
@@ -772,6 +773,185 @@ class TestRedisCacheDatabase:
         # Assert
         assert result == {order.client_order_id: order}
 
+    def test_load_orders_cache_when_more_orders_than_read_batch_size(self):
+        # Arrange
+        database = RedisCacheDatabase(
+            trader_id=self.trader_id,
+            logger=self.logger,
+            serializer=MsgPackSerializer(timestamps_as_str=True),
+            config=CacheDatabaseConfig(read_batch_size=3),
+        )
+
+        orders = [
+            self.strategy.order_factory.market(
+                AUDUSD_SIM.id,
+                OrderSide.BUY,
+                Quantity.from_int(100_000),
+            )
+            for _ in range(10)
+        ]
+
+        for order in orders:
+            database.add_order(order)
+
+        # Act
+        result = database.load_orders()
+
+        # Assert
+        assert result == {order.client_order_id: order for order in orders}
+
+    def test_buffered_writes_are_flushed_on_flush_writes(self):
+        # Arrange
+        database = RedisCacheDatabase(
+            trader_id=self.trader_id,
+            logger=self.logger,
+            serializer=MsgPackSerializer(timestamps_as_str=True),
+            config=CacheDatabaseConfig(buffer_writes=True),
+        )
+
+        order = self.strategy.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+        )
+
+        database.add_order(order)
+        keys_before_flush = self.test_redis.keys("*orders*")
+
+        # Act
+        database.flush_writes()
+
+        # Assert
+        assert keys_before_flush == []
+        assert len(self.test_redis.keys("*orders*")) == 1
+        assert database.load_order(order.client_order_id) == order
+
+    def test_buffered_writes_are_flushed_when_write_batch_size_reached(self):
+        # Arrange
+        database = RedisCacheDatabase(
+            trader_id=self.trader_id,
+            logger=self.logger,
+            serializer=MsgPackSerializer(timestamps_as_str=True),
+            config=CacheDatabaseConfig(buffer_writes=True, write_batch_size=2),
+        )
+
+        order1 = self.strategy.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+        )
+        order2 = self.strategy.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+        )
+
+        # Act
+        database.add_order(order1)
+        database.add_order(order2)
+
+        # Assert
+        assert len(self.test_redis.keys("*orders*")) == 2
+
+    def test_write_behind_writes_are_coalesced_and_synced(self):
+        # Arrange
+        database = RedisCacheDatabase(
+            trader_id=self.trader_id,
+            logger=self.logger,
+            serializer=MsgPackSerializer(timestamps_as_str=True),
+            config=CacheDatabaseConfig(write_behind=True, buffer_writes=True),
+        )
+
+        order = self.strategy.order_factory.limit(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+            Price.from_str("1.00000"),
+        )
+
+        database.add_order(order)
+        order.apply(TestEventStubs.order_submitted(order))
+        database.update_order(order)
+        order.apply(TestEventStubs.order_accepted(order))
+        database.update_order(order)
+
+        # Act
+        database.flush_writes()
+        result = database.sync_writes()
+
+        # Assert
+        assert result
+        assert database.write_queue.depth == 0
+        assert database.write_queue.written_count == 3
+        assert database.write_queue.coalesced_count == 2
+        assert database.load_order(order.client_order_id) == order
+
+    def test_flush_with_write_behind_discards_pending_writes(self):
+        # Arrange
+        database = RedisCacheDatabase(
+            trader_id=self.trader_id,
+            logger=self.logger,
+            serializer=MsgPackSerializer(timestamps_as_str=True),
+            config=CacheDatabaseConfig(write_behind=True, buffer_writes=True),
+        )
+
+        order = self.strategy.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+        )
+
+        database.add_order(order)
+
+        # Act
+        database.flush()
+
+        # Assert
+        assert database.sync_writes()
+        assert database.load_order(order.client_order_id) is None
+
+    def test_close_with_write_behind_writes_pending_writes_and_stops_thread(self):
+        # Arrange
+        threads = set(threading.enumerate())
+        database = RedisCacheDatabase(
+            trader_id=self.trader_id,
+            logger=self.logger,
+            serializer=MsgPackSerializer(timestamps_as_str=True),
+            config=CacheDatabaseConfig(write_behind=True, buffer_writes=True),
+        )
+
+        order = self.strategy.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+        )
+
+        database.add_order(order)
+        writer_threads = set(threading.enumerate()) - threads
+
+        # Act
+        database.close()
+
+        # Assert
+        assert len(writer_threads) == 1
+        assert not writer_threads.pop().is_alive()
+        assert not database.write_queue.is_running
+        assert database.write_queue.written_count == 1
+
+    def test_instantiate_with_write_queue_size_not_greater_than_write_batch_size_raises(self):
+        # Arrange, Act, Assert
+        with pytest.raises(ValueError):
+            RedisCacheDatabase(
+                trader_id=self.trader_id,
+                logger=self.logger,
+                serializer=MsgPackSerializer(timestamps_as_str=True),
+                config=CacheDatabaseConfig(
+                    write_behind=True,
+                    write_batch_size=1000,
+                    write_queue_size=1000,
+                ),
+            )
+
     def test_load_positions_cache_when_no_positions(self):
         # Arrange, Act
         self.database.load_positions()
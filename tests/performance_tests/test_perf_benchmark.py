@@ -0,0 +1,110 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2023 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import pytest
+
+from nautilus_trader.model.enums import BookAction
+from nautilus_trader.test_kit.benchmark import BenchmarkScenario
+from nautilus_trader.test_kit.benchmark import compare_results
+from nautilus_trader.test_kit.benchmark import default_scenarios
+from nautilus_trader.test_kit.benchmark import generate_order_book_deltas
+from nautilus_trader.test_kit.benchmark import results_to_json
+from nautilus_trader.test_kit.benchmark import run_scenario
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+
+
+class TestBacktestThroughputBenchmark:
+    @pytest.mark.parametrize(
+        ("data_type", "book_type"),
+        [
+            ["quotes", "L1_TBBO"],
+            ["quotes", "L2_MBP"],
+            ["trades", "L1_TBBO"],
+            ["bars", "L1_TBBO"],
+            ["deltas", "L2_MBP"],
+        ],
+    )
+    def test_run_scenario(self, data_type, book_type):
+        # Arrange
+        scenario = BenchmarkScenario(
+            data_type=data_type,
+            events=1_000,
+            strategies=2,
+            open_orders=10,
+            book_type=book_type,
+        )
+
+        # Act
+        result = run_scenario(scenario)
+
+        # Assert
+        assert result.events >= 1_000
+        assert result.events_per_sec > 0
+
+    def test_generate_order_book_deltas_adds_levels_then_updates(self):
+        # Arrange
+        instrument = TestInstrumentProvider.default_fx_ccy("EUR/USD")
+
+        # Act
+        deltas = generate_order_book_deltas(instrument, count=100, levels=5)
+
+        # Assert
+        assert len(deltas) == 110
+        assert all(d.action == BookAction.ADD for d in deltas[:10])
+        assert all(d.action == BookAction.UPDATE for d in deltas[10:])
+
+    def test_default_scenarios_names_are_unique(self):
+        # Arrange, Act
+        scenarios = default_scenarios(events=1_000, max_strategies=4, open_orders=(0, 100))
+
+        # Assert
+        assert len({s.name for s in scenarios}) == len(scenarios) == 20
+
+    def test_compare_results_flags_regressions_beyond_threshold(self):
+        # Arrange
+        baseline = {
+            "scenarios": {
+                "a": {"events_per_sec": 1000.0},
+                "b": {"events_per_sec": 1000.0},
+                "c": {"events_per_sec": 1000.0},
+            },
+            "thresholds": {"c": 0.5},
+        }
+        results = {
+            "scenarios": {
+                "a": {"events_per_sec": 950.0},  # Within default threshold
+                "b": {"events_per_sec": 800.0},  # Regressed
+                "c": {"events_per_sec": 800.0},  # Within scenario threshold
+                "d": {"events_per_sec": 10.0},  # Not in baseline
+            },
+        }
+
+        # Act
+        regressions = compare_results(results, baseline, threshold=0.1)
+
+        # Assert
+        assert [r["scenario"] for r in regressions] == ["b"]
+        assert regressions[0]["change"] == pytest.approx(-0.2)
+
+    def test_results_to_json_round_trips_through_compare(self):
+        # Arrange
+        result = run_scenario(BenchmarkScenario(data_type="quotes", events=100))
+
+        # Act
+        document = results_to_json([result])
+
+        # Assert
+        assert list(document["scenarios"]) == [result.scenario.name]
+        assert compare_results(document, document) == []
@@ -21,9 +21,12 @@ import pandas as pd
 import pytest
 
 from nautilus_trader.accounting.calculators import ExchangeRateCalculator
+from nautilus_trader.accounting.calculators import ExchangeRateGraph
 from nautilus_trader.accounting.calculators import RolloverInterestCalculator
 from nautilus_trader.model.currencies import AUD
 from nautilus_trader.model.currencies import BTC
+from nautilus_trader.model.currencies import EUR
+from nautilus_trader.model.currencies import GBP
 from nautilus_trader.model.currencies import JPY
 from nautilus_trader.model.currencies import USD
 from nautilus_trader.model.enums import PriceType
@@ -216,6 +219,103 @@ class TestExchangeRateCalculator:
         assert result == 110.115
 
 
+class TestExchangeRateGraph:
+    def test_get_rate_when_no_quotes_returns_zero(self):
+        # Arrange
+        graph = ExchangeRateGraph()
+
+        # Act
+        result = graph.get_rate(AUD, USD, PriceType.MID)
+
+        # Assert
+        assert result == 0
+
+    def test_get_rate_for_last_price_type_raises_value_error(self):
+        # Arrange
+        graph = ExchangeRateGraph()
+
+        # Act, Assert
+        with pytest.raises(ValueError):
+            graph.get_rate(AUD, USD, PriceType.LAST)
+
+    @pytest.mark.parametrize(
+        ("from_currency", "to_currency", "price_type", "expected"),
+        [
+            [AUD, USD, PriceType.BID, 0.80000],
+            [AUD, USD, PriceType.ASK, 0.80010],
+            [AUD, USD, PriceType.MID, 0.80005],
+            [USD, AUD, PriceType.BID, 1 / 0.80000],
+            [USD, AUD, PriceType.ASK, 1 / 0.80010],
+        ],
+    )
+    def test_get_rate_for_direct_and_inverse_rates(
+        self,
+        from_currency,
+        to_currency,
+        price_type,
+        expected,
+    ):
+        # Arrange
+        graph = ExchangeRateGraph()
+        graph.update("AUD/USD", 0.80000, 0.80010)
+
+        # Act
+        result = graph.get_rate(from_currency, to_currency, price_type)
+
+        # Assert
+        assert result == pytest.approx(expected)
+
+    def test_get_rate_for_cross_rate(self):
+        # Arrange
+        graph = ExchangeRateGraph()
+        graph.update("AUD/USD", 0.80000, 0.80000)
+        graph.update("USD/JPY", 110.00, 110.00)
+
+        # Act
+        result = graph.get_rate(AUD, JPY, PriceType.MID)
+
+        # Assert
+        assert result == pytest.approx(88.0)
+
+    def test_get_rate_for_cross_rate_after_quote_update_returns_new_rate(self):
+        # Arrange
+        graph = ExchangeRateGraph()
+        graph.update("AUD/USD", 0.80000, 0.80000)
+        graph.update("USD/JPY", 110.00, 110.00)
+        graph.get_rate(AUD, JPY, PriceType.MID)  # Memoize cross rate
+
+        # Act
+        graph.update("USD/JPY", 120.00, 120.00)
+        result = graph.get_rate(AUD, JPY, PriceType.MID)
+
+        # Assert
+        assert result == pytest.approx(96.0)
+
+    def test_get_rate_for_cross_rate_with_more_than_one_hop(self):
+        # Arrange
+        graph = ExchangeRateGraph()
+        graph.update("EUR/USD", 1.10, 1.10)
+        graph.update("USD/JPY", 100.0, 100.0)
+        graph.update("GBP/EUR", 1.20, 1.20)
+
+        # Act
+        result = graph.get_rate(GBP, JPY, PriceType.MID)
+
+        # Assert
+        assert result == pytest.approx(132.0)
+
+    def test_clear_removes_all_rates(self):
+        # Arrange
+        graph = ExchangeRateGraph()
+        graph.update("AUD/USD", 0.80000, 0.80010)
+
+        # Act
+        graph.clear()
+
+        # Assert
+        assert graph.get_rate(AUD, USD, PriceType.MID) == 0
+
+
 class TestRolloverInterestCalculator:
     def setup(self):
         # Fixture Setup
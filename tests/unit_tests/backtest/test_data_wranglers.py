@@ -15,9 +15,17 @@
 
 import os
 
+import numpy as np
+import pandas as pd
+import pytest
+
 from nautilus_trader.common.clock import TestClock
+from nautilus_trader.model.data import QuoteTick
 from nautilus_trader.model.enums import AggressorSide
 from nautilus_trader.model.identifiers import TradeId
+from nautilus_trader.model.objects import PRICE_MAX
+from nautilus_trader.model.objects import PRICE_MIN
+from nautilus_trader.model.objects import QUANTITY_MAX
 from nautilus_trader.model.objects import Price
 from nautilus_trader.model.objects import Quantity
 from nautilus_trader.persistence.loaders import TardisQuoteDataLoader
@@ -68,8 +76,8 @@ class TestQuoteTickDataWrangler:
         assert ticks[0].ask == Price.from_str("86.728")
         assert ticks[0].bid_size == Quantity.from_int(1_000_000)
         assert ticks[0].ask_size == Quantity.from_int(1_000_000)
-        assert ticks[0].ts_event == 1357077600295000064
-        assert ticks[0].ts_event == 1357077600295000064
+        assert ticks[0].ts_event == 1357077600295000000
+        assert ticks[0].ts_event == 1357077600295000000
 
     def test_process_tick_data_with_delta(self):
         # Arrange
@@ -92,8 +100,8 @@ class TestQuoteTickDataWrangler:
         assert ticks[0].ask == Price.from_str("86.728")
         assert ticks[0].bid_size == Quantity.from_int(1_000_000)
         assert ticks[0].ask_size == Quantity.from_int(1_000_000)
-        assert ticks[0].ts_event == 1357077600295000064
-        assert ticks[0].ts_init == 1357077600296000564  # <-- delta diff
+        assert ticks[0].ts_event == 1357077600295000000
+        assert ticks[0].ts_init == 1357077600296000500  # <-- delta diff
 
     def test_pre_process_bar_data_with_delta(self):
         # Arrange
@@ -122,6 +130,127 @@ class TestQuoteTickDataWrangler:
         assert ticks[0].ts_event == 1359676799700000000
         assert ticks[0].ts_init == 1359676799701000500  # <-- delta diff
 
+    def test_process_does_not_modify_data_and_rounds_to_precision(self):
+        # Arrange
+        audusd = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+        wrangler = QuoteTickDataWrangler(instrument=audusd)
+        data = pd.DataFrame(
+            {"bid": [0.700004, 0.70001], "ask": [0.700026, 0.70003]},
+            index=pd.DatetimeIndex(["2021-01-01 00:00:00.000000001", "2021-01-01 00:00:01"]),
+        )
+
+        # Act
+        ticks = wrangler.process(data=data, default_volume=100)
+
+        # Assert
+        assert list(data.columns) == ["bid", "ask"]
+        assert ticks[0].bid == Price.from_str("0.70000")
+        assert ticks[0].ask == Price.from_str("0.70003")
+        assert ticks[0].bid_size == Quantity.from_int(100)
+        assert ticks[0].ts_event == 1609459200000000001
+        assert ticks[1].ts_event == 1609459201000000000
+
+    @pytest.mark.parametrize("value", [np.nan, np.inf, -np.inf])
+    def test_process_with_non_finite_values_raises_value_error(self, value):
+        # Arrange
+        audusd = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+        wrangler = QuoteTickDataWrangler(instrument=audusd)
+        data = pd.DataFrame(
+            {"bid": [0.70000, value], "ask": [0.70003, 0.70004]},
+            index=pd.DatetimeIndex(["2021-01-01 00:00:00", "2021-01-01 00:00:01"]),
+        )
+
+        # Act, Assert
+        with pytest.raises(ValueError):
+            wrangler.process(data=data)
+
+    @pytest.mark.parametrize(
+        ("bid", "bid_size"),
+        [
+            (PRICE_MAX * 2, 100.0),
+            (PRICE_MIN * 2, 100.0),
+            (0.70000, -100.0),
+            (0.70000, QUANTITY_MAX * 2),
+        ],
+    )
+    def test_process_with_out_of_range_values_raises_value_error(self, bid, bid_size):
+        # Arrange
+        audusd = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+        wrangler = QuoteTickDataWrangler(instrument=audusd)
+        data = pd.DataFrame(
+            {"bid": [bid], "ask": [0.70003], "bid_size": [bid_size], "ask_size": [100.0]},
+            index=pd.DatetimeIndex(["2021-01-01 00:00:00"]),
+        )
+
+        # Act, Assert
+        with pytest.raises(ValueError):
+            wrangler.process(data=data)
+
+    def test_pre_process_raw_bar_data_keeps_values_exact(self):
+        # Arrange
+        usdjpy = TestInstrumentProvider.default_fx_ccy("USD/JPY")
+        wrangler = QuoteTickDataWrangler(instrument=usdjpy)
+        raw_bid = 9_000_000_000_001_000_000  # Not representable as a float64
+        raw_ask = raw_bid + 2_000_000
+        index = pd.DatetimeIndex(["2021-01-01"])
+        columns = ["open", "high", "low", "close"]
+        bid_data = pd.DataFrame({c: [raw_bid] for c in columns}, index=index)
+        ask_data = pd.DataFrame({c: [raw_ask] for c in columns}, index=index)
+
+        # Act
+        ticks = wrangler.process_bar_data(
+            bid_data=bid_data,
+            ask_data=ask_data,
+            default_volume=1_000_000_000,
+            is_raw=True,
+        )
+
+        # Assert
+        assert len(ticks) == 4
+        assert ticks[3] == QuoteTick.from_raw(
+            usdjpy.id,
+            raw_bid,
+            raw_ask,
+            usdjpy.price_precision,
+            usdjpy.price_precision,
+            250_000_000,
+            250_000_000,
+            usdjpy.size_precision,
+            usdjpy.size_precision,
+            1609459200000000000,
+            1609459200000000000,
+        )
+
+    def test_pre_process_bar_data_orders_open_high_low_close_ticks(self):
+        # Arrange
+        usdjpy = TestInstrumentProvider.default_fx_ccy("USD/JPY")
+        provider = TestDataProvider()
+        bid_data = provider.read_csv_bars("fxcm-usdjpy-m1-bid-2013.csv")[:100]
+        ask_data = provider.read_csv_bars("fxcm-usdjpy-m1-ask-2013.csv")[:100]
+
+        wrangler = QuoteTickDataWrangler(instrument=usdjpy)
+
+        # Act
+        ticks = wrangler.process_bar_data(
+            bid_data=bid_data,
+            ask_data=ask_data,
+            default_volume=1000000,
+        )
+
+        # Assert
+        bar = bid_data.iloc[0]
+        assert [t.bid for t in ticks[:4]] == [
+            Price(bar[column], usdjpy.price_precision)
+            for column in ("open", "high", "low", "close")
+        ]
+        assert [t.ts_event for t in ticks[:4]] == [
+            1359676799700000000,
+            1359676799800000000,
+            1359676799900000000,
+            1359676800000000000,
+        ]
+        assert all(a.ts_event <= b.ts_event for a, b in zip(ticks, ticks[1:]))
+
     def test_pre_process_bar_data_with_random_seed(self):
         # Arrange
         usdjpy = TestInstrumentProvider.default_fx_ccy("USD/JPY")
@@ -177,8 +306,8 @@ class TestTradeTickDataWrangler:
         assert ticks[0].size == Quantity.from_str("2.67900")
         assert ticks[0].aggressor_side == AggressorSide.SELLER
         assert ticks[0].trade_id == TradeId("148568980")
-        assert ticks[0].ts_event == 1597399200223000064
-        assert ticks[0].ts_init == 1597399200223000064
+        assert ticks[0].ts_event == 1597399200223000000
+        assert ticks[0].ts_init == 1597399200223000000
 
     def test_process_with_delta(self):
         # Arrange
@@ -198,8 +327,31 @@ class TestTradeTickDataWrangler:
         assert ticks[0].size == Quantity.from_str("2.67900")
         assert ticks[0].aggressor_side == AggressorSide.SELLER
         assert ticks[0].trade_id == TradeId("148568980")
-        assert ticks[0].ts_event == 1597399200223000064
-        assert ticks[0].ts_init == 1597399200224000564  # <-- delta diff
+        assert ticks[0].ts_event == 1597399200223000000
+        assert ticks[0].ts_init == 1597399200224000500  # <-- delta diff
+
+    def test_process_with_buyer_maker(self):
+        # Arrange
+        ethusdt = TestInstrumentProvider.ethusdt_binance()
+        wrangler = TradeTickDataWrangler(instrument=ethusdt)
+        data = pd.DataFrame(
+            {
+                "price": [423.76, 423.77],
+                "quantity": [2.679, 1.0],
+                "buyer_maker": [True, False],
+                "trade_id": [1, 2],
+            },
+            index=pd.DatetimeIndex(["2020-08-14 10:00:00", "2020-08-14 10:00:01"], tz="UTC"),
+        )
+
+        # Act
+        ticks = wrangler.process(data)
+
+        # Assert
+        assert [t.aggressor_side for t in ticks] == [AggressorSide.SELLER, AggressorSide.BUYER]
+        assert [t.trade_id for t in ticks] == [TradeId("1"), TradeId("2")]
+        assert ticks[0].price == Price.from_str("423.76")
+        assert ticks[0].size == Quantity.from_str("2.67900")
 
 
 class TestBarDataWrangler:
@@ -324,8 +476,8 @@ class TestTardisQuoteDataWrangler:
         assert ticks[0].ask == Price.from_str("9682.00")
         assert ticks[0].bid_size == Quantity.from_str("0.670000")
         assert ticks[0].ask_size == Quantity.from_str("0.840000")
-        assert ticks[0].ts_event == 1582329603502091776
-        assert ticks[0].ts_init == 1582329603503092277
+        assert ticks[0].ts_event == 1582329603502092000
+        assert ticks[0].ts_init == 1582329603503092501
 
 
 class TestTardisTradeDataWrangler:
@@ -357,5 +509,5 @@ class TestTardisTradeDataWrangler:
         assert ticks[0].size == Quantity.from_str("0.132000")
         assert ticks[0].aggressor_side == AggressorSide.BUYER
         assert ticks[0].trade_id == TradeId("42377944")
-        assert ticks[0].ts_event == 1582329602418379008
-        assert ticks[0].ts_init == 1582329602418379008
+        assert ticks[0].ts_event == 1582329602418379000
+        assert ticks[0].ts_init == 1582329602418379000
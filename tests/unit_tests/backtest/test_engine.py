@@ -14,6 +14,7 @@
 # -------------------------------------------------------------------------------------------------
 
 import tempfile
+from datetime import timedelta
 from decimal import Decimal
 from typing import Optional
 
@@ -23,7 +24,10 @@ import pytest
 from nautilus_trader.backtest.engine import BacktestEngine
 from nautilus_trader.backtest.engine import BacktestEngineConfig
 from nautilus_trader.backtest.models import FillModel
+from nautilus_trader.common.actor import Actor
+from nautilus_trader.config import ActorConfig
 from nautilus_trader.config import LoggingConfig
+from nautilus_trader.config import ProfilingConfig
 from nautilus_trader.config import StreamingConfig
 from nautilus_trader.config.error import InvalidConfiguration
 from nautilus_trader.core.uuid import UUID4
@@ -73,6 +77,19 @@ GBPUSD_SIM = TestInstrumentProvider.default_fx_ccy("GBP/USD")
 USDJPY_SIM = TestInstrumentProvider.default_fx_ccy("USD/JPY")
 
 
+class TimerActor(Actor):
+    def __init__(self, component_id: str, interval: timedelta):
+        super().__init__(ActorConfig(component_id=component_id))
+        self.interval = interval
+        self.events: list[tuple[int, int]] = []  # (ts_event, clock time at handling)
+
+    def on_start(self):
+        self.clock.set_timer(self.id.value, self.interval, callback=self.handle_timer)
+
+    def handle_timer(self, event):
+        self.events.append((event.ts_event, self.clock.timestamp_ns()))
+
+
 class TestBacktestEngine:
     def setup(self):
         # Fixture Setup
@@ -243,6 +260,99 @@ class TestBacktestEngine:
         assert engine1.kernel.instance_id.value == instance_id
         assert engine2.kernel.instance_id.value != instance_id
 
+    def test_profiling_not_configured_by_default(self):
+        # Arrange, Act, Assert
+        assert self.engine.kernel.profiler is None
+        assert self.engine.kernel.msgbus.profiler is None
+        assert self.engine.kernel.profiling_summary() is None
+
+    def test_run_with_profiling_records_engine_and_handler_timings(self):
+        # Arrange
+        config = SignalStrategyConfig(instrument_id=USDJPY_SIM.id.value)
+        strategy = SignalStrategy(config)
+        engine = self.create_engine(
+            config=BacktestEngineConfig(
+                profiling=ProfilingConfig(log_interval_secs=3600.0),
+                logging=LoggingConfig(bypass_logging=True),
+            ),
+        )
+        engine.add_strategy(strategy)
+
+        # Act
+        engine.run()
+
+        # Assert
+        profiler = engine.kernel.profiler
+        assert engine.kernel.msgbus.profiler is profiler
+        names = profiler.names()
+        assert "engine:DataEngine.process" in names
+        assert f"handler:{strategy.id}.handle_quote_tick" in names
+        quote_handler = profiler.histogram(f"handler:{strategy.id}.handle_quote_tick")
+        assert quote_handler.count > 0
+        assert profiler.histogram("engine:DataEngine.process").count >= quote_handler.count
+        assert "engine:DataEngine.process" in engine.kernel.profiling_summary()
+        engine.dispose()
+
+    def test_run_with_actor_timers_fires_each_timer_at_its_own_interval(self):
+        # Arrange
+        actor1 = TimerActor("ACTOR-001", timedelta(minutes=1))
+        actor2 = TimerActor("ACTOR-002", timedelta(minutes=7))
+        self.engine.add_actor(actor1)
+        self.engine.add_actor(actor2)
+
+        # Act
+        self.engine.run()
+
+        # Assert
+        ts_end = self.engine.kernel.clock.timestamp_ns()
+        for actor in (actor1, actor2):
+            ts_events = [ts_event for ts_event, _ in actor.events]
+            interval_ns = int(actor.interval.total_seconds() * 1_000_000_000)
+            assert len(ts_events) > 1
+            assert all(b - a == interval_ns for a, b in zip(ts_events, ts_events[1:]))
+            assert ts_events[-1] <= ts_end < ts_events[-1] + interval_ns
+            # Component clocks read the kernel clock time
+            assert all(ts_now == ts_event for ts_event, ts_now in actor.events)
+            assert actor.clock.timestamp_ns() == ts_end
+
+    def test_reset_restores_component_clock_time_sources(self):
+        # Arrange
+        actor = TimerActor("ACTOR-001", timedelta(minutes=1))
+        self.engine.add_actor(actor)
+        self.engine.run()
+        ts_end = self.engine.kernel.clock.timestamp_ns()
+
+        # Act
+        self.engine.reset()
+        self.engine.kernel.clock.set_time(ts_end + 1_000_000_000)
+
+        # Assert
+        assert actor.clock.timestamp_ns() != self.engine.kernel.clock.timestamp_ns()
+
+    def test_run_with_timer_set_in_timer_callback_fires_new_timer(self):
+        # Arrange
+        actor = TimerActor("ACTOR-001", timedelta(minutes=30))
+        alerts = []
+
+        def handle_first_timer(event):
+            actor.handle_timer(event)
+            if len(actor.events) == 1:
+                actor.clock.set_time_alert_ns(
+                    "ALERT",
+                    event.ts_event + 60_000_000_000,
+                    callback=alerts.append,
+                )
+
+        actor.handle_timer = handle_first_timer
+        self.engine.add_actor(actor)
+
+        # Act
+        self.engine.run()
+
+        # Assert
+        assert len(alerts) == 1
+        assert alerts[0].ts_event == actor.events[0][0] + 60_000_000_000
+
 
 class TestBacktestEngineCashAccount:
     def setup(self) -> None:
@@ -330,6 +440,32 @@ class TestBacktestEngineData:
         # Assert
         assert len(self.engine.data) == 5
 
+    def test_add_data_in_multiple_lists_merges_streams_in_time_order(self):
+        # Arrange
+        data_type = DataType(MyData, metadata={"news_wire": "hacks"})
+
+        generic_data1 = [
+            GenericData(data_type, MyData("AAPL hacked", 1000, 1000)),
+            GenericData(data_type, MyData("AMZN hacked", 3000, 3000)),
+        ]
+
+        generic_data2 = [
+            GenericData(data_type, MyData("NFLX hacked", 3000, 3000)),
+            GenericData(data_type, MyData("MSFT hacked", 2000, 2000)),  # <-- not sorted
+        ]
+
+        # Act
+        self.engine.add_data(generic_data1, ClientId("NEWS_CLIENT"))
+        self.engine.add_data(generic_data2, ClientId("NEWS_CLIENT"))
+
+        # Assert
+        assert self.engine.data == [
+            generic_data1[0],
+            generic_data2[1],
+            generic_data1[1],  # <-- equal timestamps retain the order added
+            generic_data2[0],
+        ]
+
     def test_add_instrument_when_no_venue_raises_exception(self):
         # Arrange
         engine = BacktestEngine(BacktestEngineConfig(logging=LoggingConfig(bypass_logging=True)))
@@ -476,6 +612,45 @@ class TestBacktestEngineData:
         # Assert
         assert len(self.engine.data) == 100000
 
+    def test_add_data_stream_runs_batches_merged_with_other_data(self):
+        # Arrange
+        self.engine.add_instrument(AUDUSD_SIM)
+        wrangler = QuoteTickDataWrangler(AUDUSD_SIM)
+        provider = TestDataProvider()
+        ticks = wrangler.process(provider.read_csv_ticks("truefx-audusd-ticks.csv"))
+        streamed = ticks[::2]
+        batches = (streamed[i : i + 10_000] for i in range(0, len(streamed), 10_000))
+
+        # Act
+        self.engine.add_data_stream(batches)
+        self.engine.add_data(ticks[1::2])
+        self.engine.run()
+
+        # Assert
+        assert self.engine.iteration == 100000
+        assert self.engine.cache.quote_tick(AUDUSD_SIM.id) == ticks[-1]
+
+    def test_add_data_stream_when_no_data_raises_value_error(self):
+        # Arrange, Act, Assert
+        with pytest.raises(ValueError):
+            self.engine.add_data_stream(iter([[], []]))
+
+    def test_add_data_stream_then_data_or_streaming_run_raises_value_error(self):
+        # Arrange
+        self.engine.add_instrument(AUDUSD_SIM)
+        wrangler = QuoteTickDataWrangler(AUDUSD_SIM)
+        provider = TestDataProvider()
+        ticks = wrangler.process(provider.read_csv_ticks("truefx-audusd-ticks.csv"))
+        self.engine.add_data_stream(iter([ticks[:10], ticks[10:20]]))
+
+        # Act, Assert
+        with pytest.raises(ValueError):
+            self.engine.data
+        with pytest.raises(ValueError):
+            self.engine.dump_pickled_data()
+        with pytest.raises(ValueError):
+            self.engine.run(streaming=True)
+
     def test_add_trade_ticks_adds_to_engine(self):
         # Arrange
         self.engine.add_instrument(ETHUSDT_BINANCE)
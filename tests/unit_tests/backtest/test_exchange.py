@@ -2367,6 +2367,130 @@ class TestSimulatedExchange:
         assert order.avg_px == 90.001
         assert self.exchange.get_account().balance_total(USD) == Money(999998.00, USD)
 
+    def test_process_quote_tick_fills_only_crossed_limit_orders(self) -> None:
+        # Arrange: Prepare market
+        tick1 = TestDataStubs.quote_tick(
+            instrument=USDJPY_SIM,
+            bid=90.002,
+            ask=90.005,
+        )
+        self.data_engine.process(tick1)
+        self.exchange.process_quote_tick(tick1)
+
+        orders = [
+            self.strategy.order_factory.limit(
+                USDJPY_SIM.id,
+                OrderSide.BUY,
+                Quantity.from_int(100_000),
+                Price.from_str(price),
+            )
+            for price in ("90.001", "89.999", "90.000", "90.001")
+        ]
+
+        for order in orders:
+            self.strategy.submit_order(order)
+        self.exchange.process(0)
+
+        # Act
+        tick2 = TestDataStubs.quote_tick(
+            instrument=USDJPY_SIM,
+            bid=89.998,
+            ask=90.000,
+            ts_event=100_000,
+            ts_init=100_000,
+        )
+
+        self.exchange.process_quote_tick(tick2)
+
+        # Assert
+        assert [order.status for order in orders] == [
+            OrderStatus.FILLED,
+            OrderStatus.ACCEPTED,
+            OrderStatus.FILLED,
+            OrderStatus.FILLED,
+        ]
+        assert self.exchange.get_open_bid_orders() == [orders[1]]
+
+    def test_get_open_bid_orders_returns_orders_in_price_time_priority(self) -> None:
+        # Arrange: Prepare market
+        tick = TestDataStubs.quote_tick(
+            instrument=USDJPY_SIM,
+            bid=90.002,
+            ask=90.005,
+        )
+        self.data_engine.process(tick)
+        self.exchange.process_quote_tick(tick)
+
+        order1 = self.strategy.order_factory.limit(
+            USDJPY_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+            Price.from_str("90.000"),
+        )
+        order2 = self.strategy.order_factory.limit(
+            USDJPY_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+            Price.from_str("90.001"),
+        )
+        order3 = self.strategy.order_factory.limit(
+            USDJPY_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+            Price.from_str("90.000"),
+        )
+
+        # Act
+        self.strategy.submit_order(order1)
+        self.strategy.submit_order(order2)
+        self.strategy.submit_order(order3)
+        self.exchange.process(0)
+
+        # Assert
+        assert self.exchange.get_open_bid_orders() == [order2, order1, order3]
+
+    def test_modified_stop_market_order_is_triggered_at_new_price(self) -> None:
+        # Arrange: Prepare market
+        tick1 = TestDataStubs.quote_tick(
+            instrument=USDJPY_SIM,
+            bid=90.002,
+            ask=90.005,
+        )
+        self.data_engine.process(tick1)
+        self.exchange.process_quote_tick(tick1)
+
+        order = self.strategy.order_factory.stop_market(
+            USDJPY_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+            Price.from_str("90.020"),
+        )
+
+        self.strategy.submit_order(order)
+        self.exchange.process(0)
+
+        self.strategy.modify_order(
+            order,
+            order.quantity,
+            trigger_price=Price.from_str("90.010"),
+        )
+        self.exchange.process(0)
+
+        # Act
+        tick2 = TestDataStubs.quote_tick(
+            instrument=USDJPY_SIM,
+            bid=90.008,
+            ask=90.010,
+            ts_event=100_000,
+            ts_init=100_000,
+        )
+
+        self.exchange.process_quote_tick(tick2)
+
+        # Assert
+        assert order.status == OrderStatus.FILLED
+        assert len(self.exchange.get_open_orders()) == 0
+
     def test_process_quote_tick_fills_sell_stop_order(self) -> None:
         # Arrange: Prepare market
         tick = TestDataStubs.quote_tick(
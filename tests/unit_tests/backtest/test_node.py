@@ -19,6 +19,7 @@ import msgspec.json
 
 from nautilus_trader.backtest.engine import BacktestEngineConfig
 from nautilus_trader.backtest.node import BacktestNode
+from nautilus_trader.backtest.results import BacktestResultStore
 from nautilus_trader.config import BacktestDataConfig
 from nautilus_trader.config import BacktestRunConfig
 from nautilus_trader.config import BacktestVenueConfig
@@ -106,6 +107,106 @@ class TestBacktestNode:
         # Assert
         assert len(results) == 1
 
+    def test_backtest_run_parallel_workers(self, tmp_path):
+        # Arrange
+        catalog = data_catalog_setup(protocol="file", path=tmp_path / "catalog")
+        aud_usd_data_loader(catalog)
+        data_config = BacktestDataConfig(
+            catalog_path=catalog.path,
+            catalog_fs_protocol="file",
+            data_cls=QuoteTick,
+            instrument_id="AUD/USD.SIM",
+        )
+        configs = [
+            BacktestRunConfig(
+                engine=BacktestEngineConfig(
+                    trader_id=f"BACKTESTER-00{i}",
+                    strategies=self.strategies,
+                    logging=LoggingConfig(bypass_logging=True),
+                ),
+                venues=[self.venue_config],
+                data=[data_config],
+            )
+            for i in range(3)
+        ]
+
+        node = BacktestNode(configs=configs)
+
+        # Act
+        results = node.run(workers=2)
+
+        # Assert
+        assert [r.run_config_id for r in results] == [c.id for c in configs]
+        assert [r.trader_id for r in results] == [
+            "BACKTESTER-000",
+            "BACKTESTER-001",
+            "BACKTESTER-002",
+        ]
+        assert len({r.iterations for r in results}) == 1
+
+    def test_backtest_run_parallel_workers_with_shared_data(self, tmp_path):
+        # Arrange
+        catalog = data_catalog_setup(protocol="file", path=tmp_path / "catalog")
+        aud_usd_data_loader(catalog)
+        data_config = BacktestDataConfig(
+            catalog_path=catalog.path,
+            catalog_fs_protocol="file",
+            data_cls=QuoteTick,
+            instrument_id="AUD/USD.SIM",
+        )
+        config = BacktestRunConfig(
+            engine=BacktestEngineConfig(
+                strategies=self.strategies,
+                logging=LoggingConfig(bypass_logging=True),
+            ),
+            venues=[self.venue_config],
+            data=[data_config],
+        )
+
+        node = BacktestNode(configs=[config, config])
+
+        # Act
+        results = node.run(workers=2, share_data=True)
+
+        # Assert
+        assert len(results) == 2
+        assert results[0].iterations == results[1].iterations > 0
+
+    def test_backtest_run_with_result_store_returns_stored_results(self, tmp_path):
+        # Arrange
+        store = BacktestResultStore(path=str(tmp_path / "results"), save_reports=True)
+        node = BacktestNode(configs=self.backtest_configs, result_store=store)
+        results = node.run()
+        node.dispose()
+
+        # Act
+        node2 = BacktestNode(configs=self.backtest_configs, result_store=store)
+        stored_results = node2.run()
+
+        # Assert
+        key = store.keys(self.backtest_configs)[0]
+        assert [r.run_id for r in stored_results] == [r.run_id for r in results]
+        assert stored_results[0].iterations == results[0].iterations
+        assert node2.get_engines() == []  # Not re-run
+        assert set(store.load_reports(key)) == {
+            "account_SIM",
+            "order_fills",
+            "orders",
+            "positions",
+        }
+
+    def test_result_store_key_changes_when_catalog_data_changes(self, tmp_path):
+        # Arrange
+        store = BacktestResultStore(path=str(tmp_path / "results"))
+        key = store.keys(self.backtest_configs)[0]
+
+        # Act
+        with self.catalog.fs.open(f"{self.catalog.path}/data/new.parquet", "wb") as f:
+            f.write(b"data")
+
+        # Assert
+        assert store.keys(self.backtest_configs)[0] != key
+
     def test_backtest_run_results(self):
         # Arrange
         node = BacktestNode(configs=self.backtest_configs)
@@ -556,6 +556,39 @@ class TestCache:
         # Assert
         assert result == 0.80005
 
+    def test_get_xrate_for_cross_rate_after_quote_update_returns_new_rate(self):
+        # Arrange
+        self.cache.add_instrument(AUDUSD_SIM)
+        self.cache.add_instrument(USDJPY_SIM)
+        self.cache.add_quote_tick(
+            TestDataStubs.quote_tick(AUDUSD_SIM, bid=0.80000, ask=0.80000),
+        )
+        self.cache.add_quote_tick(
+            TestDataStubs.quote_tick(USDJPY_SIM, bid=110.000, ask=110.000),
+        )
+        result1 = self.cache.get_xrate(SIM, AUD, JPY)
+
+        # Act
+        self.cache.add_quote_tick(
+            TestDataStubs.quote_tick(USDJPY_SIM, bid=120.000, ask=120.000),
+        )
+        result2 = self.cache.get_xrate(SIM, AUD, JPY)
+
+        # Assert
+        assert result1 == pytest.approx(88.0)
+        assert result2 == pytest.approx(96.0)
+
+    def test_get_xrate_for_other_venue_returns_zero(self):
+        # Arrange
+        self.cache.add_instrument(AUDUSD_SIM)
+        self.cache.add_quote_tick(TestDataStubs.quote_tick(AUDUSD_SIM))
+
+        # Act
+        result = self.cache.get_xrate(Venue("OTHER"), AUD, USD)
+
+        # Assert
+        assert result == 0
+
     def test_get_xrate_fallbacks_to_bars_if_no_quotes_returns_correct_rate(self):
         # Arrange
         self.cache.reset()
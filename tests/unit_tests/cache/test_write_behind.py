@@ -0,0 +1,197 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2023 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import threading
+
+import pytest
+
+from nautilus_trader.cache.write_behind import WRITE_DELETE
+from nautilus_trader.cache.write_behind import WRITE_HSET
+from nautilus_trader.cache.write_behind import WRITE_RPUSH
+from nautilus_trader.cache.write_behind import WRITE_SET
+from nautilus_trader.cache.write_behind import WriteBehindQueue
+from nautilus_trader.common.clock import TestClock
+from nautilus_trader.common.logging import Logger
+
+
+class TestWriteBehindQueue:
+    def setup(self):
+        # Fixture Setup
+        self.logger = Logger(clock=TestClock(), bypass=True)
+        self.batches: list[dict] = []
+        self.queue = WriteBehindQueue(
+            writer=self.batches.append,
+            logger=self.logger,
+            retry_delay_secs=0.0,
+        )
+
+    def teardown(self):
+        self.queue.stop(timeout_secs=1.0)
+
+    def test_instantiate_with_invalid_maxsize_raises_value_error(self):
+        # Arrange, Act, Assert
+        with pytest.raises(ValueError):
+            WriteBehindQueue(writer=self.batches.append, logger=self.logger, maxsize=0)
+
+    def test_put_stages_writes_until_commit(self):
+        # Arrange
+        self.queue.start()
+
+        # Act
+        self.queue.put("key", WRITE_SET, b"1")
+
+        # Assert
+        assert self.queue.sync(timeout_secs=1.0)
+        assert self.queue.staged == 1
+        assert self.queue.depth == 1
+        assert self.batches == []
+
+    def test_commit_writes_batch(self):
+        # Arrange
+        self.queue.start()
+        self.queue.put("key", WRITE_SET, b"1")
+
+        # Act
+        self.queue.commit()
+
+        # Assert
+        assert self.queue.sync(timeout_secs=1.0)
+        assert self.batches == [{"key": [[WRITE_SET, b"1"]]}]
+        assert self.queue.depth == 0
+        assert self.queue.lag_ns == 0
+        assert self.queue.written_count == 1
+
+    def test_repeated_writes_to_same_key_are_coalesced(self):
+        # Arrange
+        self.queue.start()
+
+        # Act
+        self.queue.put("list", WRITE_RPUSH, b"a")
+        self.queue.put("list", WRITE_RPUSH, b"b")
+        self.queue.put("hash", WRITE_HSET, {"x": b"1"})
+        self.queue.put("hash", WRITE_HSET, {"y": b"2"})
+        self.queue.put("value", WRITE_SET, b"1")
+        self.queue.put("value", WRITE_SET, b"2")
+        self.queue.commit()
+
+        # Assert
+        assert self.queue.sync(timeout_secs=1.0)
+        assert self.batches == [
+            {
+                "list": [[WRITE_RPUSH, [b"a", b"b"]]],
+                "hash": [[WRITE_HSET, {"x": b"1", "y": b"2"}]],
+                "value": [[WRITE_SET, b"2"]],
+            },
+        ]
+        assert self.queue.coalesced_count == 3
+        assert self.queue.written_count == 6
+
+    def test_delete_supersedes_pending_writes_for_key(self):
+        # Arrange
+        self.queue.start()
+
+        # Act
+        self.queue.put("hash", WRITE_HSET, {"x": b"1"})
+        self.queue.put("hash", WRITE_DELETE, None)
+        self.queue.put("hash", WRITE_HSET, {"y": b"2"})
+        self.queue.commit()
+
+        # Assert
+        assert self.queue.sync(timeout_secs=1.0)
+        assert self.batches == [
+            {"hash": [[WRITE_DELETE, None], [WRITE_HSET, {"y": b"2"}]]},
+        ]
+
+    def test_failed_batch_is_retried(self):
+        # Arrange
+        batches = []
+
+        def writer(batch):
+            if not queue.error_count:
+                raise ConnectionError("connection lost")
+            batches.append(batch)
+
+        queue = WriteBehindQueue(writer=writer, logger=self.logger, retry_delay_secs=0.0)
+        queue.start()
+
+        # Act
+        queue.put("list", WRITE_RPUSH, b"a")
+        queue.commit()
+
+        # Assert
+        assert queue.stop(timeout_secs=1.0)
+        assert batches == [{"list": [[WRITE_RPUSH, [b"a"]]]}]
+        assert queue.error_count == 1
+
+    def test_clear_discards_pending_writes(self):
+        # Arrange
+        release = threading.Event()
+
+        def writer(batch):
+            release.wait()
+            self.batches.append(batch)
+
+        queue = WriteBehindQueue(writer=writer, logger=self.logger)
+        queue.start()
+        queue.put("key1", WRITE_SET, b"1")
+        queue.commit()
+        queue.put("key2", WRITE_SET, b"2")
+
+        # Act
+        release.set()
+        queue.clear()
+
+        # Assert
+        assert queue.stop(timeout_secs=1.0)
+        assert b"2" not in [cmds[0][1] for batch in self.batches for cmds in batch.values()]
+        assert queue.depth == 0
+
+    def test_stop_writes_staged_writes(self):
+        # Arrange
+        self.queue.start()
+        self.queue.put("key", WRITE_SET, b"1")
+
+        # Act
+        result = self.queue.stop(timeout_secs=1.0)
+
+        # Assert
+        assert result
+        assert not self.queue.is_running
+        assert self.batches == [{"key": [[WRITE_SET, b"1"]]}]
+        assert self.queue.max_depth == 1
+
+    def test_put_when_staged_writes_exceed_maxsize_does_not_block(self):
+        # Arrange
+        queue = WriteBehindQueue(
+            writer=self.batches.append,
+            logger=self.logger,
+            maxsize=2,
+            retry_delay_secs=0.0,
+        )
+        queue.start()
+
+        # Act: stage more than `maxsize` writes within a single event
+        thread = threading.Thread(
+            target=lambda: [queue.put(f"key-{i}", WRITE_SET, b"1") for i in range(5)],
+        )
+        thread.start()
+        thread.join(timeout=1.0)
+
+        # Assert
+        assert not thread.is_alive()
+        assert queue.staged == 5
+        queue.commit()
+        assert queue.stop(timeout_secs=1.0)
+        assert queue.written_count == 5
@@ -554,6 +554,84 @@ class TestTestClock:
         assert clock.timer_names == ["TEST_TIMER1", "TEST_TIMER2"]
         assert clock.timer_count == 2
 
+    def test_next_event_time_ns_with_no_timers_returns_zero(self):
+        # Arrange
+        clock = TestClock()
+
+        # Act, Assert
+        assert clock.next_event_time_ns() == 0
+
+    def test_next_event_time_ns_returns_earliest_timer_event(self):
+        # Arrange
+        clock = TestClock()
+        clock.set_time_alert_ns("TEST_ALERT", 3_000_000_000, callback=[].append)
+        clock.set_timer_ns("TEST_TIMER", 2_000_000_000, 0, 0, callback=[].append)
+
+        # Act
+        next_time_ns1 = clock.next_event_time_ns()
+        clock.advance_time(2_000_000_000)
+        next_time_ns2 = clock.next_event_time_ns()
+        clock.cancel_timers()
+        next_time_ns3 = clock.next_event_time_ns()
+
+        # Assert
+        assert next_time_ns1 == 2_000_000_000
+        assert next_time_ns2 == 3_000_000_000
+        assert next_time_ns3 == 0
+
+    def test_set_time_source_to_self_raises_value_error(self):
+        # Arrange
+        clock = TestClock()
+
+        # Act, Assert
+        with pytest.raises(ValueError):
+            clock.set_time_source(clock)
+
+    def test_clock_with_time_source_reads_source_time(self):
+        # Arrange
+        source = TestClock()
+        clock = TestClock()
+        clock.set_time_source(source)
+
+        # Act
+        source.set_time(60_000_000_000)
+
+        # Assert
+        assert clock.timestamp_ns() == 60_000_000_000
+        assert clock.timestamp_ms() == 60_000
+        assert clock.timestamp() == 60.0
+        assert clock.utc_now() == pd.Timestamp(60_000_000_000, tz="UTC")
+
+    def test_clock_with_time_source_sets_timers_from_source_time(self):
+        # Arrange
+        source = TestClock()
+        clock = TestClock()
+        clock.set_time_source(source)
+        source.set_time(60_000_000_000)
+        handler = []
+
+        # Act
+        clock.set_time_alert_ns("TEST_ALERT", 61_000_000_000, callback=handler.append)
+        clock.set_timer_ns("TEST_TIMER", 10_000_000_000, 0, 0, callback=handler.append)
+        event_handlers = clock.advance_time(70_000_000_000)
+
+        # Assert
+        assert [e.event.ts_event for e in event_handlers] == [61_000_000_000, 70_000_000_000]
+
+    def test_remove_time_source_retains_source_time(self):
+        # Arrange
+        source = TestClock()
+        clock = TestClock()
+        clock.set_time_source(source)
+        source.set_time(60_000_000_000)
+
+        # Act
+        clock.set_time_source(None)
+        source.set_time(120_000_000_000)
+
+        # Assert
+        assert clock.timestamp_ns() == 60_000_000_000
+
 
 class TestLiveClockWithThreadTimer:
     def setup(self):
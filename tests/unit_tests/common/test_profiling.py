@@ -0,0 +1,206 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2023 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import pytest
+
+from nautilus_trader.common.profiling import LatencyHistogram
+from nautilus_trader.common.profiling import Profiler
+from nautilus_trader.common.profiling import handler_name
+from nautilus_trader.test_kit.stubs.identifiers import TestIdStubs
+from nautilus_trader.trading.strategy import Strategy
+
+
+class TestLatencyHistogram:
+    def test_instantiate(self):
+        # Arrange, Act
+        histogram = LatencyHistogram("test")
+
+        # Assert
+        assert histogram.name == "test"
+        assert histogram.count == 0
+        assert histogram.total_ns == 0
+        assert histogram.max_ns == 0
+        assert histogram.mean_ns() == 0.0
+        assert histogram.percentile_ns(0.5) == 0
+
+    def test_record_updates_aggregates(self):
+        # Arrange
+        histogram = LatencyHistogram("test")
+
+        # Act
+        for value in (100, 200, 300, 400):
+            histogram.record(value)
+
+        # Assert
+        assert histogram.count == 4
+        assert histogram.total_ns == 1_000
+        assert histogram.min_ns == 100
+        assert histogram.max_ns == 400
+        assert histogram.mean_ns() == 250.0
+
+    def test_percentiles_within_bucket_error(self):
+        # Arrange
+        histogram = LatencyHistogram("test")
+
+        # Act
+        for value in range(1, 10_001):
+            histogram.record(value)
+
+        # Assert
+        assert 5_000 <= histogram.percentile_ns(0.50) <= 5_000 * 1.25
+        assert 9_900 <= histogram.percentile_ns(0.99) <= 10_000
+        assert histogram.percentile_ns(1.0) == 10_000
+        assert histogram.percentile_ns(0.0) == 1
+
+    def test_small_values_are_exact(self):
+        # Arrange
+        histogram = LatencyHistogram("test")
+
+        # Act
+        for value in (0, 1, 2, 3):
+            histogram.record(value)
+
+        # Assert
+        assert histogram.percentile_ns(0.25) == 0
+        assert histogram.percentile_ns(0.50) == 1
+        assert histogram.percentile_ns(1.0) == 3
+
+    def test_percentile_with_invalid_q_raises(self):
+        # Arrange
+        histogram = LatencyHistogram("test")
+
+        # Act, Assert
+        with pytest.raises(ValueError):
+            histogram.percentile_ns(1.5)
+
+    def test_reset(self):
+        # Arrange
+        histogram = LatencyHistogram("test")
+        histogram.record(1_000)
+
+        # Act
+        histogram.reset()
+
+        # Assert
+        assert histogram.count == 0
+        assert histogram.max_ns == 0
+        assert histogram.percentile_ns(0.5) == 0
+        assert histogram.to_dict()["min_ns"] == 0
+
+
+class TestProfiler:
+    def test_record_creates_histograms_by_name(self):
+        # Arrange
+        profiler = Profiler()
+
+        # Act
+        profiler.record("engine:DataEngine.process", 1_000)
+        profiler.record("engine:DataEngine.process", 3_000)
+        profiler.record("send:RiskEngine.execute", 500)
+
+        # Assert
+        assert profiler.names() == ["engine:DataEngine.process", "send:RiskEngine.execute"]
+        assert profiler.histogram("engine:DataEngine.process").count == 2
+        assert profiler.histogram("unknown") is None
+
+    def test_snapshot(self):
+        # Arrange
+        profiler = Profiler()
+        profiler.record("a", 1_000)
+
+        # Act
+        snapshot = profiler.snapshot()
+
+        # Assert
+        assert snapshot == {
+            "a": {
+                "count": 1,
+                "total_ns": 1_000,
+                "mean_ns": 1_000.0,
+                "min_ns": 1_000,
+                "p50_ns": 1_000,
+                "p90_ns": 1_000,
+                "p99_ns": 1_000,
+                "max_ns": 1_000,
+            },
+        }
+
+    def test_summary_sorted_by_total_time_with_limit(self):
+        # Arrange
+        profiler = Profiler()
+        profiler.record("fast", 10)
+        profiler.record("slow", 5_000_000)
+        profiler.record("medium", 2_000)
+
+        # Act
+        summary = profiler.summary(limit=2)
+
+        # Assert
+        lines = summary.splitlines()
+        assert len(lines) == 2
+        assert lines[0].startswith("slow: count=1, total=5.0ms")
+        assert lines[1].startswith("medium: count=1, total=2.0us")
+
+    def test_timestamp_ns_is_monotonic(self):
+        # Arrange
+        profiler = Profiler()
+
+        # Act
+        first = profiler.timestamp_ns()
+        second = profiler.timestamp_ns()
+
+        # Assert
+        assert second >= first
+
+    def test_reset_clears_histograms(self):
+        # Arrange
+        profiler = Profiler()
+        profiler.record("a", 1_000)
+
+        # Act
+        profiler.reset()
+
+        # Assert
+        assert profiler.names() == []
+        assert profiler.summary() == ""
+
+
+class TestHandlerName:
+    def test_handler_name_for_component_method(self):
+        # Arrange
+        strategy = Strategy()
+
+        # Act
+        result = handler_name(strategy.handle_bar)
+
+        # Assert
+        assert result == f"{strategy.id}.handle_bar"
+
+    def test_handler_name_for_object_without_id(self):
+        # Arrange
+        handler = []
+
+        # Act
+        result = handler_name(handler.append)
+
+        # Assert
+        assert result == "list.append"
+
+    def test_handler_name_for_function(self):
+        # Arrange, Act
+        result = handler_name(TestIdStubs.trader_id)
+
+        # Assert
+        assert result == "TestIdStubs.trader_id"
@@ -31,10 +31,12 @@ from nautilus_trader.data.messages import DataRequest
 from nautilus_trader.data.messages import DataResponse
 from nautilus_trader.data.messages import Subscribe
 from nautilus_trader.data.messages import Unsubscribe
+from nautilus_trader.model.currencies import USD
 from nautilus_trader.model.data import Bar
 from nautilus_trader.model.data import BarSpecification
 from nautilus_trader.model.data import BarType
 from nautilus_trader.model.data import DataType
+from nautilus_trader.model.data import GenericData
 from nautilus_trader.model.data import OrderBookDelta
 from nautilus_trader.model.data import OrderBookDeltas
 from nautilus_trader.model.data import QuoteTick
@@ -64,6 +66,7 @@ from nautilus_trader.test_kit.stubs.data import UNIX_EPOCH
 from nautilus_trader.test_kit.stubs.data import TestDataStubs
 from nautilus_trader.test_kit.stubs.identifiers import TestIdStubs
 from nautilus_trader.trading.filters import NewsEvent
+from nautilus_trader.trading.filters import NewsImpact
 from tests import TEST_DATA_DIR
 from tests.unit_tests.portfolio.test_portfolio import BETFAIR
 
@@ -1463,6 +1466,73 @@ class TestDataEngine:
         # Assert
         assert self.data_engine.subscribed_synthetic_trades() == [synthetic.id]
 
+    def test_process_publishes_on_cached_topics_matching_formatted_topics(self):
+        # Arrange
+        instrument_id = ETHUSDT_BINANCE.id
+        quote = TestDataStubs.quote_tick(instrument=ETHUSDT_BINANCE)
+        trade = TestDataStubs.trade_tick(instrument=ETHUSDT_BINANCE)
+        deltas = TestDataStubs.order_book_deltas(instrument_id)
+        bar = TestDataStubs.bar_5decimal()
+        data_type = DataType(NewsEvent, {"publisher": "NEWS_WIRE"})
+        news = NewsEvent(
+            impact=NewsImpact.HIGH,
+            name="Unemployment Rate",
+            currency=USD,
+            ts_event=0,
+            ts_init=0,
+        )
+
+        expected = {
+            f"data.quotes.{instrument_id.venue}.{instrument_id.symbol}": quote,
+            f"data.trades.{instrument_id.venue}.{instrument_id.symbol}": trade,
+            f"data.book.deltas.{instrument_id.venue}.{instrument_id.symbol}": deltas,
+            f"data.bars.{bar.bar_type}": bar,
+            f"data.{data_type.topic}": news,
+        }
+        received = {}
+        for topic in expected:
+            self.msgbus.subscribe(
+                topic=topic,
+                handler=lambda msg, topic=topic: received.setdefault(topic, msg),
+            )
+
+        # Act
+        for data in (quote, trade, deltas, bar, GenericData(data_type, news)):
+            self.data_engine.process(data)
+
+        # Assert
+        topics = list(expected)
+        assert received == expected
+        assert self.data_engine._topics_quotes == {instrument_id: topics[0]}
+        assert self.data_engine._topics_trades == {instrument_id: topics[1]}
+        assert self.data_engine._topics_deltas == {instrument_id: topics[2]}
+        assert self.data_engine._topics_bars == {bar.bar_type: topics[3]}
+        assert self.data_engine._topics_generic == {data_type: topics[4]}
+
+    def test_process_repeated_data_reuses_cached_topic(self):
+        # Arrange
+        instrument_id = ETHUSDT_BINANCE.id
+        self.data_engine.process(TestDataStubs.quote_tick(instrument=ETHUSDT_BINANCE))
+        topic = self.data_engine._topics_quotes[instrument_id]
+
+        # Act
+        self.data_engine.process(TestDataStubs.quote_tick(instrument=ETHUSDT_BINANCE))
+
+        # Assert
+        assert len(self.data_engine._topics_quotes) == 1
+        assert self.data_engine._topics_quotes[instrument_id] is topic
+        assert sys.intern(f"data.quotes.{instrument_id.venue}.{instrument_id.symbol}") is topic
+
+    def test_reset_clears_cached_topics(self):
+        # Arrange
+        self.data_engine.process(TestDataStubs.quote_tick(instrument=ETHUSDT_BINANCE))
+
+        # Act
+        self.data_engine.reset()
+
+        # Assert
+        assert self.data_engine._topics_quotes == {}
+
     def test_process_trade_tick_when_subscriber_then_sends_to_registered_handler(self):
         # Arrange
         self.data_engine.register_client(self.binance_client)
@@ -15,6 +15,7 @@
 
 import sys
 
+import numpy as np
 import pytest
 
 from nautilus_trader.indicators.atr import AverageTrueRange
@@ -171,3 +172,9 @@ class TestAverageTrueRange:
         # Assert
         assert not self.atr.initialized
         assert self.atr.value == 0
+
+
+    def test_update_raw_batch_with_unequal_lengths_raises_value_error(self):
+        # Arrange, Act, Assert
+        with pytest.raises(ValueError):
+            self.atr.update_raw_batch(np.ones(3), np.ones(3), np.ones(2))
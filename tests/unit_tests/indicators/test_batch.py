@@ -0,0 +1,102 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2023 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import numpy as np
+import pytest
+
+from nautilus_trader.indicators.aroon import AroonOscillator
+from nautilus_trader.indicators.atr import AverageTrueRange
+from nautilus_trader.indicators.average.ema import ExponentialMovingAverage
+from nautilus_trader.indicators.average.moving_average import MovingAverageType
+from nautilus_trader.indicators.average.sma import SimpleMovingAverage
+from nautilus_trader.indicators.bollinger_bands import BollingerBands
+from nautilus_trader.indicators.donchian_channel import DonchianChannel
+from nautilus_trader.indicators.keltner_channel import KeltnerChannel
+from nautilus_trader.indicators.macd import MovingAverageConvergenceDivergence
+from nautilus_trader.indicators.rsi import RelativeStrengthIndex
+
+
+SIZE = 500
+X = np.arange(SIZE, dtype=np.float64)
+CLOSE = 1.0 + 0.01 * np.sin(X / 7.0) + 0.001 * np.cos(X / 3.0)
+HIGH = CLOSE + 0.002 + 0.001 * np.sin(X / 5.0)
+LOW = CLOSE - 0.002 - 0.001 * np.cos(X / 11.0)
+PRICES = {"high": HIGH, "low": LOW, "close": CLOSE}
+
+
+class TestUpdateRawBatch:
+    @pytest.mark.parametrize("split", [0, 25])
+    @pytest.mark.parametrize(
+        ("indicator_factory", "inputs", "outputs"),
+        [
+            (lambda: SimpleMovingAverage(10), ["close"], ["value"]),
+            (lambda: ExponentialMovingAverage(10), ["close"], ["value"]),
+            (lambda: RelativeStrengthIndex(10), ["close"], ["value"]),
+            (lambda: MovingAverageConvergenceDivergence(3, 10), ["close"], ["value"]),
+            (lambda: AverageTrueRange(10), ["high", "low", "close"], ["value"]),
+            (
+                lambda: BollingerBands(20, 2.0),
+                ["high", "low", "close"],
+                ["upper", "middle", "lower"],
+            ),
+            (
+                lambda: KeltnerChannel(
+                    10,
+                    2.5,
+                    MovingAverageType.EXPONENTIAL,
+                    MovingAverageType.SIMPLE,
+                ),
+                ["high", "low", "close"],
+                ["upper", "middle", "lower"],
+            ),
+            (lambda: DonchianChannel(10), ["high", "low"], ["upper", "middle", "lower"]),
+        ],
+    )
+    def test_update_raw_batch_matches_streaming_updates(
+        self,
+        indicator_factory,
+        inputs,
+        outputs,
+        split,
+    ):
+        # Arrange
+        values = [PRICES[name] for name in inputs]
+        streaming = indicator_factory()
+        expected = []
+        for i in range(SIZE):
+            streaming.update_raw(*[v[i] for v in values])
+            expected.append([getattr(streaming, name) for name in outputs])
+
+        indicator = indicator_factory()
+        for i in range(split):
+            indicator.update_raw(*[v[i] for v in values])
+
+        # Act
+        result = indicator.update_raw_batch(*[v[split:] for v in values])
+
+        # Assert
+        series = result if isinstance(result, tuple) else (result,)
+        for j, output in enumerate(series):
+            assert np.array_equal(output, [e[j] for e in expected[split:]])
+        assert indicator.initialized
+        assert [getattr(indicator, name) for name in outputs] == expected[-1]
+
+    def test_update_raw_batch_when_not_supported_raises_not_implemented_error(self):
+        # Arrange
+        indicator = AroonOscillator(10)
+
+        # Act, Assert
+        with pytest.raises(NotImplementedError):
+            indicator.update_raw_batch(HIGH, LOW)
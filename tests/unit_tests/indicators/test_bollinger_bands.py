@@ -13,6 +13,9 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import numpy as np
+import pytest
+
 from nautilus_trader.indicators.bollinger_bands import BollingerBands
 from nautilus_trader.test_kit.providers import TestInstrumentProvider
 from nautilus_trader.test_kit.stubs.data import TestDataStubs
@@ -144,3 +147,9 @@ class TestBollingerBands:
         assert indicator.upper == 0
         assert indicator.middle == 0
         assert indicator.lower == 0
+
+
+    def test_update_raw_batch_with_unequal_lengths_raises_value_error(self):
+        # Arrange, Act, Assert
+        with pytest.raises(ValueError):
+            BollingerBands(20, 2.0).update_raw_batch(np.ones(3), np.ones(2), np.ones(3))
@@ -13,6 +13,9 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import numpy as np
+import pytest
+
 from nautilus_trader.indicators.donchian_channel import DonchianChannel
 from nautilus_trader.test_kit.providers import TestInstrumentProvider
 from nautilus_trader.test_kit.stubs.data import TestDataStubs
@@ -132,3 +135,9 @@ class TestDonchianChannel:
         assert self.dc.upper == 0
         assert self.dc.middle == 0
         assert self.dc.lower == 0
+
+
+    def test_update_raw_batch_with_unequal_lengths_raises_value_error(self):
+        # Arrange, Act, Assert
+        with pytest.raises(ValueError):
+            self.dc.update_raw_batch(np.ones(3), np.ones(2))
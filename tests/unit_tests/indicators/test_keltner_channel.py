@@ -13,6 +13,9 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import numpy as np
+import pytest
+
 from nautilus_trader.indicators.average.moving_average import MovingAverageType
 from nautilus_trader.indicators.keltner_channel import KeltnerChannel
 from nautilus_trader.test_kit.providers import TestInstrumentProvider
@@ -108,3 +111,9 @@ class TestKeltnerChannel:
 
         # Assert
         assert not self.kc.initialized
+
+
+    def test_update_raw_batch_with_unequal_lengths_raises_value_error(self):
+        # Arrange, Act, Assert
+        with pytest.raises(ValueError):
+            self.kc.update_raw_batch(np.ones(2), np.ones(3), np.ones(3))
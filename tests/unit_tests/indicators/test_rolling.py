@@ -0,0 +1,133 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2023 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import math
+import pickle
+
+import numpy as np
+import pytest
+
+from nautilus_trader.indicators.base.rolling import RollingMeanVariance
+from nautilus_trader.indicators.base.rolling import RollingMinMax
+from nautilus_trader.indicators.base.rolling import RollingRegression
+from nautilus_trader.indicators.base.rolling import RollingSum
+
+
+class TestRollingWindows:
+    @pytest.mark.parametrize(
+        "window_cls",
+        [RollingSum, RollingMeanVariance, RollingMinMax, RollingRegression],
+    )
+    def test_instantiate_with_invalid_capacity_raises_value_error(self, window_cls):
+        # Arrange, Act, Assert
+        with pytest.raises(ValueError):
+            window_cls(0)
+
+    def test_values_when_capacity_exceeded_evicts_oldest(self):
+        # Arrange
+        window = RollingSum(3)
+
+        # Act
+        for value in [1.0, 2.0, 3.0, 4.0, 5.0]:
+            window.update(value)
+
+        # Assert
+        assert window.is_full()
+        assert window.count == 3
+        assert window.values() == [3.0, 4.0, 5.0]
+        assert window.last() == 5.0
+        assert window.sum == 12.0
+        assert window.mean() == 4.0
+
+    def test_reset_clears_window(self):
+        # Arrange
+        window = RollingMinMax(3)
+        window.update(1.0)
+        window.update(2.0)
+
+        # Act
+        window.reset()
+
+        # Assert
+        assert window.count == 0
+        assert window.values() == []
+        assert window.max() == 0.0
+        assert window.min() == 0.0
+
+    def test_pickling_round_trip_preserves_window(self):
+        # Arrange
+        window = RollingMeanVariance(3)
+        for value in [1.0, 2.0, 4.0, 8.0]:
+            window.update(value)
+
+        # Act
+        unpickled = pickle.loads(pickle.dumps(window))  # noqa S301 (pickle is safe here)
+
+        # Assert
+        assert unpickled.values() == [2.0, 4.0, 8.0]
+        assert unpickled.mean == window.mean
+        assert unpickled.variance() == window.variance()
+
+    @pytest.mark.parametrize("capacity", [1, 2, 5, 50])
+    def test_rolling_statistics_match_full_recalculation(self, capacity):
+        # Arrange
+        rng = np.random.default_rng(42)
+        values = 1.0 + rng.integers(0, 100, size=3_000) / 10_000
+        mean_var = RollingMeanVariance(capacity)
+        min_max = RollingMinMax(capacity)
+        regression = RollingRegression(capacity)
+
+        # Act, Assert
+        for i, value in enumerate(values):
+            mean_var.update(value)
+            min_max.update(value)
+            regression.update(value)
+
+            window = values[max(0, i + 1 - capacity) : i + 1]
+            assert mean_var.mean == pytest.approx(np.mean(window), abs=1e-12)
+            assert mean_var.variance() == pytest.approx(np.var(window), abs=1e-12)
+            assert min_max.max() == np.max(window)
+            assert min_max.min() == np.min(window)
+            if len(window) > 1:
+                x = np.arange(1, len(window) + 1)
+                slope, intercept = np.polyfit(x, window, 1)
+                assert regression.slope() == pytest.approx(slope, abs=1e-9)
+                assert regression.intercept() == pytest.approx(intercept, abs=1e-9)
+
+    def test_std_with_mean_returns_deviation_about_given_mean(self):
+        # Arrange
+        window = RollingMeanVariance(4)
+        for value in [1.0, 2.0, 3.0, 4.0]:
+            window.update(value)
+
+        # Act
+        result = window.std_with_mean(3.0)
+
+        # Assert
+        assert result == pytest.approx(math.sqrt(np.mean((np.array([1.0, 2.0, 3.0, 4.0]) - 3.0) ** 2)))
+
+    def test_regression_with_linear_values(self):
+        # Arrange
+        window = RollingRegression(4)
+
+        # Act
+        for value in range(1, 11):
+            window.update(float(value))
+
+        # Assert
+        assert window.slope() == 1.0
+        assert window.intercept() == 6.0
+        assert window.fitted(4) == 10.0
+        assert window.r_squared() == 1.0
@@ -17,6 +17,7 @@ import asyncio
 
 import pytest
 
+from nautilus_trader.common import QueueOverflowPolicy
 from nautilus_trader.common.clock import LiveClock
 from nautilus_trader.common.logging import Logger
 from nautilus_trader.config import LiveDataEngineConfig
@@ -236,6 +237,57 @@ class TestLiveDataEngine:
         assert self.engine.data_qsize() == 1
         assert self.engine.data_count == 0
 
+    @pytest.mark.asyncio()
+    async def test_data_qsize_at_max_with_drop_oldest_policy_drops_data(self):
+        # Arrange
+        self.msgbus.deregister(endpoint="DataEngine.execute", handler=self.engine.execute)
+        self.msgbus.deregister(endpoint="DataEngine.process", handler=self.engine.process)
+        self.msgbus.deregister(endpoint="DataEngine.request", handler=self.engine.request)
+        self.msgbus.deregister(endpoint="DataEngine.response", handler=self.engine.response)
+
+        self.engine = LiveDataEngine(
+            loop=self.loop,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+            logger=self.logger,
+            config=LiveDataEngineConfig(
+                qsize=1,
+                qoverflow_policy=QueueOverflowPolicy.DROP_OLDEST,
+            ),
+        )
+
+        # Act
+        self.engine.process(Data(1_000_000_000, 1_000_000_000))
+        self.engine.process(Data(2_000_000_000, 2_000_000_000))  # Add over max size
+        await asyncio.sleep(0.1)
+
+        # Assert
+        telemetry = self.engine.queue_telemetry()["data_queue"]
+        assert self.engine.data_qsize() == 1
+        assert telemetry["dropped_count"] == 1
+        assert telemetry["blocked_count"] == 0
+        assert telemetry["high_water_mark"] == 1
+
+    @pytest.mark.asyncio()
+    async def test_queue_telemetry_records_latency_for_processed_data(self):
+        # Arrange
+        self.engine.start()
+
+        # Act
+        self.engine.process(TestDataStubs.quote_tick(ts_init=self.clock.timestamp_ns()))
+        await asyncio.sleep(0.1)
+
+        # Assert
+        telemetry = self.engine.queue_telemetry()
+        assert list(telemetry) == ["cmd_queue", "req_queue", "res_queue", "data_queue"]
+        assert telemetry["data_queue"]["put_count"] == 1
+        assert telemetry["data_queue"]["get_count"] == 1
+        assert telemetry["data_queue"]["latency"]["count"] == 1
+
+        # Tear Down
+        self.engine.stop()
+
     @pytest.mark.asyncio()
     async def test_start(self):
         # Arrange, Act
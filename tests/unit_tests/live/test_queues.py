@@ -0,0 +1,216 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2023 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import pytest
+
+from nautilus_trader.common import QueueOverflowPolicy
+from nautilus_trader.common.clock import TestClock
+from nautilus_trader.common.logging import Logger
+from nautilus_trader.common.logging import LoggerAdapter
+from nautilus_trader.live.queues import EngineQueue
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+from nautilus_trader.test_kit.stubs.data import TestDataStubs
+
+
+AUDUSD_SIM = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+GBPUSD_SIM = TestInstrumentProvider.default_fx_ccy("GBP/USD")
+
+
+class TestEngineQueue:
+    def setup(self):
+        # Fixture Setup
+        self.clock = TestClock()
+        self.logger = LoggerAdapter("test", Logger(self.clock, bypass=True))
+
+    def create_queue(
+        self,
+        maxsize: int,
+        overflow_policy: QueueOverflowPolicy = QueueOverflowPolicy.BLOCK,
+    ) -> EngineQueue:
+        return EngineQueue(
+            "data_queue",
+            self.clock,
+            self.logger,
+            maxsize=maxsize,
+            overflow_policy=overflow_policy,
+        )
+
+    def test_instantiate(self):
+        # Arrange, Act
+        queue = self.create_queue(maxsize=10)
+
+        # Assert
+        assert queue.name == "data_queue"
+        assert queue.qsize() == 0
+        assert queue.empty()
+        assert not queue.full()
+        assert queue.telemetry()["high_water_mark"] == 0
+
+    def test_put_and_get_is_fifo(self):
+        # Arrange
+        queue = self.create_queue(maxsize=10)
+
+        # Act
+        queue.put("a")
+        queue.put("b")
+
+        # Assert
+        assert queue.get_nowait() == "a"
+        assert queue.get_nowait() == "b"
+        assert queue.empty()
+
+    def test_block_policy_holds_items_on_backlog_in_order(self):
+        # Arrange
+        queue = self.create_queue(maxsize=2)
+
+        # Act
+        for item in ("a", "b", "c", "d"):
+            queue.put(item)
+
+        # Assert
+        assert queue.qsize() == 2
+        assert queue.backlog_size() == 2
+        assert [queue.get_nowait() for _ in range(4)] == ["a", "b", "c", "d"]
+        assert queue.empty()
+        telemetry = queue.telemetry()
+        assert telemetry["blocked_count"] == 2
+        assert telemetry["dropped_count"] == 0
+        assert telemetry["high_water_mark"] == 4
+
+    def test_drop_oldest_policy_drops_oldest_items(self):
+        # Arrange
+        queue = self.create_queue(maxsize=2, overflow_policy=QueueOverflowPolicy.DROP_OLDEST)
+
+        # Act
+        for item in ("a", "b", "c", "d"):
+            queue.put(item)
+
+        # Assert
+        assert queue.qsize() == 2
+        assert queue.backlog_size() == 0
+        assert [queue.get_nowait() for _ in range(2)] == ["c", "d"]
+        assert queue.telemetry()["dropped_count"] == 2
+
+    def test_drop_oldest_policy_does_not_drop_sentinel(self):
+        # Arrange
+        queue = self.create_queue(maxsize=1, overflow_policy=QueueOverflowPolicy.DROP_OLDEST)
+        queue.put_nowait(None)
+
+        # Act
+        queue.put("a")
+
+        # Assert
+        assert queue.get_nowait() is None
+        assert queue.get_nowait() == "a"
+
+    def test_coalesce_policy_replaces_pending_quote_for_same_instrument(self):
+        # Arrange
+        queue = self.create_queue(maxsize=2, overflow_policy=QueueOverflowPolicy.COALESCE)
+        audusd1 = TestDataStubs.quote_tick(AUDUSD_SIM, bid=1.0, ask=1.1)
+        gbpusd1 = TestDataStubs.quote_tick(GBPUSD_SIM, bid=1.0, ask=1.1)
+        audusd2 = TestDataStubs.quote_tick(AUDUSD_SIM, bid=2.0, ask=2.1)
+
+        # Act
+        queue.put(audusd1)
+        queue.put(gbpusd1)
+        queue.put(audusd2)  # Queue full
+
+        # Assert
+        assert queue.qsize() == 2
+        assert queue.get_nowait() == audusd2  # Keeps queue position of the replaced quote
+        assert queue.get_nowait() == gbpusd1
+        telemetry = queue.telemetry()
+        assert telemetry["coalesced_count"] == 1
+        assert telemetry["dropped_count"] == 0
+
+    def test_coalesce_policy_drops_oldest_when_not_coalescable(self):
+        # Arrange
+        queue = self.create_queue(maxsize=2, overflow_policy=QueueOverflowPolicy.COALESCE)
+        quote = TestDataStubs.quote_tick(AUDUSD_SIM)
+        trade1 = TestDataStubs.trade_tick(AUDUSD_SIM)
+        trade2 = TestDataStubs.trade_tick(AUDUSD_SIM)
+
+        # Act
+        queue.put(quote)
+        queue.put(trade1)
+        queue.put(trade2)  # Queue full
+
+        # Assert
+        assert [queue.get_nowait() for _ in range(2)] == [trade1, trade2]
+        assert queue.telemetry()["dropped_count"] == 1
+
+    def test_coalesce_after_dequeue_does_not_replace_taken_quote(self):
+        # Arrange
+        queue = self.create_queue(maxsize=1, overflow_policy=QueueOverflowPolicy.COALESCE)
+        quote1 = TestDataStubs.quote_tick(AUDUSD_SIM, bid=1.0, ask=1.1)
+        quote2 = TestDataStubs.quote_tick(AUDUSD_SIM, bid=2.0, ask=2.1)
+        quote3 = TestDataStubs.quote_tick(AUDUSD_SIM, bid=3.0, ask=3.1)
+        queue.put(quote1)
+        assert queue.get_nowait() == quote1
+
+        # Act
+        queue.put(quote2)
+        queue.put(quote3)  # Queue full
+
+        # Assert
+        assert queue.qsize() == 1
+        assert queue.get_nowait() == quote3
+        assert queue.telemetry()["coalesced_count"] == 1
+
+    def test_get_records_latency_from_ts_init(self):
+        # Arrange
+        queue = self.create_queue(maxsize=10)
+        queue.put(TestDataStubs.quote_tick(AUDUSD_SIM, ts_init=1_000))
+        queue.put("no-timestamp")
+        self.clock.set_time(5_000)
+
+        # Act
+        queue.get_nowait()
+        queue.get_nowait()
+
+        # Assert
+        latency = queue.telemetry()["latency"]
+        assert latency["count"] == 1
+        assert latency["max_ns"] == 4_000
+        assert queue.telemetry()["get_count"] == 2
+
+    def test_reset_telemetry(self):
+        # Arrange
+        queue = self.create_queue(maxsize=1)
+        queue.put("a")
+        queue.put("b")
+        queue.get_nowait()
+
+        # Act
+        queue.reset_telemetry()
+
+        # Assert
+        telemetry = queue.telemetry()
+        assert telemetry["put_count"] == 0
+        assert telemetry["blocked_count"] == 0
+        assert telemetry["high_water_mark"] == 1
+        assert telemetry["latency"]["count"] == 0
+
+    @pytest.mark.asyncio()
+    async def test_get_awaits_next_item(self):
+        # Arrange
+        queue = self.create_queue(maxsize=10)
+        queue.put("a")
+
+        # Act
+        result = await queue.get()
+
+        # Assert
+        assert result == "a"
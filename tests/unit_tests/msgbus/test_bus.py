@@ -17,6 +17,7 @@ import pytest
 
 from nautilus_trader.common.clock import TestClock
 from nautilus_trader.common.logging import Logger
+from nautilus_trader.common.profiling import Profiler
 from nautilus_trader.core.message import Request
 from nautilus_trader.core.message import Response
 from nautilus_trader.core.uuid import UUID4
@@ -446,6 +447,112 @@ class TestMessageBus:
         assert len(subscriber) == 2
         assert subscriber == ["DUMMY EVENT", "TRADER EVENT"]
 
+    def test_publish_sends_to_subscribers_in_priority_then_subscription_order(self):
+        # Arrange
+        received = []
+
+        self.msgbus.subscribe(topic="data.quotes.*", handler=lambda m: received.append("wildcard"))
+        self.msgbus.subscribe(topic="data.quotes.SIM.AUD/USD", handler=lambda m: received.append("exact"))
+        self.msgbus.subscribe(topic="*", handler=lambda m: received.append("priority"), priority=10)
+
+        # Act
+        self.msgbus.publish("data.quotes.SIM.AUD/USD", "QUOTE")
+
+        # Assert
+        assert received == ["priority", "wildcard", "exact"]
+
+    def test_subscribe_after_publish_then_receives_messages_on_resolved_topic(self):
+        # Arrange
+        handler1 = []
+        handler2 = []
+        self.msgbus.publish("data.trades.SIM.AUD/USD", "message1")
+
+        # Act
+        self.msgbus.subscribe(topic="data.trades.SIM.AUD/USD", handler=handler1.append)
+        self.msgbus.subscribe(topic="data.?rades.SIM.*", handler=handler2.append)
+        self.msgbus.publish("data.trades.SIM.AUD/USD", "message2")
+
+        # Assert
+        assert handler1 == ["message2"]
+        assert handler2 == ["message2"]
+
+    def test_unsubscribe_after_publish_then_no_longer_receives_messages(self):
+        # Arrange
+        handler1 = []
+        handler2 = []
+        self.msgbus.subscribe(topic="data.trades.*", handler=handler1.append)
+        self.msgbus.subscribe(topic="data.trades.SIM.AUD/USD", handler=handler2.append)
+        self.msgbus.publish("data.trades.SIM.AUD/USD", "message1")
+
+        # Act
+        self.msgbus.unsubscribe(topic="data.trades.*", handler=handler1.append)
+        self.msgbus.unsubscribe(topic="data.trades.SIM.AUD/USD", handler=handler2.append)
+        self.msgbus.publish("data.trades.SIM.AUD/USD", "message2")
+        self.msgbus.subscribe(topic="data.trades.*", handler=handler1.append)
+        self.msgbus.publish("data.trades.SIM.AUD/USD", "message3")
+
+        # Assert
+        assert handler1 == ["message1", "message3"]
+        assert handler2 == ["message1"]
+        assert self.msgbus.topics() == ["data.trades.*"]
+
+    def test_profiler_is_none_by_default(self):
+        # Arrange, Act, Assert
+        assert self.msgbus.profiler is None
+
+    def test_send_with_profiler_records_endpoint_timing(self):
+        # Arrange
+        profiler = Profiler()
+        self.msgbus.set_profiler(profiler)
+
+        endpoint = []
+        self.msgbus.register(endpoint="mailbox", handler=endpoint.append)
+
+        # Act
+        self.msgbus.send(endpoint="mailbox", msg="message1")
+        self.msgbus.send(endpoint="mailbox", msg="message2")
+
+        # Assert
+        assert endpoint == ["message1", "message2"]
+        assert profiler.names() == ["send:mailbox"]
+        assert profiler.histogram("send:mailbox").count == 2
+
+    def test_publish_with_profiler_records_timing_per_handler(self):
+        # Arrange
+        profiler = Profiler()
+        self.msgbus.set_profiler(profiler)
+
+        handler1 = []
+        handler2 = []
+        self.msgbus.subscribe(topic="data.quotes.*", handler=handler1.append)
+        self.msgbus.subscribe(topic="data.*", handler=handler2.extend)
+
+        # Act
+        self.msgbus.publish("data.quotes.SIM.AUD/USD", ["message1"])
+        self.msgbus.publish("data.trades.SIM.AUD/USD", ["message2"])
+
+        # Assert
+        assert handler1 == [["message1"]]
+        assert handler2 == ["message1", "message2"]
+        assert profiler.names() == ["handler:list.append", "handler:list.extend"]
+        assert profiler.histogram("handler:list.append").count == 1
+        assert profiler.histogram("handler:list.extend").count == 2
+
+    def test_set_profiler_none_disables_profiling(self):
+        # Arrange
+        profiler = Profiler()
+        self.msgbus.set_profiler(profiler)
+        self.msgbus.subscribe(topic="*", handler=self.handler.append)
+
+        # Act
+        self.msgbus.set_profiler(None)
+        self.msgbus.publish("events", "message1")
+
+        # Assert
+        assert self.handler == ["message1"]
+        assert self.msgbus.profiler is None
+        assert profiler.names() == []
+
 
 @pytest.mark.parametrize(
     ("topic", "pattern", "expected"),
@@ -459,6 +566,11 @@ class TestMessageBus:
         ["data.quotes.BINANCE", "data.*.BINANCE", True],
         ["data.trades.BINANCE.ETHUSDT", "data.*.BINANCE.*", True],
         ["data.trades.BINANCE.ETHUSDT", "data.*.BINANCE.ETH*", True],
+        ["data.trades.BINANCE.ETHUSDT", "data.*.BINANCE.BTC*", False],
+        ["data.quotes.BINANCE", "data.quotes", False],
+        ["data.quotes", "data.quotes.*", False],
+        ["data.quotes.BINANCE", "data.?uotes.*", True],
+        ["data.quotes.BINANCE", "data.??uotes.*", False],
     ],
 )
 def test_is_matching_given_various_topic_pattern_combos(topic, pattern, expected):
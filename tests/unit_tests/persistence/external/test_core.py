@@ -14,7 +14,9 @@
 # -------------------------------------------------------------------------------------------------
 
 import asyncio
+import os
 import pickle
+import signal
 import sys
 
 import fsspec
@@ -45,6 +47,8 @@ from nautilus_trader.persistence.external.core import write_objects
 from nautilus_trader.persistence.external.core import write_parquet
 from nautilus_trader.persistence.external.core import write_parquet_rust
 from nautilus_trader.persistence.external.core import write_tables
+from nautilus_trader.persistence.external.pipeline import IngestState
+from nautilus_trader.persistence.external.pipeline import process_files_parallel
 from nautilus_trader.persistence.external.readers import CSVReader
 from nautilus_trader.persistence.wranglers import QuoteTickDataWrangler
 from nautilus_trader.test_kit.mocks.data import NewsEventData
@@ -59,6 +63,11 @@ from tests.integration_tests.adapters.betfair.test_kit import BetfairTestStubs
 pytestmark = pytest.mark.skip(reason="WIP pending catalog refactor")
 
 
+def _kill_worker_parser(block):
+    # Simulates a worker process being killed (e.g. by the OOM killer)
+    os.kill(os.getpid(), signal.SIGKILL)
+
+
 class _TestPersistenceCore:
     def setup(self) -> None:
         self.catalog = data_catalog_setup(protocol=self.fs_protocol)  # type: ignore
@@ -380,6 +389,62 @@ class _TestPersistenceCore:
         assert None in split[NewsEventData]
         assert len(split[NewsEventData][None]) == 22941
 
+    def test_process_files_parallel(self):
+        # Arrange
+        TestPersistenceStubs.setup_news_event_persistence()
+
+        # Act
+        result = process_files_parallel(
+            glob_path=f"{TEST_DATA_DIR}/news_events.csv",
+            reader=CSVReader(block_parser=TestPersistenceStubs.news_event_parser),
+            catalog=self.catalog,
+            block_size="100kb",
+            workers=2,
+            progress=False,
+            worker_initializer=TestPersistenceStubs.setup_news_event_persistence,
+        )
+
+        # Assert
+        objs = self.catalog.generic_data(cls=NewsEventData, as_nautilus=True)
+        assert list(result.values()) == [86985]
+        assert len(objs) == 86985
+        state = IngestState.load(fs=self.fs, root=self.catalog.path)
+        assert all(file_state.complete for file_state in state.files.values())
+
+    def test_process_files_parallel_skips_ingested_files(self):
+        # Arrange
+        TestPersistenceStubs.setup_news_event_persistence()
+        kwargs = {
+            "glob_path": f"{TEST_DATA_DIR}/news_events.csv",
+            "reader": CSVReader(block_parser=TestPersistenceStubs.news_event_parser),
+            "catalog": self.catalog,
+            "block_size": "100kb",
+            "progress": False,
+            "worker_initializer": TestPersistenceStubs.setup_news_event_persistence,
+        }
+        process_files_parallel(**kwargs)
+        files = self.fs.glob(f"{self.catalog.path}/data/**/*.parquet")
+
+        # Act
+        result = process_files_parallel(**kwargs)
+
+        # Assert
+        assert list(result.values()) == [86985]
+        assert self.fs.glob(f"{self.catalog.path}/data/**/*.parquet") == files
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="Signals not supported on windows")
+    def test_process_files_parallel_when_worker_killed_raises_runtime_error(self):
+        # Arrange, Act, Assert
+        with pytest.raises(RuntimeError, match="exited while processing"):
+            process_files_parallel(
+                glob_path=f"{TEST_DATA_DIR}/news_events.csv",
+                reader=CSVReader(block_parser=_kill_worker_parser),
+                catalog=self.catalog,
+                block_size="100kb",
+                workers=1,
+                progress=False,
+            )
+
     @pytest.mark.skipif(sys.platform == "win32", reason="Failing on windows and being rewritten")
     def test_catalog_generic_data_not_overwritten(self):
         # Arrange
@@ -510,6 +575,34 @@ class TestPersistenceCoreFile(_TestPersistenceCore):
             f"{self.catalog.path}/sample.parquet/instrument_id=b/",
         )
 
+    def test_write_parquet_overwriting_file_writes_sorted_file(self):
+        # Arrange
+        fs = self.catalog.fs
+        root = self.catalog.path
+        schema = pa.schema({"value": pa.int64(), "ts_init": pa.uint64()})
+        write_parquet(
+            fs=fs,
+            path=f"{root}/sample.parquet",
+            df=pd.DataFrame({"value": [1, 2, 3], "ts_init": [1, 2, 3]}),
+            schema=schema,
+            partition_cols=None,
+        )
+
+        # Act (same time range, so the same basename is overwritten)
+        written = write_parquet(
+            fs=fs,
+            path=f"{root}/sample.parquet",
+            df=pd.DataFrame({"value": [6, 4, 5], "ts_init": [3, 1, 2]}),
+            schema=schema,
+            partition_cols=None,
+        )
+
+        # Assert
+        table = pq.read_table(written[0], filesystem=fs)
+        assert fs.glob(f"{root}/sample.parquet/*.parquet") == written
+        assert table.column("ts_init").to_pylist() == [1, 2, 3]
+        assert table.column("value").to_pylist() == [4, 5, 6]
+
     @pytest.mark.skip(reason="Implement with new Rust datafusion backend")
     def test_process_files_use_rust_writes_expected(self):
         # Arrange
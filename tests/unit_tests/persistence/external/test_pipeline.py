@@ -0,0 +1,88 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2023 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import fsspec
+
+from nautilus_trader.persistence.external.pipeline import IngestFileState
+from nautilus_trader.persistence.external.pipeline import IngestState
+
+
+class TestIngestState:
+    def setup(self):
+        # Fixture Setup
+        self.fs = fsspec.filesystem("memory")
+        self.root = "/ingest_state_catalog"
+        self.fs.mkdir(self.root, create_parents=True)
+
+    def teardown(self):
+        # Cleanup
+        if self.fs.exists(self.root):
+            self.fs.rm(self.root, recursive=True)
+
+    def test_resume_from_new_file_starts_at_first_block(self):
+        # Arrange
+        state = IngestState(fs=self.fs, root=self.root)
+
+        # Act, Assert
+        assert state.resume_from("raw/a.csv", "abc") == 0
+
+    def test_resume_from_partially_committed_file(self):
+        # Arrange
+        state = IngestState(fs=self.fs, root=self.root)
+        state.commit_block("raw/a.csv", "abc", block=0, rows=10)
+        state.commit_block("raw/a.csv", "abc", block=1, rows=5)
+
+        # Act
+        loaded = IngestState.load(fs=self.fs, root=self.root)
+
+        # Assert
+        assert loaded.resume_from("raw/a.csv", "abc") == 2
+        assert loaded.files["raw/a.csv"] == IngestFileState(fingerprint="abc", blocks=2, rows=15)
+
+    def test_resume_from_completed_file_returns_none(self):
+        # Arrange
+        state = IngestState(fs=self.fs, root=self.root)
+        state.commit_block("raw/a.csv", "abc", block=0, rows=10)
+        state.complete("raw/a.csv", "abc")
+
+        # Act
+        loaded = IngestState.load(fs=self.fs, root=self.root)
+
+        # Assert
+        assert loaded.resume_from("raw/a.csv", "abc") is None
+
+    def test_resume_from_changed_file_starts_again(self):
+        # Arrange
+        state = IngestState(fs=self.fs, root=self.root)
+        state.commit_block("raw/a.csv", "abc", block=0, rows=10)
+        state.complete("raw/a.csv", "abc")
+
+        # Act, Assert
+        assert state.resume_from("raw/a.csv", "changed") == 0
+
+    def test_write_replaces_state_file(self):
+        # Arrange
+        state = IngestState(fs=self.fs, root=self.root)
+
+        # Act
+        state.commit_block("raw/a.csv", "abc", block=0, rows=10)
+        state.commit_block("raw/b.csv", "def", block=0, rows=20)
+
+        # Assert
+        assert self.fs.glob(f"{self.root}/_ingest_state.json*") == [state.path]
+        assert sorted(IngestState.load(fs=self.fs, root=self.root).files) == [
+            "raw/a.csv",
+            "raw/b.csv",
+        ]
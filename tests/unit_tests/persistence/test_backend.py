@@ -16,11 +16,17 @@
 import os
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 from nautilus_trader import PACKAGE_ROOT
 from nautilus_trader.core.nautilus_pyo3.persistence import DataBackendSession
 from nautilus_trader.core.nautilus_pyo3.persistence import NautilusDataType
+from nautilus_trader.model.data import Bar
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
 from nautilus_trader.persistence.wranglers import list_from_capsule
+from nautilus_trader.test_kit.stubs.data import TestDataStubs
 
 
 def test_python_catalog_data():
@@ -85,3 +91,62 @@ def test_python_catalog_order_book():
     assert len(ticks) == 1077
     is_ascending = all(ticks[i].ts_init <= ticks[i].ts_init for i in range(len(ticks) - 1))
     assert is_ascending
+
+
+def test_python_catalog_bars(tmp_path):
+    # Arrange
+    bar_type = TestDataStubs.bartype_audusd_1min_bid()
+    parquet_data_path = str(tmp_path / "bars.parquet")
+    table = pa.table(
+        {
+            "open": pa.array([1_000_020_000, 1_000_030_000], type=pa.int64()),
+            "high": pa.array([1_000_040_000, 1_000_050_000], type=pa.int64()),
+            "low": pa.array([1_000_010_000, 1_000_020_000], type=pa.int64()),
+            "close": pa.array([1_000_030_000, 1_000_040_000], type=pa.int64()),
+            "volume": pa.array([1_000_000_000_000_000, 2_000_000_000_000_000], type=pa.uint64()),
+            "ts_event": pa.array([60_000_000_000, 120_000_000_000], type=pa.uint64()),
+            "ts_init": pa.array([60_000_000_001, 120_000_000_001], type=pa.uint64()),
+        },
+    ).replace_schema_metadata(
+        {"bar_type": str(bar_type), "price_precision": "5", "size_precision": "0"},
+    )
+    pq.write_table(table, parquet_data_path)
+
+    session = DataBackendSession()
+    session.add_file("bars", parquet_data_path, NautilusDataType.Bar)
+
+    # Act
+    bars = []
+    for chunk in session.to_query_result():
+        bars.extend(list_from_capsule(chunk))
+
+    # Assert
+    assert bars == [
+        Bar(
+            bar_type=bar_type,
+            open=Price.from_str("1.00002"),
+            high=Price.from_str("1.00004"),
+            low=Price.from_str("1.00001"),
+            close=Price.from_str("1.00003"),
+            volume=Quantity.from_int(1_000_000),
+            ts_event=60_000_000_000,
+            ts_init=60_000_000_001,
+        ),
+        Bar(
+            bar_type=bar_type,
+            open=Price.from_str("1.00003"),
+            high=Price.from_str("1.00005"),
+            low=Price.from_str("1.00002"),
+            close=Price.from_str("1.00004"),
+            volume=Quantity.from_int(2_000_000),
+            ts_event=120_000_000_000,
+            ts_init=120_000_000_001,
+        ),
+    ]
+    assert [bar.bar_type for bar in bars] == [bar_type, bar_type]
+    assert [bar.open for bar in bars] == [Price.from_str("1.00002"), Price.from_str("1.00003")]
+    assert [bar.volume for bar in bars] == [
+        Quantity.from_int(1_000_000),
+        Quantity.from_int(2_000_000),
+    ]
+    assert [bar.ts_init for bar in bars] == [60_000_000_001, 120_000_000_001]
@@ -18,6 +18,7 @@ import os
 from decimal import Decimal
 
 import fsspec
+import pyarrow as pa
 import pyarrow.dataset as ds
 import pytest
 
@@ -35,6 +36,7 @@ from nautilus_trader.model.instruments.betting import BettingInstrument
 from nautilus_trader.model.instruments.equity import Equity
 from nautilus_trader.model.objects import Price
 from nautilus_trader.model.objects import Quantity
+from nautilus_trader.persistence.catalog.parquet import map_table_columns
 from nautilus_trader.persistence.external.core import dicts_to_dataframes
 from nautilus_trader.persistence.external.core import process_files
 from nautilus_trader.persistence.external.core import split_and_serialize
@@ -680,3 +682,27 @@ class TestPersistenceCatalogFile(_TestPersistenceCatalog):
 
 class TestPersistenceCatalogMemory(_TestPersistenceCatalog):
     fs_protocol = "memory"
+
+
+def test_map_table_columns_maps_distinct_values_and_keeps_unmapped():
+    # Arrange
+    table = pa.table(
+        {
+            "instrument_id": ["AUD-USD.SIM", "EUR-USD.SIM", "AUD-USD.SIM", "GBP-USD.SIM"],
+            "ts_init": [0, 1, 2, 3],
+        },
+    )
+    mappings = {"instrument_id": {"AUD-USD.SIM": "AUD/USD.SIM", "EUR-USD.SIM": "EUR/USD.SIM"}}
+
+    # Act
+    result = map_table_columns(table, mappings)
+
+    # Assert
+    assert result.column_names == ["instrument_id", "ts_init"]
+    assert result.column("instrument_id").to_pylist() == [
+        "AUD/USD.SIM",
+        "EUR/USD.SIM",
+        "AUD/USD.SIM",
+        "GBP-USD.SIM",
+    ]
+    assert result.column("ts_init").to_pylist() == [0, 1, 2, 3]
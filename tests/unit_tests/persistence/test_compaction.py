@@ -0,0 +1,193 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2023 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from nautilus_trader.persistence.catalog.compaction import CatalogCompactor
+from nautilus_trader.persistence.catalog.manifest import CatalogManifest
+from nautilus_trader.test_kit.mocks.data import data_catalog_setup
+
+
+FOLDER = "data/quote_tick.parquet/instrument_id=AUD-USD.SIM"
+
+
+class TestCatalogCompactor:
+    def setup(self):
+        # Fixture Setup
+        self.catalog = data_catalog_setup(protocol="memory")
+        self.fs = self.catalog.fs
+        self.root = self.catalog.path
+
+    def teardown(self):
+        # Cleanup
+        if self.fs.exists(self.root):
+            self.fs.rm(self.root, recursive=True)
+
+    def _write_file(self, name: str, ts_inits: list[int], values: list[int]) -> str:
+        table = pa.table(
+            {
+                "value": pa.array(values, type=pa.int64()),
+                "ts_init": pa.array(ts_inits, type=pa.uint64()),
+            },
+        )
+        path = f"{self.root}/{FOLDER}/{name}"
+        with self.fs.open(path, "wb") as f:
+            pq.write_table(table, f)
+        self.catalog.update_manifest(added=[path], create=True)
+        return path
+
+    def _compactor(self, **kwargs) -> CatalogCompactor:
+        kwargs.setdefault("period", pd.Timedelta(100))
+        kwargs.setdefault("retention", pd.Timedelta(0))
+        return CatalogCompactor(fs=self.fs, root=self.root, **kwargs)
+
+    def _read(self, paths: list[str]) -> pa.Table:
+        return pa.concat_tables(pq.read_table(p, filesystem=self.fs) for p in sorted(paths))
+
+    def test_pending_groups_by_directory_and_period(self):
+        # Arrange
+        first = self._write_file("1-50-0.parquet", [1, 50], [1, 2])
+        second = self._write_file("60-90-0.parquet", [60, 90], [3, 4])
+        third = self._write_file("120-150-0.parquet", [120, 150], [5, 6])
+
+        # Act
+        pending = self._compactor().pending()
+
+        # Assert
+        assert [(g.start_ns, len(g.files)) for g in pending] == [(0, 2), (100, 1)]
+        assert pending[0].directory == FOLDER
+        assert pending[0].files == [p[len(self.root) + 1 :] for p in (first, second)]
+        assert pending[1].files == [third[len(self.root) + 1 :]]
+
+    def test_compact_merges_sorts_and_drops_duplicates(self):
+        # Arrange
+        self._write_file("1-5-0.parquet", [1, 3, 5], [1, 3, 5])
+        self._write_file("2-4-0.parquet", [2, 3, 4], [2, 3, 4])
+
+        # Act
+        written = self._compactor(batch_size=1).compact()
+
+        # Assert
+        table = self._read(written)
+        assert len(written) == 1
+        assert table.column("ts_init").to_pylist() == [1, 2, 3, 4, 5]
+        assert table.column("value").to_pylist() == [1, 2, 3, 4, 5]
+
+    def test_compact_keeps_rows_with_equal_timestamps_across_batches(self):
+        # Arrange
+        self._write_file("1-3-0.parquet", [1, 2, 2, 2, 3], [1, 2, 3, 4, 8])
+        self._write_file("2-3-0.parquet", [2, 2, 3], [5, 6, 7])
+
+        # Act
+        written = self._compactor(batch_size=2).compact()
+
+        # Assert
+        table = self._read(written)
+        assert table.column("ts_init").to_pylist() == [1, 2, 2, 2, 2, 2, 3, 3]
+        assert table.column("value").to_pylist() == [1, 2, 3, 4, 5, 6, 8, 7]
+
+    def test_compact_splits_files_by_period(self):
+        # Arrange
+        self._write_file("10-250-0.parquet", [10, 20, 150, 250], [1, 2, 3, 4])
+
+        # Act
+        written = self._compactor().compact()
+
+        # Assert
+        manifest = CatalogManifest.load(fs=self.fs, root=self.root)
+        entries = [manifest.entry(p) for p in sorted(written)]
+        assert [(e.ts_min, e.ts_max, e.num_rows) for e in entries] == [
+            (10, 20, 2),
+            (150, 150, 1),
+            (250, 250, 1),
+        ]
+        assert all(e.compacted for e in entries)
+
+    def test_compact_sorts_unsorted_files(self):
+        # Arrange
+        self._write_file("1-3-0.parquet", [3, 1, 2], [3, 1, 2])
+
+        # Act
+        written = self._compactor().compact()
+
+        # Assert
+        assert self._read(written).column("ts_init").to_pylist() == [1, 2, 3]
+
+    def test_compact_only_rewrites_partitions_with_new_files(self):
+        # Arrange
+        compactor = self._compactor()
+        self._write_file("1-50-0.parquet", [1, 50], [1, 2])
+        self._write_file("120-150-0.parquet", [120, 150], [3, 4])
+        first_written = compactor.compact()
+
+        # Act
+        self._write_file("160-170-0.parquet", [160, 170], [5, 6])
+        written = compactor.compact()
+
+        # Assert
+        manifest = CatalogManifest.load(fs=self.fs, root=self.root)
+        files = [e.path for e in manifest.entries()]
+        assert compactor.pending() == []
+        assert len(written) == 1
+        assert manifest.entry(written[0]).num_rows == 4
+        assert self.fs.exists(sorted(first_written)[0])  # Untouched partition
+        assert len(files) == 2
+
+    def test_compact_new_file_spanning_compacted_partitions_rewrites_each_partition(self):
+        # Arrange
+        compactor = self._compactor()
+        self._write_file("1-50-0.parquet", [1, 50], [1, 2])
+        self._write_file("120-150-0.parquet", [120, 150], [3, 4])
+        compactor.compact()
+        self._write_file("40-130-0.parquet", [40, 130], [5, 6])
+
+        # Act
+        pending = compactor.pending()
+        written = compactor.compact()
+
+        # Assert
+        manifest = CatalogManifest.load(fs=self.fs, root=self.root)
+        entries = [manifest.entry(p) for p in sorted(written)]
+        assert [(g.start_ns, len(g.files)) for g in pending] == [(0, 3)]
+        assert [(e.ts_min, e.ts_max, e.num_rows) for e in entries] == [
+            (1, 50, 3),
+            (120, 150, 3),
+        ]
+        assert sorted(e.path for e in manifest.entries()) == sorted(e.path for e in entries)
+        assert compactor.pending() == []
+
+    def test_compact_retains_replaced_files_for_retention_period(self):
+        # Arrange
+        path = self._write_file("1-50-0.parquet", [1, 50], [1, 2])
+        compactor = self._compactor(retention=pd.Timedelta(hours=1))
+
+        # Act
+        compactor.compact()
+
+        # Assert
+        manifest = CatalogManifest.load(fs=self.fs, root=self.root)
+        assert manifest.entry(path) is None
+        assert self.fs.exists(path)
+        assert self._compactor().purge() == [path]
+        assert not self.fs.exists(path)
+
+    def test_compact_with_nothing_pending_returns_empty(self):
+        # Arrange, Act
+        written = self._compactor().compact()
+
+        # Assert
+        assert written == []
@@ -0,0 +1,233 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2023 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from typing import Optional
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from nautilus_trader.model.data import Bar
+from nautilus_trader.model.data import BarSpecification
+from nautilus_trader.model.data import QuoteTick
+from nautilus_trader.persistence.catalog.manifest import CatalogManifest
+from nautilus_trader.persistence.catalog.manifest import ManifestEntry
+from nautilus_trader.test_kit.mocks.data import data_catalog_setup
+
+
+class TestCatalogManifest:
+    def setup(self):
+        # Fixture Setup
+        self.catalog = data_catalog_setup(protocol="memory")
+        self.fs = self.catalog.fs
+        self.root = self.catalog.path
+
+    def teardown(self):
+        # Cleanup
+        if self.fs.exists(self.root):
+            self.fs.rm(self.root, recursive=True)
+
+    def _write_file(
+        self,
+        relative: str,
+        ts_inits: list[int],
+        bar_type: Optional[str] = None,
+    ) -> str:
+        columns = {"ts_init": pa.array(ts_inits, type=pa.uint64())}
+        if bar_type is not None:
+            columns["bar_type"] = pa.array([bar_type] * len(ts_inits)).dictionary_encode()
+        path = f"{self.root}/{relative}"
+        with self.fs.open(path, "wb") as f:
+            pq.write_table(pa.table(columns), f)
+        return path
+
+    def _write_quotes(self):
+        folder = "data/quote_tick.parquet/instrument_id=AUD-USD.SIM"
+        return [
+            self._write_file(f"{folder}/{start}-{end}-0.parquet", [start, end])
+            for start, end in ((100, 199), (200, 299), (300, 399))
+        ]
+
+    def test_rebuild_indexes_files_from_footer_statistics(self):
+        # Arrange
+        path = self._write_file(
+            "data/quote_tick.parquet/instrument_id=AUD-USD.SIM/unnamed.parquet",
+            [30, 10, 20],
+        )
+
+        # Act
+        manifest = CatalogManifest.rebuild(fs=self.fs, root=self.root)
+
+        # Assert
+        entry = manifest.entry(path)
+        assert len(manifest) == 1
+        assert entry == ManifestEntry(
+            path="data/quote_tick.parquet/instrument_id=AUD-USD.SIM/unnamed.parquet",
+            data_type="quote_tick",
+            instrument_id="AUD-USD.SIM",
+            bar_specs=[],
+            ts_min=10,
+            ts_max=30,
+            num_rows=3,
+            size=self.fs.size(path),
+        )
+
+    def test_files_selects_overlapping_files_inclusive(self):
+        # Arrange
+        paths = self._write_quotes()
+        manifest = CatalogManifest.rebuild(fs=self.fs, root=self.root)
+
+        # Act, Assert
+        assert manifest.files("quote_tick") == paths
+        assert manifest.files("quote_tick", "AUD-USD.SIM", 199, 200) == paths[:2]
+        assert manifest.files("quote_tick", "AUD-USD.SIM", 250, None) == paths[1:]
+        assert manifest.files("quote_tick", "AUD-USD.SIM", None, 99) == []
+        assert manifest.files("quote_tick", "GBP-USD.SIM") == []
+        assert manifest.files("trade_tick") == []
+
+    def test_files_filters_by_bar_spec(self):
+        # Arrange
+        folder = "data/bar.parquet/instrument_id=AUD-USD.SIM"
+        minute = self._write_file(
+            f"{folder}/1-2-0.parquet",
+            [1, 2],
+            bar_type="AUD/USD.SIM-1-MINUTE-BID-EXTERNAL",
+        )
+        self._write_file(
+            f"{folder}/3-4-0.parquet",
+            [3, 4],
+            bar_type="AUD/USD.SIM-1-HOUR-BID-EXTERNAL",
+        )
+        manifest = CatalogManifest.rebuild(fs=self.fs, root=self.root)
+
+        # Act
+        files = manifest.files("bar", bar_spec="1-MINUTE-BID")
+
+        # Assert
+        assert files == [minute]
+        assert manifest.entry(minute).bar_specs == ["1-MINUTE-BID"]
+
+    def test_dataset_files_includes_untimed_files(self):
+        # Arrange
+        quotes = self._write_quotes()
+        untimed = f"{self.root}/data/quote_tick.parquet/instrument_id=AUD-USD.SIM/0.parquet"
+        with self.fs.open(untimed, "wb") as f:
+            pq.write_table(pa.table({"value": [1]}), f)
+        manifest = CatalogManifest.rebuild(fs=self.fs, root=self.root)
+
+        # Act
+        files = manifest.dataset_files("quote_tick", ["AUD-USD.SIM"], 300, None)
+
+        # Assert
+        assert manifest.files("quote_tick") == quotes
+        assert files == sorted([untimed, quotes[2]])
+
+    def test_write_and_load_round_trip(self):
+        # Arrange
+        self._write_quotes()
+        manifest = CatalogManifest.rebuild(fs=self.fs, root=self.root)
+
+        # Act
+        manifest.write()
+        loaded = CatalogManifest.load(fs=self.fs, root=self.root)
+
+        # Assert
+        assert loaded.entries() == manifest.entries()
+        assert self.fs.glob(f"{self.root}/_manifest.json*") == [manifest.path]
+
+    def test_load_when_no_manifest_returns_none(self):
+        # Arrange, Act, Assert
+        assert CatalogManifest.load(fs=self.fs, root=self.root) is None
+
+    def test_catalog_get_files_uses_manifest(self):
+        # Arrange
+        paths = self._write_quotes()
+        self.catalog.rebuild_manifest()
+
+        # Written without updating the manifest, so not selected
+        self._write_file(
+            "data/quote_tick.parquet/instrument_id=AUD-USD.SIM/400-499-0.parquet",
+            [400, 499],
+        )
+
+        # Act
+        files = self.catalog.get_files(QuoteTick, "AUD/USD.SIM", start_nanos=150)
+
+        # Assert
+        assert files == paths
+
+    def test_catalog_query_when_manifest_matches_no_files_returns_empty_table(self):
+        # Arrange
+        self._write_quotes()
+        self.catalog.rebuild_manifest()
+
+        # Written without updating the manifest, so not listed by the query
+        self._write_file(
+            "data/quote_tick.parquet/instrument_id=AUD-USD.SIM/400-499-0.parquet",
+            [400, 499],
+        )
+
+        # Act
+        table = self.catalog.query_table(QuoteTick, start=400, raise_on_empty=False)
+
+        # Assert
+        assert table.num_rows == 0
+        assert "ts_init" in table.schema.names
+
+    def test_catalog_get_files_for_bars_requires_bar_spec(self):
+        # Arrange
+        path = self._write_file(
+            "data/bar.parquet/instrument_id=AUD-USD.SIM/1-2-0.parquet",
+            [1, 2],
+            bar_type="AUD/USD.SIM-1-MINUTE-BID-EXTERNAL",
+        )
+        self.catalog.rebuild_manifest()
+
+        # Act, Assert
+        assert self.catalog.get_files(Bar, "AUD/USD.SIM") == []
+        assert self.catalog.get_files(
+            Bar,
+            "AUD/USD.SIM",
+            bar_spec=BarSpecification.from_str("1-MINUTE-BID"),
+        ) == [path]
+
+    def test_catalog_update_manifest_without_manifest_does_nothing(self):
+        # Arrange
+        path = self._write_quotes()[0]
+
+        # Act
+        result = self.catalog.update_manifest(added=[path])
+
+        # Assert
+        assert result is None
+        assert self.catalog.manifest() is None
+
+    def test_catalog_update_manifest_adds_and_removes_files(self):
+        # Arrange
+        paths = self._write_quotes()
+        self.catalog.update_manifest(added=paths, create=True)
+        new_path = self._write_file(
+            "data/quote_tick.parquet/instrument_id=AUD-USD.SIM/20200101.parquet",
+            [100, 399],
+        )
+
+        # Act
+        self.catalog.update_manifest(added=[new_path], removed=paths)
+
+        # Assert
+        loaded = CatalogManifest.load(fs=self.fs, root=self.root)
+        assert [e.path for e in loaded.entries()] == [
+            "data/quote_tick.parquet/instrument_id=AUD-USD.SIM/20200101.parquet",
+        ]
+        assert self.catalog.get_files(QuoteTick, "AUD/USD.SIM") == [new_path]
@@ -0,0 +1,123 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2023 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import os
+import pickle
+
+from nautilus_trader.config import BacktestDataConfig
+from nautilus_trader.model.data import QuoteTick
+from nautilus_trader.persistence.catalog.shared import SharedCatalogData
+from nautilus_trader.test_kit.mocks.data import aud_usd_data_loader
+from nautilus_trader.test_kit.mocks.data import data_catalog_setup
+
+
+class TestSharedCatalogData:
+    def setup(self):
+        # Fixture Setup
+        self.catalog = data_catalog_setup(protocol="file")
+        aud_usd_data_loader(self.catalog)
+        self.data_config = BacktestDataConfig(
+            catalog_path=self.catalog.path,
+            catalog_fs_protocol="file",
+            data_cls=QuoteTick,
+            instrument_id="AUD/USD.SIM",
+        )
+        self.shared_data = SharedCatalogData()
+
+    def teardown(self):
+        self.shared_data.dispose()
+
+    def test_add_shares_data_config(self):
+        # Arrange, Act
+        result = self.shared_data.add(self.data_config)
+
+        # Assert
+        assert result
+        assert self.shared_data.contains(self.data_config)
+        assert len(os.listdir(self.shared_data.path)) == 1
+
+    def test_add_when_use_rust_does_not_share(self):
+        # Arrange
+        data_config = BacktestDataConfig(
+            catalog_path=self.catalog.path,
+            catalog_fs_protocol="file",
+            data_cls=QuoteTick,
+            instrument_id="AUD/USD.SIM",
+            use_rust=True,
+        )
+
+        # Act
+        result = self.shared_data.add(data_config)
+
+        # Assert
+        assert not result
+        assert not self.shared_data.contains(data_config)
+
+    def test_add_when_query_matches_no_rows_does_not_share(self):
+        # Arrange
+        data_config = BacktestDataConfig(
+            catalog_path=self.catalog.path,
+            catalog_fs_protocol="file",
+            data_cls=QuoteTick,
+            instrument_id="AUD/USD.SIM",
+            start_time="2100-01-01",
+        )
+
+        # Act
+        result = self.shared_data.add(data_config)
+
+        # Assert
+        assert not result
+        assert not self.shared_data.contains(data_config)
+        assert os.listdir(self.shared_data.path) == []
+
+    def test_load_returns_same_data_as_config_load(self):
+        # Arrange
+        self.shared_data.add(self.data_config)
+        shared_data = pickle.loads(pickle.dumps(self.shared_data))  # As for a worker process
+
+        # Act
+        loaded = shared_data.load(self.data_config)
+
+        # Assert
+        expected = self.data_config.load()
+        assert loaded["type"] == expected["type"]
+        assert loaded["instrument"] == expected["instrument"]
+        assert loaded["data"] == expected["data"]
+
+    def test_load_batches_decodes_data_in_batches(self):
+        # Arrange
+        self.shared_data.add(self.data_config)
+        expected = self.data_config.load()["data"]
+
+        # Act
+        loaded = self.shared_data.load_batches(self.data_config, batch_size=1000)
+        batches = list(loaded["data"])
+
+        # Assert
+        assert all(len(batch) <= 1000 for batch in batches)
+        assert len(batches) == -(-len(expected) // 1000)
+        assert [d for batch in batches for d in batch] == expected
+
+    def test_dispose_removes_shared_files(self):
+        # Arrange
+        self.shared_data.add(self.data_config)
+
+        # Act
+        self.shared_data.dispose()
+
+        # Assert
+        assert not self.shared_data.contains(self.data_config)
+        assert not os.path.exists(self.shared_data.path)
@@ -16,10 +16,15 @@
 import os
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
+from nautilus_trader.model.data import OrderBookDelta
 from nautilus_trader.model.data import QuoteTick
 from nautilus_trader.model.data import TradeTick
 from nautilus_trader.model.identifiers import Venue
+from nautilus_trader.persistence.streaming.batching import _row_groups_in_time_range
+from nautilus_trader.persistence.streaming.batching import _slice_batch_to_time_range
 from nautilus_trader.persistence.streaming.batching import generate_batches_rust
 from nautilus_trader.test_kit.providers import TestInstrumentProvider
 from tests import TEST_DATA_DIR
@@ -41,7 +46,7 @@ class TestBatchingData:
 
 
 class TestGenerateBatches(TestBatchingData):
-    def test_generate_batches_returns_empty_list_before_start_timestamp_with_end_timestamp(self):
+    def test_generate_batches_skips_data_before_start_timestamp_with_end_timestamp(self):
         start_timestamp = 1546389021944999936
         batch_gen = generate_batches_rust(
             files=[self.test_parquet_files[1]],
@@ -51,8 +56,8 @@ class TestGenerateBatches(TestBatchingData):
             end_nanos=1546394394948999936,
         )
         batches = list(batch_gen)
-        assert [len(x) for x in batches] == [0, 0, 0, 0, 172, 1000, 1000, 1000, 1000, 887]
-        assert batches[4][0].ts_init == start_timestamp
+        assert [len(x) for x in batches] == [1000, 1000, 1000, 1000, 1000, 59]
+        assert batches[0][0].ts_init == start_timestamp
 
         #################################
         batch_gen = generate_batches_rust(
@@ -63,8 +68,8 @@ class TestGenerateBatches(TestBatchingData):
             end_nanos=1546394394948999936,
         )
         batches = list(batch_gen)
-        assert [len(x) for x in batches] == [0, 0, 0, 0, 172, 1000, 1000, 1000, 1000, 887]
-        assert batches[4][0].ts_init == start_timestamp
+        assert [len(x) for x in batches] == [1000, 1000, 1000, 1000, 1000, 59]
+        assert batches[0][0].ts_init == start_timestamp
 
     def test_generate_batches_returns_batches_of_expected_size(self):
         batch_gen = generate_batches_rust(
@@ -75,7 +80,7 @@ class TestGenerateBatches(TestBatchingData):
         batches = list(batch_gen)
         assert all(len(x) == 1000 for x in batches)
 
-    def test_generate_batches_returns_empty_list_before_start_timestamp(self):
+    def test_generate_batches_skips_data_before_start_timestamp(self):
         # Arrange
         parquet_data_path = self.test_parquet_files[0]
         start_timestamp = 1546383601403000064  # index 10 (1st item in batch)
@@ -90,7 +95,7 @@ class TestGenerateBatches(TestBatchingData):
         batch = next(batch_gen, None)
 
         # Assert
-        assert batch == []
+        assert batch[0].ts_init == start_timestamp
 
         #############################################
         # Arrange
@@ -106,7 +111,7 @@ class TestGenerateBatches(TestBatchingData):
         batch = next(batch_gen, None)
 
         # Assert
-        assert batch == []
+        assert batch[0].ts_init == start_timestamp
 
         ###################################################
         # Arrange
@@ -206,8 +211,7 @@ class TestGenerateBatches(TestBatchingData):
 
         # Assert
         first_batch = batches[0]
-        print(len(first_batch))
-        assert len(first_batch) == 5
+        assert len(first_batch) == 10  # Data before the start is skipped (not an empty batch)
 
         first_timestamp = first_batch[0].ts_init
         assert first_timestamp == start_timestamp
@@ -349,3 +353,52 @@ class TestGenerateBatches(TestBatchingData):
         # Assert
         assert len(results) == len(expected)
         assert [x.ts_init for x in results] == list(expected.ts_init)
+
+    def test_generate_batches_rust_order_book_deltas(self):
+        # Arrange
+        parquet_data_path = os.path.join(TEST_DATA_DIR, "order_book_deltas.parquet")
+
+        batch_gen = generate_batches_rust(
+            files=[parquet_data_path],
+            cls=OrderBookDelta,
+            batch_size=500,
+        )
+
+        # Act
+        results = []
+        for batch in batch_gen:
+            results.extend(batch)
+
+        # Assert
+        assert len(results) == 1077
+        assert all(isinstance(x, OrderBookDelta) for x in results)
+        assert [x.ts_init for x in results] == sorted(x.ts_init for x in results)
+
+
+class TestTimeRangePruning:
+    def test_row_groups_in_time_range_skips_row_groups_by_statistics(self, tmp_path):
+        # Arrange
+        path = str(tmp_path / "data.parquet")
+        table = pa.table({"ts_init": pa.array(range(100), type=pa.uint64())})
+        pq.write_table(table, path, row_group_size=10)
+        metadata = pq.ParquetFile(path).metadata
+
+        # Act, Assert
+        assert _row_groups_in_time_range(metadata, None, None) == list(range(10))
+        assert _row_groups_in_time_range(metadata, 25, 44) == [2, 3, 4]
+        assert _row_groups_in_time_range(metadata, 29, 30) == [2, 3]
+        assert _row_groups_in_time_range(metadata, 95, None) == [9]
+        assert _row_groups_in_time_range(metadata, None, 5) == [0]
+        assert _row_groups_in_time_range(metadata, 100, None) == []
+
+    def test_slice_batch_to_time_range_is_inclusive(self):
+        # Arrange
+        batch = pa.record_batch([pa.array([1, 2, 2, 3, 5, 8], type=pa.uint64())], names=["ts_init"])
+
+        # Act
+        sliced = _slice_batch_to_time_range(batch, 2, 5)
+
+        # Assert
+        assert sliced.column("ts_init").to_pylist() == [2, 2, 3, 5]
+        assert _slice_batch_to_time_range(batch, None, None) is batch
+        assert _slice_batch_to_time_range(batch, 9, None).num_rows == 0
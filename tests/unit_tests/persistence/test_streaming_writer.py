@@ -0,0 +1,77 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2023 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import fsspec
+import pyarrow as pa
+
+from nautilus_trader.common.clock import LiveClock
+from nautilus_trader.common.logging import Logger
+from nautilus_trader.common.logging import LoggerAdapter
+from nautilus_trader.persistence.streaming.writer import StreamingFeatherWriter
+from nautilus_trader.test_kit.stubs.data import TestDataStubs
+
+
+class TestStreamingFeatherWriter:
+    def setup(self):
+        self.fs = fsspec.filesystem("memory")
+        self.path = "/.nautilus/writer/backtest/run.feather"
+        if self.fs.exists(self.path):
+            self.fs.rm(self.path, recursive=True)
+        self.logger = LoggerAdapter("test", logger=Logger(clock=LiveClock()))
+
+    def _read_batches(self, name: str) -> list[pa.RecordBatch]:
+        with self.fs.open(f"{self.path}/{name}.feather", "rb") as f:
+            return list(pa.ipc.open_stream(f))
+
+    def test_write_buffers_rows_until_max_batch_size(self):
+        # Arrange
+        writer = StreamingFeatherWriter(
+            path=self.path,
+            logger=self.logger,
+            fs_protocol="memory",
+            flush_interval_ms=3_600_000,
+            max_batch_size=4,
+        )
+        writer.check_flush()  # Start the flush interval
+
+        # Act
+        for i in range(10):
+            writer.write(TestDataStubs.trade_tick(ts_event=i, ts_init=i))
+        writer.close()
+
+        # Assert
+        batches = self._read_batches("TradeTick")
+        assert [batch.num_rows for batch in batches] == [4, 4, 2]
+        assert pa.Table.from_batches(batches).column("ts_init").to_pylist() == list(range(10))
+
+    def test_flush_writes_buffered_rows_as_single_batch(self):
+        # Arrange
+        writer = StreamingFeatherWriter(
+            path=self.path,
+            logger=self.logger,
+            fs_protocol="memory",
+            flush_interval_ms=3_600_000,
+        )
+        writer.check_flush()  # Start the flush interval
+        for i in range(5):
+            writer.write(TestDataStubs.trade_tick(ts_event=i, ts_init=i))
+
+        # Act
+        writer.flush()
+        writer.close()
+
+        # Assert
+        batches = self._read_batches("TradeTick")
+        assert [batch.num_rows for batch in batches] == [5]
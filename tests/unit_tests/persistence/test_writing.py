@@ -19,6 +19,7 @@ import pyarrow as pa
 
 from nautilus_trader.core.nautilus_pyo3.persistence import DataTransformer
 from nautilus_trader.model.data import OrderBookDelta
+from nautilus_trader.test_kit.stubs.data import TestDataStubs
 
 
 def test_legacy_deltas_to_record_batch_reader() -> None:
@@ -52,3 +53,18 @@ def test_legacy_deltas_to_record_batch_reader() -> None:
     assert len(ticks) == 1
     assert len(reader.read_all()) == len(ticks)
     reader.close()
+
+
+def test_legacy_quote_ticks_encoded_as_single_record_batch() -> None:
+    # Arrange
+    ticks = [TestDataStubs.quote_tick(ts_event=i, ts_init=i) for i in range(5)]
+
+    # Act
+    batches_bytes = DataTransformer.pyobjects_to_batches_bytes(ticks)
+    reader = pa.ipc.open_stream(BytesIO(batches_bytes))
+    batches = list(reader)
+
+    # Assert
+    assert len(batches) == 1
+    assert batches[0].num_rows == len(ticks)
+    assert batches[0].column("ts_init").to_pylist() == list(range(5))
@@ -32,6 +32,7 @@ from nautilus_trader.model.data import QuoteTick
 from nautilus_trader.model.enums import AccountType
 from nautilus_trader.model.enums import OmsType
 from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.enums import PriceType
 from nautilus_trader.model.events import AccountState
 from nautilus_trader.model.identifiers import AccountId
 from nautilus_trader.model.identifiers import PositionId
@@ -44,6 +45,7 @@ from nautilus_trader.model.objects import Price
 from nautilus_trader.model.objects import Quantity
 from nautilus_trader.model.position import Position
 from nautilus_trader.msgbus.bus import MessageBus
+from nautilus_trader.portfolio.portfolio import CurrencyTotals
 from nautilus_trader.portfolio.portfolio import Portfolio
 from nautilus_trader.test_kit.providers import TestInstrumentProvider
 from nautilus_trader.test_kit.stubs.component import TestComponentStubs
@@ -1412,3 +1414,112 @@ class TestPortfolio:
         assert self.portfolio.is_net_long(AUDUSD_SIM.id)
         assert self.portfolio.is_flat(GBPUSD_SIM.id)
         assert not self.portfolio.is_completely_flat()
+
+    def test_quote_tick_updates_net_exposures_and_unrealized_pnls(self):
+        # Arrange
+        AccountFactory.register_calculated_account("SIM")
+
+        account_id = AccountId("SIM-01234")
+        state = AccountState(
+            account_id=account_id,
+            account_type=AccountType.MARGIN,
+            base_currency=USD,
+            reported=True,
+            balances=[
+                AccountBalance(
+                    Money(1_000_000, USD),
+                    Money(0, USD),
+                    Money(1_000_000, USD),
+                ),
+            ],
+            margins=[],
+            info={},
+            event_id=UUID4(),
+            ts_event=0,
+            ts_init=0,
+        )
+
+        self.portfolio.update_account(state)
+
+        last_audusd1 = TestDataStubs.quote_tick(AUDUSD_SIM, bid=0.80501, ask=0.80505)
+        self.cache.add_quote_tick(last_audusd1)
+        self.portfolio.update_quote_tick(last_audusd1)
+
+        order = self.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+        )
+
+        fill = TestEventStubs.order_filled(
+            order,
+            instrument=AUDUSD_SIM,
+            strategy_id=StrategyId("S-1"),
+            account_id=account_id,
+            position_id=PositionId("P-123456"),
+            last_px=Price.from_str("1.00000"),
+        )
+
+        position = Position(instrument=AUDUSD_SIM, fill=fill)
+        self.cache.add_position(position, OmsType.HEDGING)
+        self.portfolio.update_position(TestEventStubs.position_opened(position))
+
+        net_exposures1 = self.portfolio.net_exposures(SIM)
+        unrealized_pnls1 = self.portfolio.unrealized_pnls(SIM)
+
+        # Act
+        last_audusd2 = TestDataStubs.quote_tick(AUDUSD_SIM, bid=0.81000, ask=0.81004)
+        self.cache.add_quote_tick(last_audusd2)
+        self.portfolio.update_quote_tick(last_audusd2)
+
+        # Assert
+        assert net_exposures1 == {USD: Money(80501.00, USD)}
+        assert unrealized_pnls1 == {USD: Money(-19499.00, USD)}
+        assert self.portfolio.net_exposures(SIM) == {USD: Money(81000.00, USD)}
+        assert self.portfolio.unrealized_pnls(SIM) == {USD: Money(-19000.00, USD)}
+
+
+class TestCurrencyTotals:
+    def test_totals_when_no_parts_returns_empty_dict(self):
+        # Arrange
+        totals = CurrencyTotals()
+
+        # Act, Assert
+        assert totals.totals() == {}
+
+    def test_set_parts_sums_totals_by_key(self):
+        # Arrange
+        totals = CurrencyTotals()
+
+        # Act
+        totals.set(AUDUSD_SIM.id, {(USD, PriceType.BID): 100.0})
+        totals.set(GBPUSD_SIM.id, {(USD, PriceType.BID): 50.0, (USD, PriceType.ASK): -25.0})
+
+        # Assert
+        assert totals.totals() == {(USD, PriceType.BID): 150.0, (USD, PriceType.ASK): -25.0}
+
+    def test_set_parts_for_same_instrument_replaces_previous_parts(self):
+        # Arrange
+        totals = CurrencyTotals()
+        totals.set(AUDUSD_SIM.id, {(USD, PriceType.BID): 100.0})
+        totals.set(GBPUSD_SIM.id, {(USD, PriceType.BID): 50.0})
+
+        # Act
+        totals.set(AUDUSD_SIM.id, {(USD, PriceType.ASK): 10.0})
+
+        # Assert
+        assert totals.totals() == {(USD, PriceType.BID): 50.0, (USD, PriceType.ASK): 10.0}
+
+    def test_remove_last_part_removes_total(self):
+        # Arrange
+        totals = CurrencyTotals()
+        totals.set(AUDUSD_SIM.id, {(USD, PriceType.BID): 0.1})
+        totals.set(GBPUSD_SIM.id, {(USD, PriceType.BID): 0.2})
+
+        # Act
+        totals.remove(AUDUSD_SIM.id)
+        totals.remove(GBPUSD_SIM.id)
+        totals.remove(GBPUSD_SIM.id)  # Already removed
+
+        # Assert
+        assert totals.totals() == {}